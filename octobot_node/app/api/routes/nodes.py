@@ -18,12 +18,18 @@ from typing import Any, List
 
 from fastapi import APIRouter
 
-from octobot_node.app.models import Node
-from octobot_node.scheduler.api import get_node_status
+from octobot_node.app.models import ClusterNode, Node
+from octobot_node.scheduler import ASYNC_STORAGE
+from octobot_node.scheduler.api import get_node_status, get_nodes
 
 router = APIRouter(tags=["nodes"])
 
+@router.get("/", response_model=List[ClusterNode])
+async def get_cluster_nodes() -> Any:
+    return await ASYNC_STORAGE.run(get_nodes)
+
+
 @router.get("/me", response_model=Node)
-def get_current_node() -> Any:
-    status = get_node_status()
+async def get_current_node() -> Any:
+    status = await ASYNC_STORAGE.run(get_node_status)
     return Node(**status)
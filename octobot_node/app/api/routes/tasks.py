@@ -14,41 +14,189 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Any, List, Tuple
+from typing import Annotated, Any, AsyncIterator, Dict, List, Optional
+import datetime
+import logging
 import uuid
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 
-from octobot_node.app.models import Task
-from octobot_node.scheduler.api import get_all_tasks, get_task_metrics
-from octobot_node.scheduler.tasks import trigger_task
+from octobot_node.app.models import Task, TaskGraph, TaskGraphStatus, TaskStatus, TaskSubmission
+from octobot_node.constants import NEXT_CURSOR_HEADER, BULK_TASKS_CHUNK_SIZE
+from octobot_node.app.core.config import settings
+from octobot_node.scheduler import ASYNC_STORAGE, TASK_EVENTS
+from octobot_node.scheduler.api import (
+    get_tasks_page, get_task_metrics, get_task_async, get_task_result, get_task_results, find_tasks_by_name,
+    get_task_graph, iter_task_results_export,
+)
+from octobot_node.scheduler.results_export import ExportFormat, MEDIA_TYPES
+from octobot_node.scheduler.pagination import InvalidCursorError
+from octobot_node.scheduler.task_graph import TaskGraphError
+from octobot_node.scheduler.tasks import trigger_tasks, trigger_task_graph
 
 router = APIRouter(tags=["tasks"])
+EXPORTED_STATUSES = {TaskStatus.COMPLETED, TaskStatus.FAILED}
+logger = logging.getLogger(__name__)
 
-@router.post("/", response_model=Tuple[int, int])
-def create_tasks(tasks: List[Task]) -> Tuple[int, int]:
-    success_count = 0
-    error_count = 0
-    for task in tasks:
-        is_scheduled = trigger_task(task)
-        if is_scheduled:
-            success_count += 1
-        else:
-            error_count += 1
-    return success_count, error_count
+@router.post("/", response_model=List[TaskSubmission])
+async def create_tasks(tasks: List[Task]) -> Any:
+    """
+    Enqueues the tasks in a single storage write. Returns the id or the error of each task.
+    """
+    return await ASYNC_STORAGE.run(trigger_tasks, tasks)
+
+
+async def _iter_ndjson_lines(request: Request) -> AsyncIterator[bytes]:
+    remaining = b""
+    async for data in request.stream():
+        *lines, remaining = (remaining + data).split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if remaining.strip():
+        yield remaining
+
+
+async def _trigger_tasks_chunk(tasks: list[Task]) -> list[TaskSubmission]:
+    try:
+        return await ASYNC_STORAGE.run(trigger_tasks, tasks)
+    except Exception as e:
+        logger.error("Failed to enqueue %d tasks: %s", len(tasks), e)
+        return [TaskSubmission(error=str(e)) for _ in tasks]
+
+
+@router.post("/bulk", response_model=List[TaskSubmission])
+async def create_tasks_bulk(request: Request) -> Any:
+    """
+    Enqueues the tasks of a newline delimited JSON body, BULK_TASKS_CHUNK_SIZE tasks per storage write.
+    Returns the id or the error of each line.
+    """
+    submissions: list[Optional[TaskSubmission]] = []
+    chunk: list[Task] = []
+    chunk_positions: list[int] = []
+
+    async def flush():
+        for position, submission in zip(chunk_positions, await _trigger_tasks_chunk(chunk)):
+            submissions[position] = submission
+        chunk.clear()
+        chunk_positions.clear()
+
+    async for line in _iter_ndjson_lines(request):
+        try:
+            task = Task.model_validate_json(line)
+        except ValidationError as e:
+            submissions.append(TaskSubmission(error=str(e)))
+            continue
+        chunk_positions.append(len(submissions))
+        submissions.append(None)
+        chunk.append(task)
+        if len(chunk) >= BULK_TASKS_CHUNK_SIZE:
+            await flush()
+    if chunk:
+        await flush()
+    return submissions
+
+
+@router.post("/graphs", response_model=TaskSubmission)
+async def create_task_graph(graph: TaskGraph) -> Any:
+    """
+    Enqueues a graph of tasks: each node runs once all the nodes it depends on completed
+    """
+    try:
+        return TaskSubmission(id=await ASYNC_STORAGE.run(trigger_task_graph, graph))
+    except TaskGraphError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/graphs/{graph_id}", response_model=TaskGraphStatus)
+async def get_task_graph_by_id(graph_id: str) -> Any:
+    graph = await ASYNC_STORAGE.run(get_task_graph, graph_id)
+    if graph is None:
+        raise HTTPException(status_code=404, detail="Task graph not found")
+    return graph
 
 
 @router.get("/metrics")
-def get_metrics() -> Any:
-    return get_task_metrics()
+async def get_metrics() -> Any:
+    return await ASYNC_STORAGE.run(get_task_metrics)
+
+
+async def _iter_task_events(request: Request) -> AsyncIterator[str]:
+    async with TASK_EVENTS.broadcaster.subscribe() as subscription:
+        yield ": connected\n\n"
+        while not await request.is_disconnected():
+            event = await subscription.get(settings.SCHEDULER_TASK_EVENTS_KEEPALIVE)
+            # comments keep proxies from closing idle streams
+            yield ": keepalive\n\n" if event is None else event.to_sse()
+
+
+@router.get("/events")
+async def stream_task_events(request: Request) -> StreamingResponse:
+    """
+    Server-sent events of task state changes (enqueued, scheduled, started, completed, failed, rescheduled)
+    with their tasks count change by status. A resync event means events were missed: reload the tasks.
+    """
+    if not settings.SCHEDULER_TASK_EVENTS_ENABLED:
+        raise HTTPException(status_code=404, detail="Task events are disabled")
+    return StreamingResponse(
+        _iter_task_events(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.get("/results", response_model=Dict[str, Dict[str, Any]])
+async def get_results(
+    ids: Annotated[List[str], Query(min_length=1)],
+    wait: Annotated[float, Query(ge=0)] = 0,
+) -> Any:
+    """
+    Results of the given tasks, waiting up to wait seconds for all of them to finish
+    """
+    return await get_task_results(ids, wait)
+
+@router.get("/results/export")
+async def export_results(
+    format: ExportFormat = ExportFormat.CSV,
+    status: Annotated[Optional[List[TaskStatus]], Query()] = None,
+    since: Optional[datetime.datetime] = None,
+    until: Optional[datetime.datetime] = None,
+    name: Optional[str] = None,
+) -> StreamingResponse:
+    """
+    Streams the stored results of the finished tasks completed between since and until, by completion time.
+    Results and their metadata are exported as stored, encrypted when tasks outputs encryption is enabled.
+    """
+    statuses = set(status or EXPORTED_STATUSES)
+    if not statuses <= EXPORTED_STATUSES:
+        raise HTTPException(status_code=400, detail="Only completed and failed tasks have results")
+    chunks = iter_task_results_export(format, statuses, since, until, name)
+    return StreamingResponse(
+        # read each batch in the scheduler executor: the export runs in constant memory
+        ASYNC_STORAGE.iterate(chunks),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="task-results.{format.value}"'},
+    )
 
 @router.get("/", response_model=List[Task])
-def get_tasks(page: int = 1, limit: int = 100) -> Any:
-    tasks_data = get_all_tasks()
-    
-    start_idx = (page - 1) * limit
-    end_idx = start_idx + limit
-    paginated_tasks = tasks_data[start_idx:end_idx]
-    return paginated_tasks
+async def get_tasks(
+    response: Response,
+    page: Annotated[int, Query(ge=1)] = 1,
+    limit: Annotated[int, Query(ge=1)] = 100,
+    cursor: Optional[str] = None,
+    status: Annotated[Optional[List[TaskStatus]], Query()] = None,
+) -> Any:
+    try:
+        tasks, next_cursor = await ASYNC_STORAGE.run(get_tasks_page, limit, cursor=cursor, statuses=status, page=page)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return tasks
+
+@router.get("/names/{name}", response_model=List[Task])
+async def get_tasks_by_name(name: str, limit: Annotated[int, Query(ge=1)] = 100) -> Any:
+    return await ASYNC_STORAGE.run(find_tasks_by_name, name, limit)
 
 @router.put("/", response_model=Task)
 def update_task(taskId: uuid.UUID, task: Task) -> Any:
@@ -59,3 +207,20 @@ def update_task(taskId: uuid.UUID, task: Task) -> Any:
 def delete_task(taskId: uuid.UUID) -> str:
     # TODO
     return taskId
+
+@router.get("/{task_id}", response_model=Task)
+async def get_task_by_id(task_id: str) -> Any:
+    task = await get_task_async(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task
+
+@router.get("/{task_id}/result", response_model=Dict[str, Any])
+async def get_result_by_task_id(task_id: str, wait: Annotated[float, Query(ge=0)] = 0) -> Any:
+    """
+    Result of the task, waiting up to wait seconds for it to finish
+    """
+    result = await get_task_result(task_id, wait)
+    if result.get("error") == "task not found":
+        raise HTTPException(status_code=404, detail="Task not found")
+    return result
@@ -85,9 +85,40 @@ class Settings(BaseSettings):
 
     SENTRY_DSN: HttpUrl | None = None
     SCHEDULER_REDIS_URL: AnyUrl | None = None
+    SCHEDULER_REDIS_PRIORITIES: bool = False  # honor tasks priority, changes the Redis queue format
     SCHEDULER_SQLITE_FILE: str = "tasks.db"
     SCHEDULER_WORKERS: int = 0  # 0 disables consumers, >0 enables consumers
+    SCHEDULER_WORKER_TYPE: Literal["thread", "process", "greenlet"] = "thread"
+    SCHEDULER_HEALTH_CHECK_INTERVAL: float = 10  # seconds between crashed workers respawn checks
+    SCHEDULER_SHUTDOWN_TIMEOUT: float | None = None  # seconds to wait for running tasks on stop, None waits for them
+    SCHEDULER_AUTOSCALE_MAX_WORKERS: int | None = None  # max workers when autoscaling, None keeps SCHEDULER_WORKERS
+    SCHEDULER_AUTOSCALE_INTERVAL: float = 5  # seconds between workers autoscaling decisions
+    SCHEDULER_AUTOSCALE_PENDING_PER_WORKER: int = 10  # pending tasks per worker above which workers are added
+    SCHEDULER_AUTOSCALE_MAX_WAIT: float = 30  # seconds a pending task can wait before workers are added
+    SCHEDULER_AUTOSCALE_SCALE_DOWN_DELAY: float = 60  # seconds of low load before a worker is removed
+    SCHEDULER_AUTOSCALE_WORKER_MAX_MEMORY: int | None = None  # max MB of memory per process worker, None disables the cap
+    SCHEDULER_LANE_WEIGHTS: dict[str, int] = {}  # task type lanes dequeue weights, {} uses a single queue
+    SCHEDULER_LANE_MAX_CONCURRENCY: dict[str, int] = {}  # max running tasks per lane in a thread workers consumer
+    SCHEDULER_COMPACT_MESSAGES: bool = False  # compact tasks encoding, enable once no older node shares the queue
+    SCHEDULER_MESSAGE_COMPRESSION_THRESHOLD: int | None = 1024  # min task content size to compress, None disables
+    SCHEDULER_RESULTS_MAX_AGE: float | None = None  # seconds a finished task result is kept, None keeps them
+    SCHEDULER_RESULTS_MAX_COUNT: int | None = None  # max number of kept results, None keeps them
+    SCHEDULER_RESULTS_MAX_BYTES: int | None = None  # max total size of kept results, None keeps them
+    SCHEDULER_RESULTS_ARCHIVE_PATH: str | None = None  # folder of expired results archives, None disables archiving
+    SCHEDULER_RESULTS_COMPACTION_INTERVAL: int = 60  # minutes between results compactions
+    SCHEDULER_ACTIONS_PLAN_CACHE_SIZE: int = 128  # actions plans kept in each worker memory, 0 disables the cache
+    SCHEDULER_TASK_VISIBILITY_TIMEOUT: float | None = None  # seconds before a running task lease expires, None disables leases
+    SCHEDULER_TASK_MAX_ATTEMPTS: int = 3  # executions of a task interrupted by worker crashes before it is failed
+    SCHEDULER_TASK_REAPER_INTERVAL: int = 1  # minutes between expired task leases checks
+    METRICS_ENABLED: bool = True  # expose OpenMetrics at /metrics
+    SCHEDULER_API_EXECUTOR_WORKERS: int = 8  # threads running the API scheduler storage calls
+    SCHEDULER_TASK_EVENTS_ENABLED: bool = True  # push task state changes at /tasks/events
+    SCHEDULER_TASK_EVENTS_KEEPALIVE: float = 15  # seconds between keepalive comments of idle event streams
+    SCHEDULER_TASK_RESULT_MAX_WAIT: float = 60  # max seconds a task result request can wait for the result
+    SCHEDULER_TASK_DEDUPE_TTL: float | None = None  # max seconds duplicate task submissions are ignored, None disables
     IS_MASTER_MODE: bool = False  # Enable master node mode
+    SCHEDULER_NODE_ID: str | None = None  # id of this node in the cluster registry, None uses hostname-pid
+    SCHEDULER_NODE_HEARTBEAT_INTERVAL: float = 10  # seconds between node heartbeats, 0 disables them
     REDIS_STORAGE_CERTS_PATH: str | None = None
 
     ADMIN_USERNAME: EmailStr = DEFAULT_ADMIN_USERNAME
@@ -105,6 +136,10 @@ class Settings(BaseSettings):
     TASKS_OUTPUTS_RSA_PRIVATE_KEY: Annotated[bytes | None, BeforeValidator(parse_key_to_bytes)] = None
     TASKS_OUTPUTS_ECDSA_PUBLIC_KEY: Annotated[bytes | None, BeforeValidator(parse_key_to_bytes)] = None
 
+    # Share one RSA-wrapped AES key between the results encrypted in the same period
+    TASKS_OUTPUTS_ENVELOPE_TTL: float | None = None  # seconds an envelope key is used, None uses a key per result
+    TASKS_OUTPUTS_ENVELOPE_MAX_RESULTS: int = 10000  # max results encrypted with the same envelope key
+
     def _check_default_secret(self, var_name: str, value: str | None, default_value: EmailStr | None) -> None:
         if value == default_value:
             message = (
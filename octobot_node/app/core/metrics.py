@@ -0,0 +1,187 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import bisect
+import dataclasses
+import math
+import threading
+import time
+from typing import Callable, Optional
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+METRICS_PREFIX = "octobot_node"
+UNMATCHED_ROUTE = "unmatched"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+SIZE_BUCKETS = (128, 512, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+@dataclasses.dataclass
+class MetricFamily:
+    name: str
+    type: str
+    documentation: str
+    # (name suffix, labels, value)
+    samples: list[tuple[str, dict[str, str], float]] = dataclasses.field(default_factory=list)
+
+
+class Histogram:
+    """
+    Thread safe histogram with a fixed set of labels and buckets
+    """
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...], buckets: tuple[float, ...]):
+        self.name: str = name
+        self.documentation: str = documentation
+        self.label_names: tuple[str, ...] = label_names
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # labels values: (non cumulative buckets counts (last one is +Inf), sum)
+        self._values: dict[tuple[str, ...], tuple[list[int], float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        label_values = tuple(str(labels.get(label_name, "")) for label_name in self.label_names)
+        bucket_index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(label_values) or ([0] * (len(self.buckets) + 1), 0.0)
+            counts[bucket_index] += 1
+            self._values[label_values] = (counts, total + value)
+
+    def collect(self) -> MetricFamily:
+        family = MetricFamily(self.name, "histogram", self.documentation)
+        with self._lock:
+            values = {label_values: (list(counts), total) for label_values, (counts, total) in self._values.items()}
+        for label_values, (counts, total) in sorted(values.items()):
+            labels = dict(zip(self.label_names, label_values))
+            cumulated_count = 0
+            for upper_bound, count in zip((*self.buckets, math.inf), counts):
+                cumulated_count += count
+                family.samples.append(("_bucket", {**labels, "le": _format_value(float(upper_bound))}, cumulated_count))
+            family.samples.append(("_count", labels, cumulated_count))
+            family.samples.append(("_sum", labels, total))
+        return family
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Registry:
+    def __init__(self):
+        self.histograms: list[Histogram] = []
+        self.collectors: list[Callable[[], list[MetricFamily]]] = []
+
+    def histogram(
+        self, name: str, documentation: str, label_names: tuple[str, ...], buckets: tuple[float, ...] = LATENCY_BUCKETS
+    ) -> Histogram:
+        histogram = Histogram(f"{METRICS_PREFIX}_{name}", documentation, label_names, buckets)
+        self.histograms.append(histogram)
+        return histogram
+
+    def add_collector(self, collector: Callable[[], list[MetricFamily]]) -> None:
+        """
+        collector is called on each scrape to return metrics read from elsewhere
+        """
+        self.collectors.append(collector)
+
+    def collect(self) -> list[MetricFamily]:
+        families = [histogram.collect() for histogram in self.histograms]
+        for collector in self.collectors:
+            families.extend(collector())
+        return families
+
+    def render(self) -> str:
+        """
+        Returns the registry metrics in the OpenMetrics text format
+        """
+        lines = []
+        for family in self.collect():
+            lines.append(f"# TYPE {family.name} {family.type}")
+            lines.append(f"# HELP {family.name} {_escape(family.documentation)}")
+            for suffix, labels, value in family.samples:
+                lines.append(f"{family.name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+REGISTRY = Registry()
+
+TASK_QUEUE_WAIT = REGISTRY.histogram(
+    "task_queue_wait_seconds", "Time between a task becoming ready to run and its execution start", ("task",)
+)
+TASK_EXECUTION = REGISTRY.histogram(
+    "task_execution_seconds", "Task execution duration", ("task", "outcome")
+)
+TASK_RESULT_SIZE = REGISTRY.histogram(
+    "task_result_bytes", "Serialized task result size", ("task",), SIZE_BUCKETS
+)
+TASK_ENCRYPTION = REGISTRY.histogram(
+    "task_encryption_seconds", "Task content decryption and result encryption duration", ("operation",)
+)
+HTTP_REQUEST = REGISTRY.histogram(
+    "http_request_duration_seconds", "HTTP requests duration", ("method", "route", "status")
+)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware measuring requests duration per route template
+    """
+
+    def __init__(self, app, excluded_paths: Optional[set[str]] = None):
+        self.app = app
+        self.excluded_paths: set[str] = excluded_paths or set()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # the router stores the matched route in the request scope
+            route = scope.get("route")
+            HTTP_REQUEST.observe(
+                time.perf_counter() - start,
+                method=scope["method"],
+                route=getattr(route, "path", UNMATCHED_ROUTE),
+                status=str(status_code),
+            )
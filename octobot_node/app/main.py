@@ -18,16 +18,23 @@ from contextlib import asynccontextmanager
 
 import sentry_sdk
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.routing import APIRoute
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.cors import CORSMiddleware
 
 from octobot_node import PROJECT_NAME
+from octobot_node.constants import NEXT_CURSOR_HEADER
 from octobot_node.app.api.main import api_router
 from octobot_node.app.core.config import settings
+from octobot_node.app.core import metrics
 from octobot_node.app.utils import get_dist_directory
-from octobot_node.scheduler import SCHEDULER, CONSUMER
+from octobot_node.scheduler import SCHEDULER, CONSUMER, NODE_HEARTBEAT, ASYNC_STORAGE, TASK_EVENTS
+from octobot_node.scheduler.api import get_node_status
+from octobot_node.scheduler.encryption import KEY_MANAGER
+
+
+METRICS_PATH = "/metrics"
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -51,8 +58,16 @@ async def lifespan(app: FastAPI):
     # Startup - scheduler starts automatically on import
     # Import scheduler module to ensure it's initialized
     from octobot_node.scheduler import scheduler  # noqa: F401
+    # Parse encryption keys once and fail early on mismatching key pairs
+    KEY_MANAGER.load_keys()
+    NODE_HEARTBEAT.start(get_node_status)
+    if settings.SCHEDULER_TASK_EVENTS_ENABLED:
+        await TASK_EVENTS.start()
     yield
     # Shutdown
+    NODE_HEARTBEAT.stop()
+    await TASK_EVENTS.stop()
+    await ASYNC_STORAGE.close()
     SCHEDULER.stop()
     CONSUMER.stop()
 
@@ -72,10 +87,41 @@ if settings.all_cors_origins:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
 
+if settings.METRICS_ENABLED:
+    app.add_middleware(metrics.MetricsMiddleware, excluded_paths={METRICS_PATH})
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+
+def _collect_scheduler_metrics() -> list[metrics.MetricFamily]:
+    if SCHEDULER.metrics is None:
+        return []
+    tasks_metrics = SCHEDULER.metrics.get_metrics()
+    tasks = metrics.MetricFamily(f"{metrics.METRICS_PREFIX}_tasks", "gauge", "Number of tasks by status")
+    for status, count in tasks_metrics["by_status"].items():
+        tasks.samples.append(("", {"status": status.value}, count))
+    tasks_by_type = metrics.MetricFamily(
+        f"{metrics.METRICS_PREFIX}_tasks_by_type", "gauge", "Number of tasks by type and status"
+    )
+    for task_type, counts in tasks_metrics["by_type"].items():
+        for status, count in counts.items():
+            tasks_by_type.samples.append(("", {"type": task_type, "status": status}, count))
+    events = metrics.MetricFamily(f"{metrics.METRICS_PREFIX}_task_events", "counter", "Number of tasks events")
+    for event, count in tasks_metrics["events"].items():
+        events.samples.append(("_total", {"event": event}, count))
+    return [tasks, tasks_by_type, events]
+
+
+if settings.METRICS_ENABLED:
+    metrics.REGISTRY.add_collector(_collect_scheduler_metrics)
+
+    @app.get(METRICS_PATH, include_in_schema=False)
+    def get_metrics() -> Response:
+        return Response(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
 # Get the path to the dist folder (works for both development and installed packages)
 DIST_DIR = get_dist_directory()
 
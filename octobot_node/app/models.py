@@ -49,7 +49,7 @@ class TaskType(str, Enum):
     STOP_OCTOBOT = "stop_octobot"
 
 class Task(BaseModel):
-    id: uuid.UUID = uuid.uuid4()
+    id: uuid.UUID = Field(default_factory=uuid.uuid4)
     name: typing.Optional[str] = None
     description: typing.Optional[str] = None
     content: typing.Optional[str] = None
@@ -66,11 +66,61 @@ class Task(BaseModel):
     scheduled_at: typing.Optional[datetime.datetime] = None
     started_at: typing.Optional[datetime.datetime] = None
     completed_at: typing.Optional[datetime.datetime] = None
+    # when SCHEDULER_TASK_DEDUPE_TTL is set, submissions of a task with the same key are ignored until it is finished,
+    # defaults to a hash of its name, type and content
+    idempotency_key: typing.Optional[str] = None
+
+class TaskSubmission(BaseModel):
+    id: typing.Optional[str] = None
+    error: typing.Optional[str] = None
+    duplicate: bool = False  # id is the already scheduled task with the same idempotency key
+
+class TaskGraphNode(BaseModel):
+    key: str
+    # a node without task, or without task type, merges the results of its dependencies
+    task: typing.Optional[Task] = None
+    depends_on: list[str] = Field(default_factory=list)
+
+class TaskGraph(BaseModel):
+    name: typing.Optional[str] = None
+    nodes: list[TaskGraphNode]
+
+class TaskGraphNodeStatus(BaseModel):
+    key: str
+    task_id: str
+    depends_on: list[str]
+    status: typing.Optional[TaskStatus] = None  # None while waiting for dependencies
+
+class TaskGraphStatus(BaseModel):
+    id: str
+    name: typing.Optional[str] = None
+    status: TaskStatus
+    nodes: list[TaskGraphNodeStatus]
 
 class Node(BaseModel):
     node_type: str
     backend_type: str
     workers: int | None
+    worker_type: str | None = None
     status: str
     redis_url: str | None = None
     sqlite_file: str | None = None
+
+class ClusterNode(BaseModel):
+    node_id: str
+    node_type: str
+    backend_type: str
+    workers: int | None
+    # None when the node workers are processes
+    in_flight: int | None
+    executed: int | None
+    throughput: float | None  # tasks per minute
+    version: str
+    hostname: str
+    pid: int
+    started_at: float
+    heartbeat_at: float
+    heartbeat_age: float
+    interval: float
+    status: str  # alive or stale
+    is_current: bool
@@ -0,0 +1,44 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+from octobot_node.benchmarks.runner import (
+    BENCHMARKS,
+    BACKENDS,
+    BenchmarkContext,
+    BenchmarkResult,
+    Regression,
+    benchmark,
+    run_benchmarks,
+    compare_to_baseline,
+    dump_results,
+    load_results,
+)
+# register benchmarks
+from octobot_node.benchmarks import scheduler_benchmarks  # noqa: F401
+from octobot_node.benchmarks import encryption_benchmarks  # noqa: F401
+
+__all__ = [
+    "BENCHMARKS",
+    "BACKENDS",
+    "BenchmarkContext",
+    "BenchmarkResult",
+    "Regression",
+    "benchmark",
+    "run_benchmarks",
+    "compare_to_baseline",
+    "dump_results",
+    "load_results",
+]
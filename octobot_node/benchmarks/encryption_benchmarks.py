@@ -0,0 +1,102 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import contextlib
+import csv
+import json
+import os
+
+import octobot_commons.cryptography as cryptography
+
+from octobot_node.app.core.config import settings
+from octobot_node.app.models import Task, TaskType
+from octobot_node.benchmarks.runner import BenchmarkContext, BenchmarkResult, benchmark
+from octobot_node.scheduler.encryption import KEY_MANAGER
+from octobot_node.scheduler.encryption.task_inputs import encrypt_task_content
+from octobot_node.scheduler.task_context import encrypted_task
+from octobot_node.tools.csv_utils import parse_csv
+
+ENCRYPTED_TASKS = 200
+PARSED_CSV_ROWS = 10000
+KEYS_SETTINGS = (
+    ("TASKS_INPUTS_RSA_PRIVATE_KEY", "TASKS_INPUTS_RSA_PUBLIC_KEY", "TASKS_INPUTS_ECDSA_PRIVATE_KEY",
+     "TASKS_INPUTS_ECDSA_PUBLIC_KEY"),
+    ("TASKS_OUTPUTS_RSA_PRIVATE_KEY", "TASKS_OUTPUTS_RSA_PUBLIC_KEY", "TASKS_OUTPUTS_ECDSA_PRIVATE_KEY",
+     "TASKS_OUTPUTS_ECDSA_PUBLIC_KEY"),
+)
+
+
+@contextlib.contextmanager
+def _generated_keys():
+    """
+    Uses newly generated keys, the configured keys are restored on exit
+    """
+    previous_keys = {key: getattr(settings, key) for keys in KEYS_SETTINGS for key in keys}
+    try:
+        for rsa_private, rsa_public, ecdsa_private, ecdsa_public in KEYS_SETTINGS:
+            rsa_private_key, rsa_public_key = cryptography.generate_rsa_key_pair(key_size=4096)
+            ecdsa_private_key, ecdsa_public_key = cryptography.generate_ecdsa_key_pair()
+            setattr(settings, rsa_private, rsa_private_key)
+            setattr(settings, rsa_public, rsa_public_key)
+            setattr(settings, ecdsa_private, ecdsa_private_key)
+            setattr(settings, ecdsa_public, ecdsa_public_key)
+        KEY_MANAGER.clear()
+        yield
+    finally:
+        for key, value in previous_keys.items():
+            setattr(settings, key, value)
+        KEY_MANAGER.clear()
+
+
+@benchmark("encrypted_task")
+def encrypted_task_round_trip(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """Task content decryption and result encryption"""
+    count = context.scaled(ENCRYPTED_TASKS)
+    with _generated_keys():
+        content = json.dumps({"actions": [{"action": "trade", "symbol": "BTC/USDT"}] * 10})
+
+        def setup():
+            tasks = []
+            for i in range(count):
+                encrypted_content, metadata = encrypt_task_content(content)
+                tasks.append(Task(
+                    name=f"benchmark-{i}", type=TaskType.EXECUTE_ACTIONS.value,
+                    content=encrypted_content, content_metadata=metadata
+                ))
+            return tasks
+
+        def run(tasks):
+            for task in tasks:
+                with encrypted_task(task):
+                    task.result = {"orders": [], "transfers": []}
+
+        return [context.measure("encrypted_task", count, run, setup, tasks=count)]
+
+
+@benchmark("parse_csv")
+def parse_csv_rows(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """Tasks CSV file parsing"""
+    count = context.scaled(PARSED_CSV_ROWS)
+    file_path = os.path.join(context.work_dir, "tasks.csv")
+    with open(file_path, "w", encoding="utf-8", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(["name", "type", "exchange", "symbol", "content"])
+        for i in range(count):
+            writer.writerow([
+                f"benchmark-{i}", TaskType.EXECUTE_ACTIONS.value, "binance", "BTC/USDT",
+                json.dumps({"amount": i, "side": "buy"})
+            ])
+    return [context.measure("parse_csv", count, lambda _: parse_csv(file_path), rows=count)]
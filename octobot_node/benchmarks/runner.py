@@ -0,0 +1,179 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import dataclasses
+import json
+import logging
+import os
+import platform
+import shutil
+import tempfile
+import time
+import uuid
+from typing import Any, Callable, Optional
+
+import huey
+
+from octobot_node import VERSION
+from octobot_node.scheduler.scheduler import Scheduler
+
+BACKENDS = ("sqlite", "memory")
+DEFAULT_REPEAT = 3
+DEFAULT_TOLERANCE = 0.2
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    name: str
+    params: dict[str, Any]
+    operations: int
+    seconds: float
+
+    @property
+    def ops_per_second(self) -> float:
+        return self.operations / self.seconds if self.seconds > 0 else float("inf")
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}{json.dumps(self.params, sort_keys=True)}"
+
+    def to_dict(self) -> dict:
+        return {**dataclasses.asdict(self), "ops_per_second": self.ops_per_second}
+
+    @classmethod
+    def from_dict(cls, values: dict) -> "BenchmarkResult":
+        return cls(values["name"], values["params"], values["operations"], values["seconds"])
+
+
+@dataclasses.dataclass
+class Regression:
+    result: BenchmarkResult
+    baseline: BenchmarkResult
+
+    @property
+    def change(self) -> float:
+        return self.result.ops_per_second / self.baseline.ops_per_second - 1
+
+    def __str__(self) -> str:
+        return (
+            f"{self.result.key}: {self.result.ops_per_second:.1f} ops/s "
+            f"(baseline: {self.baseline.ops_per_second:.1f} ops/s, {self.change:+.1%})"
+        )
+
+
+@dataclasses.dataclass
+class BenchmarkContext:
+    backend: str
+    scale: float
+    repeat: int
+    work_dir: str
+
+    def scaled(self, count: int) -> int:
+        return max(1, int(count * self.scale))
+
+    def create_scheduler(self, name: str = "benchmark") -> Scheduler:
+        """
+        Returns a scheduler using its own huey instance of the benchmarked backend
+        """
+        scheduler = Scheduler()
+        if self.backend == "sqlite":
+            scheduler.INSTANCE = huey.SqliteHuey(
+                name, filename=os.path.join(self.work_dir, f"{name}-{uuid.uuid4().hex}.db")
+            )
+        else:
+            scheduler.INSTANCE = huey.MemoryHuey(name)
+        scheduler.create_index()
+        return scheduler
+
+    def measure(
+        self,
+        name: str,
+        operations: int,
+        run: Callable[[Any], None],
+        setup: Optional[Callable[[], Any]] = None,
+        **params
+    ) -> BenchmarkResult:
+        """
+        Runs setup (not measured) then run repeat times and keeps the fastest run
+        """
+        best = float("inf")
+        for _ in range(self.repeat):
+            state = setup() if setup else None
+            start = time.perf_counter()
+            run(state)
+            best = min(best, time.perf_counter() - start)
+        return BenchmarkResult(name, {"backend": self.backend, **params}, operations, best)
+
+
+BENCHMARKS: dict[str, Callable[[BenchmarkContext], list[BenchmarkResult]]] = {}
+
+
+def benchmark(name: str):
+    def register(func: Callable[[BenchmarkContext], list[BenchmarkResult]]):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+def run_benchmarks(
+    names: Optional[list[str]] = None,
+    backend: str = "sqlite",
+    scale: float = 1,
+    repeat: int = DEFAULT_REPEAT,
+) -> list[BenchmarkResult]:
+    logger = logging.getLogger("Benchmarks")
+    results: list[BenchmarkResult] = []
+    for name in names or list(BENCHMARKS):
+        if name not in BENCHMARKS:
+            raise ValueError(f"Unknown benchmark: {name}, available benchmarks: {', '.join(BENCHMARKS)}")
+        work_dir = tempfile.mkdtemp(prefix=f"octobot_node_benchmark_{name}_")
+        try:
+            benchmark_results = BENCHMARKS[name](BenchmarkContext(backend, scale, repeat, work_dir))
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        for result in benchmark_results:
+            logger.info(f"{result.key}: {result.ops_per_second:.1f} ops/s ({result.seconds:.3f}s)")
+        results.extend(benchmark_results)
+    return results
+
+
+def compare_to_baseline(
+    results: list[BenchmarkResult], baseline: list[BenchmarkResult], tolerance: float = DEFAULT_TOLERANCE
+) -> list[Regression]:
+    """
+    Returns the results that are slower than their baseline by more than tolerance
+    """
+    baseline_by_key = {result.key: result for result in baseline}
+    regressions = []
+    for result in results:
+        baseline_result = baseline_by_key.get(result.key)
+        if baseline_result is not None and result.ops_per_second < baseline_result.ops_per_second * (1 - tolerance):
+            regressions.append(Regression(result, baseline_result))
+    return regressions
+
+
+def dump_results(results: list[BenchmarkResult]) -> dict:
+    return {
+        "version": VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [result.to_dict() for result in results],
+    }
+
+
+def load_results(file_path: str) -> list[BenchmarkResult]:
+    with open(file_path, encoding="utf-8") as results_file:
+        return [BenchmarkResult.from_dict(values) for values in json.load(results_file)["results"]]
@@ -0,0 +1,167 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import pickle
+import threading
+import time
+
+from huey.storage import SqliteStorage
+
+from octobot_node.app.enums import TaskResultKeys
+from octobot_node.app.models import Task, TaskStatus, TaskType
+from octobot_node.benchmarks.runner import BenchmarkContext, BenchmarkResult, benchmark
+from octobot_node.scheduler.consumer import NodeConsumer
+from octobot_node.scheduler.scheduler import Scheduler
+
+ENQUEUED_TASKS = 1000
+BULK_ENQUEUED_TASKS = 10000
+DRAINED_TASKS = 1000
+DRAIN_WORKERS = (1, 4)
+DRAIN_TIMEOUT = 600
+LISTED_RESULTS = (10_000, 100_000, 1_000_000)
+PAGE_SIZE = 100
+POPULATE_BATCH_SIZE = 10_000
+
+
+def _register_task(scheduler: Scheduler):
+    @scheduler.INSTANCE.task(name="benchmark_task")
+    def benchmark_task(task: Task):
+        return {
+            TaskResultKeys.STATUS.value: TaskStatus.COMPLETED.value,
+            TaskResultKeys.RESULT.value: "ok",
+            TaskResultKeys.METADATA.value: None,
+            TaskResultKeys.TASK.value: {"name": task.name},
+            TaskResultKeys.ERROR.value: None,
+        }
+    return benchmark_task
+
+
+def _create_tasks(count: int) -> list[Task]:
+    return [
+        Task(name=f"benchmark-{i}", type=TaskType.START_OCTOBOT.value, content="{}")
+        for i in range(count)
+    ]
+
+
+@benchmark("enqueue")
+def enqueue(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """Tasks scheduled one by one"""
+    count = context.scaled(ENQUEUED_TASKS)
+
+    def setup():
+        return _register_task(context.create_scheduler()), _create_tasks(count)
+
+    def run(state):
+        benchmark_task, tasks = state
+        for task in tasks:
+            benchmark_task.schedule(args=[task], delay=1)
+
+    return [context.measure("enqueue", count, run, setup, tasks=count)]
+
+
+@benchmark("enqueue_many")
+def enqueue_many(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """Tasks enqueued in a single storage write, as trigger_tasks does"""
+    count = context.scaled(BULK_ENQUEUED_TASKS)
+
+    def setup():
+        scheduler = context.create_scheduler()
+        benchmark_task = _register_task(scheduler)
+        return scheduler, [benchmark_task.s(task) for task in _create_tasks(count)]
+
+    def run(state):
+        scheduler, scheduler_tasks = state
+        scheduler.enqueue_many(scheduler_tasks)
+
+    return [context.measure("enqueue_many", count, run, setup, tasks=count)]
+
+
+@benchmark("consumer_drain")
+def consumer_drain(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """Time for thread workers to execute already enqueued tasks"""
+    count = context.scaled(DRAINED_TASKS)
+    results = []
+    for workers in DRAIN_WORKERS:
+        def setup():
+            scheduler = context.create_scheduler()
+            benchmark_task = _register_task(scheduler)
+            scheduler.enqueue_many([benchmark_task.s(task) for task in _create_tasks(count)])
+            return scheduler
+
+        def run(scheduler):
+            consumer = NodeConsumer(
+                scheduler.INSTANCE, workers=workers, worker_type="thread", periodic=False,
+                initial_delay=0.001, max_delay=0.01, check_worker_health=False
+            )
+            thread = threading.Thread(target=consumer.run, daemon=True)
+            thread.start()
+            deadline = time.monotonic() + DRAIN_TIMEOUT
+            try:
+                while scheduler.INSTANCE.result_count() < count:
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"Consumer did not execute {count} tasks in {DRAIN_TIMEOUT} seconds")
+                    time.sleep(0.001)
+            finally:
+                consumer.stop(graceful=True)
+                thread.join()
+
+        results.append(context.measure("consumer_drain", count, run, setup, tasks=count, workers=workers))
+    return results
+
+
+def _populate_results(scheduler: Scheduler, count: int) -> None:
+    storage = scheduler.INSTANCE.storage
+    for start in range(0, count, POPULATE_BATCH_SIZE):
+        values = [
+            (
+                f"result-{i:09d}",
+                pickle.dumps({
+                    TaskResultKeys.STATUS.value: TaskStatus.COMPLETED.value,
+                    TaskResultKeys.RESULT.value: {"orders": [], "transfers": []},
+                    TaskResultKeys.METADATA.value: None,
+                    TaskResultKeys.TASK.value: {"name": f"benchmark-{i}"},
+                    TaskResultKeys.ERROR.value: None,
+                })
+            )
+            for i in range(start, min(start + POPULATE_BATCH_SIZE, count))
+        ]
+        if isinstance(storage, SqliteStorage):
+            with storage.db(commit=True) as curs:
+                curs.executemany(
+                    "insert into kv (queue, key, value) values (?, ?, ?)",
+                    [(storage.name, key, value) for key, value in values]
+                )
+        else:
+            for key, value in values:
+                storage.put_data(key, value)
+
+
+@benchmark("list_results")
+def list_results(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """Full results listing (as get_all_tasks does) and first page listing"""
+    results = []
+    for stored_results in LISTED_RESULTS:
+        count = context.scaled(stored_results)
+        scheduler = context.create_scheduler()
+        _populate_results(scheduler, count)
+        results.append(context.measure(
+            "list_results", count, lambda _: scheduler.get_results(), results=count
+        ))
+        results.append(context.measure(
+            "list_results_page", PAGE_SIZE, lambda _: scheduler.get_tasks_page(PAGE_SIZE), results=count
+        ))
+        scheduler.INSTANCE.storage.flush_results()
+    return results
@@ -14,8 +14,13 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 import argparse
+import atexit
+import json
+import os
+import shutil
 import sys
 import logging
+import tempfile
 
 try:
     import uvicorn
@@ -30,6 +35,15 @@ except ImportError:
 from octobot_node import PROJECT_NAME, LONG_VERSION
 
 
+def _patch_with_gevent():
+    try:
+        from gevent import monkey
+    except ImportError:
+        # the scheduler disables consumers when gevent is missing
+        return
+    monkey.patch_all()
+
+
 def start_server(args):
     logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)-8s %(name)-24s %(message)s")
     port = args.port or 8000
@@ -40,6 +54,8 @@ def start_server(args):
     if args.master:
         settings.IS_MASTER_MODE = True
     settings.SCHEDULER_WORKERS = args.consumers
+    if args.worker_type is not None:
+        settings.SCHEDULER_WORKER_TYPE = args.worker_type
 
     # Check that the node is either a master node or has consumers enabled
     if not settings.IS_MASTER_MODE and settings.SCHEDULER_WORKERS <= 0:
@@ -52,6 +68,10 @@ def start_server(args):
         )
         sys.exit(1)
 
+    if settings.SCHEDULER_WORKER_TYPE == "greenlet":
+        # greenlet workers only yield on patched blocking calls: patch before the scheduler is imported
+        _patch_with_gevent()
+
     from octobot_node.scheduler import CONSUMER
     
     if args.environment is not None:
@@ -83,6 +103,93 @@ def start_server(args):
     )
 
 
+def run_benchmarks(args):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)-8s %(name)-24s %(message)s")
+    # tasks executions are logged by huey at info level
+    logging.getLogger("huey").setLevel(logging.WARNING)
+
+    # This must be done before the scheduler module is imported: benchmarks never use the node database
+    from octobot_node.app.core.config import settings
+    settings.SCHEDULER_WORKERS = 0
+    database_dir = tempfile.mkdtemp(prefix="octobot_node_benchmark_")
+    atexit.register(shutil.rmtree, database_dir, True)
+    settings.SCHEDULER_SQLITE_FILE = os.path.join(database_dir, "tasks.db")
+
+    import octobot_node.benchmarks as benchmarks
+
+    try:
+        results = benchmarks.run_benchmarks(args.only, backend=args.backend, scale=args.scale, repeat=args.repeat)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    output = json.dumps(benchmarks.dump_results(results), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(output)
+    else:
+        print(output)
+
+    if args.baseline:
+        regressions = benchmarks.compare_to_baseline(
+            results, benchmarks.load_results(args.baseline), args.tolerance
+        )
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) slower than baseline:", file=sys.stderr)
+            for regression in regressions:
+                print(f"  - {regression}", file=sys.stderr)
+            sys.exit(1)
+        print("No regression compared to baseline", file=sys.stderr)
+
+
+def benchmark_parser(parser):
+    """Configure argument parser for the benchmark subcommand."""
+    parser.add_argument(
+        '--only',
+        help='Benchmarks to run (default: all). Available: enqueue, enqueue_many, consumer_drain, '
+             'list_results, encrypted_task, parse_csv.',
+        nargs='+',
+        default=None
+    )
+    parser.add_argument(
+        '--backend',
+        help='Scheduler storage backend to benchmark (default: sqlite).',
+        type=str,
+        choices=['sqlite', 'memory'],
+        default='sqlite'
+    )
+    parser.add_argument(
+        '--scale',
+        help='Multiplier applied to the number of benchmarked items (default: 1).',
+        type=float,
+        default=1
+    )
+    parser.add_argument(
+        '--repeat',
+        help='Number of runs of each benchmark, the fastest one is kept (default: 3).',
+        type=int,
+        default=3
+    )
+    parser.add_argument(
+        '--output',
+        help='File to write JSON results to (default: stdout).',
+        type=str,
+        default=None
+    )
+    parser.add_argument(
+        '--baseline',
+        help='JSON results file to compare to: exits with an error when a benchmark is slower than its baseline.',
+        type=str,
+        default=None
+    )
+    parser.add_argument(
+        '--tolerance',
+        help='Allowed slowdown ratio compared to the baseline (default: 0.2).',
+        type=float,
+        default=0.2
+    )
+    parser.set_defaults(func=run_benchmarks)
+
+
 def octobot_node_parser(parser):
     """Configure argument parser for OctoBot-Node CLI."""
     parser.add_argument(
@@ -113,6 +220,14 @@ def octobot_node_parser(parser):
         type=int,
         default=0
     )
+    parser.add_argument(
+        '--worker-type',
+        help='Consumer workers type: thread, process (one process per worker, for CPU-bound tasks) '
+             'or greenlet (requires gevent). Default: from SCHEDULER_WORKER_TYPE environment variable or thread.',
+        type=str,
+        choices=['thread', 'process', 'greenlet'],
+        default=None
+    )
     parser.add_argument(
         '--environment',
         help='Environment mode: local or production (default: from ENVIRONMENT environment variable). Auto-reload is enabled when environment is local.',
@@ -138,6 +253,10 @@ def octobot_node_parser(parser):
         action='store_true'
     )
     parser.set_defaults(func=start_octobot_node)
+    subparsers = parser.add_subparsers(title='commands')
+    benchmark_parser(subparsers.add_parser(
+        'benchmark', help='Run the scheduler, consumer and encryption benchmarks and output JSON results.'
+    ))
 
 
 def start_octobot_node(args):
@@ -13,3 +13,12 @@
 #
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+# Response header holding the opaque cursor of the next tasks page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Number of NDJSON tasks enqueued per storage write on bulk submissions
+BULK_TASKS_CHUNK_SIZE = 1000
+
+# Number of task results read per storage call on results exports
+RESULTS_EXPORT_BATCH_SIZE = 500
@@ -18,13 +18,27 @@ import logging
 
 from octobot_node.app.core.config import settings
 from octobot_node.scheduler.scheduler import Scheduler
+from octobot_node.scheduler.async_storage import AsyncSchedulerStorage
 from octobot_node.scheduler.consumer import SchedulerConsumer
+from octobot_node.scheduler.node_registry import NodeHeartbeatPublisher, get_default_node_id
+from octobot_node.scheduler.task_events import TaskEventBus, create_task_event_bus
+from octobot_node.scheduler.result_waiter import TaskResultWaiter
 
 scheduler_logger = logging.getLogger(__name__)
 
 SCHEDULER: Scheduler = Scheduler()
 SCHEDULER.create()
 CONSUMER: SchedulerConsumer = SchedulerConsumer(SCHEDULER)
+ASYNC_STORAGE: AsyncSchedulerStorage = AsyncSchedulerStorage(SCHEDULER, settings.SCHEDULER_API_EXECUTOR_WORKERS)
+NODE_HEARTBEAT: NodeHeartbeatPublisher = NodeHeartbeatPublisher(
+    SCHEDULER.INSTANCE, SCHEDULER.nodes,
+    settings.SCHEDULER_NODE_ID or get_default_node_id(), settings.SCHEDULER_NODE_HEARTBEAT_INTERVAL
+)
+NODE_HEARTBEAT.connect()
+TASK_EVENTS: TaskEventBus = create_task_event_bus(SCHEDULER.INSTANCE, ASYNC_STORAGE.get_redis_client)
+if settings.SCHEDULER_TASK_EVENTS_ENABLED:
+    SCHEDULER.index_updater.add_listener(TASK_EVENTS.on_status_changes)
+RESULT_WAITER: TaskResultWaiter = TaskResultWaiter(ASYNC_STORAGE, TASK_EVENTS.broadcaster)
 
 # Import tasks to register them with the scheduler
 from octobot_node.scheduler import tasks  # noqa: F401
@@ -14,12 +14,23 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
+import datetime
 import logging
 import uuid
-from typing import Any
+from typing import Any, Iterator, Optional
+
+from huey.constants import EmptyData
+from huey.utils import Error as HueyError
 
 from octobot_node.app.core.config import settings
-from octobot_node.scheduler import SCHEDULER, CONSUMER
+from octobot_node.app.models import TaskStatus
+from octobot_node.constants import RESULTS_EXPORT_BATCH_SIZE
+from octobot_node.scheduler import SCHEDULER, CONSUMER, NODE_HEARTBEAT, ASYNC_STORAGE, RESULT_WAITER
+from octobot_node.scheduler.pagination import TaskCursor
+from octobot_node.scheduler.results_export import ExportFormat, iter_export_chunks
+from octobot_node.scheduler.task_index import TaskIndexEntry
+from octobot_node.scheduler.tasks import TASK_GRAPH_RUNNER
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +41,7 @@ def get_node_status() -> dict[str, str | int | None | uuid.UUID]:
     status = "running" if is_running else "stopped"
 
     backend_type = "redis" if settings.SCHEDULER_REDIS_URL else "sqlite"
-    workers = CONSUMER.workers if settings.SCHEDULER_WORKERS > 0 else None
+    workers = CONSUMER.get_workers() if settings.SCHEDULER_WORKERS > 0 else None
 
     if settings.IS_MASTER_MODE and settings.SCHEDULER_WORKERS > 0:
         node_type = "both"
@@ -45,27 +56,52 @@ def get_node_status() -> dict[str, str | int | None | uuid.UUID]:
         "node_type": node_type,
         "backend_type": backend_type,
         "workers": workers,
+        "worker_type": CONSUMER.worker_type,
         "status": status,
         "redis_url": str(settings.SCHEDULER_REDIS_URL) if settings.SCHEDULER_REDIS_URL else None,
         "sqlite_file": settings.SCHEDULER_SQLITE_FILE if not settings.SCHEDULER_REDIS_URL else None,
     }
 
 
-def get_task_metrics() -> dict[str, int]:
+def get_nodes() -> list[dict[str, Any]]:
+    try:
+        if NODE_HEARTBEAT.store is None:
+            logger.warning("Scheduler instance not initialized")
+            return []
+        return NODE_HEARTBEAT.list_nodes()
+    except Exception as e:
+        logger.error("Failed to retrieve nodes from scheduler: %s", e)
+        return []
+
+
+def get_task_metrics() -> dict[str, Any]:
     try:
         huey_instance = SCHEDULER.INSTANCE
         if huey_instance is None:
             logger.warning("Scheduler instance not initialized")
             return {"pending": 0, "scheduled": 0, "results": 0}
 
-        scheduled_count = huey_instance.scheduled_count()
-        periodic_tasks = SCHEDULER.get_periodic_tasks()
-        scheduled_count += len(periodic_tasks)
+        periodic_count = SCHEDULER.get_periodic_tasks_count()
+        if SCHEDULER.metrics is None:
+            return {
+                "pending": huey_instance.pending_count(),
+                "scheduled": huey_instance.scheduled_count() + periodic_count,
+                "results": huey_instance.result_count(),
+            }
 
+        metrics = SCHEDULER.metrics.get_metrics()
+        by_status = metrics["by_status"]
         return {
-            "pending": huey_instance.pending_count(),
-            "scheduled": scheduled_count,
+            "pending": by_status[TaskStatus.PENDING],
+            "scheduled": by_status[TaskStatus.SCHEDULED] + periodic_count,
+            # stored results are popped when read: count them in the storage rather than from status counters
             "results": huey_instance.result_count(),
+            "periodic": periodic_count,
+            "running": by_status[TaskStatus.RUNNING],
+            "completed": by_status[TaskStatus.COMPLETED],
+            "failed": by_status[TaskStatus.FAILED],
+            "by_type": metrics["by_type"],
+            "events": metrics["events"],
         }
     except Exception as e:
         logger.error("Failed to retrieve task metrics from scheduler: %s", e)
@@ -81,6 +117,9 @@ def get_all_tasks() -> list[dict[str, Any]]:
         pending_tasks = SCHEDULER.get_pending_tasks()
         tasks.extend(pending_tasks)
 
+        running_tasks = SCHEDULER.get_running_tasks()
+        tasks.extend(running_tasks)
+
         scheduled_tasks = SCHEDULER.get_scheduled_tasks()
         tasks.extend(scheduled_tasks)
 
@@ -93,16 +132,128 @@ def get_all_tasks() -> list[dict[str, Any]]:
     return tasks
 
 
-async def get_task_result(task_id: str):
-    res = SCHEDULER.INSTANCE.result(task_id)
+def get_tasks_page(
+    limit: int,
+    cursor: Optional[str] = None,
+    statuses: Optional[list[TaskStatus]] = None,
+    page: int = 1,
+) -> tuple[list[dict[str, Any]], Optional[str]]:
+    """
+    Returns a page of tasks and the opaque cursor of the next page.
+    When no cursor is given, the listing starts at the given page.
+    Raises InvalidCursorError when cursor can't be decoded.
+    """
+    task_cursor = TaskCursor.decode(cursor) if cursor else None
+    offset = 0 if task_cursor else max(page - 1, 0) * limit
+    try:
+        tasks, next_cursor = SCHEDULER.get_tasks_page(
+            limit, cursor=task_cursor, statuses=set(statuses) if statuses else None, offset=offset
+        )
+    except Exception as e:
+        logger.error("Failed to retrieve tasks page from scheduler: %s", e)
+        return [], None
+    return tasks, next_cursor.encode() if next_cursor else None
 
-    if res is None:
-        return {"error": "task not found"}
 
-    # True if finished
-    if res.ready():          
-        # blocks if not ready, or returns the value                        
-        result_data = res.get()
-        return {"status": "completed", "data": result_data}
-    else:
-        return {"status": "pending or running"}
+def get_task(task_id: str) -> Optional[dict[str, Any]]:
+    try:
+        return SCHEDULER.get_indexed_task(task_id)
+    except Exception as e:
+        logger.error("Failed to retrieve task %s from scheduler: %s", task_id, e)
+        return None
+
+
+async def get_task_async(task_id: str) -> Optional[dict[str, Any]]:
+    """
+    Same as get_task without blocking the event loop
+    """
+    try:
+        return await ASYNC_STORAGE.get_indexed_task(task_id)
+    except Exception as e:
+        logger.error("Failed to retrieve task %s from scheduler: %s", task_id, e)
+        return None
+
+
+def find_tasks_by_name(name: str, limit: int = 100) -> list[dict[str, Any]]:
+    try:
+        return SCHEDULER.find_indexed_tasks(name, limit)
+    except Exception as e:
+        logger.error("Failed to find tasks named %s from scheduler: %s", name, e)
+        return []
+
+
+async def get_task_result(task_id: str, wait: float = 0) -> dict[str, Any]:
+    return (await get_task_results([task_id], wait))[task_id]
+
+
+async def get_task_results(task_ids: list[str], wait: float = 0) -> dict[str, dict[str, Any]]:
+    """
+    Returns the result of each task, waiting up to wait seconds for the unfinished ones to finish
+    """
+    try:
+        wait = min(wait, settings.SCHEDULER_TASK_RESULT_MAX_WAIT)
+        entries = dict(zip(task_ids, await asyncio.gather(
+            *(ASYNC_STORAGE.get_index_entry(task_id) for task_id in task_ids)
+        )))
+        # unknown tasks might only have a result: don't wait for them
+        known_values, unknown_values = await asyncio.gather(
+            RESULT_WAITER.wait([task_id for task_id in task_ids if entries[task_id] is not None], wait),
+            RESULT_WAITER.wait([task_id for task_id in task_ids if entries[task_id] is None]),
+        )
+        values = {**known_values, **unknown_values}
+        return {
+            task_id: await _build_task_result(task_id, entries[task_id], values[task_id])
+            for task_id in task_ids
+        }
+    except Exception as e:
+        logger.error("Failed to retrieve results of %d tasks from scheduler: %s", len(task_ids), e)
+        return {task_id: {"error": "failed to retrieve task result"} for task_id in task_ids}
+
+
+async def _build_task_result(task_id: str, entry: Optional[TaskIndexEntry], value: Any) -> dict[str, Any]:
+    if value is EmptyData:
+        if entry is None:
+            return {"error": "task not found"}
+        return {"status": entry.status.value if entry.status else "pending or running"}
+    # unpickling results can be slow
+    _, result = await ASYNC_STORAGE.run(SCHEDULER.decode_result, task_id, value)
+    if isinstance(result, HueyError):
+        return {"status": TaskStatus.FAILED.value, "error": result.metadata.get("error")}
+    return {"status": TaskStatus.COMPLETED.value, "data": result}
+
+
+def iter_task_results_export(
+    export_format: ExportFormat,
+    statuses: set[TaskStatus],
+    since: Optional[datetime.datetime] = None,
+    until: Optional[datetime.datetime] = None,
+    name: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    Yields the export of the stored task results, one chunk per RESULTS_EXPORT_BATCH_SIZE tasks
+    """
+    batches = SCHEDULER.iter_results(
+        statuses, _get_timestamp(since), _get_timestamp(until), name, RESULTS_EXPORT_BATCH_SIZE
+    )
+    try:
+        yield from iter_export_chunks(batches, export_format)
+    except Exception as e:
+        # the response already started: abort it so that clients don't take a truncated export as complete
+        logger.error("Failed to export task results from scheduler: %s", e)
+        raise
+
+
+def _get_timestamp(value: Optional[datetime.datetime]) -> Optional[float]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value.timestamp()
+
+
+def get_task_graph(graph_id: str) -> Optional[dict[str, Any]]:
+    try:
+        return TASK_GRAPH_RUNNER.get_status(graph_id, SCHEDULER.index)
+    except Exception as e:
+        logger.error("Failed to retrieve task graph %s from scheduler: %s", graph_id, e)
+        return None
@@ -0,0 +1,131 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import concurrent.futures
+import functools
+import threading
+from typing import Any, AsyncIterator, Callable, Generator, Optional
+
+from huey.constants import EmptyData
+from huey.storage import RedisStorage
+
+from octobot_node.app.core.config import settings
+from octobot_node.scheduler.scheduler import Scheduler, get_redis_connection_kwargs
+from octobot_node.scheduler.task_index import RedisTaskIndex, TaskIndexEntry
+
+_END = object()
+
+
+class AsyncSchedulerStorage:
+    """
+    Non blocking access to the scheduler storage for async API routes.
+    On redis, single task reads use redis.asyncio. Other storage calls (sqlite queries, listings, results unpickling)
+    run in a dedicated executor instead of the Starlette threadpool shared by sync routes.
+    """
+
+    def __init__(self, scheduler: Scheduler, max_workers: int):
+        self.scheduler: Scheduler = scheduler
+        self.max_workers: int = max_workers
+        self.lock = threading.Lock()
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._redis = None
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Runs the blocking func in the scheduler executor
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._get_executor(), functools.partial(func, *args, **kwargs)
+        )
+
+    async def iterate(self, generator: Generator) -> AsyncIterator:
+        """
+        Iterates the blocking generator in the scheduler executor and closes it when the iteration stops,
+        including when the consumer is cancelled
+        """
+        # a step still running in the executor when the iteration is cancelled finishes before closing
+        lock = threading.Lock()
+
+        def _next():
+            with lock:
+                return next(generator, _END)
+
+        def _close():
+            with lock:
+                generator.close()
+
+        try:
+            while (item := await self.run(_next)) is not _END:
+                yield item
+        finally:
+            await self.run(_close)
+
+    async def peek_result(self, task_id: str) -> Any:
+        """
+        Returns the stored result value of task_id without consuming it, EmptyData when there is none
+        """
+        client = self.get_redis_client()
+        if client is None:
+            return await self.run(self.scheduler.INSTANCE.storage.peek_data, task_id)
+        value = await client.hget(self.scheduler.INSTANCE.storage.result_key, task_id)
+        return EmptyData if value is None else value
+
+    async def get_index_entry(self, task_id: str) -> Optional[TaskIndexEntry]:
+        if self.scheduler.index is None:
+            return None
+        client = self.get_redis_client()
+        if client is None or not isinstance(self.scheduler.index, RedisTaskIndex):
+            return await self.run(self.scheduler.index.get, task_id)
+        return await self.scheduler.index.get_async(client, task_id)
+
+    async def get_indexed_task(self, task_id: str) -> Optional[dict]:
+        """
+        Same as Scheduler.get_indexed_task
+        """
+        entry, value = await asyncio.gather(self.get_index_entry(task_id), self.peek_result(task_id))
+        if value is EmptyData:
+            return self.scheduler.build_indexed_task(task_id, entry, value)
+        # unpickling results can be slow
+        return await self.run(self.scheduler.build_indexed_task, task_id, entry, value)
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self.lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="scheduler-api"
+                )
+            return self._executor
+
+    def get_redis_client(self):
+        if not isinstance(self.scheduler.INSTANCE.storage, RedisStorage) or not settings.SCHEDULER_REDIS_URL:
+            return None
+        with self.lock:
+            if self._redis is None:
+                import redis.asyncio
+                self._redis = redis.asyncio.Redis.from_url(
+                    str(settings.SCHEDULER_REDIS_URL), **get_redis_connection_kwargs()
+                )
+            return self._redis
+
+    async def close(self) -> None:
+        with self.lock:
+            executor, self._executor = self._executor, None
+            client, self._redis = self._redis, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if client is not None:
+            await client.aclose()
@@ -0,0 +1,177 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import dataclasses
+import math
+import os
+import time
+from typing import Optional
+
+import huey
+
+from octobot_node.app.core.config import settings
+from octobot_node.app.models import TaskStatus
+from octobot_node.scheduler.task_index import TaskIndex
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+EXECUTED_STATUSES = {TaskStatus.COMPLETED, TaskStatus.FAILED}
+RECENT_EXECUTIONS_COUNT = 50
+# the load has to fit in the remaining workers with this margin before a worker is removed
+SCALE_DOWN_LOAD_RATIO = 0.5
+
+
+@dataclasses.dataclass
+class AutoscalePolicy:
+    min_workers: int
+    max_workers: Optional[int] = None
+    interval: float = 5  # seconds between scaling decisions
+    pending_per_worker: int = 10
+    max_wait: float = 30  # seconds the oldest pending task can wait before adding workers
+    scale_down_delay: float = 60  # seconds of low load before removing a worker
+    worker_max_memory: Optional[int] = None  # bytes, only applied to process workers
+
+    @classmethod
+    def from_settings(cls) -> "AutoscalePolicy":
+        return cls(
+            min_workers=settings.SCHEDULER_WORKERS,
+            max_workers=settings.SCHEDULER_AUTOSCALE_MAX_WORKERS,
+            interval=settings.SCHEDULER_AUTOSCALE_INTERVAL,
+            pending_per_worker=settings.SCHEDULER_AUTOSCALE_PENDING_PER_WORKER,
+            max_wait=settings.SCHEDULER_AUTOSCALE_MAX_WAIT,
+            scale_down_delay=settings.SCHEDULER_AUTOSCALE_SCALE_DOWN_DELAY,
+            worker_max_memory=(
+                None if settings.SCHEDULER_AUTOSCALE_WORKER_MAX_MEMORY is None
+                else settings.SCHEDULER_AUTOSCALE_WORKER_MAX_MEMORY * 1024 * 1024
+            ),
+        )
+
+    def is_enabled(self) -> bool:
+        return self.max_workers is not None and self.max_workers > self.min_workers > 0
+
+
+@dataclasses.dataclass
+class AutoscaleSample:
+    pending: int
+    oldest_pending_age: float = 0
+    mean_execution_time: Optional[float] = None
+    worker_memory: Optional[int] = None  # bytes
+
+
+class ConsumerAutoscaler:
+    """
+    Computes the consumer workers count from the queue depth, the oldest pending task age and recent execution times.
+    Workers are added as soon as the load requires it but are removed one at a time after scale_down_delay
+    seconds of low load, which avoids flapping when the load oscillates around a threshold.
+    """
+
+    def __init__(self, policy: AutoscalePolicy, task_index: Optional[TaskIndex] = None):
+        self.policy: AutoscalePolicy = policy
+        self.task_index: Optional[TaskIndex] = task_index
+        self._low_load_since: Optional[float] = None
+
+    def sample(self, huey_instance: huey.Huey, worker_pids: Optional[list[int]] = None) -> AutoscaleSample:
+        """
+        worker_pids are the process ids of process workers: the mean of their memory is compared to the memory cap
+        """
+        sample = AutoscaleSample(pending=huey_instance.pending_count())
+        if self.task_index is not None:
+            sample.oldest_pending_age = self._get_oldest_pending_age()
+            sample.mean_execution_time = self._get_mean_execution_time()
+        if self.policy.worker_max_memory is not None and worker_pids:
+            memories = [memory for memory in map(get_process_memory, worker_pids) if memory is not None]
+            sample.worker_memory = sum(memories) // len(memories) if memories else None
+        return sample
+
+    def get_target(self, workers: int, sample: AutoscaleSample, now: Optional[float] = None) -> int:
+        now = time.monotonic() if now is None else now
+        if self._is_over_memory(sample):
+            # workers use too much memory: shrink the pool instead of growing it
+            self._low_load_since = None
+            return max(workers - 1, self.policy.min_workers)
+        target = self._get_load_target(workers, sample, 1)
+        if target > workers:
+            self._low_load_since = None
+            return target
+        if self._get_load_target(workers, sample, SCALE_DOWN_LOAD_RATIO) >= workers:
+            self._low_load_since = None
+            return workers
+        if self._low_load_since is None:
+            self._low_load_since = now
+        elif now - self._low_load_since >= self.policy.scale_down_delay:
+            # restart the delay to remove the next worker
+            self._low_load_since = now
+            return max(workers - 1, self.policy.min_workers)
+        return workers
+
+    def _get_load_target(self, workers: int, sample: AutoscaleSample, load_ratio: float) -> int:
+        target = self.policy.min_workers
+        if sample.pending:
+            target = max(target, math.ceil(sample.pending / (self.policy.pending_per_worker * load_ratio)))
+            if sample.mean_execution_time:
+                # workers required to drain the queue within max_wait
+                target = max(target, math.ceil(
+                    sample.pending * sample.mean_execution_time / (self.policy.max_wait * load_ratio)
+                ))
+        if sample.oldest_pending_age > self.policy.max_wait * load_ratio:
+            target = max(target, workers + 1 if load_ratio >= 1 else workers)
+        return min(target, self.policy.max_workers)
+
+    def _is_over_memory(self, sample: AutoscaleSample) -> bool:
+        return (
+            self.policy.worker_max_memory is not None
+            and sample.worker_memory is not None
+            and sample.worker_memory > self.policy.worker_max_memory
+        )
+
+    def _get_oldest_pending_age(self) -> float:
+        entries = self.task_index.list_entries({TaskStatus.PENDING}, 0, 1)
+        if not entries or entries[0].created_at is None:
+            return 0
+        # scheduled tasks only become ready at their eta
+        ready_at = max(entries[0].created_at, entries[0].eta or 0)
+        return max(time.time() - ready_at, 0)
+
+    def _get_mean_execution_time(self) -> Optional[float]:
+        # entries are sorted by completion time: the most recent ones are the last ones
+        offset = max(self.task_index.count(EXECUTED_STATUSES) - RECENT_EXECUTIONS_COUNT, 0)
+        durations = [
+            entry.completed_at - entry.started_at
+            for entry in self.task_index.list_entries(EXECUTED_STATUSES, offset, RECENT_EXECUTIONS_COUNT)
+            if entry.started_at is not None and entry.completed_at is not None
+        ]
+        return sum(durations) / len(durations) if durations else None
+
+
+def get_process_memory(pid: Optional[int] = None) -> Optional[int]:
+    """
+    Returns the resident memory of the pid process, the node process by default, in bytes.
+    Returns None when it can't be read.
+    """
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return None
+    try:
+        # linux fallback: resident pages are the second value of statm
+        with open(f"/proc/{'self' if pid is None else pid}/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
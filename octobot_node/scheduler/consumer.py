@@ -14,13 +14,237 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
+import contextvars
 import logging
+import os
+import sys
 import threading
+import time
+import weakref
+from typing import Any, Coroutine, Optional
 
 from octobot_node.app.core.config import settings
 
+from octobot_node.scheduler.autoscaler import AutoscalePolicy, ConsumerAutoscaler
 from octobot_node.scheduler.scheduler import Scheduler
-from huey.constants import WORKER_THREAD
+from huey.consumer import Consumer, Worker, WorkerRecycle
+from huey.constants import WORKER_GREENLET, WORKER_PROCESS, WORKER_THREAD
+from huey.storage import BaseSqlStorage
+
+
+class WorkerRetired(WorkerRecycle):
+    """
+    Raised by retired workers: huey exits the worker loop on WorkerRecycle, without reporting it as dead
+    """
+
+
+class NodeWorker(Worker):
+    """
+    Huey worker that exits after its current task once its retire_flag is set, used to shrink the workers pool
+    """
+
+    def __init__(self, *args, retire_flag=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.retire_flag = retire_flag
+
+    def loop(self, now=None):
+        if self.retire_flag is not None and self.retire_flag.is_set():
+            self._logger.info("Worker stopped (workers pool scaled down).")
+            raise WorkerRetired()
+        super().loop(now)
+
+
+class NodeConsumer(Consumer):
+    """
+    Huey consumer that can run outside of the main thread: signal handlers
+    can only be set from the main thread, the node stops the consumer through SchedulerConsumer.stop() instead.
+    Running the consumer loop keeps the workers health checks, which respawn crashed workers.
+    When an autoscaler is given, the consumer loop also grows and shrinks the workers pool.
+    """
+    worker_class = NodeWorker
+
+    def __init__(self, huey_instance, autoscaler: Optional[ConsumerAutoscaler] = None, **kwargs):
+        super().__init__(huey_instance, **kwargs)
+        self.autoscaler: Optional[ConsumerAutoscaler] = autoscaler
+        # workers removed from the pool that may still be completing their last task
+        self.retired_worker_threads: list = []
+        self._autoscale_ts: float = time.monotonic()
+        if self.worker_type == WORKER_PROCESS:
+            _make_fork_safe(self.huey.storage)
+            for lane_storage in getattr(self.huey.storage, "lane_storages", {}).values():
+                _make_fork_safe(lane_storage)
+
+    def _create_worker(self):
+        return self.worker_class(
+            huey=self.huey,
+            stop_flag=self.stop_flag,
+            default_delay=self.default_delay,
+            max_delay=self.max_delay,
+            backoff=self.backoff,
+            max_tasks=self.max_tasks,
+            retire_flag=self.environment.get_stop_flag(),
+        )
+
+    def loop(self, health_check_ts=None):
+        health_check_ts = super().loop(health_check_ts)
+        if self.autoscaler is not None:
+            now = time.monotonic()
+            if now >= self._autoscale_ts + self.autoscaler.policy.interval:
+                self._autoscale_ts = now
+                self.autoscale()
+        return health_check_ts
+
+    def autoscale(self) -> None:
+        workers = len(self.worker_threads)
+        # the memory of thread and greenlet workers is shared: retiring them would not free it
+        worker_pids = (
+            [worker_t.pid for _, worker_t in self.worker_threads] if self.worker_type == WORKER_PROCESS else None
+        )
+        try:
+            sample = self.autoscaler.sample(self.huey, worker_pids)
+        except Exception as e:
+            self._logger.exception(f"Failed to sample the consumer load: {e}")
+            return
+        target = self.autoscaler.get_target(workers, sample)
+        if target != workers:
+            self._logger.info(
+                f"Scaling workers from {workers} to {target} (pending: {sample.pending}, "
+                f"oldest pending age: {sample.oldest_pending_age:.1f}s, "
+                f"mean execution time: {sample.mean_execution_time}, worker memory: {sample.worker_memory})"
+            )
+            self.scale_to(target)
+
+    def scale_to(self, workers: int) -> None:
+        self.retired_worker_threads = [
+            (worker, worker_t) for worker, worker_t in self.retired_worker_threads
+            if self.environment.is_alive(worker_t)
+        ]
+        while len(self.worker_threads) < workers:
+            worker = self._create_worker()
+            worker_t = self._create_process(worker, f"Worker-{len(self.worker_threads) + 1}")
+            worker_t.start()
+            self.worker_threads.append((worker, worker_t))
+        while len(self.worker_threads) > workers:
+            worker, worker_t = self.worker_threads.pop()
+            worker.retire_flag.set()
+            self.retired_worker_threads.append((worker, worker_t))
+        self.workers = len(self.worker_threads)
+
+    def stop(self, graceful=False):
+        # wait for retired workers completing their last task as well
+        self.worker_threads = self.worker_threads + self.retired_worker_threads
+        self.retired_worker_threads = []
+        super().stop(graceful=graceful)
+
+    def _set_signal_handlers(self):
+        if threading.current_thread() is threading.main_thread():
+            super()._set_signal_handlers()
+        else:
+            self._logger.debug("Consumer running outside of the main thread: signal handlers are not set")
+
+
+# sqlite storages shared with forked process workers, see _make_fork_safe
+_FORK_SAFE_STORAGES = weakref.WeakSet()
+_forking_storages: list = []
+
+
+def _before_fork() -> None:
+    _forking_storages.extend(_FORK_SAFE_STORAGES)
+    for storage in _forking_storages:
+        storage.lock.acquire()
+
+
+def _after_fork_in_parent() -> None:
+    while _forking_storages:
+        _forking_storages.pop().lock.release()
+
+
+def _after_fork_in_child() -> None:
+    while _forking_storages:
+        storage = _forking_storages.pop()
+        storage._conn = None
+        storage.lock.release()
+
+
+os.register_at_fork(
+    before=_before_fork, after_in_parent=_after_fork_in_parent, after_in_child=_after_fork_in_child
+)
+
+
+def _make_fork_safe(storage) -> None:
+    """
+    Process workers are forked from the node process where other threads share the sqlite connection:
+    fork while no thread is using it and let the child process open its own connection.
+    """
+    if isinstance(storage, BaseSqlStorage):
+        # redis connection pools already reset themselves in forked processes
+        _FORK_SAFE_STORAGES.add(storage)
+
+
+def _is_gevent_patched() -> bool:
+    monkey = sys.modules.get("gevent.monkey")
+    return monkey is not None and monkey.is_module_patched("socket")
+
+
+class ConsumerEventLoop:
+    """
+    Long-lived asyncio event loop running in its own thread, shared by the workers of a consumer process.
+    Async tasks are submitted to it instead of creating a loop per job, which allows loop-bound
+    resources (such as HTTP sessions) to be reused.
+    Huey stores results and runs retries and post execute hooks from the worker executing the task:
+    each worker waits for its coroutine to complete, async tasks run concurrently up to the workers count.
+    """
+
+    def __init__(self):
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def run(self, coroutine: Coroutine) -> Any:
+        """
+        Runs coroutine in the event loop and blocks the calling worker until it completes
+        """
+        loop = self._get_loop()
+        # the coroutine sees the context variables of the calling worker, such as its current task id
+        context = contextvars.copy_context()
+        return asyncio.run_coroutine_threadsafe(self._run_in_context(coroutine, context), loop).result()
+
+    async def _run_in_context(self, coroutine: Coroutine, context: contextvars.Context) -> Any:
+        return await context.run(asyncio.get_running_loop().create_task, coroutine)
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self.lock:
+            # process workers are forked: the loop thread only exists in the process that started it
+            if self.loop is None or self._pid != os.getpid():
+                self._start()
+            return self.loop
+
+    def _start(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._pid = os.getpid()
+        self.thread = threading.Thread(
+            target=self.loop.run_forever,
+            name="scheduler-consumer-event-loop",
+            daemon=True,
+        )
+        self.thread.start()
+        self.logger.info("Consumer event loop started")
+
+    def stop(self) -> None:
+        with self.lock:
+            if self.loop is None or self._pid != os.getpid():
+                return
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout=5)
+            if not self.thread.is_alive():
+                self.loop.close()
+            self.loop = None
+            self.thread = None
+            self.logger.info("Consumer event loop stopped")
+
 
 class SchedulerConsumer:
     def __init__(self, scheduler: Scheduler):
@@ -30,6 +254,8 @@ class SchedulerConsumer:
         self.lock = threading.Lock()
         self.logger = logging.getLogger(__name__)
         self.workers: int | None = None
+        self.worker_type: str | None = None
+        self.event_loop: ConsumerEventLoop | None = None
     
     def start(self):
         with self.lock:
@@ -44,9 +270,8 @@ class SchedulerConsumer:
         self.logger.info("Starting consumer...")
         try:
             self.consumer.run()
-        except ValueError as e:
-            # Ignore `ValueError: signal only works in main thread of the main interpreter``
-            self.logger.debug(f"ValueError ignored when starting consumer: {e}")
+        except Exception as e:
+            self.logger.exception(f"Scheduler consumer stopped unexpectedly: {e}")
 
     def start_thread(self) -> None:
         if settings.SCHEDULER_WORKERS <= 0:
@@ -54,15 +279,45 @@ class SchedulerConsumer:
             self.workers = None
             return
         self.logger.info(f"Starting {settings.SCHEDULER_WORKERS} scheduler consumer")
-        self.workers = settings.SCHEDULER_WORKERS
         config_values = {
-            "worker_type": WORKER_THREAD,
-            "workers": self.workers,
+            "worker_type": settings.SCHEDULER_WORKER_TYPE,
+            "workers": settings.SCHEDULER_WORKERS,
+            "check_worker_health": True,
+            "health_check_interval": settings.SCHEDULER_HEALTH_CHECK_INTERVAL,
+            "shutdown_timeout": settings.SCHEDULER_SHUTDOWN_TIMEOUT,
         }
-        self.consumer = self.scheduler.INSTANCE.create_consumer(**config_values)
+        policy = AutoscalePolicy.from_settings()
+        if policy.is_enabled():
+            config_values["autoscaler"] = ConsumerAutoscaler(policy, self.scheduler.index)
+            self.logger.info(f"Workers autoscaling enabled (max workers: {policy.max_workers})")
+        if settings.SCHEDULER_WORKER_TYPE == WORKER_GREENLET and not _is_gevent_patched():
+            # greenlet workers only yield on gevent patched blocking calls
+            self.logger.error(
+                "Impossible to start greenlet workers: gevent is not installed or did not patch the node, "
+                "use the --worker-type greenlet option to start the node. Consumers are disabled."
+            )
+            return
+        lanes = getattr(self.scheduler.INSTANCE.storage, "lanes", None)
+        if settings.SCHEDULER_WORKER_TYPE != WORKER_THREAD and lanes is not None and lanes.has_max_concurrency():
+            # lanes running tasks are counted in memory: processes and greenlets can't share these counts
+            self.logger.error(
+                f"SCHEDULER_LANE_MAX_CONCURRENCY is not supported by {settings.SCHEDULER_WORKER_TYPE} workers, "
+                f"use thread workers or remove it. Consumers are disabled."
+            )
+            return
+        try:
+            self.consumer = NodeConsumer(self.scheduler.INSTANCE, **config_values)
+        except ImportError as e:
+            # greenlet workers require gevent
+            self.logger.error(
+                f"Impossible to start {settings.SCHEDULER_WORKER_TYPE} workers: {e}. Consumers are disabled."
+            )
+            return
+        self.workers = settings.SCHEDULER_WORKERS
+        self.worker_type = settings.SCHEDULER_WORKER_TYPE
+        self.event_loop = ConsumerEventLoop()
         self.logger.info(
-            f"Scheduler consumer started with {self.workers} workers (worker_type=thread)",
-            self.workers
+            f"Scheduler consumer started with {self.workers} workers (worker_type={self.worker_type})"
         )
         self.thread = threading.Thread(
             target=self._run,
@@ -73,6 +328,13 @@ class SchedulerConsumer:
         self.thread.start()
         self.logger.info("Scheduler consumer running in thread")
 
+    def get_workers(self) -> int | None:
+        """
+        Returns the current workers count, which changes over time when autoscaling is enabled
+        """
+        consumer = self.consumer
+        return consumer.workers if consumer is not None else self.workers
+
     def is_started(self) -> bool:
         with self.lock:
             return self.thread is not None
@@ -90,7 +352,12 @@ class SchedulerConsumer:
             if self.thread:
                 self.thread.join(timeout=5)
 
+            if self.event_loop:
+                self.event_loop.stop()
+
             self.logger.info("Scheduler consumer stopped")
+            self.event_loop = None
             self.consumer = None
             self.thread = None
             self.workers = None
+            self.worker_type = None
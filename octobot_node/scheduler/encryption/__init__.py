@@ -18,6 +18,8 @@
 ENCRYPTED_AES_KEY_B64_METADATA_KEY = "ENCRYPTED_AES_KEY_B64"
 IV_B64_METADATA_KEY = "IV_B64"
 SIGNATURE_B64_METADATA_KEY = "SIGNATURE_B64"
+ENVELOPE_ID_METADATA_KEY = "ENVELOPE_ID"
+ENVELOPE_SIGNATURE_B64_METADATA_KEY = "ENVELOPE_SIGNATURE_B64"
 
 # Encryption tasks errors
 class MissingMetadataError(Exception):
@@ -32,6 +34,18 @@ class EncryptionTaskError(Exception):
 class SignatureVerificationError(Exception):
     pass
 
+class InvalidKeyError(Exception):
+    pass
+
+class KeyPairMismatchError(InvalidKeyError):
+    pass
+
+from octobot_node.scheduler.encryption import key_manager
+from octobot_node.scheduler.encryption.key_manager import (KeyManager, KEY_MANAGER)
+
+from octobot_node.scheduler.encryption import envelopes
+from octobot_node.scheduler.encryption.envelopes import (ResultEnvelope, EnvelopeManager, ENVELOPE_MANAGER)
+
 from octobot_node.scheduler.encryption import task_inputs
 from octobot_node.scheduler.encryption.task_inputs import (decrypt_task_content, encrypt_task_content)
 
@@ -42,10 +56,19 @@ __all__ = [
     "ENCRYPTED_AES_KEY_B64_METADATA_KEY",
     "IV_B64_METADATA_KEY",
     "SIGNATURE_B64_METADATA_KEY",
+    "ENVELOPE_ID_METADATA_KEY",
+    "ENVELOPE_SIGNATURE_B64_METADATA_KEY",
     "MissingMetadataError",
     "MetadataParsingError",
     "EncryptionTaskError",
     "SignatureVerificationError",
+    "InvalidKeyError",
+    "KeyPairMismatchError",
+    "KeyManager",
+    "KEY_MANAGER",
+    "ResultEnvelope",
+    "EnvelopeManager",
+    "ENVELOPE_MANAGER",
     "decrypt_task_content",
     "encrypt_task_content",
     "encrypt_task_result",
@@ -0,0 +1,146 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import collections
+import dataclasses
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Optional
+
+import octobot_commons.cryptography as cryptography
+
+from octobot_node.app.core.config import settings
+from octobot_node.scheduler.encryption import (
+    EncryptionTaskError,
+    SignatureVerificationError,
+    KEY_MANAGER,
+)
+
+MAX_UNWRAPPED_ENVELOPES = 128
+
+
+@dataclasses.dataclass
+class ResultEnvelope:
+    """
+    AES data key shared by a batch of task results, RSA-wrapped and signed once
+    """
+    id: str
+    data_key: bytes
+    encrypted_aes_key: bytes
+    signature: bytes
+    created_at: float
+    results_count: int = 0
+
+    @property
+    def associated_data(self) -> bytes:
+        return self.id.encode("utf-8")
+
+    def is_expired(self, now: float, ttl: float, max_results: int) -> bool:
+        return now - self.created_at >= ttl or self.results_count >= max_results
+
+
+def get_envelope_signed_data(envelope_id: str, encrypted_aes_key: bytes) -> bytes:
+    return envelope_id.encode("utf-8") + encrypted_aes_key
+
+
+class EnvelopeManager:
+    """
+    Keeps the current results envelope of this process and the data keys of already unwrapped envelopes.
+    Envelopes are enabled when TASKS_OUTPUTS_ENVELOPE_TTL is set.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._envelope: Optional[ResultEnvelope] = None
+        self._pid: Optional[int] = None
+        self._data_keys: collections.OrderedDict[tuple[str, bytes], bytes] = collections.OrderedDict()
+
+    def is_enabled(self) -> bool:
+        return settings.TASKS_OUTPUTS_ENVELOPE_TTL is not None
+
+    def get_envelope(self) -> ResultEnvelope:
+        """
+        Returns the envelope to encrypt the next result with, rotating it when expired
+        """
+        now = time.time()
+        with self._lock:
+            # never share a data key with a forked worker process
+            if (
+                self._envelope is None
+                or self._pid != os.getpid()
+                or self._envelope.is_expired(
+                    now, settings.TASKS_OUTPUTS_ENVELOPE_TTL, settings.TASKS_OUTPUTS_ENVELOPE_MAX_RESULTS
+                )
+            ):
+                self._envelope = self._create_envelope(now)
+                self._pid = os.getpid()
+            self._envelope.results_count += 1
+            return self._envelope
+
+    def _create_envelope(self, now: float) -> ResultEnvelope:
+        envelope_id = uuid.uuid4().hex
+        data_key = cryptography.generate_aes_key()
+        encrypted_aes_key = KEY_MANAGER.rsa_encrypt_aes_key(data_key, "TASKS_OUTPUTS_RSA_PUBLIC_KEY")
+        if not encrypted_aes_key:
+            raise EncryptionTaskError("Failed to encrypt envelope AES key")
+        signature = KEY_MANAGER.sign_data(
+            get_envelope_signed_data(envelope_id, encrypted_aes_key), "TASKS_OUTPUTS_ECDSA_PRIVATE_KEY"
+        )
+        if not signature:
+            raise EncryptionTaskError("Failed to sign envelope")
+        self.logger.debug(f"Created results envelope {envelope_id}")
+        return ResultEnvelope(
+            id=envelope_id,
+            data_key=data_key,
+            encrypted_aes_key=encrypted_aes_key,
+            signature=signature,
+            created_at=now,
+        )
+
+    def unwrap(self, envelope_id: str, encrypted_aes_key: bytes, signature: bytes) -> bytes:
+        """
+        Returns the data key of an envelope, verifying and decrypting it only the first time
+        """
+        cache_key = (envelope_id, encrypted_aes_key)
+        with self._lock:
+            data_key = self._data_keys.get(cache_key)
+            if data_key is not None:
+                self._data_keys.move_to_end(cache_key)
+                return data_key
+        if not KEY_MANAGER.verify_signature(
+            get_envelope_signed_data(envelope_id, encrypted_aes_key), "TASKS_OUTPUTS_ECDSA_PUBLIC_KEY", signature
+        ):
+            raise SignatureVerificationError("Envelope signature verification failed")
+        data_key = KEY_MANAGER.rsa_decrypt_aes_key(encrypted_aes_key, "TASKS_OUTPUTS_RSA_PRIVATE_KEY")
+        if not data_key:
+            raise EncryptionTaskError("Failed to decrypt envelope AES key")
+        with self._lock:
+            self._data_keys[cache_key] = data_key
+            while len(self._data_keys) > MAX_UNWRAPPED_ENVELOPES:
+                self._data_keys.popitem(last=False)
+        return data_key
+
+    def clear(self) -> None:
+        with self._lock:
+            self._envelope = None
+            self._pid = None
+            self._data_keys.clear()
+
+
+ENVELOPE_MANAGER: EnvelopeManager = EnvelopeManager()
@@ -0,0 +1,184 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import contextlib
+import dataclasses
+import logging
+import threading
+import time
+from typing import Any, Optional
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, padding, rsa
+
+from octobot_node.app.core.config import settings
+from octobot_node.scheduler.encryption import InvalidKeyError, KeyPairMismatchError
+
+# Same parameters as octobot_commons.cryptography
+RSA_OAEP_PADDING = padding.OAEP(
+    mgf=padding.MGF1(algorithm=hashes.SHA256()),
+    algorithm=hashes.SHA256(),
+    label=None,
+)
+ECDSA_SIGNATURE_ALGORITHM = ec.ECDSA(hashes.SHA256())
+
+# settings key name: (expected key type, is private key)
+KEY_TYPES = {
+    "TASKS_INPUTS_RSA_PRIVATE_KEY": (rsa.RSAPrivateKey, True),
+    "TASKS_INPUTS_RSA_PUBLIC_KEY": (rsa.RSAPublicKey, False),
+    "TASKS_INPUTS_ECDSA_PRIVATE_KEY": (ec.EllipticCurvePrivateKey, True),
+    "TASKS_INPUTS_ECDSA_PUBLIC_KEY": (ec.EllipticCurvePublicKey, False),
+    "TASKS_OUTPUTS_RSA_PRIVATE_KEY": (rsa.RSAPrivateKey, True),
+    "TASKS_OUTPUTS_RSA_PUBLIC_KEY": (rsa.RSAPublicKey, False),
+    "TASKS_OUTPUTS_ECDSA_PRIVATE_KEY": (ec.EllipticCurvePrivateKey, True),
+    "TASKS_OUTPUTS_ECDSA_PUBLIC_KEY": (ec.EllipticCurvePublicKey, False),
+}
+# (private key name, public key name)
+KEY_PAIRS = [
+    ("TASKS_INPUTS_RSA_PRIVATE_KEY", "TASKS_INPUTS_RSA_PUBLIC_KEY"),
+    ("TASKS_INPUTS_ECDSA_PRIVATE_KEY", "TASKS_INPUTS_ECDSA_PUBLIC_KEY"),
+    ("TASKS_OUTPUTS_RSA_PRIVATE_KEY", "TASKS_OUTPUTS_RSA_PUBLIC_KEY"),
+    ("TASKS_OUTPUTS_ECDSA_PRIVATE_KEY", "TASKS_OUTPUTS_ECDSA_PUBLIC_KEY"),
+]
+
+
+@dataclasses.dataclass
+class OperationTimings:
+    count: int = 0
+    total: float = 0
+    max: float = 0
+
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+
+class KeyManager:
+    """
+    Parses each configured PEM key once and keeps the key object.
+    Keys are parsed again when their settings value changes.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._keys: dict[str, tuple[bytes, Any]] = {}
+        self._lock = threading.Lock()
+        self._timings_lock = threading.Lock()
+        self.timings: dict[str, OperationTimings] = {}
+
+    def get_key(self, key_name: str) -> Any:
+        pem = getattr(settings, key_name)
+        if pem is None:
+            raise InvalidKeyError(f"{key_name} is not set")
+        cached = self._keys.get(key_name)
+        if cached is not None and (cached[0] is pem or cached[0] == pem):
+            return cached[1]
+        with self._lock:
+            with self.timed("load_key"):
+                key = self._load_key(key_name, pem)
+            self._keys[key_name] = (pem, key)
+        self.logger.debug(f"Loaded {key_name}")
+        return key
+
+    def _load_key(self, key_name: str, pem: bytes) -> Any:
+        expected_type, is_private = KEY_TYPES[key_name]
+        try:
+            key = serialization.load_pem_private_key(pem, password=None) if is_private \
+                else serialization.load_pem_public_key(pem)
+        except Exception as e:
+            raise InvalidKeyError(f"Failed to load {key_name}: {e}") from e
+        if not isinstance(key, expected_type):
+            raise InvalidKeyError(f"{key_name} must be a {expected_type.__name__}")
+        return key
+
+    def load_keys(self) -> None:
+        """
+        Parses every configured key and checks that configured key pairs match
+        """
+        for key_name in KEY_TYPES:
+            if getattr(settings, key_name) is not None:
+                self.get_key(key_name)
+        self.validate_key_pairs()
+
+    def validate_key_pairs(self) -> None:
+        for private_key_name, public_key_name in KEY_PAIRS:
+            if getattr(settings, private_key_name) is None or getattr(settings, public_key_name) is None:
+                continue
+            private_key = self.get_key(private_key_name)
+            public_key = self.get_key(public_key_name)
+            if private_key.public_key().public_numbers() != public_key.public_numbers():
+                raise KeyPairMismatchError(f"{public_key_name} is not the public key of {private_key_name}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys.clear()
+
+    def rsa_encrypt_aes_key(self, aes_key: bytes, key_name: str) -> bytes:
+        public_key = self.get_key(key_name)
+        with self.timed("rsa_encrypt"):
+            return public_key.encrypt(aes_key, RSA_OAEP_PADDING)
+
+    def rsa_decrypt_aes_key(self, encrypted_aes_key: bytes, key_name: str) -> bytes:
+        private_key = self.get_key(key_name)
+        with self.timed("rsa_decrypt"):
+            return private_key.decrypt(encrypted_aes_key, RSA_OAEP_PADDING)
+
+    def sign_data(self, data: bytes, key_name: str) -> bytes:
+        private_key = self.get_key(key_name)
+        with self.timed("sign"):
+            return private_key.sign(data, ECDSA_SIGNATURE_ALGORITHM)
+
+    def verify_signature(self, data: bytes, key_name: str, signature: bytes) -> bool:
+        public_key = self.get_key(key_name)
+        with self.timed("verify"):
+            try:
+                public_key.verify(signature, data, ECDSA_SIGNATURE_ALGORITHM)
+                return True
+            except InvalidSignature:
+                return False
+
+    @contextlib.contextmanager
+    def timed(self, operation: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            with self._timings_lock:
+                self.timings.setdefault(operation, OperationTimings()).add(duration)
+
+    def get_timings(self) -> dict[str, dict[str, float]]:
+        return {
+            operation: {
+                "count": timings.count,
+                "total": timings.total,
+                "average": timings.average,
+                "max": timings.max,
+            }
+            for operation, timings in self.timings.items()
+        }
+
+    def reset_timings(self) -> None:
+        self.timings = {}
+
+
+KEY_MANAGER: KeyManager = KeyManager()
@@ -18,7 +18,6 @@ import json
 import base64
 
 from typing import Optional, Tuple
-from octobot_node.app.core.config import settings
 from octobot_node.scheduler.encryption import (
     ENCRYPTED_AES_KEY_B64_METADATA_KEY, 
     IV_B64_METADATA_KEY, 
@@ -26,7 +25,8 @@ from octobot_node.scheduler.encryption import (
     MissingMetadataError, 
     EncryptionTaskError, 
     MetadataParsingError, 
-    SignatureVerificationError
+    SignatureVerificationError,
+    KEY_MANAGER,
 )
 import octobot_commons.cryptography as cryptography
 
@@ -54,10 +54,10 @@ def decrypt_task_content(content: str, metadata: Optional[str] = None) -> str:
         raise MetadataParsingError(f"Failed to decode base64-encoded data: {e}")
 
     data_to_verify = content_bytes + encrypted_aes_key + iv
-    if not cryptography.verify_signature(data_to_verify, settings.TASKS_INPUTS_ECDSA_PUBLIC_KEY, signature):
+    if not KEY_MANAGER.verify_signature(data_to_verify, "TASKS_INPUTS_ECDSA_PUBLIC_KEY", signature):
         raise SignatureVerificationError("Signature verification failed")
 
-    decrypted_aes_key = cryptography.rsa_decrypt_aes_key(encrypted_aes_key, settings.TASKS_INPUTS_RSA_PRIVATE_KEY)
+    decrypted_aes_key = KEY_MANAGER.rsa_decrypt_aes_key(encrypted_aes_key, "TASKS_INPUTS_RSA_PRIVATE_KEY")
     if not decrypted_aes_key:
         raise EncryptionTaskError("Failed to decrypt AES key")
 
@@ -76,12 +76,12 @@ def encrypt_task_content(content: str) -> Tuple[str, str]:
     if not encrypted_content:
         raise EncryptionTaskError("Failed to encrypt content")
 
-    encrypted_aes_key = cryptography.rsa_encrypt_aes_key(aes_encryption_key, settings.TASKS_INPUTS_RSA_PUBLIC_KEY)
+    encrypted_aes_key = KEY_MANAGER.rsa_encrypt_aes_key(aes_encryption_key, "TASKS_INPUTS_RSA_PUBLIC_KEY")
     if not encrypted_aes_key:
         raise EncryptionTaskError("Failed to encrypt AES key")
 
     data_to_sign = encrypted_content + encrypted_aes_key + iv
-    signature = cryptography.sign_data(data_to_sign, settings.TASKS_INPUTS_ECDSA_PRIVATE_KEY)
+    signature = KEY_MANAGER.sign_data(data_to_sign, "TASKS_INPUTS_ECDSA_PRIVATE_KEY")
     if not signature:
         raise EncryptionTaskError("Failed to sign data")
 
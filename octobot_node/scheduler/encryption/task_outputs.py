@@ -18,20 +18,25 @@ import json
 import base64
 
 from typing import Tuple, Optional
-from octobot_node.app.core.config import settings
 from octobot_node.scheduler.encryption import (
     ENCRYPTED_AES_KEY_B64_METADATA_KEY, 
     IV_B64_METADATA_KEY, 
     SIGNATURE_B64_METADATA_KEY, 
+    ENVELOPE_ID_METADATA_KEY,
+    ENVELOPE_SIGNATURE_B64_METADATA_KEY,
     MissingMetadataError, 
     EncryptionTaskError, 
     MetadataParsingError, 
-    SignatureVerificationError
+    SignatureVerificationError,
+    KEY_MANAGER,
+    ENVELOPE_MANAGER,
 )
 import octobot_commons.cryptography as cryptography
 
 
 def encrypt_task_result(result: str) -> Tuple[str, str]:
+    if ENVELOPE_MANAGER.is_enabled():
+        return _encrypt_task_result_with_envelope(result)
     aes_encryption_key = cryptography.generate_aes_key()
     iv = cryptography.generate_iv()
 
@@ -39,12 +44,12 @@ def encrypt_task_result(result: str) -> Tuple[str, str]:
     if not encrypted_result:
         raise EncryptionTaskError("Failed to encrypt result")
 
-    encrypted_aes_key = cryptography.rsa_encrypt_aes_key(aes_encryption_key, settings.TASKS_OUTPUTS_RSA_PUBLIC_KEY)
+    encrypted_aes_key = KEY_MANAGER.rsa_encrypt_aes_key(aes_encryption_key, "TASKS_OUTPUTS_RSA_PUBLIC_KEY")
     if not encrypted_aes_key:
         raise EncryptionTaskError("Failed to encrypt AES key")
 
     data_to_sign = encrypted_result + encrypted_aes_key + iv
-    signature = cryptography.sign_data(data_to_sign, settings.TASKS_OUTPUTS_ECDSA_PRIVATE_KEY)
+    signature = KEY_MANAGER.sign_data(data_to_sign, "TASKS_OUTPUTS_ECDSA_PRIVATE_KEY")
     if not signature:
         raise EncryptionTaskError("Failed to sign data")
 
@@ -57,18 +62,67 @@ def encrypt_task_result(result: str) -> Tuple[str, str]:
     return encrypted_result_b64, json.dumps(metadata)
 
 
+def _encrypt_task_result_with_envelope(result: str) -> Tuple[str, str]:
+    envelope = ENVELOPE_MANAGER.get_envelope()
+    iv = cryptography.generate_iv()
+
+    encrypted_result = cryptography.aes_gcm_encrypt(
+        result.encode('utf-8'), envelope.data_key, iv, associated_data=envelope.associated_data
+    )
+    if not encrypted_result:
+        raise EncryptionTaskError("Failed to encrypt result")
+
+    metadata = {
+        ENVELOPE_ID_METADATA_KEY: envelope.id,
+        ENCRYPTED_AES_KEY_B64_METADATA_KEY: base64.b64encode(envelope.encrypted_aes_key).decode('utf-8'),
+        IV_B64_METADATA_KEY: base64.b64encode(iv).decode('utf-8'),
+        ENVELOPE_SIGNATURE_B64_METADATA_KEY: base64.b64encode(envelope.signature).decode('utf-8'),
+    }
+    encrypted_result_b64 = base64.b64encode(encrypted_result).decode('utf-8')
+    return encrypted_result_b64, json.dumps(metadata)
+
+
+def _decrypt_task_result_with_envelope(encrypted_result: str, envelope_id: str, metadata: dict) -> str:
+    encrypted_aes_key_b64 = metadata.get(ENCRYPTED_AES_KEY_B64_METADATA_KEY, None)
+    iv_b64 = metadata.get(IV_B64_METADATA_KEY, None)
+    signature_b64 = metadata.get(ENVELOPE_SIGNATURE_B64_METADATA_KEY, None)
+    if not encrypted_aes_key_b64 or not iv_b64 or not signature_b64:
+        raise MissingMetadataError("No encrypted AES key or IV or envelope signature provided for result decryption")
+
+    try:
+        encrypted_result_bytes = base64.b64decode(encrypted_result)
+        encrypted_aes_key = base64.b64decode(encrypted_aes_key_b64)
+        iv = base64.b64decode(iv_b64)
+        signature = base64.b64decode(signature_b64)
+    except Exception as e:
+        raise MetadataParsingError(f"Failed to decode base64-encoded data: {e}")
+
+    data_key = ENVELOPE_MANAGER.unwrap(envelope_id, encrypted_aes_key, signature)
+    decrypted_result = cryptography.aes_gcm_decrypt(
+        encrypted_result_bytes, data_key, iv, associated_data=envelope_id.encode('utf-8')
+    )
+    if not decrypted_result:
+        raise EncryptionTaskError("Failed to decrypt result")
+
+    return decrypted_result.decode('utf-8')
+
+
 def decrypt_task_result(encrypted_result: str, metadata: Optional[str] = None) -> str:
     if metadata is None:
         raise MissingMetadataError("No metadata provided for result decryption")
 
     try:
         metadata = json.loads(metadata)
+        envelope_id = metadata.get(ENVELOPE_ID_METADATA_KEY, None)
         encrypted_aes_key_b64 = metadata.get(ENCRYPTED_AES_KEY_B64_METADATA_KEY, None)
         iv_b64 = metadata.get(IV_B64_METADATA_KEY, None)
         signature_b64 = metadata.get(SIGNATURE_B64_METADATA_KEY, None)
     except Exception as e:
         raise MetadataParsingError(f"Failed to parse encrypted AES key or IV from metadata: {e}")
 
+    if envelope_id is not None:
+        return _decrypt_task_result_with_envelope(encrypted_result, envelope_id, metadata)
+
     if not encrypted_aes_key_b64 or not iv_b64 or not signature_b64:
         raise MissingMetadataError("No encrypted AES key or IV or signature provided for result decryption")
 
@@ -81,10 +135,10 @@ def decrypt_task_result(encrypted_result: str, metadata: Optional[str] = None) -
         raise MetadataParsingError(f"Failed to decode base64-encoded data: {e}")
 
     data_to_verify = encrypted_result_bytes + encrypted_aes_key + iv
-    if not cryptography.verify_signature(data_to_verify, settings.TASKS_OUTPUTS_ECDSA_PUBLIC_KEY, signature):
+    if not KEY_MANAGER.verify_signature(data_to_verify, "TASKS_OUTPUTS_ECDSA_PUBLIC_KEY", signature):
         raise SignatureVerificationError("Signature verification failed")
 
-    decrypted_aes_key = cryptography.rsa_decrypt_aes_key(encrypted_aes_key, settings.TASKS_OUTPUTS_RSA_PRIVATE_KEY)
+    decrypted_aes_key = KEY_MANAGER.rsa_decrypt_aes_key(encrypted_aes_key, "TASKS_OUTPUTS_RSA_PRIVATE_KEY")
     if not decrypted_aes_key:
         raise EncryptionTaskError("Failed to decrypt AES key")
 
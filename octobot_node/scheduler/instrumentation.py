@@ -0,0 +1,73 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import threading
+import time
+from typing import Any, Optional
+
+import huey
+
+from octobot_node.app.core import metrics
+from octobot_node.app.models import TaskStatus
+from octobot_node.scheduler.serializer import get_stored_size
+from octobot_node.scheduler.task_index import TaskIndexEntry, TaskIndexUpdater
+
+
+class TaskInstrumentation:
+    """
+    Feeds the tasks queue wait, execution duration and result size histograms from huey hooks.
+    Queue waits are read from the running tasks entries recorded by index_updater.
+    Histograms live in the process executing the tasks: use thread or greenlet workers to expose them.
+    """
+
+    def __init__(self, huey_instance: huey.Huey, index_updater: Optional[TaskIndexUpdater] = None):
+        self.huey: huey.Huey = huey_instance
+        self.index_updater: Optional[TaskIndexUpdater] = index_updater
+        self._lock = threading.Lock()
+        self._started_at: dict[str, float] = {}
+        self._local = threading.local()
+
+    def connect(self) -> None:
+        if self.index_updater is not None:
+            self.index_updater.add_listener(self.on_status_changes)
+        self.huey.pre_execute(name=self.__class__.__name__)(self.on_pre_execute)
+        self.huey.post_execute(name=self.__class__.__name__)(self.on_post_execute)
+
+    def on_status_changes(self, changes: list[tuple[TaskIndexEntry, Optional[TaskStatus]]]) -> None:
+        for entry, previous_status in changes:
+            if entry.status is TaskStatus.RUNNING and previous_status is not None and entry.created_at is not None:
+                # scheduled tasks only become ready at their eta
+                ready_at = max(entry.created_at, entry.eta or 0)
+                # tasks start executing in the thread recording their running status
+                self._local.queue_wait = (entry.id, max(time.time() - ready_at, 0))
+
+    def on_pre_execute(self, task: huey.api.Task) -> None:
+        with self._lock:
+            self._started_at[task.id] = time.perf_counter()
+        task_id, queue_wait = getattr(self._local, "queue_wait", (None, None))
+        self._local.queue_wait = None, None
+        if task_id == task.id:
+            metrics.TASK_QUEUE_WAIT.observe(queue_wait, task=task.name)
+
+    def on_post_execute(self, task: huey.api.Task, task_value: Any, exception: Optional[Exception]) -> None:
+        with self._lock:
+            started_at = self._started_at.pop(task.id, None)
+        if started_at is not None:
+            metrics.TASK_EXECUTION.observe(
+                time.perf_counter() - started_at, task=task.name, outcome="failure" if exception else "success"
+            )
+        if exception is None and task_value is not None:
+            metrics.TASK_RESULT_SIZE.observe(get_stored_size(self.huey, task_value), task=task.name)
@@ -0,0 +1,226 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import dataclasses
+import logging
+import threading
+from typing import Optional
+
+import huey
+import huey.api
+from huey.storage import BaseStorage, RedisStorage
+
+from octobot_node.app.models import Task
+
+DEFAULT_LANE = "default"
+
+
+@dataclasses.dataclass
+class Lane:
+    name: str
+    weight: int = 1
+    max_concurrency: Optional[int] = None  # None: no limit
+    current_weight: int = 0
+    in_flight: int = 0
+
+    def is_full(self) -> bool:
+        return self.max_concurrency is not None and self.in_flight >= self.max_concurrency
+
+
+class LaneMessage(bytes):
+    """
+    Serialized task message tagged with the lane of its task
+    """
+    lane: Optional[str] = None
+
+
+def get_task_lane(task: huey.api.Task) -> str:
+    node_task = task.args[0] if task.args and isinstance(task.args[0], Task) else None
+    return node_task.type if node_task is not None and node_task.type else DEFAULT_LANE
+
+
+class LaneScheduler:
+    """
+    Selects the lane to dequeue from using smooth weighted round robin: under load, each lane gets
+    a share of dequeues proportional to its weight, without long bursts from a single lane.
+    Lanes with max_concurrency running tasks are skipped. Running tasks are counted in the consumer process
+    memory: a thread worker releases its previous task lane when dequeuing again. Other worker types
+    can't share these counts, see has_max_concurrency.
+    """
+
+    def __init__(self, weights: dict[str, int], max_concurrency: Optional[dict[str, int]] = None):
+        max_concurrency = max_concurrency or {}
+        self.lanes: dict[str, Lane] = {
+            name: Lane(name, max(weight, 1), max_concurrency.get(name))
+            for name, weight in weights.items()
+        }
+        self.lanes.setdefault(DEFAULT_LANE, Lane(DEFAULT_LANE, 1, max_concurrency.get(DEFAULT_LANE)))
+        self.total_weight: int = sum(lane.weight for lane in self.lanes.values())
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def has_max_concurrency(self) -> bool:
+        return any(lane.max_concurrency is not None for lane in self.lanes.values())
+
+    def get_lane_name(self, lane: Optional[str]) -> str:
+        return lane if lane in self.lanes else DEFAULT_LANE
+
+    def select(self) -> list[Lane]:
+        """
+        Returns the lanes to try dequeuing from, in order
+        """
+        self.release()
+        with self._lock:
+            lanes = [lane for lane in self.lanes.values() if not lane.is_full()]
+            for lane in lanes:
+                lane.current_weight += lane.weight
+            self._local.selected_weight = sum(lane.weight for lane in lanes)
+            return sorted(lanes, key=lambda lane: lane.current_weight, reverse=True)
+
+    def reserve(self, lane: Lane) -> bool:
+        with self._lock:
+            if lane.is_full():
+                return False
+            lane.in_flight += 1
+            return True
+
+    def on_dequeued(self, lane: Lane) -> None:
+        with self._lock:
+            lane.current_weight -= self._local.selected_weight
+        # the lane stays reserved until this worker dequeues again
+        self._local.lane = lane
+
+    def on_empty(self, lane: Lane) -> None:
+        with self._lock:
+            lane.in_flight -= 1
+            # empty lanes don't accumulate credit
+            lane.current_weight = 0
+            self._local.selected_weight -= lane.weight
+
+    def release(self) -> None:
+        lane = getattr(self._local, "lane", None)
+        if lane is not None:
+            self._local.lane = None
+            with self._lock:
+                lane.in_flight -= 1
+
+    def get_in_flight(self) -> dict[str, int]:
+        with self._lock:
+            return {name: lane.in_flight for name, lane in self.lanes.items()}
+
+
+class LanedStorageMixin:
+    """
+    Storage keeping a queue per lane: the default lane uses the storage queue, other lanes
+    use "<name>.<lane>" queues of the same backend. Dequeuing picks the lane using a LaneScheduler.
+    """
+    base_storage_class: type[BaseStorage]
+
+    def __init__(self, name: str = "huey", lanes: Optional[LaneScheduler] = None, **kwargs):
+        super().__init__(name, **kwargs)
+        self.lanes: LaneScheduler = lanes or LaneScheduler({})
+        self.lane_storages: dict[str, BaseStorage] = {
+            lane_name: self._create_lane_storage(lane_name, kwargs) for lane_name in self.lanes.lanes
+        }
+
+    def _create_lane_storage(self, lane_name: str, kwargs: dict) -> BaseStorage:
+        name = self.name if lane_name == DEFAULT_LANE else f"{self.name}.{lane_name}"
+        if isinstance(self, RedisStorage):
+            # share the connection pool, never block on an empty lane
+            return self.base_storage_class(
+                name, blocking=False, connection_pool=self.pool, clean_name=False
+            )
+        kwargs = dict(kwargs)
+        if "filename" in kwargs:
+            # tables are already created by this storage
+            kwargs["create_tables"] = False
+        return self.base_storage_class(name, **kwargs)
+
+    def get_lane_storage(self, lane: Optional[str]) -> BaseStorage:
+        return self.lane_storages[self.lanes.get_lane_name(lane)]
+
+    def enqueue(self, data: bytes, priority: Optional[int] = None) -> None:
+        self.get_lane_storage(getattr(data, "lane", None)).enqueue(data, priority)
+
+    def dequeue(self) -> Optional[bytes]:
+        for lane in self.lanes.select():
+            if not self.lanes.reserve(lane):
+                continue
+            data = self.lane_storages[lane.name].dequeue()
+            if data is not None:
+                self.lanes.on_dequeued(lane)
+                return data
+            self.lanes.on_empty(lane)
+        return None
+
+    def queue_size(self) -> int:
+        return sum(storage.queue_size() for storage in self.lane_storages.values())
+
+    def enqueued_items(self, limit: Optional[int] = None) -> list[bytes]:
+        items = []
+        for storage in self.lane_storages.values():
+            items.extend(storage.enqueued_items(None if limit is None else limit - len(items)))
+            if limit is not None and len(items) >= limit:
+                break
+        return items
+
+    def flush_queue(self) -> None:
+        for storage in self.lane_storages.values():
+            storage.flush_queue()
+
+
+def create_laned_storage_class(storage_class: type[BaseStorage]) -> type[BaseStorage]:
+    return type(
+        f"Laned{storage_class.__name__}",
+        (LanedStorageMixin, storage_class),
+        {"base_storage_class": storage_class},
+    )
+
+
+class LanedHueyMixin:
+    """
+    Tags serialized tasks with their lane, used by LanedStorageMixin to select the task queue
+    """
+
+    def serialize_task(self, task: huey.api.Task) -> bytes:
+        message = LaneMessage(super().serialize_task(task))
+        message.lane = get_task_lane(task)
+        return message
+
+
+def create_laned_huey_class(huey_class: type[huey.Huey]) -> type[huey.Huey]:
+    return type(f"Laned{huey_class.__name__}", (LanedHueyMixin, huey_class), {})
+
+
+def create_huey(
+    huey_class: type[huey.Huey], name: str, lanes: Optional[LaneScheduler] = None, **kwargs
+) -> huey.Huey:
+    """
+    Returns a huey_class instance, with a queue per lane when lanes are given
+    """
+    if lanes is None:
+        return huey_class(name, **kwargs)
+    return create_laned_huey_class(huey_class)(
+        name, storage_class=create_laned_storage_class(huey_class.storage_class), lanes=lanes, **kwargs
+    )
+
+
+def create_lane_scheduler(weights: dict[str, int], max_concurrency: dict[str, int]) -> Optional[LaneScheduler]:
+    if not weights:
+        return None
+    logging.getLogger(LaneScheduler.__name__).info(
+        f"Scheduler lanes: {', '.join(f'{name} (weight={weight})' for name, weight in weights.items())}"
+    )
+    return LaneScheduler(weights, max_concurrency)
@@ -0,0 +1,217 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import dataclasses
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Any, Callable, Optional
+
+import huey
+import huey.api
+from huey.constants import WORKER_PROCESS
+from octobot_node.scheduler.stores import KeyedStore, create_keyed_store
+
+from octobot_node import VERSION
+
+# a node is stale when it missed this number of heartbeats
+STALE_HEARTBEATS_COUNT = 3
+# nodes without heartbeat for this time are removed from the registry
+FORGOTTEN_NODE_AGE = 24 * 3600
+
+
+@dataclasses.dataclass
+class NodeHeartbeat:
+    node_id: str
+    node_type: str
+    backend_type: str
+    workers: Optional[int]
+    # None when the node workers are processes
+    in_flight: Optional[int]
+    executed: Optional[int]  # tasks executed since the node started
+    throughput: Optional[float]  # tasks executed per minute since the previous heartbeat
+    version: str
+    hostname: str
+    pid: int
+    started_at: float
+    heartbeat_at: float
+    interval: float  # seconds between heartbeats
+
+    def to_json(self) -> str:
+        return json.dumps(dataclasses.asdict(self))
+
+    @classmethod
+    def from_json(cls, value: str | bytes) -> "NodeHeartbeat":
+        return cls(**json.loads(value))
+
+    def is_stale(self, now: float) -> bool:
+        return now - self.heartbeat_at > self.interval * STALE_HEARTBEATS_COUNT
+
+
+class NodeRegistryStore:
+    """
+    Stores the heartbeats of the nodes sharing the scheduler backend
+    """
+
+    def __init__(self, store: KeyedStore):
+        self.store: KeyedStore = store
+
+    def publish(self, heartbeat: NodeHeartbeat) -> None:
+        self.store.put(heartbeat.node_id, heartbeat.to_json())
+
+    def get_all(self) -> list[NodeHeartbeat]:
+        return [NodeHeartbeat.from_json(value) for value in self.store.get_all().values()]
+
+    def delete(self, node_ids: list[str]) -> None:
+        self.store.delete(node_ids)
+
+
+def create_node_registry_store(huey_instance: huey.Huey) -> NodeRegistryStore:
+    return NodeRegistryStore(create_keyed_store(huey_instance, "nodes"))
+
+
+def get_default_node_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class NodeHeartbeatPublisher:
+    """
+    Publishes the heartbeat of this node to the scheduler backend from a background thread.
+    get_status returns the node_type, backend_type, workers and worker_type of the node.
+    In flight and executed tasks are counted from huey hooks in this process: they are not published
+    when workers are processes.
+    """
+
+    def __init__(
+        self, huey_instance: huey.Huey, store: NodeRegistryStore, node_id: str, interval: float,
+        get_status: Optional[Callable[[], dict[str, Any]]] = None
+    ):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.huey: huey.Huey = huey_instance
+        self.store: NodeRegistryStore = store
+        self.node_id: str = node_id
+        self.interval: float = interval
+        self.get_status: Optional[Callable[[], dict[str, Any]]] = get_status
+        self.started_at: float = time.time()
+        self.in_flight: int = 0
+        self.executed: int = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._previous_heartbeat: Optional[tuple[float, int]] = None
+
+    def connect(self) -> None:
+        self.huey.pre_execute(name=self.__class__.__name__)(self.on_pre_execute)
+        self.huey.post_execute(name=self.__class__.__name__)(self.on_post_execute)
+
+    def on_pre_execute(self, task: huey.api.Task) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def on_post_execute(self, task: huey.api.Task, task_value: Any, exception: Optional[Exception]) -> None:
+        with self._lock:
+            self.in_flight = max(self.in_flight - 1, 0)
+            self.executed += 1
+
+    def is_enabled(self) -> bool:
+        return self.interval > 0
+
+    def start(self, get_status: Optional[Callable[[], dict[str, Any]]] = None) -> None:
+        if get_status is not None:
+            self.get_status = get_status
+        if not self.is_enabled() or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="node-heartbeat", daemon=True)
+        self._thread.start()
+        self.logger.info(f"Publishing node {self.node_id} heartbeat every {self.interval} seconds")
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join(timeout=5)
+        self._thread = None
+        try:
+            # stopped nodes leave the cluster instead of becoming stale
+            self.store.delete([self.node_id])
+        except Exception as e:
+            self.logger.error(f"Failed to unregister node {self.node_id}: {e}")
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.publish()
+            except Exception as e:
+                self.logger.error(f"Failed to publish node {self.node_id} heartbeat: {e}")
+            self._stop_event.wait(self.interval)
+
+    def create_heartbeat(self, now: Optional[float] = None) -> NodeHeartbeat:
+        now = time.time() if now is None else now
+        status = self.get_status() if self.get_status is not None else {}
+        with self._lock:
+            in_flight, executed = self.in_flight, self.executed
+        previous_at, previous_executed = self._previous_heartbeat or (self.started_at, 0)
+        elapsed = now - previous_at
+        self._previous_heartbeat = (now, executed)
+        throughput = (executed - previous_executed) * 60 / elapsed if elapsed > 0 else 0
+        if status.get("worker_type") == WORKER_PROCESS:
+            # tasks are executed by the workers processes: this process hooks don't see them
+            in_flight = executed = throughput = None
+        return NodeHeartbeat(
+            node_id=self.node_id,
+            node_type=status.get("node_type", "none"),
+            backend_type=status.get("backend_type", ""),
+            workers=status.get("workers"),
+            in_flight=in_flight,
+            executed=executed,
+            throughput=throughput,
+            version=VERSION,
+            hostname=socket.gethostname(),
+            pid=os.getpid(),
+            started_at=self.started_at,
+            heartbeat_at=now,
+            interval=self.interval,
+        )
+
+    def publish(self, now: Optional[float] = None) -> NodeHeartbeat:
+        heartbeat = self.create_heartbeat(now)
+        self.store.publish(heartbeat)
+        return heartbeat
+
+    def list_nodes(self, now: Optional[float] = None) -> list[dict[str, Any]]:
+        """
+        Returns the registered nodes with their stale state, nodes forgotten for too long are removed
+        """
+        now = time.time() if now is None else now
+        nodes = []
+        forgotten_node_ids = []
+        for heartbeat in self.store.get_all():
+            if now - heartbeat.heartbeat_at > FORGOTTEN_NODE_AGE:
+                forgotten_node_ids.append(heartbeat.node_id)
+                continue
+            nodes.append({
+                **dataclasses.asdict(heartbeat),
+                "status": "stale" if heartbeat.is_stale(now) else "alive",
+                "heartbeat_age": max(now - heartbeat.heartbeat_at, 0),
+                "is_current": heartbeat.node_id == self.node_id,
+            })
+        if forgotten_node_ids:
+            self.store.delete(forgotten_node_ids)
+        return nodes
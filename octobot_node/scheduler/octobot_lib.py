@@ -14,13 +14,19 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 import typing
+import collections
 import dataclasses
 import json
 import logging
+import threading
+import uuid
 
+import huey
 import octobot_commons.list_util as list_util
 import octobot_commons.dataclasses
 
+from octobot_node.scheduler.stores import KeyedStore, create_keyed_store
+
 try:
     import mini_octobot
     import mini_octobot.environment
@@ -53,6 +59,121 @@ except ImportError:
     mini_octobot = mini_octobot_mock()
 
 
+DESCRIPTION_VERSION_KEY = "version"
+COMPACT_DESCRIPTION_VERSION = 2
+
+
+class ActionsPlan:
+    """
+    Action bundles of a multi steps task, shared by all the executions of this task.
+    The bundles are stored once in an ActionsPlanStore and referenced by step index in compact descriptions.
+    """
+
+    def __init__(
+        self,
+        plan_id: str,
+        bundles: list[list[mini_octobot.BotActionDetails]],
+        bundles_json: typing.Optional[str] = None,
+    ):
+        self.id: str = plan_id
+        self.bundles: list[list[mini_octobot.BotActionDetails]] = bundles
+        self._bundles_json: typing.Optional[str] = bundles_json
+
+    @classmethod
+    def create(cls, bundles: list[list[mini_octobot.BotActionDetails]]) -> "ActionsPlan":
+        return cls(uuid.uuid4().hex, bundles)
+
+    @classmethod
+    def from_json(cls, plan_id: str, bundles_json: str) -> "ActionsPlan":
+        bundles = [
+            [mini_octobot.BotActionDetails.from_dict(action) for action in bundle]
+            for bundle in json.loads(bundles_json)
+        ]
+        return cls(plan_id, bundles, bundles_json)
+
+    def get_bundles_json(self) -> str:
+        if self._bundles_json is None:
+            self._bundles_json = json.dumps([
+                [action.to_dict(include_default_values=False) for action in bundle]
+                for bundle in self.bundles
+            ])
+        return self._bundles_json
+
+
+class ActionsPlanCache:
+    """
+    Worker-local LRU cache of actions plans by plan id, a max_size of 0 disables it
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size: int = max_size
+        self._plans: collections.OrderedDict[str, ActionsPlan] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, plan_id: str) -> typing.Optional[ActionsPlan]:
+        with self._lock:
+            plan = self._plans.get(plan_id)
+            if plan is not None:
+                self._plans.move_to_end(plan_id)
+            return plan
+
+    def add(self, plan: ActionsPlan) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._plans[plan.id] = plan
+            self._plans.move_to_end(plan.id)
+            while len(self._plans) > self.max_size:
+                self._plans.popitem(last=False)
+
+    def discard(self, plan_id: str) -> None:
+        with self._lock:
+            self._plans.pop(plan_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+
+class ActionsPlanStore:
+    """
+    Stores actions plans bundles once in the scheduler backend by plan id.
+    Plans are read from the worker-local cache first: each step only loads its plan on a cache miss.
+    """
+
+    def __init__(self, store: KeyedStore, cache: ActionsPlanCache):
+        self.store: KeyedStore = store
+        self.cache: ActionsPlanCache = cache
+
+    def save(self, plan: ActionsPlan) -> None:
+        self.store.put(plan.id, plan.get_bundles_json())
+        self.cache.add(plan)
+
+    def get(self, plan_id: str) -> ActionsPlan:
+        """
+        Raises ValueError when the plan is not stored
+        """
+        plan = self.cache.get(plan_id)
+        if plan is None:
+            bundles_json = self.store.get(plan_id)
+            if bundles_json is None:
+                raise ValueError(f"Unknown actions plan: {plan_id}")
+            plan = ActionsPlan.from_json(plan_id, bundles_json)
+            self.cache.add(plan)
+        return plan
+
+    def delete(self, plan_id: str) -> None:
+        self.store.delete([plan_id])
+        self.cache.discard(plan_id)
+
+
+def create_actions_plan_store(huey_instance: huey.Huey, cache_size: int) -> ActionsPlanStore:
+    return ActionsPlanStore(create_keyed_store(huey_instance, "action_plans"), ActionsPlanCache(cache_size))
+
+
 @dataclasses.dataclass
 class OctoBotActionsJobDescription(octobot_commons.dataclasses.MinimizableDataclass):
     state: dict = dataclasses.field(default_factory=dict)
@@ -62,6 +183,9 @@ class OctoBotActionsJobDescription(octobot_commons.dataclasses.MinimizableDatacl
     pending_actions: list[list[mini_octobot.BotActionDetails]] = dataclasses.field(default_factory=list)
 
     def __post_init__(self):
+        # not dataclass fields: only used by compact descriptions
+        self.actions_plan: typing.Optional[ActionsPlan] = None
+        self.step: int = 0
         if self.immediate_actions and isinstance(self.immediate_actions[0], dict):
             self.immediate_actions = [
                 mini_octobot.BotActionDetails.from_dict(action) for action in self.immediate_actions
@@ -83,6 +207,39 @@ class OctoBotActionsJobDescription(octobot_commons.dataclasses.MinimizableDatacl
         self.immediate_actions = action_bundles[0]
         self.pending_actions = action_bundles[1:]
 
+    @classmethod
+    def from_compact_dict(
+        cls, compact_description: dict, plan_store: ActionsPlanStore
+    ) -> "OctoBotActionsJobDescription":
+        actions_plan = plan_store.get(compact_description["plan_id"])
+        step = compact_description["step"]
+        description = cls(
+            state=compact_description.get("state", {}),
+            auth_details=compact_description.get("auth_details", {}),
+            immediate_actions=actions_plan.bundles[step],
+            pending_actions=actions_plan.bundles[step + 1:],
+        )
+        description.actions_plan = actions_plan
+        description.step = step
+        return description
+
+    def to_compact_dict(self, plan_store: ActionsPlanStore) -> dict:
+        """
+        Returns a versioned description referencing its step in the actions plan.
+        The plan is stored when it is created: next step descriptions only reference it.
+        """
+        if self.actions_plan is None:
+            self.actions_plan = ActionsPlan.create([self.immediate_actions] + self.pending_actions)
+            self.step = 0
+            plan_store.save(self.actions_plan)
+        return {
+            DESCRIPTION_VERSION_KEY: COMPACT_DESCRIPTION_VERSION,
+            "plan_id": self.actions_plan.id,
+            "step": self.step,
+            "state": self.state,
+            "auth_details": self.auth_details,
+        }
+
     def get_next_execution_time(self) -> float:
         return min(
             bot["execution"]["current_execution"]["scheduled_to"]
@@ -117,11 +274,17 @@ class OctoBotActionsJobResult:
 
 
 class OctoBotActionsJob:
-    def __init__(self, description: str):
+    def __init__(self, description: str, plan_store: typing.Optional[ActionsPlanStore] = None):
         parsed_description = self._parse_description(description)
-        self.description: OctoBotActionsJobDescription = OctoBotActionsJobDescription.from_dict(
-            parsed_description
-        )
+        self.description: OctoBotActionsJobDescription
+        if DESCRIPTION_VERSION_KEY in parsed_description:
+            if parsed_description[DESCRIPTION_VERSION_KEY] != COMPACT_DESCRIPTION_VERSION:
+                raise ValueError(f"Unsupported description version: {parsed_description[DESCRIPTION_VERSION_KEY]}")
+            if plan_store is None:
+                raise ValueError("An actions plan store is required to run compact descriptions")
+            self.description = OctoBotActionsJobDescription.from_compact_dict(parsed_description, plan_store)
+        else:
+            self.description = OctoBotActionsJobDescription.from_dict(parsed_description)
         self.after_execution_state = None
 
     def _parse_description(self, description: str) -> dict:
@@ -130,7 +293,7 @@ class OctoBotActionsJob:
             parsed_description = description
         else:
             dict_description = json.loads(description)
-            if "state" in dict_description:
+            if "state" in dict_description or DESCRIPTION_VERSION_KEY in dict_description:
                 # there is a state, so it's a non init case
                 parsed_description = dict_description
             else:
@@ -164,7 +327,7 @@ class OctoBotActionsJob:
         if not self.description.pending_actions:
             # completed all actions
             return None
-        return OctoBotActionsJobDescription(
+        next_description = OctoBotActionsJobDescription(
             state=post_execution_state,
             auth_details=self.description.auth_details,
             # next immediate actions are the first remaining pending actions
@@ -172,3 +335,8 @@ class OctoBotActionsJob:
             # next pending actions are the remaining pending actions
             pending_actions=self.description.pending_actions[1:]
         )
+        if self.description.actions_plan is not None:
+            # keep referencing the same stored plan
+            next_description.actions_plan = self.description.actions_plan
+            next_description.step = self.description.step + 1
+        return next_description
@@ -0,0 +1,90 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import base64
+import binascii
+import dataclasses
+import enum
+import json
+from typing import Optional
+
+from octobot_node.app.models import TaskStatus
+from octobot_node.scheduler.task_index import EntryCursor
+
+
+class TaskSource(str, enum.Enum):
+    PERIODIC = "periodic"
+    PENDING = "pending"
+    RUNNING = "running"
+    SCHEDULED = "scheduled"
+    RESULTS = "results"
+
+
+# Order in which task sources are streamed when listing tasks
+TASK_SOURCES_ORDER: list[TaskSource] = [
+    TaskSource.PERIODIC,
+    TaskSource.PENDING,
+    TaskSource.RUNNING,
+    TaskSource.SCHEDULED,
+    TaskSource.RESULTS,
+]
+
+SOURCE_STATUSES: dict[TaskSource, set[TaskStatus]] = {
+    TaskSource.PERIODIC: {TaskStatus.PERIODIC},
+    TaskSource.PENDING: {TaskStatus.PENDING},
+    TaskSource.RUNNING: {TaskStatus.RUNNING},
+    TaskSource.SCHEDULED: {TaskStatus.SCHEDULED},
+    TaskSource.RESULTS: {TaskStatus.COMPLETED, TaskStatus.FAILED},
+}
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+@dataclasses.dataclass
+class TaskCursor:
+    """
+    Position in the task listing stream.
+    position is the offset of in memory periodic tasks, after is the (sort time, id) keyset
+    of the last listed task of index sources.
+    """
+    source: TaskSource = TASK_SOURCES_ORDER[0]
+    position: int = 0
+    after: Optional[EntryCursor] = None
+
+    def encode(self) -> str:
+        payload = json.dumps(
+            [self.source.value, self.position, list(self.after) if self.after else None], separators=(",", ":")
+        )
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("utf-8").rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> "TaskCursor":
+        try:
+            padding = "=" * (-len(cursor) % 4)
+            source, position, after = json.loads(base64.urlsafe_b64decode(cursor + padding).decode("utf-8"))
+            if after is not None:
+                sort_time, task_id = after
+                if not isinstance(task_id, str):
+                    raise TypeError(f"Invalid task id: {task_id}")
+                after = (float(sort_time), task_id)
+            parsed = cls(TaskSource(source), int(position), after)
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+            raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+        if parsed.position < 0:
+            raise InvalidCursorError(f"Invalid cursor: {cursor}")
+        return parsed
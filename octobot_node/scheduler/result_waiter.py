@@ -0,0 +1,82 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+from typing import Any
+
+from huey.constants import EmptyData
+
+from octobot_node.app.models import TaskStatus
+from octobot_node.scheduler.async_storage import AsyncSchedulerStorage
+from octobot_node.scheduler.task_events import RESYNC_EVENT_TYPE, TaskEventBroadcaster, TaskEventSubscription
+
+FINISHED_STATUSES = {TaskStatus.COMPLETED, TaskStatus.FAILED}
+
+
+class TaskResultWaiter:
+    """
+    Waits for task results without client polling: waiters are woken up by the task events of finished tasks.
+    Results are also checked every recheck_interval seconds as events can be missed (disabled events,
+    process workers or failed tasks, whose event is emitted before their result is stored).
+    """
+
+    def __init__(self, storage: AsyncSchedulerStorage, broadcaster: TaskEventBroadcaster, recheck_interval: float = 1):
+        self.storage: AsyncSchedulerStorage = storage
+        self.broadcaster: TaskEventBroadcaster = broadcaster
+        self.recheck_interval: float = recheck_interval
+
+    async def wait(self, task_ids: list[str], timeout: float = 0) -> dict[str, Any]:
+        """
+        Returns the stored result value of each task (EmptyData when there is none) once all of them
+        are available or timeout seconds passed
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        results: dict[str, Any] = {}
+        # subscribe before reading results to not miss the events of tasks finishing in the meantime
+        async with self.broadcaster.subscribe() as subscription:
+            to_check = set(task_ids)
+            while True:
+                checked = list(to_check)
+                for task_id, value in zip(checked, await asyncio.gather(
+                    *(self.storage.peek_result(task_id) for task_id in checked)
+                )):
+                    if value is not EmptyData:
+                        results[task_id] = value
+                pending = set(task_ids) - results.keys()
+                remaining = deadline - loop.time()
+                if not pending or remaining <= 0:
+                    break
+                to_check = await self._wait_for_finished_tasks(
+                    subscription, pending, min(remaining, self.recheck_interval)
+                )
+        return {task_id: results.get(task_id, EmptyData) for task_id in task_ids}
+
+    async def _wait_for_finished_tasks(
+        self, subscription: TaskEventSubscription, pending: set[str], timeout: float
+    ) -> set[str]:
+        """
+        Returns the pending tasks to check: the first one to finish or all of them after timeout seconds
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while (remaining := deadline - loop.time()) > 0:
+            event = await subscription.get(remaining)
+            if event is None or event.type == RESYNC_EVENT_TYPE:
+                break
+            if event.task_id in pending and event.status in FINISHED_STATUSES:
+                return {event.task_id}
+        return pending
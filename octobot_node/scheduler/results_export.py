@@ -0,0 +1,64 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import csv
+import datetime
+import enum
+import io
+import json
+from typing import Any, Iterable, Iterator
+
+
+class ExportFormat(str, enum.Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+EXPORT_COLUMNS = [
+    "id", "name", "type", "status", "scheduled_at", "started_at", "completed_at", "result", "result_metadata"
+]
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+
+def iter_export_chunks(batches: Iterable[list[dict]], export_format: ExportFormat) -> Iterator[str]:
+    """
+    Yields the export of each batch of tasks, preceded by the header line in csv
+    """
+    if export_format is ExportFormat.CSV:
+        yield _to_csv([EXPORT_COLUMNS])
+    for tasks in batches:
+        rows = [[_to_export_value(task.get(column)) for column in EXPORT_COLUMNS] for task in tasks]
+        if export_format is ExportFormat.CSV:
+            yield _to_csv(rows)
+        else:
+            yield "".join(f"{json.dumps(dict(zip(EXPORT_COLUMNS, row)))}\n" for row in rows)
+
+
+def _to_csv(rows: list[list[Any]]) -> str:
+    output = io.StringIO()
+    csv.writer(output).writerows(rows)
+    return output.getvalue()
+
+
+def _to_export_value(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
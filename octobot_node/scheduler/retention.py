@@ -0,0 +1,265 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import base64
+import dataclasses
+import datetime
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Any, Callable, Optional
+
+from huey.storage import RedisStorage, SqliteStorage
+
+from octobot_node.app.core.config import settings
+from octobot_node.app.models import TaskStatus
+from octobot_node.scheduler.scheduler import Scheduler
+from octobot_node.scheduler.task_index import TaskIndexEntry
+
+FINISHED_STATUSES = {TaskStatus.COMPLETED, TaskStatus.FAILED}
+COMPACTION_BATCH_SIZE = 500
+SQLITE_INCREMENTAL_AUTO_VACUUM = 2
+SQLITE_INCREMENTAL_VACUUM_PAGES = 1000
+SQLITE_VACUUM_TIMEOUT = 60
+
+
+@dataclasses.dataclass
+class ResultRetentionPolicy:
+    max_age: Optional[float] = None  # seconds since the task completion
+    max_count: Optional[int] = None
+    max_bytes: Optional[int] = None
+
+    @classmethod
+    def from_settings(cls) -> "ResultRetentionPolicy":
+        return cls(
+            max_age=settings.SCHEDULER_RESULTS_MAX_AGE,
+            max_count=settings.SCHEDULER_RESULTS_MAX_COUNT,
+            max_bytes=settings.SCHEDULER_RESULTS_MAX_BYTES,
+        )
+
+    def is_enabled(self) -> bool:
+        return any(limit is not None for limit in (self.max_age, self.max_count, self.max_bytes))
+
+
+@dataclasses.dataclass
+class CompactionReport:
+    expired_count: int = 0
+    archived_count: int = 0
+    expired_bytes: int = 0
+    expired_graphs: int = 0
+    archive_path: Optional[str] = None
+
+
+class ResultCompactor:
+    """
+    Expires finished tasks results according to a ResultRetentionPolicy, oldest completed first.
+    Results are selected from the task index: results of tasks that are not indexed are kept.
+    Expired results are appended to a gzip NDJSON archive before being deleted when archive_dir is set.
+    Finished task graphs definitions expire with the results of their nodes.
+    """
+
+    def __init__(self, scheduler: Scheduler, policy: ResultRetentionPolicy, archive_dir: Optional[str] = None):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.scheduler: Scheduler = scheduler
+        self.policy: ResultRetentionPolicy = policy
+        self.archive_dir: Optional[str] = archive_dir
+
+    def compact(self, now: Optional[float] = None) -> CompactionReport:
+        report = CompactionReport()
+        if not self.policy.is_enabled() or self.scheduler.index is None:
+            return report
+        now = time.time() if now is None else now
+        min_completed_at = None if self.policy.max_age is None else now - self.policy.max_age
+        remaining_count = (
+            self.scheduler.index.count(FINISHED_STATUSES) if self.policy.max_count is not None else 0
+        )
+        remaining_bytes = self._get_total_bytes() if self.policy.max_bytes is not None else 0
+        archive_file = None
+        offset = 0
+        try:
+            while True:
+                entries = self.scheduler.index.list_entries(FINISHED_STATUSES, offset, COMPACTION_BATCH_SIZE)
+                expired_entries = []
+                done = len(entries) < COMPACTION_BATCH_SIZE
+                for entry in entries:
+                    if not self._is_expired(entry, min_completed_at, remaining_count, remaining_bytes):
+                        if entry.completed_at is not None:
+                            # entries are sorted by completion time: the following ones are more recent
+                            done = True
+                            break
+                        continue
+                    expired_entries.append(entry)
+                    remaining_count -= 1
+                    remaining_bytes -= entry.result_size or 0
+                if expired_entries:
+                    archive_file = self._expire(expired_entries, report, archive_file, now)
+                if done:
+                    break
+                offset += len(entries) - len(expired_entries)
+        finally:
+            if archive_file is not None:
+                archive_file.close()
+        if self.scheduler.graphs is not None:
+            report.expired_graphs = self._expire_graphs(min_completed_at)
+        if report.expired_count:
+            self.vacuum()
+            self.logger.info(
+                f"Expired {report.expired_count} results ({report.expired_bytes} bytes), "
+                f"{report.archived_count} archived"
+            )
+        return report
+
+    def _expire_graphs(self, min_completed_at: Optional[float]) -> int:
+        expired_graph_ids = []
+        for graph_id, finished_at in self.scheduler.graphs.get_finished().items():
+            if min_completed_at is not None and finished_at < min_completed_at:
+                expired_graph_ids.append(graph_id)
+                continue
+            definition = self.scheduler.graphs.get(graph_id)
+            if definition is None or not self.scheduler.index.get_many(
+                [node.task_id for node in definition.nodes.values()]
+            ):
+                # the results of all its nodes already expired
+                expired_graph_ids.append(graph_id)
+        if expired_graph_ids:
+            self.scheduler.graphs.delete(expired_graph_ids)
+        return len(expired_graph_ids)
+
+    def _get_total_bytes(self) -> int:
+        size = 0
+        offset = 0
+        while True:
+            entries = self.scheduler.index.list_entries(FINISHED_STATUSES, offset, COMPACTION_BATCH_SIZE)
+            size += sum(entry.result_size or 0 for entry in entries)
+            offset += len(entries)
+            if len(entries) < COMPACTION_BATCH_SIZE:
+                return size
+
+    def _is_expired(
+        self, entry: TaskIndexEntry, min_completed_at: Optional[float], remaining_count: int, remaining_bytes: int
+    ) -> bool:
+        if min_completed_at is not None and entry.completed_at is not None and entry.completed_at < min_completed_at:
+            return True
+        if self.policy.max_count is not None and remaining_count > self.policy.max_count:
+            return True
+        return self.policy.max_bytes is not None and remaining_bytes > self.policy.max_bytes
+
+    def _expire(self, entries: list[TaskIndexEntry], report: CompactionReport, archive_file, now: float):
+        task_ids = [entry.id for entry in entries]
+        values = self.scheduler.INSTANCE.storage.peek_many(task_ids)
+        if self.archive_dir and values:
+            if archive_file is None:
+                archive_file = self._open_archive(now, report)
+            for entry in entries:
+                if (value := values.get(entry.id)) is not None:
+                    archive_file.write(json.dumps(_get_archived_result(entry, value)))
+                    archive_file.write("\n")
+                    report.archived_count += 1
+        # archive is written before any deletion
+        if archive_file is not None:
+            archive_file.flush()
+        self._delete_results(list(values))
+        self.scheduler.index.delete(task_ids)
+        if self.scheduler.metrics is not None:
+            self.scheduler.metrics.on_entries_deleted(entries)
+        report.expired_count += len(entries)
+        report.expired_bytes += sum(entry.result_size or 0 for entry in entries)
+        return archive_file
+
+    def _open_archive(self, now: float, report: CompactionReport):
+        os.makedirs(self.archive_dir, exist_ok=True)
+        file_name = datetime.datetime.fromtimestamp(now, tz=datetime.timezone.utc).strftime(
+            "results-%Y%m%dT%H%M%S.ndjson.gz"
+        )
+        report.archive_path = os.path.join(self.archive_dir, file_name)
+        return gzip.open(report.archive_path, "at", encoding="utf-8")
+
+    def _delete_results(self, task_ids: list[Any]) -> None:
+        if not task_ids:
+            return
+        storage = self.scheduler.INSTANCE.storage
+        if isinstance(storage, SqliteStorage):
+            with storage.db(commit=True) as curs:
+                curs.executemany(
+                    "delete from kv where queue = ? and key = ?", [(storage.name, task_id) for task_id in task_ids]
+                )
+        elif isinstance(storage, RedisStorage):
+            storage.conn.hdel(storage.result_key, *task_ids)
+        else:
+            for task_id in task_ids:
+                storage.delete_data(task_id)
+
+    def vacuum(self) -> None:
+        """
+        Gives the space of deleted results back to the file system on the sqlite backend.
+        The first call switches the database to incremental auto vacuum using a full VACUUM on its own connection,
+        following calls only run incremental vacuums of a few pages at a time, without blocking the storage for long.
+        """
+        storage = self.scheduler.INSTANCE.storage
+        if not isinstance(storage, SqliteStorage):
+            return
+        try:
+            auto_vacuum, = storage.sql("pragma auto_vacuum", results=True)[0]
+            if auto_vacuum != SQLITE_INCREMENTAL_AUTO_VACUUM:
+                # a full VACUUM rewrites the database: keep the storage connection and lock available meanwhile
+                conn = sqlite3.connect(storage.filename, timeout=SQLITE_VACUUM_TIMEOUT)
+                try:
+                    conn.execute("pragma auto_vacuum = incremental")
+                    conn.execute("vacuum")
+                finally:
+                    conn.close()
+                return
+            previous_free_pages, free_pages = None, _get_free_pages(storage)
+            while free_pages and free_pages != previous_free_pages:
+                with storage.lock:
+                    # executescript steps the pragma until the pages are freed
+                    storage.conn.executescript(f"pragma incremental_vacuum({SQLITE_INCREMENTAL_VACUUM_PAGES})")
+                previous_free_pages, free_pages = free_pages, _get_free_pages(storage)
+        except Exception as e:
+            self.logger.warning(f"Failed to vacuum results storage: {e}")
+
+
+def _get_free_pages(storage: SqliteStorage) -> int:
+    return storage.sql("pragma freelist_count", results=True)[0][0]
+
+
+def _get_archived_result(entry: TaskIndexEntry, value: Any) -> dict:
+    return {
+        "id": entry.id,
+        "name": entry.name,
+        "type": entry.type,
+        "status": entry.status.value if entry.status else None,
+        "created_at": entry.created_at,
+        "completed_at": entry.completed_at,
+        # raw stored result: can be loaded back with the huey serializer
+        "value": base64.b64encode(bytes(value)).decode(),
+    }
+
+
+def every_minutes(interval: int) -> Callable[[datetime.datetime], bool]:
+    """
+    Huey periodic task validator running once every interval minutes
+    """
+    interval = max(1, int(interval))
+
+    def validate_datetime(timestamp: datetime.datetime) -> bool:
+        minutes = timestamp.hour * 60 + timestamp.minute + timestamp.toordinal() * 24 * 60
+        return minutes % interval == 0
+
+    return validate_datetime
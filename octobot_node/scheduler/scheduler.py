@@ -14,26 +14,71 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 
-from huey import Huey, RedisHuey, SqliteHuey
+from huey import Huey, PriorityRedisHuey, RedisHuey, SqliteHuey
+from huey.api import Task as HueyTask
+from huey.signals import SIGNAL_ENQUEUED, SIGNAL_SCHEDULED
 from huey.registry import Message
+from huey.storage import RedisStorage, SqliteStorage
 from huey.utils import Error as HueyError
-from typing import Optional, Any
+from huey.constants import EmptyData
+from typing import Optional, Any, Iterator
 import logging
 import pickle
 import json
+import datetime
+import copy
 from octobot_node.app.models import Task, TaskType, TaskStatus
 from octobot_node.app.core.config import settings
 from octobot_node.app.enums import TaskResultKeys
+from octobot_node.scheduler.pagination import TaskCursor, TaskSource, TASK_SOURCES_ORDER, SOURCE_STATUSES
+from octobot_node.scheduler.task_index import (
+    TaskIndex, TaskIndexEntry, TaskIndexUpdater, create_task_index, get_entry_sort_time
+)
+from octobot_node.scheduler.task_metrics import TaskMetrics
+from octobot_node.scheduler.node_registry import NodeRegistryStore, create_node_registry_store
+from octobot_node.scheduler.task_graph import TaskGraphStore, create_task_graph_store
+from octobot_node.scheduler.task_leases import TaskLeaseStore, create_task_lease_store
+from octobot_node.scheduler.task_dedupe import TaskDedupeStore, create_task_dedupe_store
+from octobot_node.scheduler.lanes import LanedStorageMixin, create_huey, create_lane_scheduler
+from octobot_node.scheduler.instrumentation import TaskInstrumentation
+from octobot_node.scheduler.serializer import TaskSerializer
 
 DEFAULT_NAME = "octobot_node"
+PAGE_READ_BATCH_SIZE = 100
+
+
+class ListRedisStorage(RedisStorage):
+    """
+    Redis list queue: tasks priorities are only honored by the priority storage
+    """
+
+    def enqueue(self, data, priority=None):
+        super().enqueue(data)
+
+
+class ListRedisHuey(RedisHuey):
+    storage_class = ListRedisStorage
+
 
 class Scheduler:
     INSTANCE: Optional[Huey] = None
 
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.index: Optional[TaskIndex] = None
+        self.index_updater: Optional[TaskIndexUpdater] = None
+        self.metrics: Optional[TaskMetrics] = None
+        self.graphs: Optional[TaskGraphStore] = None
+        self.nodes: Optional[NodeRegistryStore] = None
+        self.leases: Optional[TaskLeaseStore] = None
+        self.dedupe: Optional[TaskDedupeStore] = None
 
     def create(self):
+        lanes = create_lane_scheduler(settings.SCHEDULER_LANE_WEIGHTS, settings.SCHEDULER_LANE_MAX_CONCURRENCY)
+        serializer = TaskSerializer(
+            compact=settings.SCHEDULER_COMPACT_MESSAGES,
+            compression_threshold=settings.SCHEDULER_MESSAGE_COMPRESSION_THRESHOLD,
+        )
         if settings.SCHEDULER_REDIS_URL:
             import redis
             self.logger.info(
@@ -41,22 +86,95 @@ class Scheduler:
             )
 
             connection_pool = redis.ConnectionPool.from_url(
-                str(settings.SCHEDULER_REDIS_URL),
-                ssl_ca_certs=f"{settings.REDIS_STORAGE_CERTS_PATH}/ca.crt",
-                ssl_certfile=f"{settings.REDIS_STORAGE_CERTS_PATH}/client/client.crt",
-                ssl_keyfile=f"{settings.REDIS_STORAGE_CERTS_PATH}/client/client.key",
-                ssl_cert_reqs="required",
-                decode_responses=False,
-                socket_timeout=5,
-                socket_connect_timeout=3
+                str(settings.SCHEDULER_REDIS_URL), **get_redis_connection_kwargs()
             ) if settings.REDIS_STORAGE_CERTS_PATH is not None else None
 
-            self.INSTANCE = RedisHuey(DEFAULT_NAME, connection_pool=connection_pool) if connection_pool is not None else RedisHuey(DEFAULT_NAME, url=str(settings.SCHEDULER_REDIS_URL))
+            # the priority storage uses sorted sets instead of the lists of the default storage
+            huey_class = PriorityRedisHuey if settings.SCHEDULER_REDIS_PRIORITIES else ListRedisHuey
+            self.INSTANCE = create_huey(huey_class, DEFAULT_NAME, lanes, serializer=serializer, connection_pool=connection_pool) if connection_pool is not None else create_huey(huey_class, DEFAULT_NAME, lanes, serializer=serializer, url=str(settings.SCHEDULER_REDIS_URL))
         else:
             self.logger.info(
                 "Initializing scheduler with sqlite backend at %s", settings.SCHEDULER_SQLITE_FILE
             )
-            self.INSTANCE = SqliteHuey(DEFAULT_NAME, filename=settings.SCHEDULER_SQLITE_FILE)
+            self.INSTANCE = create_huey(
+                SqliteHuey, DEFAULT_NAME, lanes, serializer=serializer, filename=settings.SCHEDULER_SQLITE_FILE
+            )
+        self.create_index()
+        self.graphs = create_task_graph_store(self.INSTANCE)
+        self.nodes = create_node_registry_store(self.INSTANCE)
+        self.leases = create_task_lease_store(self.INSTANCE)
+        self.dedupe = create_task_dedupe_store(self.INSTANCE)
+        if settings.METRICS_ENABLED:
+            TaskInstrumentation(self.INSTANCE, self.index_updater).connect()
+
+    def create_index(self) -> None:
+        self.index = create_task_index(self.INSTANCE)
+        self.index_updater = TaskIndexUpdater(self.INSTANCE, self.index)
+        self.index_updater.connect()
+        self.metrics = TaskMetrics(self.INSTANCE)
+        self.metrics.connect(self.index_updater)
+        if not self.metrics.has_counters() and self.index.count():
+            # tasks indexed before metrics were kept
+            self.metrics.rebuild(self.index)
+
+    def enqueue_many(self, tasks: list[HueyTask]) -> None:
+        """
+        Enqueues tasks using a single storage write: one transaction on sqlite, one pipeline on redis.
+        Tasks with an eta are added to the schedule. Tasks are indexed once they are stored.
+        """
+        if self.INSTANCE.immediate:
+            for task in tasks:
+                self.INSTANCE.enqueue(task)
+            return
+        for task in tasks:
+            if task.expires:
+                task.resolve_expires(self.INSTANCE.utc)
+        messages = [(self.INSTANCE.serialize_task(task), task) for task in tasks]
+        queued = [(data, task.priority) for data, task in messages if task.eta is None]
+        scheduled = [(data, task.eta) for data, task in messages if task.eta is not None]
+        storage = self.INSTANCE.storage
+        if isinstance(storage, SqliteStorage):
+            with storage.db(commit=True) as curs:
+                curs.executemany(
+                    "insert into task (queue, data, priority) values (?, ?, ?)",
+                    [
+                        (_get_queue_storage(storage, data).name, storage.to_blob(data), priority or 0)
+                        for data, priority in queued
+                    ]
+                )
+                curs.executemany(
+                    "insert into schedule (queue, data, timestamp) values (?, ?, ?)",
+                    [(storage.name, storage.to_blob(data), eta.timestamp()) for data, eta in scheduled]
+                )
+        elif isinstance(storage, RedisStorage):
+            # run the storage own enqueue logic against a pipeline to keep priorities handling
+            pipeline = storage.conn.pipeline()
+            pipelined_storages = {}
+            for data, priority in queued:
+                queue_storage = _get_queue_storage(storage, data)
+                if queue_storage.name not in pipelined_storages:
+                    pipelined_storages[queue_storage.name] = copy.copy(queue_storage)
+                    pipelined_storages[queue_storage.name].conn = pipeline
+                pipelined_storages[queue_storage.name].enqueue(data, priority)
+            if scheduled:
+                pipelined_storage = copy.copy(storage)
+                pipelined_storage.conn = pipeline
+                for data, eta in scheduled:
+                    pipelined_storage.add_to_schedule(data, eta)
+            pipeline.execute()
+        else:
+            for data, priority in queued:
+                storage.enqueue(data, priority)
+            for data, eta in scheduled:
+                storage.add_to_schedule(data, eta)
+        self._on_tasks_stored(tasks)
+
+    def _on_tasks_stored(self, tasks: list[HueyTask]) -> None:
+        # huey has no public way to emit its signals: update the scheduler index, which also counts the events
+        if self.index_updater is not None:
+            with self.index_updater.batched():
+                for task in tasks:
+                    self.index_updater.on_signal(SIGNAL_SCHEDULED if task.eta else SIGNAL_ENQUEUED, task)
 
     def stop(self) -> None:
         if self.INSTANCE:
@@ -70,36 +188,45 @@ class Scheduler:
         periodic_tasks = self.INSTANCE._registry.periodic_tasks
         for task in periodic_tasks or []:
             try:
-                tasks.append(self._parse_task(task, TaskStatus.PERIODIC, f"Periodic task: {task.name}"))
+                tasks.append(self._parse_periodic_task(task))
             except Exception as e:
                 self.logger.warning(f"Failed to process periodic task {task.name}: {e}")
         return tasks
 
+    def get_periodic_tasks_count(self) -> int:
+        return len(self.INSTANCE._registry.periodic_tasks or [])
+
     def get_pending_tasks(self) -> list[dict]:
         tasks: list[dict] = []
         pending_tasks = self.INSTANCE.pending()
         for task in pending_tasks or []:
             try:
-                tasks.append(self._parse_task(task, TaskStatus.PENDING, f"Pending task: {task.name}"))
+                tasks.append(self._parse_pending_task(task))
             except Exception as e:
                 self.logger.warning(f"Failed to process pending task {task.name}: {e}")
         return tasks
 
+    def get_running_tasks(self) -> list[dict]:
+        """
+        Returns the tasks being executed by workers, read from the task index
+        """
+        return [task for task, _ in self.iter_tasks(TaskCursor(TaskSource.RUNNING), {TaskStatus.RUNNING})]
+
     def get_scheduled_tasks(self) -> list[dict]:
         tasks: list[dict] = []
         scheduled_tasks = self.INSTANCE.scheduled()
         for task in scheduled_tasks or []:
             try:
-                tasks.append(self._parse_task(task, TaskStatus.SCHEDULED, f"Scheduled at {task.eta.strftime('%Y-%m-%d %H:%M:%S')}"))
+                tasks.append(self._parse_scheduled_task(task))
             except Exception as e:
                 self.logger.warning(f"Failed to process scheduled task {task.name}: {e}")
         return tasks
 
-    def _decode_result(self, result_key_bytes: bytes | str, result_value_bytes: bytes | Any) -> tuple[str, Any | None]:
+    def decode_result(self, result_key_bytes: bytes | str, result_value_bytes: bytes | Any) -> tuple[str, Any | None]:
         task_id = result_key_bytes.decode('utf-8') if isinstance(result_key_bytes, bytes) else result_key_bytes
         
         try:
-            result_obj = pickle.loads(result_value_bytes) if isinstance(result_value_bytes, bytes) else result_value_bytes
+            result_obj = self.INSTANCE.serializer.deserialize(result_value_bytes) if isinstance(result_value_bytes, bytes) else result_value_bytes
             return (task_id, result_obj)
         except (pickle.UnpicklingError, Exception) as unpickle_error:
             self.logger.warning(f"Failed to unpickle result for task {task_id}: {unpickle_error}")
@@ -110,39 +237,250 @@ class Scheduler:
         result_keys = self.INSTANCE.all_results()
         for result_key_bytes, result_value_bytes in result_keys.items():
             try:
-                task_id, result_obj = self._decode_result(result_key_bytes, result_value_bytes)
-                
-                if result_obj is None:
-                    description = f"Task completed (unable to parse result)"
-                    status = TaskStatus.COMPLETED
-                    result = ""
-                    metadata = ""
-                elif isinstance(result_obj, HueyError):
-                    description = f"Task failed: {result_obj.metadata.get('error')}"
-                    status = TaskStatus.FAILED
-                    result = ""
-                    metadata = ""
-                else:
-                    description = f"Task completed"
-                    status = TaskStatus.COMPLETED
-                    result = result_obj.get(TaskResultKeys.RESULT.value)
-                    metadata = result_obj.get(TaskResultKeys.METADATA.value)
-
-                tasks.append({
-                    "id": task_id,
-                    "name": self.get_task_name(result_obj, task_id),
-                    "description": description,
-                    "status": status,
-                    "result": json.dumps(result),
-                    "result_metadata": metadata,
-                    "scheduled_at": None,
-                    "started_at": None,
-                    "completed_at": None,
-                })
+                tasks.append(self._parse_result(result_key_bytes, result_value_bytes))
             except Exception as e:
                 self.logger.warning(f"Failed to process result key {result_key_bytes}: {e}")
         return tasks
 
+    def get_tasks_page(
+        self,
+        limit: int,
+        cursor: Optional[TaskCursor] = None,
+        statuses: Optional[set[TaskStatus]] = None,
+        offset: int = 0,
+    ) -> tuple[list[dict], Optional[TaskCursor]]:
+        """
+        Returns up to limit tasks starting at cursor (or at offset when no cursor is given)
+        and the cursor of the next page, None when the listing is exhausted.
+        Only the read tasks are deserialized: a page costs O(limit) instead of O(total tasks).
+        """
+        tasks: list[dict] = []
+        if limit <= 0:
+            return tasks, None
+        batch_size = min(limit, PAGE_READ_BATCH_SIZE)
+        for task, task_cursor in self.iter_tasks(cursor, statuses, offset, batch_size):
+            tasks.append(task)
+            if len(tasks) >= limit:
+                return tasks, task_cursor
+        return tasks, None
+
+    def iter_tasks(
+        self,
+        cursor: Optional[TaskCursor] = None,
+        statuses: Optional[set[TaskStatus]] = None,
+        offset: int = 0,
+        batch_size: int = PAGE_READ_BATCH_SIZE,
+    ) -> Iterator[tuple[dict | Task, TaskCursor]]:
+        """
+        Streams tasks from each source in TASK_SOURCES_ORDER, yielding each task
+        with the cursor pointing right after it.
+        Periodic tasks are read from the registry, other tasks are listed from the index
+        by (sort time, id) keyset: resuming from a cursor costs O(batch_size) whatever the listing depth.
+        """
+        cursor = cursor or TaskCursor()
+        for source in TASK_SOURCES_ORDER[TASK_SOURCES_ORDER.index(cursor.source):]:
+            source_statuses = SOURCE_STATUSES[source] & statuses if statuses else SOURCE_STATUSES[source]
+            if not source_statuses:
+                continue
+            if source is not TaskSource.PERIODIC and self.index is None:
+                return
+            source_cursor = cursor if source is cursor.source else TaskCursor(source)
+            if offset:
+                source_size = self.get_periodic_tasks_count() if source is TaskSource.PERIODIC \
+                    else self.index.count(source_statuses)
+                if offset >= source_size:
+                    offset -= source_size
+                    continue
+            if source is TaskSource.PERIODIC:
+                yield from self._iter_periodic_tasks(source_cursor, offset)
+            else:
+                yield from self._iter_indexed_tasks(source_cursor, source_statuses, offset, batch_size)
+            offset = 0
+
+    def _iter_periodic_tasks(self, cursor: TaskCursor, offset: int) -> Iterator[tuple[Task, TaskCursor]]:
+        periodic_tasks = self.INSTANCE._registry.periodic_tasks or []
+        start = cursor.position + offset
+        for position, task in enumerate(periodic_tasks[start:], start + 1):
+            try:
+                yield self._parse_periodic_task(task), TaskCursor(cursor.source, position)
+            except Exception as e:
+                self.logger.warning(f"Failed to process periodic task {task.name}: {e}")
+
+    def _iter_indexed_tasks(
+        self, cursor: TaskCursor, statuses: set[TaskStatus], offset: int, batch_size: int
+    ) -> Iterator[tuple[dict, TaskCursor]]:
+        after = cursor.after
+        while True:
+            entries = self.index.list_page(statuses, after, batch_size, offset)
+            offset = 0
+            if not entries:
+                return
+            values = self.INSTANCE.storage.peek_many([entry.id for entry in entries]) \
+                if cursor.source is TaskSource.RESULTS else {}
+            for entry in entries:
+                after = (get_entry_sort_time(entry), entry.id)
+                task = self._parse_source_entry(cursor.source, entry, values)
+                if task is not None:
+                    yield task, TaskCursor(cursor.source, after=after)
+            if len(entries) < batch_size:
+                return
+
+    def _parse_source_entry(self, source: TaskSource, entry: TaskIndexEntry, values: dict) -> Optional[dict]:
+        if source is TaskSource.PENDING:
+            return self._parse_pending_entry(entry)
+        if source is TaskSource.RUNNING:
+            return self._parse_running_entry(entry)
+        if source is TaskSource.SCHEDULED:
+            return self._parse_scheduled_entry(entry)
+        value = values.get(entry.id)
+        if value is None:
+            # result consumed or not stored yet
+            return None
+        try:
+            return self._merge_index_entry(self._parse_result(entry.id, value), entry)
+        except Exception as e:
+            self.logger.warning(f"Failed to process result of task {entry.id}: {e}")
+            return None
+
+    def iter_results(
+        self,
+        statuses: set[TaskStatus],
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        name: Optional[str] = None,
+        batch_size: int = 500,
+    ) -> Iterator[list[dict]]:
+        """
+        Yields batches of the stored results of tasks in statuses completed between since and until,
+        by completion time. Results and their metadata are kept as stored.
+        """
+        if self.index is None:
+            return
+        after = None
+        while True:
+            entries = self.index.list_completed(statuses, since, until, after, batch_size)
+            if not entries:
+                return
+            after = (entries[-1].completed_at, entries[-1].id)
+            selected = [entry for entry in entries if name is None or entry.name == name]
+            values = self.INSTANCE.storage.peek_many([entry.id for entry in selected]) if selected else {}
+            tasks = []
+            for entry in selected:
+                value = values.get(entry.id)
+                if value is None:
+                    # result consumed or expired
+                    continue
+                try:
+                    task = self._merge_index_entry(self._parse_result(entry.id, value), entry)
+                except Exception as e:
+                    self.logger.warning(f"Failed to process result of task {entry.id}: {e}")
+                    continue
+                task["name"] = entry.name or task["name"]
+                task["type"] = entry.type
+                tasks.append(task)
+            if tasks:
+                yield tasks
+            if len(entries) < batch_size:
+                return
+
+    def _merge_index_entry(self, task: dict, entry: TaskIndexEntry) -> dict:
+        task["started_at"] = _to_datetime(entry.started_at)
+        task["completed_at"] = _to_datetime(entry.completed_at)
+        if task.get("scheduled_at") is None:
+            task["scheduled_at"] = _to_datetime(entry.eta)
+        return task
+
+    def get_indexed_task(self, task_id: str) -> Optional[dict]:
+        """
+        Returns the task identified by task_id from its stored result or its index entry,
+        None when the task is unknown
+        """
+        entry = self.index.get(task_id) if self.index is not None else None
+        return self.build_indexed_task(task_id, entry, self.INSTANCE.storage.peek_data(task_id))
+
+    def build_indexed_task(self, task_id: str, entry: Optional[TaskIndexEntry], value: Any) -> Optional[dict]:
+        """
+        Returns the task identified by task_id from its stored result value (EmptyData when there is none)
+        or its index entry
+        """
+        if value is not EmptyData:
+            task = self._parse_result(task_id, value)
+            return self._merge_index_entry(task, entry) if entry else task
+        return self._parse_index_entry(entry) if entry else None
+
+    def find_indexed_tasks(self, name: str, limit: int = 100) -> list[dict]:
+        if self.index is None:
+            return []
+        return [self._parse_index_entry(entry) for entry in self.index.find_by_name(name, limit)]
+
+    def _parse_index_entry(self, entry: TaskIndexEntry) -> dict:
+        return {
+            "id": entry.id,
+            "name": entry.name,
+            "type": entry.type,
+            "status": entry.status,
+            "priority": entry.priority,
+            "scheduled_at": _to_datetime(entry.eta),
+            "started_at": _to_datetime(entry.started_at),
+            "completed_at": _to_datetime(entry.completed_at),
+        }
+
+    def _parse_pending_entry(self, entry: TaskIndexEntry) -> dict:
+        task = self._parse_index_entry(entry)
+        task["description"] = f"Pending task: {task['name']}"
+        return task
+
+    def _parse_running_entry(self, entry: TaskIndexEntry) -> dict:
+        task = self._parse_index_entry(entry)
+        task["description"] = f"Running since {task['started_at'].strftime('%Y-%m-%d %H:%M:%S')}" \
+            if task["started_at"] else "Running task"
+        return task
+
+    def _parse_scheduled_entry(self, entry: TaskIndexEntry) -> dict:
+        task = self._parse_index_entry(entry)
+        task["description"] = f"Scheduled at {task['scheduled_at'].strftime('%Y-%m-%d %H:%M:%S')}" \
+            if task["scheduled_at"] else "Scheduled task"
+        return task
+
+    def _parse_periodic_task(self, task) -> Task:
+        return self._parse_task(task, TaskStatus.PERIODIC, f"Periodic task: {task.name}")
+
+    def _parse_pending_task(self, task) -> Task:
+        return self._parse_task(task, TaskStatus.PENDING, f"Pending task: {task.name}")
+
+    def _parse_scheduled_task(self, task) -> Task:
+        return self._parse_task(task, TaskStatus.SCHEDULED, f"Scheduled at {task.eta.strftime('%Y-%m-%d %H:%M:%S')}")
+
+    def _parse_result(self, result_key_bytes: bytes | str, result_value_bytes: bytes | Any) -> dict:
+        task_id, result_obj = self.decode_result(result_key_bytes, result_value_bytes)
+
+        if result_obj is None:
+            description = f"Task completed (unable to parse result)"
+            status = TaskStatus.COMPLETED
+            result = ""
+            metadata = ""
+        elif isinstance(result_obj, HueyError):
+            description = f"Task failed: {result_obj.metadata.get('error')}"
+            status = TaskStatus.FAILED
+            result = ""
+            metadata = ""
+        else:
+            description = f"Task completed"
+            status = TaskStatus.COMPLETED
+            result = result_obj.get(TaskResultKeys.RESULT.value)
+            metadata = result_obj.get(TaskResultKeys.METADATA.value)
+
+        return {
+            "id": task_id,
+            "name": self.get_task_name(result_obj, task_id),
+            "description": description,
+            "status": status,
+            "result": json.dumps(result),
+            "result_metadata": metadata,
+            "scheduled_at": None,
+            "started_at": None,
+            "completed_at": None,
+        }
 
     def _parse_task(self, message: Message, status: TaskStatus, description: Optional[str] = None) -> Task:
         task_kwargs = message.kwargs
@@ -182,3 +520,30 @@ class Scheduler:
             return task_data.get(TaskResultKeys.TASK.value, {}).get("name", default_value)
         else:
             return default_value
+
+
+def get_redis_connection_kwargs() -> dict[str, Any]:
+    """
+    Returns the redis connection options of the scheduler storage when REDIS_STORAGE_CERTS_PATH is set
+    """
+    if settings.REDIS_STORAGE_CERTS_PATH is None:
+        return {}
+    return {
+        "ssl_ca_certs": f"{settings.REDIS_STORAGE_CERTS_PATH}/ca.crt",
+        "ssl_certfile": f"{settings.REDIS_STORAGE_CERTS_PATH}/client/client.crt",
+        "ssl_keyfile": f"{settings.REDIS_STORAGE_CERTS_PATH}/client/client.key",
+        "ssl_cert_reqs": "required",
+        "decode_responses": False,
+        "socket_timeout": 5,
+        "socket_connect_timeout": 3,
+    }
+
+
+def _get_queue_storage(storage, data: bytes):
+    if isinstance(storage, LanedStorageMixin):
+        return storage.get_lane_storage(getattr(data, "lane", None))
+    return storage
+
+
+def _to_datetime(timestamp: Optional[float]) -> Optional[datetime.datetime]:
+    return None if timestamp is None else datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
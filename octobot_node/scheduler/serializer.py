@@ -0,0 +1,177 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import io
+import pickle
+import threading
+import uuid
+import zlib
+from typing import Any, Optional
+
+import huey
+from huey.serializer import Serializer
+
+from octobot_node.app.models import Task, TaskStatus
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# pickle data starts with the \x80 PROTO opcode: legacy messages never start with this tag
+FORMAT_TAG = b"\xfeOBN"
+FORMAT_VERSION = 1
+RAW_CONTENT = 0
+ZLIB_CONTENT = 1
+ZSTD_CONTENT = 2
+# encoded tasks reference their fields by position: only append new Task fields
+TASK_SCHEMA = (
+    "id", "name", "description", "content", "content_metadata", "type", "status", "result", "result_metadata",
+    "retries", "retry_delay", "priority", "expires", "expires_resolved", "scheduled_at", "started_at", "completed_at",
+    "idempotency_key",
+)
+
+TASK_DEFAULTS = {name: field.default for name, field in Task.model_fields.items()}
+
+
+class UnsupportedMessageVersionError(ValueError):
+    pass
+
+
+class TaskSerializer(Serializer):
+    """
+    Huey serializer encoding Task models as compact tuples of their non default fields,
+    compressing contents larger than compression_threshold bytes.
+    Messages are tagged with their format version, untagged messages are read as legacy pickles.
+    When compact is False, messages are written as legacy pickles: use it while older nodes share the queue.
+    """
+
+    def __init__(self, compact: bool = True, compression_threshold: Optional[int] = 1024, **kwargs):
+        super().__init__(**kwargs)
+        self.compact: bool = compact
+        self.compression_threshold: Optional[int] = compression_threshold
+        self._local = threading.local()
+
+    def serialize(self, data: Any) -> bytes:
+        serialized = super().serialize(data)
+        # huey hooks run after the result is stored, in the same thread: keep its size for them.
+        # data is referenced by id: keeping it would hold the last serialized value in memory
+        self._local.last_serialized = (id(data), len(serialized))
+        return serialized
+
+    def get_serialized_size(self, data: Any) -> Optional[int]:
+        """
+        Returns the size of data when it is the last value serialized by the current thread
+        """
+        last_data_id, size = getattr(self._local, "last_serialized", (None, None))
+        return size if last_data_id == id(data) else None
+
+    def _serialize(self, data: Any) -> bytes:
+        if not self.compact:
+            return super()._serialize(data)
+        buffer = io.BytesIO()
+        buffer.write(FORMAT_TAG)
+        buffer.write(bytes((FORMAT_VERSION,)))
+        _TaskPickler(buffer, self.pickle_protocol, self.compression_threshold).dump(data)
+        return buffer.getvalue()
+
+    def _deserialize(self, data: bytes) -> Any:
+        if not data.startswith(FORMAT_TAG):
+            return super()._deserialize(data)
+        version = data[len(FORMAT_TAG)]
+        if version > FORMAT_VERSION:
+            raise UnsupportedMessageVersionError(f"Unsupported message format version: {version}")
+        return pickle.loads(data[len(FORMAT_TAG) + 1:])
+
+
+def get_stored_size(huey_instance: huey.Huey, value: Any) -> int:
+    """
+    Returns the size of value once serialized by huey_instance, reusing the size of its last serialization when known
+    """
+    serializer = huey_instance.serializer
+    if isinstance(serializer, TaskSerializer) and (size := serializer.get_serialized_size(value)) is not None:
+        return size
+    return len(serializer.serialize(value))
+
+
+class _TaskPickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO, protocol: int, compression_threshold: Optional[int]):
+        super().__init__(file, protocol)
+        self.compression_threshold: Optional[int] = compression_threshold
+
+    def reducer_override(self, obj: Any) -> Any:
+        if type(obj) is Task:
+            return load_task, (encode_task(obj, self.compression_threshold),)
+        return NotImplemented
+
+
+def encode_task(task: Task, compression_threshold: Optional[int] = None) -> dict[int, Any]:
+    """
+    Returns the non default fields of task by position in TASK_SCHEMA
+    """
+    values = {}
+    for index, name in enumerate(TASK_SCHEMA):
+        value = getattr(task, name)
+        if name == "id":
+            # the id default is generated: always keep it
+            values[index] = value.bytes if isinstance(value, uuid.UUID) else value
+        elif value != TASK_DEFAULTS[name]:
+            if isinstance(value, TaskStatus):
+                value = value.value
+            elif name == "content" and value is not None:
+                value = _encode_content(value, compression_threshold)
+            values[index] = value
+    return values
+
+
+def load_task(values: dict[int, Any]) -> Task:
+    fields = {TASK_SCHEMA[index]: value for index, value in values.items()}
+    if isinstance(fields.get("id"), bytes):
+        fields["id"] = uuid.UUID(bytes=fields["id"])
+    if fields.get("status") is not None:
+        fields["status"] = TaskStatus(fields["status"])
+    if fields.get("content") is not None:
+        fields["content"] = _decode_content(fields["content"])
+    # encoded tasks were validated when created: restore their state like unpickling does
+    task = Task.__new__(Task)
+    task.__setstate__({
+        "__dict__": {**TASK_DEFAULTS, **fields},
+        "__pydantic_fields_set__": set(fields),
+        "__pydantic_extra__": None,
+        "__pydantic_private__": None,
+    })
+    return task
+
+
+def _encode_content(content: str, compression_threshold: Optional[int]) -> tuple[int, bytes] | str:
+    if compression_threshold is None or len(content) < compression_threshold:
+        return content
+    if zstandard is not None:
+        return ZSTD_CONTENT, zstandard.ZstdCompressor().compress(content.encode())
+    return ZLIB_CONTENT, zlib.compress(content.encode())
+
+
+def _decode_content(content: tuple[int, bytes] | str) -> str:
+    if isinstance(content, str):
+        return content
+    codec, data = content
+    if codec == ZLIB_CONTENT:
+        return zlib.decompress(data).decode()
+    if codec == ZSTD_CONTENT:
+        if zstandard is None:
+            raise UnsupportedMessageVersionError("zstandard is required to read this message")
+        return zstandard.ZstdDecompressor().decompress(data).decode()
+    return data.decode()
@@ -0,0 +1,178 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import abc
+import threading
+from typing import Callable, Optional, TypeVar
+
+import huey
+from huey.storage import RedisStorage, SqliteStorage
+
+StoreT = TypeVar("StoreT")
+
+
+def create_backend_store(
+    huey_instance: huey.Huey,
+    sqlite_store: Callable[[SqliteStorage], StoreT],
+    redis_store: Callable[[RedisStorage], StoreT],
+    memory_store: Callable[[], StoreT],
+) -> StoreT:
+    """
+    Returns the store of the huey_instance storage backend
+    """
+    storage = huey_instance.storage
+    if isinstance(storage, SqliteStorage):
+        return sqlite_store(storage)
+    if isinstance(storage, RedisStorage):
+        return redis_store(storage)
+    return memory_store()
+
+
+class KeyedStore(abc.ABC):
+    """
+    Stores serialized values by key in a namespace next to the Huey storage
+    """
+
+    def put(self, key: str, value: str) -> None:
+        self.put_many({key: value})
+
+    @abc.abstractmethod
+    def put_many(self, values: dict[str, str]) -> None:
+        """
+        Stores values by key in a single write
+        """
+
+    def get(self, key: str) -> Optional[str]:
+        return self.get_many([key]).get(key)
+
+    @abc.abstractmethod
+    def get_many(self, keys: list[str]) -> dict[str, str]:
+        """
+        Returns the values of the stored keys
+        """
+
+    @abc.abstractmethod
+    def get_all(self) -> dict[str, str]:
+        """
+        Returns all the values, sorted by key
+        """
+
+    @abc.abstractmethod
+    def delete(self, keys: list[str]) -> None:
+        ...
+
+
+class SqliteKeyedStore(KeyedStore):
+    TABLE = (
+        "create table if not exists keyed_store ("
+        "queue text not null, namespace text not null, key text not null, value text not null, "
+        "primary key(queue, namespace, key))"
+    )
+    MAX_SQL_VARIABLES = 500
+
+    def __init__(self, storage: SqliteStorage, namespace: str):
+        self.storage: SqliteStorage = storage
+        self.namespace: str = namespace
+        self.storage.sql(self.TABLE, commit=True)
+
+    def put_many(self, values: dict[str, str]) -> None:
+        with self.storage.db(commit=True) as curs:
+            curs.executemany(
+                "insert or replace into keyed_store (queue, namespace, key, value) values (?, ?, ?, ?)",
+                [(self.storage.name, self.namespace, key, value) for key, value in values.items()]
+            )
+
+    def get_many(self, keys: list[str]) -> dict[str, str]:
+        values = {}
+        for i in range(0, len(keys), self.MAX_SQL_VARIABLES):
+            chunk = keys[i:i + self.MAX_SQL_VARIABLES]
+            values.update(self.storage.sql(
+                f"select key, value from keyed_store where queue = ? and namespace = ? "
+                f"and key in ({', '.join('?' * len(chunk))})",
+                (self.storage.name, self.namespace, *chunk), results=True
+            ))
+        return values
+
+    def get_all(self) -> dict[str, str]:
+        return dict(self.storage.sql(
+            "select key, value from keyed_store where queue = ? and namespace = ? order by key",
+            (self.storage.name, self.namespace), results=True
+        ))
+
+    def delete(self, keys: list[str]) -> None:
+        with self.storage.db(commit=True) as curs:
+            curs.executemany(
+                "delete from keyed_store where queue = ? and namespace = ? and key = ?",
+                [(self.storage.name, self.namespace, key) for key in keys]
+            )
+
+
+class RedisKeyedStore(KeyedStore):
+    def __init__(self, storage: RedisStorage, namespace: str):
+        self.conn = storage.conn
+        self.key = f"huey.{namespace}.{storage.name}"
+
+    def put_many(self, values: dict[str, str]) -> None:
+        if values:
+            self.conn.hset(self.key, mapping=values)
+
+    def get_many(self, keys: list[str]) -> dict[str, str]:
+        if not keys:
+            return {}
+        return {
+            key: value.decode()
+            for key, value in zip(keys, self.conn.hmget(self.key, keys))
+            if value is not None
+        }
+
+    def get_all(self) -> dict[str, str]:
+        return {key.decode(): value.decode() for key, value in sorted(self.conn.hgetall(self.key).items())}
+
+    def delete(self, keys: list[str]) -> None:
+        if keys:
+            self.conn.hdel(self.key, *keys)
+
+
+class MemoryKeyedStore(KeyedStore):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values: dict[str, str] = {}
+
+    def put_many(self, values: dict[str, str]) -> None:
+        with self.lock:
+            self.values.update(values)
+
+    def get_many(self, keys: list[str]) -> dict[str, str]:
+        with self.lock:
+            return {key: self.values[key] for key in keys if key in self.values}
+
+    def get_all(self) -> dict[str, str]:
+        with self.lock:
+            return {key: self.values[key] for key in sorted(self.values)}
+
+    def delete(self, keys: list[str]) -> None:
+        with self.lock:
+            for key in keys:
+                self.values.pop(key, None)
+
+
+def create_keyed_store(huey_instance: huey.Huey, namespace: str) -> KeyedStore:
+    return create_backend_store(
+        huey_instance,
+        lambda storage: SqliteKeyedStore(storage, namespace),
+        lambda storage: RedisKeyedStore(storage, namespace),
+        MemoryKeyedStore,
+    )
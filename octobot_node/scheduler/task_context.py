@@ -17,10 +17,12 @@
 import contextlib
 import logging
 import json
+import time
 from typing import Any
 
 from octobot_node.scheduler.encryption import decrypt_task_content, encrypt_task_result
 from octobot_node.app.core.config import settings
+from octobot_node.app.core import metrics
 from octobot_node.app.models import Task
 from octobot_node.app.enums import TaskResultKeys
 from octobot_node.scheduler.encryption import MissingMetadataError
@@ -44,7 +46,9 @@ def encrypted_task(task: Task):
             try:
                 if not task.content_metadata:
                     raise MissingMetadataError("No metadata provided for content decryption")
+                start = time.perf_counter()
                 decrypted_content = decrypt_task_content(task.content, task.content_metadata)
+                metrics.TASK_ENCRYPTION.observe(time.perf_counter() - start, operation="decrypt_content")
                 task.content = decrypted_content
             except Exception as e:
                 logger.error(f"Failed to decrypt content: {e}")
@@ -69,7 +73,9 @@ def encrypted_task(task: Task):
             if settings.TASKS_OUTPUTS_RSA_PUBLIC_KEY and settings.TASKS_OUTPUTS_ECDSA_PRIVATE_KEY:
                 try:
                     result_json = json.dumps(task.result)
+                    start = time.perf_counter()
                     encrypted_result, metadata = encrypt_task_result(result_json)
+                    metrics.TASK_ENCRYPTION.observe(time.perf_counter() - start, operation="encrypt_result")
                     task.result = encrypted_result
                     task.result_metadata = metadata
                 except Exception as e:
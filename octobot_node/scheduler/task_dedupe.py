@@ -0,0 +1,186 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import abc
+import hashlib
+import json
+import threading
+import time
+from typing import Optional
+
+import huey
+import huey.api
+import huey.signals
+from huey.storage import RedisStorage, SqliteStorage
+
+from octobot_node.app.models import Task
+from octobot_node.scheduler.stores import create_backend_store
+
+
+def get_idempotency_key(task: Task) -> str:
+    """
+    Returns the task idempotency key, defaults to a hash of its name, type and content
+    """
+    if task.idempotency_key:
+        return task.idempotency_key
+    return hashlib.sha256(json.dumps([task.name, task.type, task.content]).encode()).hexdigest()
+
+
+class TaskDedupeStore(abc.ABC):
+    """
+    Stores the idempotency keys of submitted tasks with the id of their scheduler task,
+    until the task is finished or for ttl seconds at most
+    """
+    FINISHED_SIGNALS = (
+        huey.signals.SIGNAL_COMPLETE,
+        huey.signals.SIGNAL_ERROR,
+        huey.signals.SIGNAL_EXPIRED,
+        huey.signals.SIGNAL_REVOKED,
+        huey.signals.SIGNAL_CANCELED,
+    )
+
+    def connect(self, huey_instance: huey.Huey) -> None:
+        """
+        Releases the keys of finished tasks: their task can be submitted again
+        """
+        huey_instance.signal(*self.FINISHED_SIGNALS)(self.on_finished)
+
+    def on_finished(self, signal: str, task: huey.api.Task, *args) -> None:
+        if signal == huey.signals.SIGNAL_ERROR and task.retries:
+            # the task will be retried
+            return
+        if task.args and isinstance(task.args[0], Task):
+            self.release([get_idempotency_key(task.args[0])], [task.id])
+
+    @abc.abstractmethod
+    def claim_many(self, keys: list[str], task_ids: list[str], ttl: float) -> list[Optional[str]]:
+        """
+        Atomically claims each key for the task id at the same position.
+        Returns None for claimed keys and the id of the task that already claimed the others.
+        """
+
+    @abc.abstractmethod
+    def release(self, keys: list[str], task_ids: list[str]) -> None:
+        """
+        Releases each key still claimed by the task id at the same position
+        """
+
+
+class SqliteTaskDedupeStore(TaskDedupeStore):
+    TABLE = (
+        "create table if not exists task_dedupe ("
+        "queue text not null, key text not null, task_id text not null, expires_at real not null, "
+        "primary key(queue, key))"
+    )
+    EXPIRES_AT_INDEX = "create index if not exists task_dedupe_expires_at on task_dedupe (queue, expires_at)"
+
+    def __init__(self, storage: SqliteStorage):
+        self.storage: SqliteStorage = storage
+        self.storage.sql(self.TABLE, commit=True)
+        self.storage.sql(self.EXPIRES_AT_INDEX, commit=True)
+
+    def claim_many(self, keys: list[str], task_ids: list[str], ttl: float) -> list[Optional[str]]:
+        now = time.time()
+        claimed_by = []
+        with self.storage.db(commit=True) as curs:
+            curs.execute("delete from task_dedupe where queue = ? and expires_at <= ?", (self.storage.name, now))
+            for key, task_id in zip(keys, task_ids):
+                curs.execute(
+                    "insert or ignore into task_dedupe (queue, key, task_id, expires_at) values (?, ?, ?, ?)",
+                    (self.storage.name, key, task_id, now + ttl)
+                )
+                if curs.rowcount:
+                    claimed_by.append(None)
+                else:
+                    claimed_by.append(curs.execute(
+                        "select task_id from task_dedupe where queue = ? and key = ?", (self.storage.name, key)
+                    ).fetchone()[0])
+        return claimed_by
+
+    def release(self, keys: list[str], task_ids: list[str]) -> None:
+        with self.storage.db(commit=True) as curs:
+            curs.executemany(
+                "delete from task_dedupe where queue = ? and key = ? and task_id = ?",
+                [(self.storage.name, key, task_id) for key, task_id in zip(keys, task_ids)]
+            )
+
+
+class RedisTaskDedupeStore(TaskDedupeStore):
+    # deletes the key only when it is still claimed by the task
+    RELEASE_SCRIPT = """
+    if redis.call("get", KEYS[1]) == ARGV[1] then
+        return redis.call("del", KEYS[1])
+    end
+    return 0
+    """
+
+    def __init__(self, storage: RedisStorage):
+        self.conn = storage.conn
+        self.prefix = f"huey.dedupe.{storage.name}"
+        self._release_script = self.conn.register_script(self.RELEASE_SCRIPT)
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}.{key}"
+
+    def claim_many(self, keys: list[str], task_ids: list[str], ttl: float) -> list[Optional[str]]:
+        # a transaction: keys can't expire or be claimed between SET and GET
+        pipe = self.conn.pipeline()
+        for key, task_id in zip(keys, task_ids):
+            pipe.set(self._key(key), task_id, nx=True, px=max(int(ttl * 1000), 1))
+            pipe.get(self._key(key))
+        results = pipe.execute()
+        return [
+            None if claimed else task_id.decode()
+            for claimed, task_id in zip(results[::2], results[1::2])
+        ]
+
+    def release(self, keys: list[str], task_ids: list[str]) -> None:
+        pipe = self.conn.pipeline()
+        for key, task_id in zip(keys, task_ids):
+            self._release_script(keys=[self._key(key)], args=[task_id], client=pipe)
+        pipe.execute()
+
+
+class MemoryTaskDedupeStore(TaskDedupeStore):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.claims: dict[str, tuple[str, float]] = {}
+
+    def claim_many(self, keys: list[str], task_ids: list[str], ttl: float) -> list[Optional[str]]:
+        now = time.time()
+        claimed_by = []
+        with self.lock:
+            for key in [key for key, (_, expires_at) in self.claims.items() if expires_at <= now]:
+                del self.claims[key]
+            for key, task_id in zip(keys, task_ids):
+                claim = self.claims.get(key)
+                if claim is None:
+                    self.claims[key] = (task_id, now + ttl)
+                    claimed_by.append(None)
+                else:
+                    claimed_by.append(claim[0])
+        return claimed_by
+
+    def release(self, keys: list[str], task_ids: list[str]) -> None:
+        with self.lock:
+            for key, task_id in zip(keys, task_ids):
+                claim = self.claims.get(key)
+                if claim is not None and claim[0] == task_id:
+                    del self.claims[key]
+
+
+def create_task_dedupe_store(huey_instance: huey.Huey) -> TaskDedupeStore:
+    return create_backend_store(huey_instance, SqliteTaskDedupeStore, RedisTaskDedupeStore, MemoryTaskDedupeStore)
@@ -0,0 +1,254 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import contextlib
+import dataclasses
+import json
+import logging
+import threading
+import time
+from typing import AsyncIterator, Callable, Optional
+
+import huey
+from huey.storage import RedisStorage
+
+from octobot_node.app.models import TaskStatus
+from octobot_node.scheduler.task_index import TaskIndexEntry
+
+EVENT_TYPES: dict[TaskStatus, str] = {
+    TaskStatus.PENDING: "enqueued",
+    TaskStatus.SCHEDULED: "scheduled",
+    TaskStatus.RUNNING: "started",
+    TaskStatus.COMPLETED: "completed",
+    TaskStatus.FAILED: "failed",
+}
+RESCHEDULED_EVENT_TYPE = "rescheduled"
+# sent to subscribers that missed events: they should reload the tasks listing
+RESYNC_EVENT_TYPE = "resync"
+WAITING_STATUSES = {TaskStatus.PENDING, TaskStatus.SCHEDULED}
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 1000
+
+
+@dataclasses.dataclass
+class TaskEvent:
+    type: str
+    task_id: Optional[str] = None
+    status: Optional[TaskStatus] = None
+    previous_status: Optional[TaskStatus] = None
+    name: Optional[str] = None
+    task_type: Optional[str] = None
+    timestamp: float = 0
+    metrics_delta: dict[str, int] = dataclasses.field(default_factory=dict)  # tasks count change by status
+
+    def __post_init__(self):
+        if self.status is not None and not isinstance(self.status, TaskStatus):
+            self.status = TaskStatus(self.status)
+        if self.previous_status is not None and not isinstance(self.previous_status, TaskStatus):
+            self.previous_status = TaskStatus(self.previous_status)
+
+    def to_dict(self) -> dict:
+        values = dataclasses.asdict(self)
+        values["status"] = self.status.value if self.status else None
+        values["previous_status"] = self.previous_status.value if self.previous_status else None
+        return values
+
+    def to_sse(self) -> str:
+        return f"event: {self.type}\ndata: {json.dumps(self.to_dict())}\n\n"
+
+
+def create_task_events(changes: list[tuple[TaskIndexEntry, Optional[TaskStatus]]]) -> list[TaskEvent]:
+    """
+    Returns the events of the status changes recorded by a TaskIndexUpdater
+    """
+    events = []
+    now = time.time()
+    for entry, previous_status in changes:
+        if entry.status is None or entry.status is previous_status:
+            # result size updates and repeated signals
+            continue
+        event_type = EVENT_TYPES[entry.status]
+        if entry.status in WAITING_STATUSES and previous_status is not None and previous_status not in WAITING_STATUSES:
+            # retried or requeued after its execution started
+            event_type = RESCHEDULED_EVENT_TYPE
+        metrics_delta = {entry.status.value: 1}
+        if previous_status is not None:
+            metrics_delta[previous_status.value] = -1
+        events.append(TaskEvent(
+            type=event_type,
+            task_id=entry.id,
+            status=entry.status,
+            previous_status=previous_status,
+            name=entry.name,
+            task_type=entry.type,
+            timestamp=now,
+            metrics_delta=metrics_delta,
+        ))
+    return events
+
+
+class TaskEventSubscription:
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_queue_size: int):
+        self.loop: asyncio.AbstractEventLoop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(max_queue_size)
+        self.lagged: bool = False
+
+    def put(self, event: TaskEvent) -> None:
+        # called in the subscription loop
+        if self.lagged:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # the subscriber is too slow: replace its backlog by a resync event
+            self.lagged = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(TaskEvent(type=RESYNC_EVENT_TYPE, timestamp=time.time()))
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[TaskEvent]:
+        """
+        Returns the next event, None when no event was published within timeout seconds
+        """
+        try:
+            event = await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if event.type == RESYNC_EVENT_TYPE:
+            self.lagged = False
+        return event
+
+
+class TaskEventBroadcaster:
+    """
+    Fans out task events to the subscribers of this process. Events can be published from any thread.
+    """
+
+    def __init__(self, max_queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE):
+        self.max_queue_size: int = max_queue_size
+        self.lock = threading.Lock()
+        self.subscriptions: list[TaskEventSubscription] = []
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[TaskEventSubscription]:
+        subscription = TaskEventSubscription(asyncio.get_running_loop(), self.max_queue_size)
+        with self.lock:
+            self.subscriptions.append(subscription)
+        try:
+            yield subscription
+        finally:
+            with self.lock:
+                self.subscriptions.remove(subscription)
+
+    def publish(self, events: list[TaskEvent]) -> None:
+        with self.lock:
+            subscriptions = list(self.subscriptions)
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(_put_events, subscription, events)
+            except RuntimeError:
+                # subscription loop is closed
+                pass
+
+
+def _put_events(subscription: TaskEventSubscription, events: list[TaskEvent]) -> None:
+    for event in events:
+        subscription.put(event)
+
+
+class TaskEventBus:
+    """
+    Publishes task events from the task index status changes to the broadcaster of this process.
+    Events are only seen by the API of the process executing the tasks: use thread or greenlet workers.
+    """
+
+    def __init__(self, broadcaster: TaskEventBroadcaster):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.broadcaster: TaskEventBroadcaster = broadcaster
+
+    def on_status_changes(self, changes: list[tuple[TaskIndexEntry, Optional[TaskStatus]]]) -> None:
+        events = create_task_events(changes)
+        if events:
+            self.publish(events)
+
+    def publish(self, events: list[TaskEvent]) -> None:
+        self.broadcaster.publish(events)
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class RedisTaskEventBus(TaskEventBus):
+    """
+    Publishes task events on a redis pub/sub channel, which is relayed to the broadcaster of each API process:
+    events of the tasks executed on any node are seen by every node.
+    get_async_client returns the redis.asyncio client used to listen to the channel.
+    """
+    RELAY_RETRY_DELAY = 5
+
+    def __init__(self, broadcaster: TaskEventBroadcaster, storage: RedisStorage, get_async_client: Callable):
+        super().__init__(broadcaster)
+        self.conn = storage.conn
+        self.channel: str = f"huey.events.{storage.name}"
+        self.get_async_client: Callable = get_async_client
+        self._relay_task: Optional[asyncio.Task] = None
+
+    def publish(self, events: list[TaskEvent]) -> None:
+        self.conn.publish(self.channel, json.dumps([event.to_dict() for event in events]))
+
+    async def start(self) -> None:
+        if self._relay_task is None:
+            self._relay_task = asyncio.create_task(self._relay_forever())
+
+    async def stop(self) -> None:
+        if self._relay_task is not None:
+            self._relay_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._relay_task
+            self._relay_task = None
+
+    async def _relay_forever(self) -> None:
+        while True:
+            try:
+                await self._relay()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Task events relay interrupted: {e}")
+                # events published in the meantime are lost: subscribers have to resync
+                self.broadcaster.publish([TaskEvent(type=RESYNC_EVENT_TYPE, timestamp=time.time())])
+                await asyncio.sleep(self.RELAY_RETRY_DELAY)
+
+    async def _relay(self) -> None:
+        pubsub = self.get_async_client().pubsub()
+        try:
+            await pubsub.subscribe(self.channel)
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                self.broadcaster.publish([TaskEvent(**values) for values in json.loads(message["data"])])
+        finally:
+            await pubsub.aclose()
+
+
+def create_task_event_bus(huey_instance: huey.Huey, get_async_client: Callable) -> TaskEventBus:
+    broadcaster = TaskEventBroadcaster()
+    if isinstance(huey_instance.storage, RedisStorage):
+        return RedisTaskEventBus(broadcaster, huey_instance.storage, get_async_client)
+    return TaskEventBus(broadcaster)
@@ -0,0 +1,362 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import contextvars
+import dataclasses
+import json
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Callable, Optional
+
+import huey
+import huey.api
+from octobot_node.scheduler.stores import KeyedStore, create_keyed_store
+
+from octobot_node.app.enums import TaskResultKeys
+from octobot_node.app.models import Task, TaskGraph, TaskStatus
+from octobot_node.scheduler.task_index import TaskIndex
+
+
+COMPLETED_NODES_COUNTER = "completed"
+# (graph_id, node_key) of the graph node executed in the current context
+_CURRENT_NODE: contextvars.ContextVar[Optional[tuple[str, str]]] = contextvars.ContextVar(
+    "task_graph_current_node", default=None
+)
+
+
+class TaskGraphError(ValueError):
+    pass
+
+
+@dataclasses.dataclass
+class TaskGraphNodeDefinition:
+    key: str
+    task_id: str
+    task: Task
+    depends_on: list[str] = dataclasses.field(default_factory=list)
+
+    def is_join(self) -> bool:
+        # nodes without task type only merge the results of their dependencies
+        return self.task.type is None
+
+
+@dataclasses.dataclass
+class TaskGraphDefinition:
+    id: str
+    name: Optional[str]
+    nodes: dict[str, TaskGraphNodeDefinition]
+    created_at: float = 0
+
+    def __post_init__(self):
+        self._dependents: dict[str, list[TaskGraphNodeDefinition]] = {key: [] for key in self.nodes}
+        for node in self.nodes.values():
+            for dependency in node.depends_on:
+                self._dependents[dependency].append(node)
+
+    def get_roots(self) -> list[TaskGraphNodeDefinition]:
+        return [node for node in self.nodes.values() if not node.depends_on]
+
+    def get_dependents(self, key: str) -> list[TaskGraphNodeDefinition]:
+        return self._dependents[key]
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "id": self.id,
+            "name": self.name,
+            "created_at": self.created_at,
+            "nodes": [
+                {
+                    "key": node.key,
+                    "task_id": node.task_id,
+                    "task": node.task.model_dump(mode="json"),
+                    "depends_on": node.depends_on,
+                }
+                for node in self.nodes.values()
+            ],
+        })
+
+    @classmethod
+    def from_json(cls, definition: str | bytes) -> "TaskGraphDefinition":
+        parsed = json.loads(definition)
+        return cls(
+            id=parsed["id"],
+            name=parsed["name"],
+            created_at=parsed["created_at"],
+            nodes={
+                node["key"]: TaskGraphNodeDefinition(
+                    key=node["key"],
+                    task_id=node["task_id"],
+                    task=Task.model_validate(node["task"]),
+                    depends_on=node["depends_on"],
+                )
+                for node in parsed["nodes"]
+            },
+        )
+
+
+def create_task_graph_definition(graph: TaskGraph) -> TaskGraphDefinition:
+    """
+    Validates graph and assigns a scheduler task id to each of its nodes.
+    Raises TaskGraphError when the graph is empty, has duplicated or unknown node keys or a cycle.
+    """
+    if not graph.nodes:
+        raise TaskGraphError("A task graph requires at least one node")
+    nodes: dict[str, TaskGraphNodeDefinition] = {}
+    for node in graph.nodes:
+        if node.key in nodes:
+            raise TaskGraphError(f"Duplicated node key: {node.key}")
+        nodes[node.key] = TaskGraphNodeDefinition(
+            key=node.key,
+            task_id=str(uuid.uuid4()),
+            task=node.task or Task(name=node.key),
+            depends_on=list(dict.fromkeys(node.depends_on)),
+        )
+    for node in nodes.values():
+        unknown = [dependency for dependency in node.depends_on if dependency not in nodes]
+        if unknown:
+            raise TaskGraphError(f"Node {node.key} depends on unknown nodes: {', '.join(unknown)}")
+    definition = TaskGraphDefinition(id=str(uuid.uuid4()), name=graph.name, nodes=nodes, created_at=time.time())
+    _check_acyclic(definition)
+    return definition
+
+
+def _check_acyclic(definition: TaskGraphDefinition) -> None:
+    remaining = {key: len(node.depends_on) for key, node in definition.nodes.items()}
+    ready = [node.key for node in definition.get_roots()]
+    visited = 0
+    while ready:
+        key = ready.pop()
+        visited += 1
+        for dependent in definition.get_dependents(key):
+            remaining[dependent.key] -= 1
+            if remaining[dependent.key] == 0:
+                ready.append(dependent.key)
+    if visited != len(definition.nodes):
+        raise TaskGraphError("Task graph has a cycle")
+
+
+def _get_counter_key(graph_id: str, key: str) -> str:
+    return f"graph:{graph_id}:{key}"
+
+
+def get_graph_status(node_statuses: list[Optional[TaskStatus]]) -> TaskStatus:
+    """
+    Aggregates the status of graph nodes, None being a node waiting for its dependencies
+    """
+    if TaskStatus.FAILED in node_statuses:
+        return TaskStatus.FAILED
+    if all(status is TaskStatus.COMPLETED for status in node_statuses):
+        return TaskStatus.COMPLETED
+    if TaskStatus.RUNNING in node_statuses or TaskStatus.COMPLETED in node_statuses:
+        return TaskStatus.RUNNING
+    if TaskStatus.SCHEDULED in node_statuses:
+        return TaskStatus.SCHEDULED
+    return TaskStatus.PENDING
+
+
+class TaskGraphStore:
+    """
+    Stores task graph definitions next to the Huey storage, with the completion time of finished graphs
+    """
+
+    def __init__(self, store: KeyedStore, finished_store: KeyedStore):
+        self.store: KeyedStore = store
+        self.finished_store: KeyedStore = finished_store
+
+    def save(self, definition: TaskGraphDefinition) -> None:
+        self.store.put(definition.id, definition.to_json())
+
+    def get(self, graph_id: str) -> Optional[TaskGraphDefinition]:
+        definition = self.store.get(graph_id)
+        return TaskGraphDefinition.from_json(definition) if definition is not None else None
+
+    def mark_finished(self, graph_id: str, finished_at: float) -> None:
+        self.finished_store.put(graph_id, str(finished_at))
+
+    def is_finished(self, graph_id: str) -> bool:
+        return self.finished_store.get(graph_id) is not None
+
+    def get_finished(self) -> dict[str, float]:
+        """
+        Returns the completion time of finished graphs by graph id
+        """
+        return {graph_id: float(finished_at) for graph_id, finished_at in self.finished_store.get_all().items()}
+
+    def delete(self, graph_ids: list[str]) -> None:
+        self.store.delete(graph_ids)
+        self.finished_store.delete(graph_ids)
+
+
+def create_task_graph_store(huey_instance: huey.Huey) -> TaskGraphStore:
+    return TaskGraphStore(
+        create_keyed_store(huey_instance, "graphs"), create_keyed_store(huey_instance, "graphs.finished")
+    )
+
+
+class TaskGraphRunner:
+    """
+    Runs task graphs: nodes without dependencies are enqueued on submission, then each node is enqueued
+    once all its dependencies completed. Independent branches run concurrently on consumers.
+    node_task is the scheduler task executing a node, called with (task, graph_id, node_key): it runs
+    nodes using execute_node, which lets them schedule their next execution with continue_current_node.
+    Once the graph completes or one of its nodes failed, its counters are deleted and it is marked as finished:
+    its definition is deleted by the results retention.
+    """
+
+    def __init__(self, huey_instance: huey.Huey, store: TaskGraphStore, node_task: huey.api.TaskWrapper):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.huey: huey.Huey = huey_instance
+        self.store: TaskGraphStore = store
+        self.node_task: huey.api.TaskWrapper = node_task
+        self._lock = threading.Lock()
+        # next executions of graph nodes, by (graph_id, node_key)
+        self._continuations: dict[tuple[str, str], tuple[Task, float]] = {}
+
+    def connect(self) -> None:
+        self.huey.post_execute(name=self.__class__.__name__)(self.on_post_execute)
+
+    def create_node_task(self, definition: TaskGraphDefinition, node: TaskGraphNodeDefinition) -> huey.api.Task:
+        node_task = self.node_task.s(node.task, definition.id, node.key, priority=node.task.priority)
+        node_task.id = node.task_id
+        return node_task
+
+    def submit(self, graph: TaskGraph) -> tuple[TaskGraphDefinition, list[huey.api.Task]]:
+        """
+        Stores graph and returns its definition with the scheduler tasks of its root nodes, to enqueue
+        """
+        definition = create_task_graph_definition(graph)
+        self.store.save(definition)
+        return definition, [self.create_node_task(definition, node) for node in definition.get_roots()]
+
+    def execute_node(self, graph_id: str, node_key: str, node_function: Callable[[], Any]) -> Any:
+        token = _CURRENT_NODE.set((graph_id, node_key))
+        try:
+            return node_function()
+        finally:
+            _CURRENT_NODE.reset(token)
+
+    def continue_current_node(self, task: Task, delay: float) -> bool:
+        """
+        Schedules the next execution of the graph node being executed with task, once its current execution
+        is stored: its dependents are only enqueued after its last execution.
+        Returns False when no graph node is being executed.
+        """
+        current_node = _CURRENT_NODE.get()
+        if current_node is None:
+            return False
+        with self._lock:
+            self._continuations[current_node] = (task, delay)
+        return True
+
+    def on_post_execute(self, task: huey.api.Task, task_value: Any, exception: Optional[Exception]) -> None:
+        # post_execute hooks run once the task result is stored: dependents can read it
+        if not isinstance(task, self.node_task.task_class):
+            return
+        _, graph_id, node_key = task.args
+        with self._lock:
+            continuation = self._continuations.pop((graph_id, node_key), None)
+        try:
+            if exception is not None:
+                if not task.retries:
+                    self.finish(graph_id)
+            elif continuation is not None:
+                next_task, delay = continuation
+                # the same scheduler task id keeps the node result where its dependents read it
+                self.node_task.schedule(
+                    args=(next_task, graph_id, node_key), delay=delay, priority=next_task.priority, id=task.id
+                )
+            else:
+                self.dispatch_dependents(graph_id, node_key)
+        except Exception as e:
+            self.logger.exception(f"Failed to dispatch dependents of node {node_key} of graph {graph_id}: {e}")
+
+    def dispatch_dependents(self, graph_id: str, node_key: str) -> None:
+        definition = self.store.get(graph_id)
+        if definition is None:
+            self.logger.warning(f"Unknown task graph: {graph_id}")
+            return
+        if self.store.is_finished(graph_id):
+            # one of its nodes failed: its counters are deleted
+            return
+        for dependent in definition.get_dependents(node_key):
+            counter_key = _get_counter_key(graph_id, dependent.key)
+            # atomic: only the last completed dependency enqueues the dependent
+            if self.huey.storage.incr(counter_key) == len(dependent.depends_on):
+                self.huey.storage.delete_counter(counter_key)
+                self.huey.enqueue(self.create_node_task(definition, dependent))
+        if self.huey.storage.incr(_get_counter_key(graph_id, COMPLETED_NODES_COUNTER)) == len(definition.nodes):
+            self.finish(graph_id, definition)
+
+    def finish(self, graph_id: str, definition: Optional[TaskGraphDefinition] = None) -> None:
+        """
+        Deletes the counters of graph_id and marks it as finished
+        """
+        definition = definition or self.store.get(graph_id)
+        if definition is None:
+            return
+        for key in [*definition.nodes, COMPLETED_NODES_COUNTER]:
+            self.huey.storage.delete_counter(_get_counter_key(graph_id, key))
+        self.store.mark_finished(graph_id, time.time())
+
+    def merge_dependencies_results(self, graph_id: str, node_key: str) -> dict:
+        """
+        Returns the results and metadata of the dependencies of a join node by dependency key
+        """
+        definition = self.store.get(graph_id)
+        if definition is None:
+            raise TaskGraphError(f"Unknown task graph: {graph_id}")
+        results = {}
+        metadata = {}
+        for dependency in definition.nodes[node_key].depends_on:
+            value = self.huey.result(definition.nodes[dependency].task_id, preserve=True)
+            if isinstance(value, dict) and TaskResultKeys.RESULT.value in value:
+                results[dependency] = value.get(TaskResultKeys.RESULT.value)
+                metadata[dependency] = value.get(TaskResultKeys.METADATA.value)
+            else:
+                results[dependency] = value
+                metadata[dependency] = None
+        return {
+            TaskResultKeys.STATUS.value: TaskStatus.COMPLETED.value,
+            TaskResultKeys.RESULT.value: results,
+            TaskResultKeys.METADATA.value: metadata,
+            TaskResultKeys.TASK.value: {"name": definition.nodes[node_key].task.name},
+            TaskResultKeys.ERROR.value: None,
+        }
+
+    def get_status(self, graph_id: str, index: Optional[TaskIndex]) -> Optional[dict[str, Any]]:
+        definition = self.store.get(graph_id)
+        if definition is None:
+            return None
+        nodes = list(definition.nodes.values())
+        statuses = {}
+        if index is not None:
+            statuses = {entry.id: entry.status for entry in index.get_many([node.task_id for node in nodes])}
+        node_statuses = [statuses.get(node.task_id) for node in nodes]
+        return {
+            "id": definition.id,
+            "name": definition.name,
+            "status": get_graph_status(node_statuses),
+            "nodes": [
+                {
+                    "key": node.key,
+                    "task_id": node.task_id,
+                    "depends_on": node.depends_on,
+                    "status": status,
+                }
+                for node, status in zip(nodes, node_statuses)
+            ],
+        }
@@ -0,0 +1,750 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import abc
+import contextlib
+import dataclasses
+import datetime
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+
+import huey
+import huey.signals
+from huey.storage import BaseStorage, RedisStorage, SqliteStorage
+
+from octobot_node.app.models import Task, TaskStatus
+from octobot_node.scheduler.serializer import get_stored_size
+from octobot_node.scheduler.stores import create_backend_store
+
+
+@dataclasses.dataclass
+class TaskIndexEntry:
+    id: str
+    name: Optional[str] = None
+    type: Optional[str] = None
+    status: Optional[TaskStatus] = None
+    priority: Optional[int] = None
+    eta: Optional[float] = None
+    created_at: Optional[float] = None
+    started_at: Optional[float] = None
+    completed_at: Optional[float] = None
+    result_size: Optional[int] = None
+
+    def __post_init__(self):
+        if self.status is not None and not isinstance(self.status, TaskStatus):
+            self.status = TaskStatus(self.status)
+
+
+INDEX_FIELDS = [field.name for field in dataclasses.fields(TaskIndexEntry)]
+UPDATABLE_FIELDS = [field for field in INDEX_FIELDS if field not in ("id", "created_at")]
+
+
+CountersGetter = Callable[[list[Optional[TaskStatus]]], dict[str, int]]
+# (completed_at, id) of the last listed completed entry
+CompletedCursor = tuple[float, str]
+# (sort time, id) of the last listed entry, see get_entry_sort_time
+EntryCursor = tuple[float, str]
+
+
+class TaskIndex(abc.ABC):
+    """
+    Secondary index of tasks lifecycle stored next to the Huey storage.
+    It allows listing, counting and finding tasks without deserializing task messages or results.
+    """
+
+    def record(self, entry: TaskIndexEntry) -> Optional[TaskStatus]:
+        """
+        Inserts or updates the non-None fields of entry, created_at is only set on insert.
+        Entries of indexed tasks are completed with their stored created_at and eta.
+        Returns the previous status of the task, None when it was not indexed yet.
+        """
+        return self.record_many([entry])[0]
+
+    @abc.abstractmethod
+    def record_many(
+        self, entries: list[TaskIndexEntry], get_counters: Optional[CountersGetter] = None
+    ) -> list[Optional[TaskStatus]]:
+        """
+        Records entries and returns their previous status.
+        get_counters is called with the previous statuses: the returned amounts are added to the huey storage
+        counters in the same storage write as the entries.
+        """
+
+    def get(self, task_id: str) -> Optional[TaskIndexEntry]:
+        entries = self.get_many([task_id])
+        return entries[0] if entries else None
+
+    @abc.abstractmethod
+    def get_many(self, task_ids: list[str]) -> list[TaskIndexEntry]:
+        ...
+
+    @abc.abstractmethod
+    def find_by_name(self, name: str, limit: int = 100) -> list[TaskIndexEntry]:
+        ...
+
+    @abc.abstractmethod
+    def list_entries(self, statuses: set[TaskStatus], offset: int = 0, limit: int = 100) -> list[TaskIndexEntry]:
+        """
+        Lists tasks of the given statuses sorted by completion then creation time
+        """
+
+    def list_completed(
+        self, statuses: set[TaskStatus], since: Optional[float] = None, until: Optional[float] = None,
+        after: Optional[CompletedCursor] = None, limit: int = 100
+    ) -> list[TaskIndexEntry]:
+        """
+        Lists tasks of the given statuses completed between since and until, sorted by (completed_at, id),
+        starting after the after cursor: entries recorded while paginating are neither skipped nor repeated
+        """
+        return list(itertools.islice(heapq.merge(
+            *(self.list_status_completed(status, since, until, after, limit) for status in statuses),
+            key=lambda entry: (entry.completed_at, entry.id)
+        ), limit))
+
+    def list_page(
+        self, statuses: set[TaskStatus], after: Optional[EntryCursor] = None, limit: int = 100, offset: int = 0
+    ) -> list[TaskIndexEntry]:
+        """
+        Lists tasks of the given statuses sorted by (sort time, id) starting after the after cursor:
+        a page costs O(limit) whatever its depth. offset entries are skipped first.
+        """
+        return list(itertools.islice(heapq.merge(
+            *(self.list_status_page(status, after, offset + limit) for status in statuses),
+            key=lambda entry: (get_entry_sort_time(entry), entry.id)
+        ), offset, offset + limit))
+
+    @abc.abstractmethod
+    def list_status_page(
+        self, status: TaskStatus, after: Optional[EntryCursor], limit: int
+    ) -> list[TaskIndexEntry]:
+        """
+        Same as list_page for a single status
+        """
+
+    @abc.abstractmethod
+    def list_status_completed(
+        self, status: TaskStatus, since: Optional[float], until: Optional[float],
+        after: Optional[CompletedCursor], limit: int
+    ) -> list[TaskIndexEntry]:
+        """
+        Same as list_completed for a single status
+        """
+
+    def count(self, statuses: Optional[set[TaskStatus]] = None) -> int:
+        counts = self.count_by_status()
+        return sum(count for status, count in counts.items() if not statuses or status in statuses)
+
+    @abc.abstractmethod
+    def count_by_status(self) -> dict[TaskStatus, int]:
+        ...
+
+    @abc.abstractmethod
+    def delete(self, task_ids: list[str]) -> None:
+        ...
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+class SqliteTaskIndex(TaskIndex):
+    TABLE = (
+        "create table if not exists task_index ("
+        "queue text not null, id text not null, name text, type text, status text not null, "
+        "priority integer, eta real, created_at real, started_at real, completed_at real, "
+        "result_size integer, primary key(queue, id))"
+    )
+    STATUS_INDEX = (
+        "create index if not exists task_index_queue_status_completed_at "
+        "on task_index (queue, status, completed_at, created_at)"
+    )
+    NAME_INDEX = "create index if not exists task_index_queue_name on task_index (queue, name)"
+    COMPLETED_INDEX = (
+        "create index if not exists task_index_queue_status_completed_at_id "
+        "on task_index (queue, status, completed_at, id)"
+    )
+    SORT_TIME = "coalesce(completed_at, created_at, 0)"
+    PAGE_INDEX = (
+        "create index if not exists task_index_queue_status_sort_time_id "
+        f"on task_index (queue, status, {SORT_TIME}, id)"
+    )
+    MAX_SQL_VARIABLES = 500
+
+    def __init__(self, storage: SqliteStorage):
+        # reuse the huey storage connection and lock: index updates don't compete with huey writes
+        self.storage: SqliteStorage = storage
+        with self.storage.db(commit=True) as curs:
+            for sql in (
+                self.TABLE, self.STATUS_INDEX, self.NAME_INDEX, self.COMPLETED_INDEX, self.PAGE_INDEX
+            ):
+                curs.execute(sql)
+
+    def record_many(
+        self, entries: list[TaskIndexEntry], get_counters: Optional[CountersGetter] = None
+    ) -> list[Optional[TaskStatus]]:
+        # a single transaction for all entries
+        with self.storage.db(commit=True) as curs:
+            previous_statuses = [self._record(curs, entry) for entry in entries]
+            if get_counters is not None:
+                increment_sqlite_counters(curs, self.storage.name, get_counters(previous_statuses))
+            return previous_statuses
+
+    def _record(self, curs, entry: TaskIndexEntry) -> Optional[TaskStatus]:
+        values = _get_entry_values(entry)
+        curs.execute(
+            "select status, created_at, eta from task_index where queue = ? and id = ?", (self.storage.name, entry.id)
+        )
+        previous = curs.fetchone()
+        if previous is None:
+            if entry.status is None:
+                return None
+            fields = ["queue", *values]
+            curs.execute(
+                f"insert into task_index ({', '.join(fields)}) values ({', '.join('?' * len(fields))})",
+                (self.storage.name, *values.values())
+            )
+            return None
+        updated = {key: value for key, value in values.items() if key in UPDATABLE_FIELDS}
+        if updated:
+            curs.execute(
+                f"update task_index set {', '.join(f'{key} = ?' for key in updated)} where queue = ? and id = ?",
+                (*updated.values(), self.storage.name, entry.id)
+            )
+        _complete_entry(entry, previous[1], previous[2])
+        return TaskStatus(previous[0])
+
+    def get_many(self, task_ids: list[str]) -> list[TaskIndexEntry]:
+        entries_by_id = {}
+        for i in range(0, len(task_ids), self.MAX_SQL_VARIABLES):
+            chunk = task_ids[i:i + self.MAX_SQL_VARIABLES]
+            for entry in self._select(
+                f"queue = ? and id in ({', '.join('?' * len(chunk))})", (self.storage.name, *chunk)
+            ):
+                entries_by_id[entry.id] = entry
+        return [entries_by_id[task_id] for task_id in task_ids if task_id in entries_by_id]
+
+    def find_by_name(self, name: str, limit: int = 100) -> list[TaskIndexEntry]:
+        return self._select(
+            "queue = ? and name = ? order by created_at limit ?", (self.storage.name, name, limit)
+        )
+
+    def list_entries(self, statuses: set[TaskStatus], offset: int = 0, limit: int = 100) -> list[TaskIndexEntry]:
+        status_values = [status.value for status in statuses]
+        return self._select(
+            f"queue = ? and status in ({', '.join('?' * len(status_values))}) "
+            "order by completed_at, created_at, id limit ? offset ?",
+            (self.storage.name, *status_values, limit, offset)
+        )
+
+    def list_status_page(
+        self, status: TaskStatus, after: Optional[EntryCursor], limit: int
+    ) -> list[TaskIndexEntry]:
+        where = "queue = ? and status = ?"
+        params = [self.storage.name, status.value]
+        if after is not None:
+            where += f" and ({self.SORT_TIME} > ? or ({self.SORT_TIME} = ? and id > ?))"
+            params.extend((after[0], after[0], after[1]))
+        return self._select(f"{where} order by {self.SORT_TIME}, id limit ?", (*params, limit))
+
+    def list_status_completed(
+        self, status: TaskStatus, since: Optional[float], until: Optional[float],
+        after: Optional[CompletedCursor], limit: int
+    ) -> list[TaskIndexEntry]:
+        where = ["queue = ? and status = ? and completed_at is not null"]
+        params = [self.storage.name, status.value]
+        if since is not None:
+            where.append("completed_at >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("completed_at <= ?")
+            params.append(until)
+        if after is not None:
+            where.append("(completed_at > ? or (completed_at = ? and id > ?))")
+            params.extend((after[0], after[0], after[1]))
+        return self._select(
+            f"{' and '.join(where)} order by completed_at, id limit ?", (*params, limit)
+        )
+
+    def count_by_status(self) -> dict[TaskStatus, int]:
+        rows = self.storage.sql(
+            "select status, count(*) from task_index where queue = ? group by status",
+            (self.storage.name,), results=True
+        )
+        return {TaskStatus(status): count for status, count in rows}
+
+    def delete(self, task_ids: list[str]) -> None:
+        for i in range(0, len(task_ids), self.MAX_SQL_VARIABLES):
+            chunk = task_ids[i:i + self.MAX_SQL_VARIABLES]
+            self.storage.sql(
+                f"delete from task_index where queue = ? and id in ({', '.join('?' * len(chunk))})",
+                (self.storage.name, *chunk), commit=True
+            )
+
+    def clear(self) -> None:
+        self.storage.sql("delete from task_index where queue = ?", (self.storage.name,), commit=True)
+
+    def _select(self, where: str, params: tuple) -> list[TaskIndexEntry]:
+        rows = self.storage.sql(
+            f"select {', '.join(INDEX_FIELDS)} from task_index where {where}", params, results=True
+        )
+        return [TaskIndexEntry(*row) for row in rows]
+
+
+class RedisTaskIndex(TaskIndex):
+    def __init__(self, storage: RedisStorage):
+        self.conn = storage.conn
+        self.counter_key = storage.counter_key
+        self.prefix = f"huey.index.{storage.name}"
+
+    def _entry_key(self, task_id: str) -> str:
+        return f"{self.prefix}.task.{task_id}"
+
+    def _status_key(self, status: TaskStatus | str) -> str:
+        return f"{self.prefix}.status.{TaskStatus(status).value}"
+
+    def _name_key(self, name: str) -> str:
+        return f"{self.prefix}.name.{name}"
+
+    def record_many(
+        self, entries: list[TaskIndexEntry], get_counters: Optional[CountersGetter] = None
+    ) -> list[Optional[TaskStatus]]:
+        if not entries:
+            return []
+
+        def record(pipe) -> list[Optional[TaskStatus]]:
+            # entries are watched before being read: when a concurrent write updates one of them,
+            # the transaction is aborted and retried with the new previous values
+            read_pipe = self.conn.pipeline(transaction=False)
+            for entry in entries:
+                read_pipe.hmget(self._entry_key(entry.id), "status", "created_at", "completed_at", "eta")
+            previous_values = read_pipe.execute()
+            pipe.multi()
+            previous_statuses = [
+                self._record(pipe, entry, *values)
+                for entry, values in zip(entries, previous_values)
+            ]
+            if get_counters is not None:
+                for key, amount in get_counters(previous_statuses).items():
+                    if amount:
+                        pipe.hincrby(self.counter_key, key, amount)
+            return previous_statuses
+
+        return self.conn.transaction(
+            record, *{self._entry_key(entry.id) for entry in entries}, value_from_callable=True
+        )
+
+    def _record(
+        self, pipe, entry: TaskIndexEntry,
+        previous_status: Optional[bytes], created_at: Optional[bytes], completed_at: Optional[bytes],
+        eta: Optional[bytes]
+    ) -> Optional[TaskStatus]:
+        if previous_status is None and entry.status is None:
+            return None
+        values = _get_entry_values(entry)
+        if previous_status is not None:
+            values = {key: value for key, value in values.items() if key in UPDATABLE_FIELDS}
+            previous_status = TaskStatus(previous_status.decode())
+        score = float(values.get("completed_at") or completed_at or values.get("created_at") or created_at or 0)
+        if values:
+            pipe.hset(
+                self._entry_key(entry.id), mapping={key: _to_redis_value(value) for key, value in values.items()}
+            )
+        if entry.status is not None:
+            if previous_status is not None and previous_status is not entry.status:
+                pipe.zrem(self._status_key(previous_status), entry.id)
+            pipe.zadd(self._status_key(entry.status), {entry.id: score})
+        if entry.name:
+            pipe.sadd(self._name_key(entry.name), entry.id)
+        if previous_status is not None:
+            _complete_entry(entry, _from_redis_timestamp(created_at), _from_redis_timestamp(eta))
+        return previous_status
+
+    def get_many(self, task_ids: list[str]) -> list[TaskIndexEntry]:
+        pipe = self.conn.pipeline()
+        for task_id in task_ids:
+            pipe.hmget(self._entry_key(task_id), *INDEX_FIELDS)
+        return [
+            _from_redis_values(values)
+            for values in pipe.execute()
+            if values[0] is not None
+        ]
+
+    async def get_async(self, async_conn, task_id: str) -> Optional[TaskIndexEntry]:
+        """
+        Same as get using a redis.asyncio connection
+        """
+        values = await async_conn.hmget(self._entry_key(task_id), *INDEX_FIELDS)
+        return _from_redis_values(values) if values[0] is not None else None
+
+    def find_by_name(self, name: str, limit: int = 100) -> list[TaskIndexEntry]:
+        task_ids = sorted(task_id.decode() for task_id in self.conn.smembers(self._name_key(name)))
+        entries = sorted(self.get_many(task_ids), key=lambda entry: entry.created_at or 0)
+        return entries[:limit]
+
+    def list_entries(self, statuses: set[TaskStatus], offset: int = 0, limit: int = 100) -> list[TaskIndexEntry]:
+        if len(statuses) == 1:
+            task_ids = self.conn.zrange(self._status_key(next(iter(statuses))), offset, offset + limit - 1)
+        else:
+            # merge the requested statuses in a temporary sorted set to keep a single ordering
+            union_key = f"{self.prefix}.union.{'.'.join(sorted(status.value for status in statuses))}"
+            pipe = self.conn.pipeline()
+            pipe.zunionstore(union_key, [self._status_key(status) for status in statuses])
+            pipe.zrange(union_key, offset, offset + limit - 1)
+            pipe.delete(union_key)
+            task_ids = pipe.execute()[1]
+        return self.get_many([task_id.decode() for task_id in task_ids])
+
+    def list_status_page(
+        self, status: TaskStatus, after: Optional[EntryCursor], limit: int
+    ) -> list[TaskIndexEntry]:
+        # entries are scored by their sort time
+        return self._list_by_score(status, None if after is None else after[0], None, after, limit)
+
+    def list_status_completed(
+        self, status: TaskStatus, since: Optional[float], until: Optional[float],
+        after: Optional[CompletedCursor], limit: int
+    ) -> list[TaskIndexEntry]:
+        # finished entries are scored by completion time
+        min_score = since if after is None else after[0] if since is None else max(since, after[0])
+        return self._list_by_score(status, min_score, until, after, limit)
+
+    def _list_by_score(
+        self, status: TaskStatus, min_score: Optional[float], max_score: Optional[float],
+        after: Optional[EntryCursor], limit: int
+    ) -> list[TaskIndexEntry]:
+        # equal scores are sorted by id
+        task_ids = []
+        start = 0
+        while len(task_ids) < limit:
+            members = self.conn.zrangebyscore(
+                self._status_key(status), "-inf" if min_score is None else min_score,
+                "+inf" if max_score is None else max_score, start=start, num=limit, withscores=True
+            )
+            task_ids.extend(
+                task_id.decode() for task_id, score in members
+                # skip the entries sorted at the cursor time up to the cursor
+                if after is None or score > after[0] or task_id.decode() > after[1]
+            )
+            if len(members) < limit:
+                break
+            start += limit
+        return self.get_many(task_ids[:limit])
+
+    def count_by_status(self) -> dict[TaskStatus, int]:
+        pipe = self.conn.pipeline()
+        for status in TaskStatus:
+            pipe.zcard(self._status_key(status))
+        return {status: count for status, count in zip(TaskStatus, pipe.execute()) if count}
+
+    def delete(self, task_ids: list[str]) -> None:
+        entries = self.get_many(task_ids)
+        pipe = self.conn.pipeline()
+        for entry in entries:
+            pipe.delete(self._entry_key(entry.id))
+            if entry.status is not None:
+                pipe.zrem(self._status_key(entry.status), entry.id)
+            if entry.name:
+                pipe.srem(self._name_key(entry.name), entry.id)
+        pipe.execute()
+
+    def clear(self) -> None:
+        keys = list(self.conn.scan_iter(match=f"{self.prefix}.*"))
+        if keys:
+            self.conn.delete(*keys)
+
+
+class MemoryTaskIndex(TaskIndex):
+    def __init__(self, storage: Optional[BaseStorage] = None):
+        # counters are kept in storage when given
+        self.storage: Optional[BaseStorage] = storage
+        self.lock = threading.Lock()
+        self.entries: dict[str, TaskIndexEntry] = {}
+
+    def record_many(
+        self, entries: list[TaskIndexEntry], get_counters: Optional[CountersGetter] = None
+    ) -> list[Optional[TaskStatus]]:
+        with self.lock:
+            previous_statuses = [self._record(entry) for entry in entries]
+        if get_counters is not None and self.storage is not None:
+            for key, amount in get_counters(previous_statuses).items():
+                if amount:
+                    self.storage.incr(key, amount)
+        return previous_statuses
+
+    def _record(self, entry: TaskIndexEntry) -> Optional[TaskStatus]:
+        existing = self.entries.get(entry.id)
+        if existing is None:
+            if entry.status is None:
+                return None
+            self.entries[entry.id] = dataclasses.replace(entry)
+            return None
+        previous_status = existing.status
+        for key in _get_entry_values(entry):
+            if key in UPDATABLE_FIELDS:
+                setattr(existing, key, getattr(entry, key))
+        _complete_entry(entry, existing.created_at, existing.eta)
+        return previous_status
+
+    def get_many(self, task_ids: list[str]) -> list[TaskIndexEntry]:
+        with self.lock:
+            return [dataclasses.replace(self.entries[task_id]) for task_id in task_ids if task_id in self.entries]
+
+    def find_by_name(self, name: str, limit: int = 100) -> list[TaskIndexEntry]:
+        return self._sorted(lambda entry: entry.name == name, lambda entry: entry.created_at or 0)[:limit]
+
+    def list_entries(self, statuses: set[TaskStatus], offset: int = 0, limit: int = 100) -> list[TaskIndexEntry]:
+        return self._sorted(
+            lambda entry: entry.status in statuses,
+            lambda entry: (entry.completed_at or 0, entry.created_at or 0, entry.id)
+        )[offset:offset + limit]
+
+    def list_status_page(
+        self, status: TaskStatus, after: Optional[EntryCursor], limit: int
+    ) -> list[TaskIndexEntry]:
+        return self._sorted(
+            lambda entry: entry.status is status
+            and (after is None or (get_entry_sort_time(entry), entry.id) > after),
+            lambda entry: (get_entry_sort_time(entry), entry.id)
+        )[:limit]
+
+    def list_status_completed(
+        self, status: TaskStatus, since: Optional[float], until: Optional[float],
+        after: Optional[CompletedCursor], limit: int
+    ) -> list[TaskIndexEntry]:
+        return self._sorted(
+            lambda entry: entry.status is status and entry.completed_at is not None
+            and (since is None or entry.completed_at >= since)
+            and (until is None or entry.completed_at <= until)
+            and (after is None or (entry.completed_at, entry.id) > after),
+            lambda entry: (entry.completed_at, entry.id)
+        )[:limit]
+
+    def count_by_status(self) -> dict[TaskStatus, int]:
+        counts: dict[TaskStatus, int] = {}
+        with self.lock:
+            for entry in self.entries.values():
+                counts[entry.status] = counts.get(entry.status, 0) + 1
+        return counts
+
+    def delete(self, task_ids: list[str]) -> None:
+        with self.lock:
+            for task_id in task_ids:
+                self.entries.pop(task_id, None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+    def _sorted(self, predicate, key) -> list[TaskIndexEntry]:
+        with self.lock:
+            return sorted(
+                (dataclasses.replace(entry) for entry in self.entries.values() if predicate(entry)), key=key
+            )
+
+
+def get_entry_sort_time(entry: TaskIndexEntry) -> float:
+    """
+    Returns the time entries are paginated by: the completion time of finished tasks, the creation time of others
+    """
+    return entry.completed_at or entry.created_at or 0
+
+
+def increment_sqlite_counters(curs, queue: str, amounts: dict[str, int]) -> None:
+    curs.executemany(
+        "insert into counter (queue, key, value) values (?, ?, ?) "
+        "on conflict (queue, key) do update set value = value + ?",
+        [(queue, key, amount, amount) for key, amount in amounts.items() if amount]
+    )
+
+
+def _complete_entry(entry: TaskIndexEntry, created_at: Optional[float], eta: Optional[float]) -> None:
+    entry.created_at = created_at
+    if entry.eta is None:
+        entry.eta = eta
+
+
+def _get_entry_values(entry: TaskIndexEntry) -> dict[str, Any]:
+    values = {}
+    for key in INDEX_FIELDS:
+        value = getattr(entry, key)
+        if value is not None:
+            values[key] = value.value if isinstance(value, TaskStatus) else value
+    return values
+
+
+def _to_redis_value(value: Any) -> str:
+    return str(value)
+
+
+def _from_redis_timestamp(value: Optional[bytes]) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+def _from_redis_values(values: list[Optional[bytes]]) -> TaskIndexEntry:
+    parsed = {}
+    for field, value in zip(INDEX_FIELDS, values):
+        if value is None:
+            parsed[field] = None
+        elif field in ("priority", "result_size"):
+            parsed[field] = int(value)
+        elif field in ("eta", "created_at", "started_at", "completed_at"):
+            parsed[field] = float(value)
+        else:
+            parsed[field] = value.decode()
+    return TaskIndexEntry(**parsed)
+
+
+def create_task_index(huey_instance: huey.Huey) -> TaskIndex:
+    return create_backend_store(
+        huey_instance, SqliteTaskIndex, RedisTaskIndex, lambda: MemoryTaskIndex(huey_instance.storage)
+    )
+
+
+def get_task_index_entry(task: huey.api.Task, status: TaskStatus, **kwargs) -> TaskIndexEntry:
+    node_task = task.args[0] if task.args and isinstance(task.args[0], Task) else None
+    return TaskIndexEntry(
+        id=task.id,
+        name=node_task.name if node_task and node_task.name else task.name,
+        type=node_task.type if node_task else None,
+        status=status,
+        **kwargs
+    )
+
+
+def _get_timestamp(value: Optional[datetime.datetime]) -> Optional[float]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        # huey stores naive UTC datetimes
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value.timestamp()
+
+
+# returns the storage counters amounts of (entry, previous status, signal) changes
+ChangesCounters = Callable[[list[tuple[TaskIndexEntry, Optional[TaskStatus], Optional[str]]]], dict[str, int]]
+
+
+class TaskIndexUpdater:
+    """
+    Keeps a TaskIndex in sync with the tasks lifecycle using huey signals.
+    Listeners can be registered to be notified of each status change.
+    """
+    SIGNAL_STATUSES = {
+        huey.signals.SIGNAL_ENQUEUED: TaskStatus.PENDING,
+        huey.signals.SIGNAL_SCHEDULED: TaskStatus.SCHEDULED,
+        huey.signals.SIGNAL_EXECUTING: TaskStatus.RUNNING,
+        huey.signals.SIGNAL_COMPLETE: TaskStatus.COMPLETED,
+        huey.signals.SIGNAL_ERROR: TaskStatus.FAILED,
+        huey.signals.SIGNAL_EXPIRED: TaskStatus.FAILED,
+        huey.signals.SIGNAL_REVOKED: TaskStatus.FAILED,
+        huey.signals.SIGNAL_CANCELED: TaskStatus.FAILED,
+    }
+
+    def __init__(self, huey_instance: huey.Huey, task_index: TaskIndex):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.huey: huey.Huey = huey_instance
+        self.task_index: TaskIndex = task_index
+        self.listeners: list[Callable[[list[tuple[TaskIndexEntry, Optional[TaskStatus]]]], None]] = []
+        self.counters: list[ChangesCounters] = []
+        self._local = threading.local()
+
+    def add_listener(self, listener: Callable[[list[tuple[TaskIndexEntry, Optional[TaskStatus]]]], None]) -> None:
+        """
+        listener is called with the recorded entries and their previous status
+        """
+        self.listeners.append(listener)
+
+    def add_counters(self, get_counters: ChangesCounters) -> None:
+        """
+        get_counters is called with the recorded entries, their previous status and the signal that recorded them.
+        It returns the amounts to add to the storage counters, which are written along with the entries.
+        """
+        self.counters.append(get_counters)
+
+    @contextlib.contextmanager
+    def batched(self):
+        """
+        Buffers the entries recorded by the current thread and writes them at once on exit
+        """
+        self._local.records = []
+        try:
+            yield
+        finally:
+            records, self._local.records = self._local.records, None
+            if records:
+                self._write(records)
+
+    def connect(self) -> None:
+        self.huey.signal(*self.SIGNAL_STATUSES)(self.on_signal)
+        self.huey.post_execute(name=self.__class__.__name__)(self.on_post_execute)
+
+    def on_signal(self, signal: str, task: huey.api.Task, *args) -> None:
+        if isinstance(task, huey.api.PeriodicTask):
+            return
+        status = self.SIGNAL_STATUSES[signal]
+        now = time.time()
+        kwargs = {}
+        if status is TaskStatus.PENDING:
+            kwargs = {"priority": task.priority, "eta": _get_timestamp(task.eta), "created_at": now}
+        elif status is TaskStatus.SCHEDULED:
+            kwargs = {"eta": _get_timestamp(task.eta), "created_at": now}
+        elif status is TaskStatus.RUNNING:
+            kwargs = {"started_at": now, "created_at": now}
+        else:
+            kwargs = {"completed_at": now, "created_at": now}
+        self._record(get_task_index_entry(task, status, **kwargs), signal)
+
+    def on_post_execute(self, task: huey.api.Task, task_value: Any, exception: Optional[Exception]) -> None:
+        if exception is not None or task_value is None or isinstance(task, huey.api.PeriodicTask):
+            return
+        # results are stored using the huey serializer: this is the stored result size
+        result_size = get_stored_size(self.huey, task_value)
+        self._record(TaskIndexEntry(id=task.id, result_size=result_size))
+
+    def _record(self, entry: TaskIndexEntry, signal: Optional[str] = None) -> None:
+        buffered_records = getattr(self._local, "records", None)
+        if buffered_records is None:
+            self._write([(entry, signal)])
+        else:
+            buffered_records.append((entry, signal))
+
+    def _write(self, records: list[tuple[TaskIndexEntry, Optional[str]]]) -> None:
+        entries = [entry for entry, _ in records]
+
+        def get_counters(previous_statuses: list[Optional[TaskStatus]]) -> dict[str, int]:
+            changes = [
+                (entry, previous_status, signal)
+                for (entry, signal), previous_status in zip(records, previous_statuses)
+            ]
+            amounts: dict[str, int] = {}
+            for get_changes_counters in self.counters:
+                for key, amount in get_changes_counters(changes).items():
+                    amounts[key] = amounts.get(key, 0) + amount
+            return amounts
+
+        previous_statuses = self.task_index.record_many(entries, get_counters if self.counters else None)
+        self._notify(list(zip(entries, previous_statuses)))
+
+    def _notify(self, changes: list[tuple[TaskIndexEntry, Optional[TaskStatus]]]) -> None:
+        for listener in self.listeners:
+            try:
+                listener(changes)
+            except Exception as e:
+                self.logger.exception(f"Failed to notify task index listener: {e}")
@@ -0,0 +1,269 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import base64
+import contextvars
+import dataclasses
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Optional
+
+import huey
+import huey.api
+import huey.signals
+from huey.exceptions import TaskLockedException
+from huey.utils import Error
+
+from octobot_node.app.models import TaskStatus
+from octobot_node.scheduler.stores import KeyedStore, create_keyed_store
+from octobot_node.scheduler.task_index import TaskIndexUpdater
+
+# id of the huey task executed by the current worker
+CURRENT_TASK_ID: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("current_task_id", default=None)
+REAPER_LOCK_NAME = "task_lease_reaper"
+
+
+class TaskLeaseExpiredError(Exception):
+    pass
+
+
+@dataclasses.dataclass
+class TaskLease:
+    task_id: str
+    node_id: str
+    worker: str
+    message: bytes  # serialized huey task, used to requeue it
+    acquired_at: float
+    expires_at: float
+    attempts: int = 1
+    side_effects: bool = False  # the task started actions that can't be replayed, such as placing orders
+    requeued: bool = False  # requeued by a reaper, until a worker executes the task again
+
+    def to_json(self) -> str:
+        values = dataclasses.asdict(self)
+        values["message"] = base64.b64encode(self.message).decode()
+        return json.dumps(values)
+
+    @classmethod
+    def from_json(cls, value: str | bytes) -> "TaskLease":
+        values = json.loads(value)
+        values["message"] = base64.b64decode(values["message"])
+        return cls(**values)
+
+    def is_expired(self, now: float) -> bool:
+        return self.expires_at <= now
+
+
+@dataclasses.dataclass
+class ReapReport:
+    requeued_task_ids: list[str] = dataclasses.field(default_factory=list)
+    failed_task_ids: list[str] = dataclasses.field(default_factory=list)
+
+
+class TaskLeaseStore:
+    """
+    Stores the leases of the executing tasks next to the Huey storage
+    """
+
+    def __init__(self, store: KeyedStore):
+        self.store: KeyedStore = store
+
+    def save(self, lease: TaskLease) -> None:
+        self.store.put(lease.task_id, lease.to_json())
+
+    def save_many(self, leases: list[TaskLease]) -> None:
+        self.store.put_many({lease.task_id: lease.to_json() for lease in leases})
+
+    def get(self, task_id: str) -> Optional[TaskLease]:
+        lease = self.store.get(task_id)
+        return TaskLease.from_json(lease) if lease is not None else None
+
+    def get_all(self) -> list[TaskLease]:
+        return [TaskLease.from_json(value) for value in self.store.get_all().values()]
+
+    def delete(self, task_ids: list[str]) -> None:
+        self.store.delete(task_ids)
+
+
+def create_task_lease_store(huey_instance: huey.Huey) -> TaskLeaseStore:
+    return TaskLeaseStore(create_keyed_store(huey_instance, "leases"))
+
+
+class TaskLeaseManager:
+    """
+    Records a lease for each executing task, renewed every visibility_timeout / 3 seconds by the process running it:
+    the leases held by a process are renewed in a single write.
+    reap() requeues the tasks whose lease expired: the worker executing them died before completing them.
+    Requeued leases expire again when the task was lost before being executed again.
+    Tasks flagged with mark_side_effects() may have placed orders: they are failed instead of being requeued
+    to run at most once, as are tasks that were already requeued max_attempts times.
+    Failed tasks are recorded as such through index_updater.
+    """
+
+    def __init__(
+        self, huey_instance: huey.Huey, store: TaskLeaseStore, node_id: str,
+        visibility_timeout: Optional[float], max_attempts: int = 3,
+        index_updater: Optional[TaskIndexUpdater] = None
+    ):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.huey: huey.Huey = huey_instance
+        self.store: TaskLeaseStore = store
+        self.node_id: str = node_id
+        self.visibility_timeout: Optional[float] = visibility_timeout
+        self.max_attempts: int = max_attempts
+        self.index_updater: Optional[TaskIndexUpdater] = index_updater
+        self._lock = threading.Lock()
+        # leases held by this process, renewed by the renewal thread
+        self._held_leases: dict[str, TaskLease] = {}
+        self._renewal_thread: Optional[threading.Thread] = None
+        self._renewal_pid: Optional[int] = None
+
+    def is_enabled(self) -> bool:
+        return bool(self.visibility_timeout)
+
+    def connect(self) -> None:
+        self.huey.pre_execute(name=self.__class__.__name__)(self.on_pre_execute)
+        self.huey.post_execute(name=self.__class__.__name__)(self.on_post_execute)
+
+    def on_pre_execute(self, task: huey.api.Task) -> None:
+        if isinstance(task, huey.api.PeriodicTask):
+            return
+        CURRENT_TASK_ID.set(task.id)
+        now = time.time()
+        previous_lease = self.store.get(task.id)
+        lease = TaskLease(
+            task_id=task.id,
+            node_id=self.node_id,
+            worker=f"{os.getpid()}:{threading.current_thread().name}",
+            message=self.huey.serialize_task(task),
+            acquired_at=now,
+            expires_at=now + self.visibility_timeout,
+            attempts=previous_lease.attempts + 1 if previous_lease is not None else 1,
+        )
+        self.store.save(lease)
+        with self._lock:
+            self._held_leases[task.id] = lease
+            self._ensure_renewal_thread()
+
+    def on_post_execute(self, task: huey.api.Task, task_value: Any, exception: Optional[Exception]) -> None:
+        if isinstance(task, huey.api.PeriodicTask):
+            return
+        CURRENT_TASK_ID.set(None)
+        with self._lock:
+            self._held_leases.pop(task.id, None)
+        self.store.delete([task.id])
+
+    def mark_side_effects(self, task_id: Optional[str] = None) -> None:
+        """
+        Flags the lease of task_id, or of the current task, to prevent requeuing it after a worker crash
+        """
+        task_id = task_id or CURRENT_TASK_ID.get()
+        if task_id is None or not self.is_enabled():
+            return
+        with self._lock:
+            lease = self._held_leases.get(task_id)
+            if lease is not None:
+                if not lease.side_effects:
+                    lease.side_effects = True
+                    self.store.save(lease)
+                return
+        lease = self.store.get(task_id)
+        if lease is not None and not lease.side_effects:
+            lease.side_effects = True
+            self.store.save(lease)
+
+    def renew(self, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        # locked: the lease of a task that completed in the meantime is not recreated
+        with self._lock:
+            for lease in self._held_leases.values():
+                lease.expires_at = now + self.visibility_timeout
+            if self._held_leases:
+                self.store.save_many(list(self._held_leases.values()))
+
+    def _ensure_renewal_thread(self) -> None:
+        # process workers are forked: the renewal thread only exists in the process that started it
+        if self._renewal_thread is not None and self._renewal_pid == os.getpid():
+            return
+        self._renewal_pid = os.getpid()
+        self._renewal_thread = threading.Thread(target=self._renew_forever, name="task-lease-renewal", daemon=True)
+        self._renewal_thread.start()
+
+    def _renew_forever(self) -> None:
+        while True:
+            time.sleep(self.visibility_timeout / 3)
+            try:
+                self.renew()
+            except Exception as e:
+                self.logger.error(f"Failed to renew task leases: {e}")
+
+    def reap(self, now: Optional[float] = None) -> ReapReport:
+        """
+        Requeues or fails the tasks whose lease expired. Concurrent reapers are skipped.
+        """
+        report = ReapReport()
+        if not self.is_enabled():
+            return report
+        now = time.time() if now is None else now
+        try:
+            with self.huey.lock_task(REAPER_LOCK_NAME):
+                for lease in self.store.get_all():
+                    if lease.is_expired(now):
+                        self._reap_lease(lease, report, now)
+        except TaskLockedException:
+            self.logger.debug("Task leases are already being reaped")
+        return report
+
+    def _reap_lease(self, lease: TaskLease, report: ReapReport, now: float) -> None:
+        task = self.huey.deserialize_task(lease.message)
+        if lease.requeued:
+            if self._is_pending(lease.task_id):
+                # the requeued task is still waiting for a worker
+                lease.expires_at = now + self.visibility_timeout
+                self.store.save(lease)
+                return
+            # the requeued task was lost before being executed again
+            lease.attempts += 1
+        if lease.side_effects or lease.attempts >= self.max_attempts:
+            reason = "it may have placed orders" if lease.side_effects else f"it was executed {lease.attempts} times"
+            self.logger.error(
+                f"Task {lease.task_id} was interrupted on node {lease.node_id} ({lease.worker}) "
+                f"and is not requeued as {reason}"
+            )
+            error = TaskLeaseExpiredError(f"Task interrupted on node {lease.node_id}: {reason}")
+            self.huey.put_result(task.id, Error(self.huey.build_error_result(task, error)))
+            if self.index_updater is not None:
+                self.index_updater.on_signal(huey.signals.SIGNAL_ERROR, task, error)
+            self.store.delete([lease.task_id])
+            report.failed_task_ids.append(lease.task_id)
+            return
+        self.logger.warning(
+            f"Requeuing task {lease.task_id} interrupted on node {lease.node_id} ({lease.worker})"
+        )
+        lease.requeued = True
+        lease.expires_at = now + self.visibility_timeout
+        self.store.save(lease)
+        self.huey.enqueue(task)
+        report.requeued_task_ids.append(lease.task_id)
+
+    def _is_pending(self, task_id: str) -> bool:
+        if self.index_updater is None:
+            return False
+        entries = self.index_updater.task_index.get_many([task_id])
+        return bool(entries) and entries[0].status in (TaskStatus.PENDING, TaskStatus.SCHEDULED)
@@ -0,0 +1,192 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+from typing import Optional
+
+import huey
+import huey.signals
+from huey.storage import MemoryStorage, RedisStorage, SqliteStorage
+
+from octobot_node.app.models import TaskStatus
+from octobot_node.scheduler.task_index import (
+    TaskIndex,
+    TaskIndexEntry,
+    TaskIndexUpdater,
+    increment_sqlite_counters,
+)
+
+COUNTERS_PREFIX = "metrics."
+STATUS_COUNTER = f"{COUNTERS_PREFIX}status."
+TYPE_COUNTER = f"{COUNTERS_PREFIX}type."
+EVENT_COUNTER = f"{COUNTERS_PREFIX}event."
+REBUILD_BATCH_SIZE = 500
+
+
+def _status_key(status: TaskStatus) -> str:
+    return f"{STATUS_COUNTER}{status.value}"
+
+
+def _type_key(task_type: str, status: TaskStatus) -> str:
+    return f"{TYPE_COUNTER}{task_type}.{status.value}"
+
+
+def _event_key(signal: str) -> str:
+    return f"{EVENT_COUNTER}{signal}"
+
+
+class TaskMetrics:
+    """
+    Tasks counters persisted in the huey storage counters, updated on each task status change.
+    Status changes counters are written along with the task index entries, by the TaskIndexUpdater.
+    Counters are read in a single storage query, independently of the number of stored tasks.
+    """
+    EVENT_SIGNALS = (
+        huey.signals.SIGNAL_ENQUEUED,
+        huey.signals.SIGNAL_EXECUTING,
+        huey.signals.SIGNAL_COMPLETE,
+        huey.signals.SIGNAL_ERROR,
+        huey.signals.SIGNAL_RETRYING,
+        huey.signals.SIGNAL_EXPIRED,
+    )
+
+    def __init__(self, huey_instance: huey.Huey):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.huey: huey.Huey = huey_instance
+
+    def connect(self, index_updater: TaskIndexUpdater) -> None:
+        index_updater.add_counters(self.get_changes_counters)
+        # events of signals that don't change the task status are not seen by the index updater
+        self.huey.signal(*(
+            signal for signal in self.EVENT_SIGNALS if signal not in TaskIndexUpdater.SIGNAL_STATUSES
+        ))(self.on_signal)
+
+    def on_signal(self, signal: str, task: huey.api.Task, *args) -> None:
+        if isinstance(task, huey.api.PeriodicTask):
+            return
+        self.increment({_event_key(signal): 1})
+
+    def get_changes_counters(
+        self, changes: list[tuple[TaskIndexEntry, Optional[TaskStatus], Optional[str]]]
+    ) -> dict[str, int]:
+        """
+        Moves the given tasks from their previous status (None for new tasks) to their entry status
+        and counts the events of the signals that recorded them
+        """
+        amounts: dict[str, int] = {}
+        for entry, previous_status, signal in changes:
+            if signal in self.EVENT_SIGNALS:
+                amounts[_event_key(signal)] = amounts.get(_event_key(signal), 0) + 1
+            if entry.status is None or entry.status is previous_status:
+                continue
+            self._add_status_amounts(amounts, entry.type, entry.status, 1)
+            if previous_status is not None:
+                self._add_status_amounts(amounts, entry.type, previous_status, -1)
+        return amounts
+
+    def on_entries_deleted(self, entries: list[TaskIndexEntry]) -> None:
+        amounts: dict[str, int] = {}
+        for entry in entries:
+            if entry.status is not None:
+                self._add_status_amounts(amounts, entry.type, entry.status, -1)
+        self.increment(amounts)
+
+    def _add_status_amounts(
+        self, amounts: dict[str, int], task_type: Optional[str], status: TaskStatus, amount: int
+    ) -> None:
+        amounts[_status_key(status)] = amounts.get(_status_key(status), 0) + amount
+        if task_type:
+            amounts[_type_key(task_type, status)] = amounts.get(_type_key(task_type, status), 0) + amount
+
+    def increment(self, amounts: dict[str, int]) -> None:
+        amounts = {key: amount for key, amount in amounts.items() if amount}
+        if not amounts:
+            return
+        storage = self.huey.storage
+        # a single storage write for every updated counter
+        if isinstance(storage, SqliteStorage):
+            with storage.db(commit=True) as curs:
+                increment_sqlite_counters(curs, storage.name, amounts)
+        elif isinstance(storage, RedisStorage):
+            pipe = storage.conn.pipeline()
+            for key, amount in amounts.items():
+                pipe.hincrby(storage.counter_key, key, amount)
+            pipe.execute()
+        else:
+            for key, amount in amounts.items():
+                storage.incr(key, amount)
+
+    def get_counters(self) -> dict[str, int]:
+        storage = self.huey.storage
+        if isinstance(storage, SqliteStorage):
+            return dict(storage.sql(
+                "select key, value from counter where queue = ? and key like ?",
+                (storage.name, f"{COUNTERS_PREFIX}%"), results=True
+            ))
+        if isinstance(storage, RedisStorage):
+            return {
+                key.decode(): int(value)
+                for key, value in storage.conn.hgetall(storage.counter_key).items()
+                if key.startswith(COUNTERS_PREFIX.encode())
+            }
+        if isinstance(storage, MemoryStorage):
+            with storage._lock:
+                return {key: value for key, value in storage._counters.items() if key.startswith(COUNTERS_PREFIX)}
+        return {}
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the number of tasks by status, by task type and status and the number of tasks events
+        """
+        by_status = {status: 0 for status in TaskStatus}
+        by_type: dict[str, dict[str, int]] = {}
+        events: dict[str, int] = {signal: 0 for signal in self.EVENT_SIGNALS}
+        for key, value in self.get_counters().items():
+            if key.startswith(STATUS_COUNTER):
+                by_status[TaskStatus(key[len(STATUS_COUNTER):])] = value
+            elif key.startswith(TYPE_COUNTER):
+                task_type, status = key[len(TYPE_COUNTER):].rsplit(".", 1)
+                by_type.setdefault(task_type, {})[status] = value
+            elif key.startswith(EVENT_COUNTER):
+                events[key[len(EVENT_COUNTER):]] = value
+        return {
+            "by_status": by_status,
+            "by_type": by_type,
+            "events": events,
+        }
+
+    def has_counters(self) -> bool:
+        return bool(self.get_counters())
+
+    def rebuild(self, task_index: TaskIndex) -> None:
+        """
+        Resets status counters from the tasks index, events counters are kept
+        """
+        amounts: dict[str, int] = {}
+        for key, value in self.get_counters().items():
+            if key.startswith((STATUS_COUNTER, TYPE_COUNTER)):
+                amounts[key] = -value
+        offset = 0
+        while True:
+            entries = task_index.list_entries(set(TaskStatus), offset, REBUILD_BATCH_SIZE)
+            for entry in entries:
+                if entry.status is not None:
+                    self._add_status_amounts(amounts, entry.type, entry.status, 1)
+            offset += len(entries)
+            if len(entries) < REBUILD_BATCH_SIZE:
+                break
+        self.increment(amounts)
+        self.logger.info(f"Rebuilt tasks metrics from {offset} indexed tasks")
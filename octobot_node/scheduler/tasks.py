@@ -21,24 +21,44 @@ import json
 import logging
 import time
 
+import huey.utils
 
-from octobot_node.scheduler import SCHEDULER
+from octobot_node.app.core.config import settings
+from octobot_node.scheduler import SCHEDULER, CONSUMER, NODE_HEARTBEAT
+from octobot_node.scheduler.retention import ResultCompactor, ResultRetentionPolicy, every_minutes
+from octobot_node.scheduler.task_graph import TaskGraphRunner
+from octobot_node.scheduler.task_leases import TaskLeaseManager
+from octobot_node.scheduler.task_dedupe import get_idempotency_key
 from octobot_node.scheduler.task_context import encrypted_task
-from octobot_node.app.models import Task, TaskType
+from octobot_node.app.models import Task, TaskGraph, TaskType, TaskSubmission
 from octobot_node.app.enums import TaskResultKeys
 from octobot_node.app.models import TaskStatus
 
 import octobot_node.scheduler.octobot_lib as octobot_lib
 
+ACTIONS_PLANS = octobot_lib.create_actions_plan_store(SCHEDULER.INSTANCE, settings.SCHEDULER_ACTIONS_PLAN_CACHE_SIZE)
+TASK_LEASES = TaskLeaseManager(
+    SCHEDULER.INSTANCE, SCHEDULER.leases, NODE_HEARTBEAT.node_id,
+    settings.SCHEDULER_TASK_VISIBILITY_TIMEOUT, settings.SCHEDULER_TASK_MAX_ATTEMPTS, SCHEDULER.index_updater
+)
+if TASK_LEASES.is_enabled():
+    TASK_LEASES.connect()
+if settings.SCHEDULER_TASK_DEDUPE_TTL:
+    SCHEDULER.dedupe.connect(SCHEDULER.INSTANCE)
+
 
 def async_task(func):
     """
-    Decorator to ensure that the function it wraps is a non-async function that can then use asyncio.run(), e.g. Huey tasks.
-    Huey tasks will be called in one of 2 contexts: either they are the top-level function(ish) in the process, and there is no loop yet, or we are running tests in an an async context already and we need to re-use the current loop.
+    Decorator to ensure that the function it wraps is a non-async function that can then be called by Huey workers.
+    When consumers are running, the coroutine is submitted to the long-lived consumer event loop, which is reused across tasks.
+    Otherwise (e.g. immediate mode), it's either the top-level function(ish) in the process, and there is no loop yet, or we are running tests in an an async context already and we need to re-use the current loop.
     """
 
     @functools.wraps(func)
     def wrapper_decorator(*args, **kwargs):
+        event_loop = CONSUMER.event_loop
+        if event_loop is not None:
+            return event_loop.run(func(*args, **kwargs))
         try:
             loop = asyncio.get_event_loop()
         except RuntimeError:
@@ -67,7 +87,7 @@ def start_octobot(task: Task):
 def _reshedule_octobot_execution(
     task: Task, next_actions_description: octobot_lib.OctoBotActionsJobDescription
 ):
-    task.content = json.dumps(next_actions_description.to_dict(include_default_values=False))
+    task.content = json.dumps(next_actions_description.to_compact_dict(ACTIONS_PLANS))
     next_execution_time = next_actions_description.get_next_execution_time()
     now_time = time.time()
     if next_execution_time == 0 or next_execution_time < now_time:
@@ -77,7 +97,15 @@ def _reshedule_octobot_execution(
     logging.getLogger("octobot_node.scheduler.tasks").info(
         f"Scheduling task '{task.name}' for execution in {delay} seconds"
     )
-    return execute_octobot.schedule(args=[task], delay=delay)
+    if TASK_GRAPH_RUNNER.continue_current_node(task, delay):
+        # graph nodes run again as the same node: their dependents wait for their last execution
+        return None
+    return execute_octobot.schedule(args=[task], delay=delay, priority=task.priority)
+
+
+def _delete_actions_plan(job: octobot_lib.OctoBotActionsJob) -> None:
+    if job.description.actions_plan is not None:
+        ACTIONS_PLANS.delete(job.description.actions_plan.id)
 
 
 @SCHEDULER.INSTANCE.task()
@@ -86,15 +114,23 @@ async def execute_octobot(task: Task):
     with encrypted_task(task):
         if task.type == TaskType.EXECUTE_ACTIONS.value:
             logging.getLogger("octobot_node.scheduler.tasks").info(f"Executing task '{task.name}' with content: {task.content} ...")
-            result: octobot_lib.OctoBotActionsJobResult = await octobot_lib.OctoBotActionsJob(
-                task.content
-            ).run()
+            job = octobot_lib.OctoBotActionsJob(task.content, plan_store=ACTIONS_PLANS)
+            # orders can't be replayed: don't requeue this task if its worker dies from now on
+            TASK_LEASES.mark_side_effects()
+            try:
+                result: octobot_lib.OctoBotActionsJobResult = await job.run()
+            except Exception:
+                # steps are not retried: the plan of a failed step won't be executed anymore
+                _delete_actions_plan(job)
+                raise
             task.result = {
                 "orders": result.get_created_orders(),
                 "transfers": result.get_deposit_and_withdrawal_details(),
             }
             if result.next_actions_description:
                 _reshedule_octobot_execution(task, result.next_actions_description)
+            else:
+                _delete_actions_plan(job)
         else:
             raise ValueError(f"Invalid task type: {task.type}")
     return {
@@ -119,15 +155,113 @@ def stop_octobot(task: Task):
         TaskResultKeys.ERROR.value: None
     }
 
-def trigger_task(task: Task) -> bool:
-    if task.type == TaskType.START_OCTOBOT.value:
-        start_octobot.schedule(args=[task], delay=1)
-        return True
-    elif task.type == TaskType.STOP_OCTOBOT.value:
-        stop_octobot.schedule(args=[task], delay=1)
-        return True
-    elif task.type == TaskType.EXECUTE_ACTIONS.value:
-        execute_octobot.schedule(args=[task], delay=1)
-        return True
-    else:
+TASK_FUNCTIONS_BY_TYPE = {
+    TaskType.START_OCTOBOT: start_octobot,
+    TaskType.STOP_OCTOBOT: stop_octobot,
+    TaskType.EXECUTE_ACTIONS: execute_octobot,
+}
+TRIGGER_DELAY = 1
+
+
+def _get_task_function(task: Task):
+    try:
+        return TASK_FUNCTIONS_BY_TYPE[TaskType(task.type)]
+    except ValueError:
         raise ValueError(f"Invalid task type: {task.type}")
+
+
+def trigger_task(task: Task) -> TaskSubmission:
+    """
+    Same as trigger_tasks for a single task
+    """
+    return trigger_tasks([task])[0]
+
+
+def trigger_tasks(tasks: list[Task]) -> list[TaskSubmission]:
+    """
+    Enqueues tasks in a single storage write and returns the scheduler task id
+    or the error of each task, in the same order as tasks.
+    Tasks whose idempotency key was already submitted are not enqueued: their submission is the existing task.
+    """
+    submissions: list[TaskSubmission] = []
+    scheduler_tasks = []
+    scheduler_task_submissions: list[TaskSubmission] = []
+    eta = huey.utils.normalize_time(delay=TRIGGER_DELAY, utc=SCHEDULER.INSTANCE.utc)
+    for task in tasks:
+        try:
+            scheduler_task = _get_task_function(task).s(task, priority=task.priority)
+        except ValueError as e:
+            submissions.append(TaskSubmission(error=str(e)))
+            continue
+        scheduler_task.eta = eta
+        scheduler_tasks.append(scheduler_task)
+        submissions.append(TaskSubmission(id=scheduler_task.id))
+        scheduler_task_submissions.append(submissions[-1])
+    claimed_keys, claimed_task_ids = [], []
+    if scheduler_tasks and settings.SCHEDULER_TASK_DEDUPE_TTL:
+        keys = [get_idempotency_key(scheduler_task.args[0]) for scheduler_task in scheduler_tasks]
+        claimed_by = SCHEDULER.dedupe.claim_many(
+            keys, [scheduler_task.id for scheduler_task in scheduler_tasks], settings.SCHEDULER_TASK_DEDUPE_TTL
+        )
+        for submission, existing_task_id in zip(scheduler_task_submissions, claimed_by):
+            if existing_task_id is not None:
+                submission.id = existing_task_id
+                submission.duplicate = True
+        claimed_keys = [key for key, existing_task_id in zip(keys, claimed_by) if existing_task_id is None]
+        scheduler_tasks = [
+            scheduler_task
+            for scheduler_task, existing_task_id in zip(scheduler_tasks, claimed_by)
+            if existing_task_id is None
+        ]
+        claimed_task_ids = [scheduler_task.id for scheduler_task in scheduler_tasks]
+    if scheduler_tasks:
+        try:
+            SCHEDULER.enqueue_many(scheduler_tasks)
+        except Exception:
+            # tasks were not enqueued: let their submission be retried
+            if claimed_keys:
+                SCHEDULER.dedupe.release(claimed_keys, claimed_task_ids)
+            raise
+    return submissions
+
+
+@SCHEDULER.INSTANCE.task()
+def execute_graph_node(task: Task, graph_id: str, node_key: str):
+    """
+    Runs a task graph node: its task function or, for join nodes, the merge of its dependencies results.
+    Dependents are enqueued by TASK_GRAPH_RUNNER once the result is stored.
+    """
+    if task.type is None:
+        return TASK_GRAPH_RUNNER.merge_dependencies_results(graph_id, node_key)
+    return TASK_GRAPH_RUNNER.execute_node(graph_id, node_key, lambda: _get_task_function(task).call_local(task))
+
+
+TASK_GRAPH_RUNNER = TaskGraphRunner(SCHEDULER.INSTANCE, SCHEDULER.graphs, execute_graph_node)
+TASK_GRAPH_RUNNER.connect()
+
+
+def trigger_task_graph(graph: TaskGraph) -> str:
+    """
+    Stores graph, enqueues its nodes without dependencies and returns the graph id.
+    Raises TaskGraphError when graph is invalid.
+    """
+    definition, root_tasks = TASK_GRAPH_RUNNER.submit(graph)
+    eta = huey.utils.normalize_time(delay=TRIGGER_DELAY, utc=SCHEDULER.INSTANCE.utc)
+    for root_task in root_tasks:
+        root_task.eta = eta
+    SCHEDULER.enqueue_many(root_tasks)
+    return definition.id
+
+
+RESULT_RETENTION_POLICY = ResultRetentionPolicy.from_settings()
+
+if RESULT_RETENTION_POLICY.is_enabled():
+    @SCHEDULER.INSTANCE.periodic_task(every_minutes(settings.SCHEDULER_RESULTS_COMPACTION_INTERVAL))
+    def compact_results():
+        ResultCompactor(SCHEDULER, RESULT_RETENTION_POLICY, settings.SCHEDULER_RESULTS_ARCHIVE_PATH).compact()
+
+
+if TASK_LEASES.is_enabled():
+    @SCHEDULER.INSTANCE.periodic_task(every_minutes(settings.SCHEDULER_TASK_REAPER_INTERVAL))
+    def reap_orphaned_tasks():
+        TASK_LEASES.reap()
@@ -14,11 +14,16 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 
+import collections
+import concurrent.futures
 import csv
+import functools
 import json
 import os
+import sys
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
 import octobot_commons.cryptography as cryptography
 from octobot_node.scheduler.encryption.task_inputs import (
@@ -50,6 +55,11 @@ KEYS_OUTSIDE_CONTENT = [COLUMN_NAME, COLUMN_TYPE, COLUMN_METADATA]
 
 DEFAULT_KEYS_FILE = "task_encryption_keys.json"
 
+# Rows sent at once to a worker process when processing rows in parallel
+DEFAULT_ROWS_CHUNK_SIZE = 64
+# Chunks submitted per worker process in advance, bounds the memory used by pending rows
+PENDING_CHUNKS_PER_JOB = 2
+
 KEY_NAMES = {
     "TASKS_INPUTS_RSA_PUBLIC_KEY": "tasks_inputs_rsa_public_key",
     "TASKS_INPUTS_RSA_PRIVATE_KEY": "tasks_inputs_rsa_private_key",
@@ -256,10 +266,42 @@ def process_row(
     return result
 
 
-def parse_csv(input_file_path: str) -> List[Dict[str, str]]:
-    rows: List[Dict[str, str]] = []
+def iter_processed_rows(
+    rows_values: Iterable[List[str]],
+    column_names: List[str]
+) -> Iterator[Dict[str, str]]:
+    required_keys_indices = validate_required_keys(column_names)
+    keys_outside_content_indices = find_keys_outside_content_indices(column_names)
+    content_column_index = find_column_index(column_names, COLUMN_CONTENT)
     
-    with open(input_file_path, 'r', encoding='utf-8', newline='') as csvfile:
+    for row_values in rows_values:
+        try:
+            processed_row = process_row(
+                row_values,
+                column_names,
+                required_keys_indices,
+                keys_outside_content_indices,
+                content_column_index
+            )
+            if processed_row is not None:
+                yield processed_row
+        except Exception as e:
+            print(f"Failed to process CSV row: {e}")
+            continue
+
+
+def _iter_file_rows(csvfile, rows: Iterator[Dict[str, str]]) -> Iterator[Dict[str, str]]:
+    with csvfile:
+        yield from rows
+
+
+def iter_csv(input_file_path: str) -> Iterator[Dict[str, str]]:
+    """Lazily parse a tasks CSV file, one row at a time.
+    
+    The header is read and validated right away, rows are read when iterating.
+    """
+    csvfile = open(input_file_path, 'r', encoding='utf-8', newline='')
+    try:
         reader = csv.reader(csvfile)
         
         try:
@@ -272,26 +314,23 @@ def parse_csv(input_file_path: str) -> List[Dict[str, str]]:
         if not column_names:
             raise ValueError("No column names found in CSV header")
         
-        required_keys_indices = validate_required_keys(column_names)
-        keys_outside_content_indices = find_keys_outside_content_indices(column_names)
-        content_column_index = find_column_index(column_names, COLUMN_CONTENT)
-        
-        for row_values in reader:
-            try:
-                processed_row = process_row(
-                    row_values,
-                    column_names,
-                    required_keys_indices,
-                    keys_outside_content_indices,
-                    content_column_index
-                )
-                if processed_row is not None:
-                    rows.append(processed_row)
-            except Exception as e:
-                print(f"Failed to process CSV row: {e}")
-                continue
-    
-    return rows
+        rows = iter_processed_rows(reader, column_names)
+        # validate header before the first row is requested
+        validate_required_keys(column_names)
+    except Exception:
+        csvfile.close()
+        raise
+    return _iter_file_rows(csvfile, rows)
+
+
+def parse_csv(input_file_path: str) -> List[Dict[str, str]]:
+    return list(iter_csv(input_file_path))
+
+
+def iter_csv_dict_rows(input_file_path: str) -> Iterator[Dict[str, str]]:
+    with open(input_file_path, 'r', encoding='utf-8', newline='') as csvfile:
+        for row in csv.DictReader(csvfile):
+            yield dict(row)
 
 
 def escape_csv_value(value: str) -> str:
@@ -305,23 +344,21 @@ def escape_csv_value(value: str) -> str:
     return value
 
 
-def generate_csv(rows: List[Dict[str, str]], output_file_path: str) -> None:
-    headers = [COLUMN_NAME, COLUMN_CONTENT, COLUMN_TYPE]
-    
+def write_csv_rows(rows: Iterable[Dict[str, str]], output_file_path: str, headers: List[str]) -> None:
+    """Write rows to output_file_path as they are produced, keeping only headers columns."""
     with open(output_file_path, 'w', encoding='utf-8', newline='') as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(headers)
         for row in rows:
-            writer.writerow([
-                row.get(COLUMN_NAME, ""),
-                row.get(COLUMN_CONTENT, ""),
-                row.get(COLUMN_TYPE, "")
-            ])
+            writer.writerow([row.get(header, "") for header in headers])
+
+
+def generate_csv(rows: Iterable[Dict[str, str]], output_file_path: str) -> None:
+    write_csv_rows(rows, output_file_path, [COLUMN_NAME, COLUMN_CONTENT, COLUMN_TYPE])
 
 
 def merge_csv_columns(input_file_path: str, output_file_path: str) -> None:
-    rows = parse_csv(input_file_path)
-    generate_csv(rows, output_file_path)
+    generate_csv(iter_csv(input_file_path), output_file_path)
 
 
 def generate_and_save_keys(keys_file_path: str = DEFAULT_KEYS_FILE) -> Dict[str, str]:
@@ -403,10 +440,112 @@ def set_keys_in_settings(keys_file_path: str = DEFAULT_KEYS_FILE) -> None:
     print("Keys successfully loaded into settings")
 
 
-def encrypt_csv_content(
-    csv_rows: List[Dict[str, str]],
-    content_column: str = "content"
+def print_progress(processed: int, total: Optional[int] = None) -> None:
+    """Print the number of processed rows on a single stderr line."""
+    message = f"Processed {processed}/{total} rows" if total else f"Processed {processed} rows"
+    end = "\n" if total and processed >= total else ""
+    print(f"\r{message}", end=end, file=sys.stderr, flush=True)
+
+
+def _get_keys_settings() -> Dict[str, Optional[bytes]]:
+    from octobot_node.app.core.config import settings
+    return {settings_key_name: getattr(settings, settings_key_name) for settings_key_name in KEY_NAMES}
+
+
+def _init_worker_process(keys_settings: Dict[str, Optional[bytes]]) -> None:
+    # worker processes are not always forked: give them the keys of the parent process
+    from octobot_node.app.core.config import settings
+    for settings_key_name, key in keys_settings.items():
+        setattr(settings, settings_key_name, key)
+
+
+def _process_rows_chunk(
+    row_function: Callable[[Dict[str, str]], Dict[str, str]],
+    rows: List[Dict[str, str]]
 ) -> List[Dict[str, str]]:
+    return [row_function(row) for row in rows]
+
+
+def _iter_chunks(rows: Iterable[Dict[str, str]], chunk_size: int) -> Iterator[List[Dict[str, str]]]:
+    chunk: List[Dict[str, str]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def process_rows(
+    row_function: Callable[[Dict[str, str]], Dict[str, str]],
+    rows: Iterable[Dict[str, str]],
+    jobs: int = 1,
+    chunk_size: int = DEFAULT_ROWS_CHUNK_SIZE,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    total: Optional[int] = None
+) -> Iterator[Dict[str, str]]:
+    """Apply row_function to each row and yield results in the rows order.
+
+    When jobs > 1, chunks of chunk_size rows are processed by a pool of jobs processes.
+    row_function must then be picklable (a module-level function or a functools.partial of it).
+    progress is called with the number of processed rows (and total) after each chunk.
+    """
+    processed = 0
+    if jobs <= 1:
+        for chunk in _iter_chunks(rows, chunk_size):
+            yield from _process_rows_chunk(row_function, chunk)
+            processed += len(chunk)
+            if progress:
+                progress(processed, total)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker_process, initargs=(_get_keys_settings(),)
+    ) as executor:
+        pending_chunks: collections.deque = collections.deque()
+        for chunk in _iter_chunks(rows, chunk_size):
+            pending_chunks.append(executor.submit(_process_rows_chunk, row_function, chunk))
+            if len(pending_chunks) < jobs * PENDING_CHUNKS_PER_JOB:
+                continue
+            # results are yielded in submission order
+            processed_chunk = pending_chunks.popleft().result()
+            yield from processed_chunk
+            processed += len(processed_chunk)
+            if progress:
+                progress(processed, total)
+        while pending_chunks:
+            processed_chunk = pending_chunks.popleft().result()
+            yield from processed_chunk
+            processed += len(processed_chunk)
+            if progress:
+                progress(processed, total)
+
+
+def _encrypt_row(row: Dict[str, str], content_column: str) -> Dict[str, str]:
+    encrypted_row = row.copy()
+    content = row.get(content_column, "")
+
+    if content:
+        try:
+            encrypted_content, metadata = encrypt_task_content(content)
+            encrypted_row[content_column] = encrypted_content
+            encrypted_row["metadata"] = metadata
+        except Exception as e:
+            error_msg = f"Failed to encrypt content for row '{row.get('name', 'unknown')}': {e}"
+            raise Exception(error_msg) from e
+    else:
+        encrypted_row["metadata"] = ""
+    return encrypted_row
+
+
+def iter_encrypt_csv_content(
+    csv_rows: Iterable[Dict[str, str]],
+    content_column: str = "content",
+    jobs: int = 1,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    total: Optional[int] = None
+) -> Iterator[Dict[str, str]]:
     from octobot_node.app.core.config import settings
     
     if settings.TASKS_INPUTS_RSA_PUBLIC_KEY is None or settings.TASKS_INPUTS_ECDSA_PRIVATE_KEY is None:
@@ -417,102 +556,92 @@ def encrypt_csv_content(
             f"Call set_keys_in_settings() or provide keys to merge_and_encrypt_csv() first."
         )
     
-    encrypted_rows: List[Dict[str, str]] = []
-    
-    for row in csv_rows:
-        encrypted_row = row.copy()
-        content = row.get(content_column, "")
-        
-        if content:
-            try:
-                encrypted_content, metadata = encrypt_task_content(content)
-                encrypted_row[content_column] = encrypted_content
-                encrypted_row["metadata"] = metadata
-            except Exception as e:
-                error_msg = f"Failed to encrypt content for row '{row.get('name', 'unknown')}': {e}"
-                raise Exception(error_msg) from e
-        else:
-            encrypted_row["metadata"] = ""
-        
-        encrypted_rows.append(encrypted_row)
-    
-    return encrypted_rows
+    return process_rows(
+        functools.partial(_encrypt_row, content_column=content_column),
+        csv_rows, jobs=jobs, progress=progress, total=total
+    )
+
+
+def encrypt_csv_content(
+    csv_rows: List[Dict[str, str]],
+    content_column: str = "content",
+    jobs: int = 1,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None
+) -> List[Dict[str, str]]:
+    return list(iter_encrypt_csv_content(
+        csv_rows, content_column, jobs=jobs, progress=progress, total=len(csv_rows)
+    ))
+
+
+def _decrypt_row(row: Dict[str, str], content_column: str, metadata_column: str) -> Dict[str, str]:
+    decrypted_row = row.copy()
+    encrypted_content = row.get(content_column, "")
+    metadata = row.get(metadata_column, "")
+
+    if encrypted_content and metadata:
+        try:
+            decrypted_content = decrypt_task_content(encrypted_content, metadata)
+            decrypted_row[content_column] = decrypted_content
+        except Exception as e:
+            print(f"Failed to decrypt content for row '{row.get('name', 'unknown')}': {e}")
+    elif not encrypted_content:
+        pass
+    else:
+        print(f"Warning: Row '{row.get('name', 'unknown')}' has content but no metadata. Skipping decryption.")
+
+    decrypted_row.pop(metadata_column, None)
+    return decrypted_row
+
+
+def iter_decrypt_csv_content(
+    csv_rows: Iterable[Dict[str, str]],
+    content_column: str = "content",
+    metadata_column: str = "metadata",
+    jobs: int = 1,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    total: Optional[int] = None
+) -> Iterator[Dict[str, str]]:
+    return process_rows(
+        functools.partial(_decrypt_row, content_column=content_column, metadata_column=metadata_column),
+        csv_rows, jobs=jobs, progress=progress, total=total
+    )
 
 
 def decrypt_csv_content(
     csv_rows: List[Dict[str, str]],
     content_column: str = "content",
-    metadata_column: str = "metadata"
+    metadata_column: str = "metadata",
+    jobs: int = 1,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None
 ) -> List[Dict[str, str]]:
-    decrypted_rows: List[Dict[str, str]] = []
-    
-    for row in csv_rows:
-        decrypted_row = row.copy()
-        encrypted_content = row.get(content_column, "")
-        metadata = row.get(metadata_column, "")
-        
-        if encrypted_content and metadata:
-            try:
-                decrypted_content = decrypt_task_content(encrypted_content, metadata)
-                decrypted_row[content_column] = decrypted_content
-            except Exception as e:
-                print(f"Failed to decrypt content for row '{row.get('name', 'unknown')}': {e}")
-        elif not encrypted_content:
-            pass
-        else:
-            print(f"Warning: Row '{row.get('name', 'unknown')}' has content but no metadata. Skipping decryption.")
-        
-        decrypted_row.pop(metadata_column, None)
-        decrypted_rows.append(decrypted_row)
-    
-    return decrypted_rows
+    return list(iter_decrypt_csv_content(
+        csv_rows, content_column, metadata_column, jobs=jobs, progress=progress, total=len(csv_rows)
+    ))
 
 
 def encrypt_csv_file(
     input_file_path: str,
     output_file_path: str,
-    content_column: str = "content"
+    content_column: str = "content",
+    jobs: int = 1,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None
 ) -> None:
-    rows = parse_csv(input_file_path)
-    encrypted_rows = encrypt_csv_content(rows, content_column)
-    headers = ["name", content_column, "type", "metadata"]
-    
-    with open(output_file_path, 'w', encoding='utf-8', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(headers)
-        for row in encrypted_rows:
-            writer.writerow([
-                row.get("name", ""),
-                row.get(content_column, ""),
-                row.get("type", ""),
-                row.get("metadata", "")
-            ])
+    encrypted_rows = iter_encrypt_csv_content(iter_csv(input_file_path), content_column, jobs=jobs, progress=progress)
+    write_csv_rows(encrypted_rows, output_file_path, ["name", content_column, "type", "metadata"])
 
 
 def decrypt_csv_file(
     input_file_path: str,
     output_file_path: str,
     content_column: str = "content",
-    metadata_column: str = "metadata"
+    metadata_column: str = "metadata",
+    jobs: int = 1,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None
 ) -> None:
-    rows = []
-    with open(input_file_path, 'r', encoding='utf-8', newline='') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            rows.append(dict(row))
-    decrypted_rows = decrypt_csv_content(rows, content_column, metadata_column)
-    headers = ["name", content_column, "type"]
-    
-    with open(output_file_path, 'w', encoding='utf-8', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(headers)
-        
-        for row in decrypted_rows:
-            writer.writerow([
-                row.get("name", ""),
-                row.get(content_column, ""),
-                row.get("type", "")
-            ])
+    decrypted_rows = iter_decrypt_csv_content(
+        iter_csv_dict_rows(input_file_path), content_column, metadata_column, jobs=jobs, progress=progress
+    )
+    write_csv_rows(decrypted_rows, output_file_path, ["name", content_column, "type"])
 
 
 def merge_and_encrypt_csv(
@@ -520,7 +649,9 @@ def merge_and_encrypt_csv(
     output_file_path: str,
     content_column: str = "content",
     keys: Optional[Dict[str, str]] = None,
-    keys_file_path: Optional[str] = None
+    keys_file_path: Optional[str] = None,
+    jobs: int = 1,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None
 ) -> None:
     if keys_file_path:
         set_keys_in_settings(keys_file_path)
@@ -541,26 +672,34 @@ def merge_and_encrypt_csv(
         settings.TASKS_OUTPUTS_ECDSA_PUBLIC_KEY = to_bytes(keys.get(KEY_NAMES["TASKS_OUTPUTS_ECDSA_PUBLIC_KEY"]))
         settings.TASKS_OUTPUTS_ECDSA_PRIVATE_KEY = to_bytes(keys.get(KEY_NAMES["TASKS_OUTPUTS_ECDSA_PRIVATE_KEY"]))
     
-    rows = parse_csv(input_file_path)
-    encrypted_rows = encrypt_csv_content(rows, content_column)
-    headers = ["name", content_column, "type", "metadata"]
-    
-    with open(output_file_path, 'w', encoding='utf-8', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(headers)
-        for row in encrypted_rows:
-            writer.writerow([
-                row.get("name", ""),
-                row.get(content_column, ""),
-                row.get("type", ""),
-                row.get("metadata", "")
-            ])
+    encrypted_rows = iter_encrypt_csv_content(iter_csv(input_file_path), content_column, jobs=jobs, progress=progress)
+    write_csv_rows(encrypted_rows, output_file_path, ["name", content_column, "type", "metadata"])
 
 
-def encrypt_result_csv_content(
-    csv_rows: List[Dict[str, str]],
-    result_column: str = "result"
-) -> List[Dict[str, str]]:
+def _encrypt_result_row(row: Dict[str, str], result_column: str) -> Dict[str, str]:
+    encrypted_row = row.copy()
+    result = row.get(result_column, "")
+
+    if result:
+        try:
+            encrypted_result, metadata = encrypt_task_result(result)
+            encrypted_row[result_column] = encrypted_result
+            encrypted_row["result_metadata"] = metadata
+        except Exception as e:
+            error_msg = f"Failed to encrypt result for row '{row.get('name', 'unknown')}': {e}"
+            raise Exception(error_msg) from e
+    else:
+        encrypted_row["result_metadata"] = ""
+    return encrypted_row
+
+
+def iter_encrypt_result_csv_content(
+    csv_rows: Iterable[Dict[str, str]],
+    result_column: str = "result",
+    jobs: int = 1,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    total: Optional[int] = None
+) -> Iterator[Dict[str, str]]:
     from octobot_node.app.core.config import settings
     
     if settings.TASKS_OUTPUTS_RSA_PUBLIC_KEY is None or settings.TASKS_OUTPUTS_ECDSA_PRIVATE_KEY is None:
@@ -571,131 +710,149 @@ def encrypt_result_csv_content(
             f"Call set_keys_in_settings() first."
         )
     
-    encrypted_rows: List[Dict[str, str]] = []
-    
-    for row in csv_rows:
-        encrypted_row = row.copy()
-        result = row.get(result_column, "")
-        
-        if result:
-            try:
-                encrypted_result, metadata = encrypt_task_result(result)
-                encrypted_row[result_column] = encrypted_result
-                encrypted_row["result_metadata"] = metadata
-            except Exception as e:
-                error_msg = f"Failed to encrypt result for row '{row.get('name', 'unknown')}': {e}"
-                raise Exception(error_msg) from e
-        else:
-            encrypted_row["result_metadata"] = ""
-        
-        encrypted_rows.append(encrypted_row)
-    
-    return encrypted_rows
+    return process_rows(
+        functools.partial(_encrypt_result_row, result_column=result_column),
+        csv_rows, jobs=jobs, progress=progress, total=total
+    )
+
+
+def encrypt_result_csv_content(
+    csv_rows: List[Dict[str, str]],
+    result_column: str = "result",
+    jobs: int = 1,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None
+) -> List[Dict[str, str]]:
+    return list(iter_encrypt_result_csv_content(
+        csv_rows, result_column, jobs=jobs, progress=progress, total=len(csv_rows)
+    ))
+
+
+def _decrypt_result_row(row: Dict[str, str], result_column: str, metadata_column: str) -> Dict[str, str]:
+    decrypted_row = row.copy()
+    encrypted_result = row.get(result_column, "")
+    metadata = row.get(metadata_column, "")
+
+    if encrypted_result and metadata:
+        try:
+            decrypted_result = decrypt_task_result(encrypted_result, metadata)
+            result_dict = decrypted_result if isinstance(decrypted_result, dict) else None
+            if result_dict is None:
+                try:
+                    parsed = json.loads(decrypted_result)
+                    result_dict = parsed if isinstance(parsed, dict) else None
+                except (json.JSONDecodeError, TypeError, AttributeError):
+                    pass
+
+            if result_dict:
+                # Split dict into separate columns
+                for key, value in result_dict.items():
+                    decrypted_row[key] = json.dumps(value) if isinstance(value, (dict, list)) else str(value)
+                decrypted_row.pop(result_column, None)
+            else:
+                decrypted_row[result_column] = decrypted_result
+        except Exception as e:
+            print(f"Failed to decrypt result for row '{row.get('name', 'unknown')}': {e}")
+    elif not encrypted_result:
+        # Remove result column if it exists but is empty
+        decrypted_row.pop(result_column, None)
+    else:
+        print(f"Warning: Row '{row.get('name', 'unknown')}' has result but no metadata. Skipping decryption.")
+
+    decrypted_row.pop(metadata_column, None)
+    return decrypted_row
+
+
+def iter_decrypt_result_csv_content(
+    csv_rows: Iterable[Dict[str, str]],
+    result_column: str = "result",
+    metadata_column: str = "result_metadata",
+    jobs: int = 1,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    total: Optional[int] = None
+) -> Iterator[Dict[str, str]]:
+    return process_rows(
+        functools.partial(_decrypt_result_row, result_column=result_column, metadata_column=metadata_column),
+        csv_rows, jobs=jobs, progress=progress, total=total
+    )
 
 
 def decrypt_result_csv_content(
     csv_rows: List[Dict[str, str]],
     result_column: str = "result",
-    metadata_column: str = "result_metadata"
+    metadata_column: str = "result_metadata",
+    jobs: int = 1,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None
 ) -> List[Dict[str, str]]:
-    decrypted_rows: List[Dict[str, str]] = []
-    
-    for row in csv_rows:
-        decrypted_row = row.copy()
-        encrypted_result = row.get(result_column, "")
-        metadata = row.get(metadata_column, "")
-        
-        if encrypted_result and metadata:
-            try:
-                decrypted_result = decrypt_task_result(encrypted_result, metadata)
-                result_dict = decrypted_result if isinstance(decrypted_result, dict) else None
-                if result_dict is None:
-                    try:
-                        parsed = json.loads(decrypted_result)
-                        result_dict = parsed if isinstance(parsed, dict) else None
-                    except (json.JSONDecodeError, TypeError, AttributeError):
-                        pass
-                
-                if result_dict:
-                    # Split dict into separate columns
-                    for key, value in result_dict.items():
-                        decrypted_row[key] = json.dumps(value) if isinstance(value, (dict, list)) else str(value)
-                    decrypted_row.pop(result_column, None)
-                else:
-                    decrypted_row[result_column] = decrypted_result
-            except Exception as e:
-                print(f"Failed to decrypt result for row '{row.get('name', 'unknown')}': {e}")
-        elif not encrypted_result:
-            # Remove result column if it exists but is empty
-            decrypted_row.pop(result_column, None)
-        else:
-            print(f"Warning: Row '{row.get('name', 'unknown')}' has result but no metadata. Skipping decryption.")
-        
-        decrypted_row.pop(metadata_column, None)
-        decrypted_rows.append(decrypted_row)
-    
-    return decrypted_rows
+    return list(iter_decrypt_result_csv_content(
+        csv_rows, result_column, metadata_column, jobs=jobs, progress=progress, total=len(csv_rows)
+    ))
 
 
 def encrypt_result_csv_file(
     input_file_path: str,
     output_file_path: str,
-    result_column: str = "result"
+    result_column: str = "result",
+    jobs: int = 1,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None
 ) -> None:
-    rows = []
-    with open(input_file_path, 'r', encoding='utf-8', newline='') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            rows.append(dict(row))
-    
-    encrypted_rows = encrypt_result_csv_content(rows, result_column)
-    headers = list(rows[0].keys()) if rows else ["name", result_column]
-    if "result_metadata" not in headers:
-        headers.append("result_metadata")
-    
-    with open(output_file_path, 'w', encoding='utf-8', newline='') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=headers)
-        writer.writeheader()
-        for row in encrypted_rows:
-            writer.writerow(row)
+    with open(input_file_path, 'r', encoding='utf-8', newline='') as input_csvfile:
+        reader = csv.DictReader(input_csvfile)
+        headers = list(reader.fieldnames) if reader.fieldnames else ["name", result_column]
+        if "result_metadata" not in headers:
+            headers.append("result_metadata")
+        encrypted_rows = iter_encrypt_result_csv_content(
+            (dict(row) for row in reader), result_column, jobs=jobs, progress=progress
+        )
+        
+        with open(output_file_path, 'w', encoding='utf-8', newline='') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=headers)
+            writer.writeheader()
+            for row in encrypted_rows:
+                writer.writerow(row)
 
 
 def decrypt_result_csv_file(
     input_file_path: str,
     output_file_path: str,
     result_column: str = "result",
-    metadata_column: str = "result_metadata"
+    metadata_column: str = "result_metadata",
+    jobs: int = 1,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None
 ) -> None:
-    rows = []
-    with open(input_file_path, 'r', encoding='utf-8', newline='') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            rows.append(dict(row))
-    
-    decrypted_rows = decrypt_result_csv_content(rows, result_column, metadata_column)
-    
+    # decrypted results are split into columns that are only known once every row is decrypted:
+    # spool decrypted rows to a temporary file instead of keeping them in memory
     all_headers = set()
-    for row in decrypted_rows:
-        all_headers.update(row.keys())
-    
-    original_headers = [col for col in (list(rows[0].keys()) if rows else ["name", result_column]) if col != metadata_column]
-    headers = []
-    seen = set()
-    
-    for col in original_headers:
-        if col != result_column and col in all_headers:
+    with tempfile.TemporaryFile('w+', encoding='utf-8') as spool_file:
+        with open(input_file_path, 'r', encoding='utf-8', newline='') as input_csvfile:
+            reader = csv.DictReader(input_csvfile)
+            input_headers = list(reader.fieldnames) if reader.fieldnames else ["name", result_column]
+            for row in iter_decrypt_result_csv_content(
+                (dict(row) for row in reader), result_column, metadata_column, jobs=jobs, progress=progress
+            ):
+                all_headers.update(row.keys())
+                spool_file.write(json.dumps(row))
+                spool_file.write("\n")
+        
+        original_headers = [col for col in input_headers if col != metadata_column]
+        headers = []
+        seen = set()
+        
+        for col in original_headers:
+            if col != result_column and col in all_headers:
+                headers.append(col)
+                seen.add(col)
+        
+        if result_column in all_headers and result_column not in seen:
+            headers.append(result_column)
+            seen.add(result_column)
+        
+        for col in sorted(all_headers - seen):
             headers.append(col)
-            seen.add(col)
-    
-    if result_column in all_headers and result_column not in seen:
-        headers.append(result_column)
-        seen.add(result_column)
-    
-    for col in sorted(all_headers - seen):
-        headers.append(col)
-    
-    with open(output_file_path, 'w', encoding='utf-8', newline='') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=headers)
-        writer.writeheader()
-        for row in decrypted_rows:
-            writer.writerow({k: v for k, v in row.items() if k in headers})
+        
+        spool_file.seek(0)
+        with open(output_file_path, 'w', encoding='utf-8', newline='') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=headers)
+            writer.writeheader()
+            for line in spool_file:
+                row = json.loads(line)
+                writer.writerow({k: v for k, v in row.items() if k in headers})
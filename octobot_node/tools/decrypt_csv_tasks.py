@@ -29,6 +29,7 @@ from typing import Optional
 
 from octobot_node.app.core.config import settings
 from octobot_node.tools.csv_utils import (
+    print_progress,
     decrypt_csv_file,
     load_keys,
     KEY_NAMES,
@@ -90,7 +91,8 @@ def decrypt_csv_file_tool(
     rsa_private_key_path: Optional[str] = None,
     ecdsa_public_key_path: Optional[str] = None,
     content_column: str = "content",
-    metadata_column: str = "metadata"
+    metadata_column: str = "metadata",
+    jobs: int = 1
 ) -> None:
     """Decrypt a CSV task file and write the decrypted version to output file.
     
@@ -101,6 +103,7 @@ def decrypt_csv_file_tool(
         ecdsa_public_key_path: Optional path to the ECDSA public key file
         content_column: Name of the column containing encrypted content (default: 'content')
         metadata_column: Name of the column containing metadata (default: 'metadata')
+        jobs: Number of processes decrypting rows in parallel (default: 1)
         
     Raises:
         FileNotFoundError: If input file or key files don't exist
@@ -124,7 +127,9 @@ def decrypt_csv_file_tool(
         input_file_path=input_file_path,
         output_file_path=output_file_path,
         content_column=content_column,
-        metadata_column=metadata_column
+        metadata_column=metadata_column,
+        jobs=jobs,
+        progress=print_progress
     )
     print(f"Successfully decrypted CSV and saved to: {output_file_path}")
 
@@ -145,7 +150,8 @@ def decrypt_csv_file_from_keys_file(
     output_file_path: str,
     keys_file_path: str,
     content_column: str = "content",
-    metadata_column: str = "metadata"
+    metadata_column: str = "metadata",
+    jobs: int = 1
 ) -> None:
     """Decrypt a CSV task file using keys from a JSON keys file.
     
@@ -158,6 +164,7 @@ def decrypt_csv_file_from_keys_file(
         keys_file_path: Path to the JSON keys file
         content_column: Name of the column containing encrypted content (default: 'content')
         metadata_column: Name of the column containing metadata (default: 'metadata')
+        jobs: Number of processes decrypting rows in parallel (default: 1)
         
     Raises:
         FileNotFoundError: If input file or keys file doesn't exist
@@ -190,7 +197,9 @@ def decrypt_csv_file_from_keys_file(
         input_file_path=input_file_path,
         output_file_path=output_file_path,
         content_column=content_column,
-        metadata_column=metadata_column
+        metadata_column=metadata_column,
+        jobs=jobs,
+        progress=print_progress
     )
     print(f"Successfully decrypted CSV and saved to: {output_file_path}")
 
@@ -252,6 +261,14 @@ Examples:
         help="Name of the column containing metadata (default: 'metadata')"
     )
     
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of processes decrypting rows in parallel (default: 1)"
+    )
+    
     args = parser.parse_args()
     
     if args.output:
@@ -266,7 +283,8 @@ Examples:
             rsa_private_key_path=args.rsa_private_key,
             ecdsa_public_key_path=args.ecdsa_public_key,
             content_column=args.content_column,
-            metadata_column=args.metadata_column
+            metadata_column=args.metadata_column,
+            jobs=args.jobs
         )
         print("\nDecryption completed successfully!")
         sys.exit(0)
@@ -33,6 +33,7 @@ from octobot_node.tools.csv_utils import (
     set_key_from_file_or_env,
     set_key_from_string,
     encrypt_csv_file as csv_utils_encrypt_csv_file,
+    print_progress,
 )
 
 
@@ -88,7 +89,8 @@ def encrypt_csv_file(
     output_file_path: str,
     rsa_public_key_path: Optional[str] = None,
     ecdsa_private_key_path: Optional[str] = None,
-    content_column: str = "content"
+    content_column: str = "content",
+    jobs: int = 1
 ) -> None:
     """Encrypt a CSV file and write the encrypted version to output file.
     
@@ -98,6 +100,7 @@ def encrypt_csv_file(
         rsa_public_key_path: Optional path to the RSA public key file
         ecdsa_private_key_path: Optional path to the ECDSA private key file
         content_column: Name of the column containing content to encrypt
+        jobs: Number of processes encrypting rows in parallel (default: 1)
         
     Raises:
         FileNotFoundError: If input file or key files don't exist
@@ -110,7 +113,9 @@ def encrypt_csv_file(
     set_keys_in_settings(rsa_public_key_path, ecdsa_private_key_path)
     
     print(f"Encrypting CSV file: {input_file_path}")
-    csv_utils_encrypt_csv_file(input_file_path, output_file_path, content_column)
+    csv_utils_encrypt_csv_file(
+        input_file_path, output_file_path, content_column, jobs=jobs, progress=print_progress
+    )
     print(f"Successfully encrypted CSV and saved to: {output_file_path}")
 
 
@@ -129,7 +134,8 @@ def encrypt_csv_file_from_keys_file(
     input_file_path: str,
     output_file_path: str,
     keys_file_path: str,
-    content_column: str = "content"
+    content_column: str = "content",
+    jobs: int = 1
 ) -> None:
     """Encrypt a CSV file using keys from a JSON keys file.
     
@@ -141,6 +147,7 @@ def encrypt_csv_file_from_keys_file(
         output_file_path: Path to the output encrypted CSV file
         keys_file_path: Path to the JSON keys file
         content_column: Name of the column containing content to encrypt
+        jobs: Number of processes encrypting rows in parallel (default: 1)
         
     Raises:
         FileNotFoundError: If input file or keys file doesn't exist
@@ -161,7 +168,9 @@ def encrypt_csv_file_from_keys_file(
     
     set_keys_in_settings_from_strings(rsa_public_key_str, ecdsa_private_key_str)
     print(f"Encrypting CSV file: {input_file_path}")
-    csv_utils_encrypt_csv_file(input_file_path, output_file_path, content_column)
+    csv_utils_encrypt_csv_file(
+        input_file_path, output_file_path, content_column, jobs=jobs, progress=print_progress
+    )
     print(f"Successfully encrypted CSV and saved to: {output_file_path}")
 
 
@@ -215,6 +224,14 @@ Examples:
         help="Name of the column containing content to encrypt (default: 'content')"
     )
     
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of processes encrypting rows in parallel (default: 1)"
+    )
+    
     args = parser.parse_args()
     
     # Determine output file path
@@ -229,7 +246,8 @@ Examples:
             output_file_path=output_file_path,
             rsa_public_key_path=args.rsa_public_key,
             ecdsa_private_key_path=args.ecdsa_private_key,
-            content_column=args.content_column
+            content_column=args.content_column,
+            jobs=args.jobs
         )
         print("\nEncryption completed successfully!")
         sys.exit(0)
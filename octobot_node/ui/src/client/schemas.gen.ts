@@ -35,6 +35,17 @@ export const NodeSchema = {
             ],
             title: 'Workers'
         },
+        worker_type: {
+            anyOf: [
+                {
+                    type: 'string'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Worker Type'
+        },
         status: {
             type: 'string',
             title: 'Status'
@@ -269,6 +280,40 @@ export const TaskStatusSchema = {
     title: 'TaskStatus'
 } as const;
 
+export const TaskSubmissionSchema = {
+    properties: {
+        id: {
+            anyOf: [
+                {
+                    type: 'string'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Id'
+        },
+        error: {
+            anyOf: [
+                {
+                    type: 'string'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Error'
+        },
+        duplicate: {
+            type: 'boolean',
+            title: 'Duplicate',
+            default: false
+        }
+    },
+    type: 'object',
+    title: 'TaskSubmission'
+} as const;
+
 export const UserSchema = {
     properties: {
         email: {
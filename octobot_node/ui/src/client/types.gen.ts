@@ -8,6 +8,7 @@ export type Node = {
     node_type: string;
     backend_type: string;
     workers: (number | null);
+    worker_type?: (string | null);
     status: string;
     redis_url?: (string | null);
     sqlite_file?: (string | null);
@@ -35,6 +36,12 @@ export type Task = {
 
 export type TaskStatus = 'pending' | 'scheduled' | 'periodic' | 'running' | 'completed' | 'failed';
 
+export type TaskSubmission = {
+    id?: (string | null);
+    error?: (string | null);
+    duplicate?: boolean;
+};
+
 export type User = {
     email: string;
     is_active?: boolean;
@@ -65,10 +72,7 @@ export type TasksCreateTasksData = {
     requestBody: Array<Task>;
 };
 
-export type TasksCreateTasksResponse = ([
-    number,
-    number
-]);
+export type TasksCreateTasksResponse = (Array<TaskSubmission>);
 
 export type TasksGetTasksData = {
     limit?: number;
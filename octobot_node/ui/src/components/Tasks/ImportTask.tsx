@@ -76,7 +76,9 @@ const ImportTask = () => {
         content_metadata: task.metadata,
       } as Task))
 
-      const [successCount, errorCount] = await createTaskMutation.mutateAsync(tasks)
+      const submissions = await createTaskMutation.mutateAsync(tasks)
+      const errorCount = submissions.filter(submission => submission.error).length
+      const successCount = submissions.length - errorCount
 
       if (successCount > 0) {
         showSuccessToast(
@@ -0,0 +1,110 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import time
+
+import huey
+import mock
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from octobot_node.app.core import metrics
+from octobot_node.app.models import Task, TaskStatus
+from octobot_node.scheduler.instrumentation import TaskInstrumentation
+from octobot_node.scheduler.task_index import MemoryTaskIndex, TaskIndexEntry, TaskIndexUpdater
+
+
+class TestHistogram:
+    def test_observe_and_render(self) -> None:
+        registry = metrics.Registry()
+        histogram = registry.histogram("test_seconds", "Test histogram", ("task",), (0.1, 1))
+        histogram.observe(0.05, task="a")
+        histogram.observe(0.5, task="a")
+        histogram.observe(5, task="a")
+        rendered = registry.render()
+        assert "# TYPE octobot_node_test_seconds histogram" in rendered
+        assert 'octobot_node_test_seconds_bucket{task="a",le="0.1"} 1' in rendered
+        assert 'octobot_node_test_seconds_bucket{task="a",le="1.0"} 2' in rendered
+        assert 'octobot_node_test_seconds_bucket{task="a",le="+Inf"} 3' in rendered
+        assert 'octobot_node_test_seconds_count{task="a"} 3' in rendered
+        assert 'octobot_node_test_seconds_sum{task="a"} 5.55' in rendered
+        assert rendered.endswith("# EOF\n")
+
+    def test_collectors(self) -> None:
+        registry = metrics.Registry()
+        registry.add_collector(lambda: [
+            metrics.MetricFamily("octobot_node_tasks", "gauge", "Tasks", [("", {"status": "pending"}, 3)])
+        ])
+        assert 'octobot_node_tasks{status="pending"} 3' in registry.render()
+
+
+class TestMetricsMiddleware:
+    def test_requests_per_route(self) -> None:
+        metrics.HTTP_REQUEST.clear()
+        app = FastAPI()
+        app.add_middleware(metrics.MetricsMiddleware, excluded_paths={"/metrics"})
+
+        @app.get("/items/{item_id}")
+        def get_item(item_id: str):
+            return {"id": item_id}
+
+        @app.get("/metrics")
+        def get_metrics():
+            return {}
+
+        client = TestClient(app)
+        client.get("/items/1")
+        client.get("/items/2")
+        client.get("/unknown")
+        client.get("/metrics")
+        rendered = metrics.REGISTRY.render()
+        assert (
+            'octobot_node_http_request_duration_seconds_count{method="GET",route="/items/{item_id}",status="200"} 2'
+            in rendered
+        )
+        assert 'route="unmatched",status="404"} 1' in rendered
+        assert 'route="/metrics"' not in rendered
+
+
+class TestTaskInstrumentation:
+    def test_tasks_histograms(self) -> None:
+        for histogram in (metrics.TASK_QUEUE_WAIT, metrics.TASK_EXECUTION, metrics.TASK_RESULT_SIZE):
+            histogram.clear()
+        huey_instance = huey.MemoryHuey("test_metrics")
+        task_index = MemoryTaskIndex()
+
+        @huey_instance.task()
+        def instrumented_task(task: Task):
+            if task.content == "fail":
+                raise ValueError("boom")
+            return {"result": task.name}
+
+        instrumented_task(Task(name="ok"))
+        instrumented_task(Task(name="ko", content="fail"))
+        index_updater = TaskIndexUpdater(huey_instance, task_index)
+        index_updater.connect()
+        TaskInstrumentation(huey_instance, index_updater).connect()
+        with mock.patch.object(task_index, "get_many", mock.Mock(wraps=task_index.get_many)) as get_many_mock:
+            while huey_task := huey_instance.dequeue():
+                task_index.record(TaskIndexEntry(huey_task.id, status=TaskStatus.PENDING, created_at=time.time() - 2))
+                huey_instance.execute(huey_task)
+        # queue waits are computed from the recorded entries
+        get_many_mock.assert_not_called()
+        rendered = metrics.REGISTRY.render()
+        assert 'octobot_node_task_queue_wait_seconds_count{task="instrumented_task"} 2' in rendered
+        assert 'octobot_node_task_execution_seconds_count{task="instrumented_task",outcome="success"} 1' in rendered
+        assert 'octobot_node_task_execution_seconds_count{task="instrumented_task",outcome="failure"} 1' in rendered
+        assert 'octobot_node_task_result_bytes_count{task="instrumented_task"} 1' in rendered
+        assert 'octobot_node_task_queue_wait_seconds_bucket{task="instrumented_task",le="1.0"} 0' in rendered
@@ -0,0 +1,40 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import mock
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from octobot_node.app.api.routes import nodes
+
+
+class TestGetCurrentNode:
+    def test_returns_worker_type(self) -> None:
+        app = FastAPI()
+        app.include_router(nodes.router, prefix="/nodes")
+        status = {
+            "node_type": "master",
+            "backend_type": "sqlite",
+            "workers": 2,
+            "worker_type": "process",
+            "status": "running",
+            "redis_url": None,
+            "sqlite_file": "tasks.db",
+        }
+        with mock.patch.object(nodes, "get_node_status", mock.Mock(return_value=status)):
+            response = TestClient(app).get("/nodes/me")
+        assert response.status_code == 200
+        assert response.json()["worker_type"] == "process"
+        assert response.json()["workers"] == 2
@@ -0,0 +1,41 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import mock
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from octobot_node.app.api.routes import tasks
+from octobot_node.app.models import TaskSubmission
+
+
+class TestCreateTasks:
+    def test_returns_submissions(self) -> None:
+        app = FastAPI()
+        app.include_router(tasks.router, prefix="/tasks")
+        submissions = [
+            TaskSubmission(id="task-1"),
+            TaskSubmission(id="task-0", duplicate=True),
+            TaskSubmission(error="Invalid task type: invalid"),
+        ]
+        with mock.patch.object(tasks, "trigger_tasks", mock.Mock(return_value=submissions)) as trigger_tasks_mock:
+            response = TestClient(app).post("/tasks/", json=[{"name": "a"}, {"name": "b"}, {"type": "invalid"}])
+        assert response.status_code == 200
+        assert [task.name for task in trigger_tasks_mock.mock_calls[0].args[0]] == ["a", "b", None]
+        assert response.json() == [
+            {"id": "task-1", "error": None, "duplicate": False},
+            {"id": "task-0", "error": None, "duplicate": True},
+            {"id": None, "error": "Invalid task type: invalid", "duplicate": False},
+        ]
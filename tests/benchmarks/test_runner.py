@@ -0,0 +1,72 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import json
+
+import pytest
+
+from octobot_node.benchmarks import (
+    BENCHMARKS,
+    BenchmarkResult,
+    compare_to_baseline,
+    dump_results,
+    load_results,
+    run_benchmarks,
+)
+
+
+class TestBenchmarkResults:
+    def test_compare_to_baseline(self) -> None:
+        baseline = [
+            BenchmarkResult("enqueue", {"tasks": 10}, 10, 1),
+            BenchmarkResult("parse_csv", {"rows": 10}, 10, 1),
+        ]
+        results = [
+            BenchmarkResult("enqueue", {"tasks": 10}, 10, 1.1),
+            BenchmarkResult("parse_csv", {"rows": 10}, 10, 2),
+            BenchmarkResult("parse_csv", {"rows": 20}, 20, 10),
+        ]
+        regressions = compare_to_baseline(results, baseline, tolerance=0.2)
+        assert [regression.result.key for regression in regressions] == ['parse_csv{"rows": 10}']
+        assert regressions[0].change == pytest.approx(-0.5)
+
+    def test_dump_and_load(self, tmp_path) -> None:
+        results = [BenchmarkResult("enqueue", {"tasks": 10, "backend": "memory"}, 10, 0.5)]
+        file_path = tmp_path / "results.json"
+        file_path.write_text(json.dumps(dump_results(results)))
+        assert load_results(str(file_path)) == results
+        assert dump_results(results)["results"][0]["ops_per_second"] == 20
+
+
+class TestRunBenchmarks:
+    @pytest.mark.parametrize("backend", ["sqlite", "memory"])
+    def test_run_scheduler_benchmarks(self, backend) -> None:
+        results = run_benchmarks(
+            ["enqueue", "enqueue_many", "consumer_drain", "list_results", "parse_csv"],
+            backend=backend, scale=0.001, repeat=1
+        )
+        assert {result.name for result in results} == {
+            "enqueue", "enqueue_many", "consumer_drain", "list_results", "list_results_page", "parse_csv"
+        }
+        assert all(result.seconds > 0 and result.params["backend"] == backend for result in results)
+
+    def test_unknown_benchmark(self) -> None:
+        with pytest.raises(ValueError):
+            run_benchmarks(["unknown"])
+
+    def test_registered_benchmarks(self) -> None:
+        assert set(BENCHMARKS) == {
+            "enqueue", "enqueue_many", "consumer_drain", "list_results", "encrypted_task", "parse_csv"
+        }
@@ -0,0 +1,27 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import huey
+import pytest
+
+
+@pytest.fixture(params=["sqlite", "memory"])
+def store_huey(request, tmp_path) -> huey.Huey:
+    """
+    Huey instance of each storage backend supported without a server
+    """
+    if request.param == "sqlite":
+        return huey.SqliteHuey(request.node.name, filename=str(tmp_path / "tasks.db"))
+    return huey.MemoryHuey(request.node.name)
@@ -16,8 +16,11 @@
 
 import csv
 import json
+import types
 from pathlib import Path
 
+import pytest
+
 from octobot_node.tools.csv_utils import (
     generate_and_save_keys,
     parse_csv,
@@ -25,11 +28,62 @@ from octobot_node.tools.csv_utils import (
     DEFAULT_KEYS_FILE,
     encrypt_result_csv_file,
     decrypt_result_csv_file,
+    process_rows,
+    iter_csv,
+    iter_encrypt_csv_content,
+    iter_decrypt_csv_content,
 )
 from octobot_node.tools.encrypt_csv_tasks import encrypt_csv_file_from_keys_file
 from octobot_node.tools.decrypt_csv_tasks import decrypt_csv_file_from_keys_file
 
 
+def _double_row(row: dict) -> dict:
+    return {"value": row["value"] * 2}
+
+
+class TestProcessRows:
+    def test_process_rows_inline(self) -> None:
+        progress = []
+        rows = [{"value": i} for i in range(10)]
+        results = list(process_rows(_double_row, rows, chunk_size=3, progress=lambda done, total: progress.append(done)))
+        assert results == [{"value": i * 2} for i in range(10)]
+        assert progress == [3, 6, 9, 10]
+
+    def test_process_rows_parallel_keeps_order(self) -> None:
+        progress = []
+        rows = [{"value": i} for i in range(50)]
+        results = list(process_rows(
+            _double_row, rows, jobs=2, chunk_size=4, total=len(rows),
+            progress=lambda done, total: progress.append((done, total))
+        ))
+        assert results == [{"value": i * 2} for i in range(50)]
+        assert progress[-1] == (50, 50)
+        assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+
+
+class TestStreamingCSV:
+    def test_iter_csv_validates_header_eagerly(self, tmp_path: Path) -> None:
+        csv_path = tmp_path / "invalid.csv"
+        csv_path.write_text("name,content\nTask 1,{}\n", encoding="utf-8")
+        with pytest.raises(ValueError):
+            iter_csv(str(csv_path))
+
+    def test_iter_csv_streams_rows(self, tmp_path: Path) -> None:
+        test_csv_path = Path(__file__).parent / "test-tasks.csv"
+        keys_file = str(tmp_path / DEFAULT_KEYS_FILE)
+        generate_and_save_keys(keys_file)
+        from octobot_node.tools.csv_utils import set_keys_in_settings
+        set_keys_in_settings(keys_file)
+
+        rows = iter_csv(str(test_csv_path))
+        assert isinstance(rows, types.GeneratorType)
+        encrypted_rows = iter_encrypt_csv_content(rows)
+        decrypted_rows = iter_decrypt_csv_content(encrypted_rows)
+        assert [row["content"] for row in decrypted_rows] == [
+            row["content"] for row in parse_csv(str(test_csv_path))
+        ]
+
+
 class TestCSVEncryption:
     def test_encrypt_and_decrypt_csv(self, tmp_path: Path) -> None:
         test_dir = Path(__file__).parent
@@ -70,6 +124,36 @@ class TestCSVEncryption:
             assert original_row["type"] == decrypted_row["type"], "Types should match"
             assert original_row["content"] == decrypted_row["content"], "Content should match after decryption"
 
+    def test_encrypt_and_decrypt_csv_with_jobs(self, tmp_path: Path) -> None:
+        test_dir = Path(__file__).parent
+        test_csv_path = test_dir / "test-tasks.csv"
+        keys_file = str(tmp_path / DEFAULT_KEYS_FILE)
+
+        encrypted_csv = tmp_path / "encrypted_tasks.csv"
+        decrypted_csv = tmp_path / "decrypted_tasks.csv"
+        merged_csv = tmp_path / "merged_tasks.csv"
+
+        generate_and_save_keys(keys_file)
+        merge_csv_columns(str(test_csv_path), str(merged_csv))
+
+        encrypt_csv_file_from_keys_file(
+            input_file_path=str(test_csv_path),
+            output_file_path=str(encrypted_csv),
+            keys_file_path=keys_file,
+            jobs=2
+        )
+        decrypt_csv_file_from_keys_file(
+            input_file_path=str(encrypted_csv),
+            output_file_path=str(decrypted_csv),
+            keys_file_path=keys_file,
+            jobs=2
+        )
+
+        original_rows = parse_csv(str(merged_csv))
+        decrypted_rows = parse_csv(str(decrypted_csv))
+        assert [row["name"] for row in original_rows] == [row["name"] for row in decrypted_rows]
+        assert [row["content"] for row in original_rows] == [row["content"] for row in decrypted_rows]
+
     def test_decrypt_exported_result_csv(self, tmp_path: Path) -> None:
         test_dir = Path(__file__).parent
         keys_file = str(test_dir / DEFAULT_KEYS_FILE)
@@ -0,0 +1,159 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import dataclasses
+import json
+
+import mock
+import pytest
+
+import octobot_node.scheduler.octobot_lib as octobot_lib
+from octobot_node.scheduler.stores import MemoryKeyedStore
+
+
+@dataclasses.dataclass
+class BotActionDetails:
+    name: str
+    result: dict | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BotActionDetails":
+        return cls(**data)
+
+    def to_dict(self, include_default_values: bool = True) -> dict:
+        return {"name": self.name}
+
+
+@pytest.fixture
+def bot_action_details():
+    with mock.patch.object(octobot_lib.mini_octobot, "BotActionDetails", BotActionDetails):
+        yield BotActionDetails
+
+
+@pytest.fixture
+def description(bot_action_details):
+    return octobot_lib.OctoBotActionsJobDescription(
+        state={"bots": []},
+        auth_details={"key": "value"},
+        immediate_actions=[BotActionDetails("deposit")],
+        pending_actions=[[BotActionDetails("trade")], [BotActionDetails("wait")], [BotActionDetails("withdraw")]],
+    )
+
+
+def _create_plan_store(cache_size: int) -> octobot_lib.ActionsPlanStore:
+    return octobot_lib.ActionsPlanStore(MemoryKeyedStore(), octobot_lib.ActionsPlanCache(cache_size))
+
+
+def _next_job(job: octobot_lib.OctoBotActionsJob, plan_store) -> octobot_lib.OctoBotActionsJob:
+    next_description = job.get_next_actions_description({"bots": []})
+    return octobot_lib.OctoBotActionsJob(json.dumps(next_description.to_compact_dict(plan_store)), plan_store)
+
+
+class TestCompactDescription:
+    def test_round_trip_without_cache(self, description) -> None:
+        plan_store = _create_plan_store(0)
+        compact_description = description.to_compact_dict(plan_store)
+        assert compact_description[octobot_lib.DESCRIPTION_VERSION_KEY] == octobot_lib.COMPACT_DESCRIPTION_VERSION
+        assert compact_description["step"] == 0
+        job = octobot_lib.OctoBotActionsJob(json.dumps(compact_description), plan_store)
+        assert job.description.immediate_actions == [BotActionDetails("deposit")]
+        assert len(job.description.pending_actions) == 3
+        assert job.description.auth_details == {"key": "value"}
+
+        job = _next_job(job, plan_store)
+        assert job.description.step == 1
+        assert job.description.immediate_actions == [BotActionDetails("trade")]
+        assert job.description.pending_actions == [[BotActionDetails("wait")], [BotActionDetails("withdraw")]]
+        assert job.description.actions_plan.id == compact_description["plan_id"]
+
+    def test_steps_only_reference_the_stored_plan(self, description) -> None:
+        plan_store = _create_plan_store(0)
+        compact_description = description.to_compact_dict(plan_store)
+        assert set(compact_description) == {
+            octobot_lib.DESCRIPTION_VERSION_KEY, "plan_id", "step", "state", "auth_details"
+        }
+        assert json.loads(plan_store.store.get(compact_description["plan_id"])) == [
+            [{"name": "deposit"}], [{"name": "trade"}], [{"name": "wait"}], [{"name": "withdraw"}]
+        ]
+        job = octobot_lib.OctoBotActionsJob(json.dumps(compact_description), plan_store)
+        with mock.patch.object(plan_store.store, "put_many", mock.Mock()) as put_many_mock:
+            next_description = job.get_next_actions_description({"bots": []}).to_compact_dict(plan_store)
+        put_many_mock.assert_not_called()
+        assert next_description["step"] == 1
+        assert "plan" not in next_description
+
+    def test_plan_is_encoded_and_parsed_once(self, description) -> None:
+        plan_store = _create_plan_store(10)
+        job = octobot_lib.OctoBotActionsJob(json.dumps(description.to_compact_dict(plan_store)), plan_store)
+        with mock.patch.object(BotActionDetails, "to_dict", mock.Mock()) as to_dict_mock, \
+             mock.patch.object(BotActionDetails, "from_dict", mock.Mock()) as from_dict_mock, \
+             mock.patch.object(plan_store.store, "get_many", mock.Mock()) as get_many_mock:
+            for step in range(1, 4):
+                job = _next_job(job, plan_store)
+                assert job.description.step == step
+            to_dict_mock.assert_not_called()
+            from_dict_mock.assert_not_called()
+            get_many_mock.assert_not_called()
+        assert job.description.immediate_actions == [BotActionDetails("withdraw")]
+        assert job.get_next_actions_description({}) is None
+        assert len(plan_store.cache) == 1
+
+    def test_plan_is_loaded_on_cache_miss(self, description) -> None:
+        plan_store = _create_plan_store(10)
+        compact_description = description.to_compact_dict(plan_store)
+        plan_store.cache.clear()
+        job = octobot_lib.OctoBotActionsJob(json.dumps(compact_description), plan_store)
+        assert job.description.immediate_actions == [BotActionDetails("deposit")]
+        assert plan_store.cache.get(compact_description["plan_id"]) is job.description.actions_plan
+        plan_store.delete(compact_description["plan_id"])
+        assert len(plan_store.cache) == 0
+        with pytest.raises(ValueError):
+            octobot_lib.OctoBotActionsJob(json.dumps(compact_description), plan_store)
+
+    def test_legacy_description(self, description) -> None:
+        legacy_description = {
+            "state": {"bots": []},
+            "immediate_actions": [{"name": "deposit"}],
+            "pending_actions": [[{"name": "trade"}]],
+        }
+        job = octobot_lib.OctoBotActionsJob(json.dumps(legacy_description))
+        assert job.description.actions_plan is None
+        assert job.description.pending_actions == [[BotActionDetails("trade")]]
+
+    def test_unsupported_version(self, description) -> None:
+        plan_store = _create_plan_store(0)
+        compact_description = description.to_compact_dict(plan_store)
+        compact_description[octobot_lib.DESCRIPTION_VERSION_KEY] = 3
+        with pytest.raises(ValueError):
+            octobot_lib.OctoBotActionsJob(json.dumps(compact_description), plan_store)
+
+
+class TestActionsPlanCache:
+    def test_evicts_least_recently_used(self) -> None:
+        plan_cache = octobot_lib.ActionsPlanCache(2)
+        plans = [octobot_lib.ActionsPlan.create([]) for _ in range(3)]
+        plan_cache.add(plans[0])
+        plan_cache.add(plans[1])
+        assert plan_cache.get(plans[0].id) is plans[0]
+        plan_cache.add(plans[2])
+        assert plan_cache.get(plans[1].id) is None
+        assert plan_cache.get(plans[0].id) is plans[0]
+        plan_cache.discard(plans[0].id)
+        assert len(plan_cache) == 1
+
+    def test_disabled(self) -> None:
+        plan_cache = octobot_lib.ActionsPlanCache(0)
+        plan_cache.add(octobot_lib.ActionsPlan.create([]))
+        assert len(plan_cache) == 0
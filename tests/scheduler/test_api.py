@@ -14,15 +14,29 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 
+import datetime
+import pickle
+
 import pytest
 import mock
+from huey.constants import EmptyData
+from huey.utils import Error as HueyError
 
 from octobot_node.scheduler.api import (
     get_node_status,
+    get_nodes,
     get_task_metrics,
     get_all_tasks,
+    get_tasks_page,
     get_task_result,
+    get_task_results,
+    get_task_async,
+    iter_task_results_export,
 )
+from octobot_node.app.models import TaskStatus
+from octobot_node.scheduler.pagination import TaskCursor, TaskSource, InvalidCursorError
+from octobot_node.scheduler.results_export import ExportFormat
+from octobot_node.scheduler.task_index import TaskIndexEntry
 
 
 class TestGetNodeStatus:
@@ -60,7 +74,7 @@ class TestGetNodeStatus:
 
         mock_consumer = mock.Mock()
         mock_consumer.is_started.return_value = True
-        mock_consumer.workers = 4
+        mock_consumer.get_workers.return_value = 4
 
         with mock.patch("octobot_node.scheduler.api.settings", mock_settings), \
              mock.patch("octobot_node.scheduler.api.CONSUMER", mock_consumer):
@@ -83,7 +97,7 @@ class TestGetNodeStatus:
 
         mock_consumer = mock.Mock()
         mock_consumer.is_started.return_value = False
-        mock_consumer.workers = 4
+        mock_consumer.get_workers.return_value = 4
 
         with mock.patch("octobot_node.scheduler.api.settings", mock_settings), \
              mock.patch("octobot_node.scheduler.api.CONSUMER", mock_consumer):
@@ -121,7 +135,7 @@ class TestGetNodeStatus:
 
         mock_consumer = mock.Mock()
         mock_consumer.is_started.return_value = True
-        mock_consumer.workers = 4
+        mock_consumer.get_workers.return_value = 4
 
         with mock.patch("octobot_node.scheduler.api.settings", mock_settings), \
              mock.patch("octobot_node.scheduler.api.CONSUMER", mock_consumer):
@@ -152,6 +166,22 @@ class TestGetNodeStatus:
             assert result["workers"] is None
 
 
+class TestGetNodes:
+    """Tests for get_nodes function."""
+
+    def test_get_nodes(self) -> None:
+        mock_heartbeat = mock.Mock()
+        mock_heartbeat.list_nodes.return_value = [{"node_id": "consumer-1", "status": "alive"}]
+        with mock.patch("octobot_node.scheduler.api.NODE_HEARTBEAT", mock_heartbeat):
+            assert get_nodes() == [{"node_id": "consumer-1", "status": "alive"}]
+
+    def test_get_nodes_exception_handling(self) -> None:
+        mock_heartbeat = mock.Mock()
+        mock_heartbeat.list_nodes.side_effect = Exception("Redis connection error")
+        with mock.patch("octobot_node.scheduler.api.NODE_HEARTBEAT", mock_heartbeat):
+            assert get_nodes() == []
+
+
 class TestGetTaskMetrics:
     """Tests for get_task_metrics function."""
 
@@ -164,10 +194,8 @@ class TestGetTaskMetrics:
 
         mock_scheduler = mock.Mock()
         mock_scheduler.INSTANCE = mock_huey
-        mock_scheduler.get_periodic_tasks.return_value = [
-            {"id": "task1"},
-            {"id": "task2"},
-        ]
+        mock_scheduler.metrics = None
+        mock_scheduler.get_periodic_tasks_count.return_value = 2
 
         with mock.patch("octobot_node.scheduler.api.SCHEDULER", mock_scheduler):
             result = get_task_metrics()
@@ -178,7 +206,39 @@ class TestGetTaskMetrics:
             mock_huey.pending_count.assert_called_once()
             mock_huey.scheduled_count.assert_called_once()
             mock_huey.result_count.assert_called_once()
-            mock_scheduler.get_periodic_tasks.assert_called_once()
+            mock_scheduler.get_periodic_tasks_count.assert_called_once()
+            mock_scheduler.get_periodic_tasks.assert_not_called()
+
+    def test_get_task_metrics_from_counters(self) -> None:
+        """Test task metrics served from the scheduler metrics counters."""
+        mock_huey = mock.Mock()
+        mock_scheduler = mock.Mock()
+        mock_scheduler.INSTANCE = mock_huey
+        mock_huey.result_count.return_value = 7
+        mock_scheduler.get_periodic_tasks_count.return_value = 1
+        mock_scheduler.metrics.get_metrics.return_value = {
+            "by_status": {
+                TaskStatus.PENDING: 4,
+                TaskStatus.SCHEDULED: 2,
+                TaskStatus.PERIODIC: 0,
+                TaskStatus.RUNNING: 1,
+                TaskStatus.COMPLETED: 6,
+                TaskStatus.FAILED: 3,
+            },
+            "by_type": {"start_octobot": {"completed": 6}},
+            "events": {"complete": 6},
+        }
+
+        with mock.patch("octobot_node.scheduler.api.SCHEDULER", mock_scheduler):
+            result = get_task_metrics()
+
+            assert result["pending"] == 4
+            assert result["scheduled"] == 3
+            assert result["results"] == 7
+            assert result["running"] == 1
+            assert result["failed"] == 3
+            assert result["by_type"] == {"start_octobot": {"completed": 6}}
+            mock_huey.pending_count.assert_not_called()
 
     def test_get_task_metrics_uninitialized_scheduler(self) -> None:
         """Test task metrics when scheduler is not initialized."""
@@ -194,6 +254,7 @@ class TestGetTaskMetrics:
         """Test task metrics when an exception occurs."""
         mock_scheduler = mock.Mock()
         mock_scheduler.INSTANCE = mock.Mock()
+        mock_scheduler.metrics = None
         mock_scheduler.INSTANCE.pending_count.side_effect = Exception("Database error")
 
         with mock.patch("octobot_node.scheduler.api.SCHEDULER", mock_scheduler):
@@ -210,7 +271,8 @@ class TestGetTaskMetrics:
 
         mock_scheduler = mock.Mock()
         mock_scheduler.INSTANCE = mock_huey
-        mock_scheduler.get_periodic_tasks.return_value = []
+        mock_scheduler.metrics = None
+        mock_scheduler.get_periodic_tasks_count.return_value = 0
 
         with mock.patch("octobot_node.scheduler.api.SCHEDULER", mock_scheduler):
             result = get_task_metrics()
@@ -227,25 +289,29 @@ class TestGetAllTasks:
         """Test successful retrieval of all tasks."""
         periodic_tasks = [{"id": "periodic1", "status": "periodic"}]
         pending_tasks = [{"id": "pending1", "status": "pending"}]
+        running_tasks = [{"id": "running1", "status": "running"}]
         scheduled_tasks = [{"id": "scheduled1", "status": "scheduled"}]
         result_tasks = [{"id": "result1", "status": "completed"}]
 
         mock_scheduler = mock.Mock()
         mock_scheduler.get_periodic_tasks.return_value = periodic_tasks
         mock_scheduler.get_pending_tasks.return_value = pending_tasks
+        mock_scheduler.get_running_tasks.return_value = running_tasks
         mock_scheduler.get_scheduled_tasks.return_value = scheduled_tasks
         mock_scheduler.get_results.return_value = result_tasks
 
         with mock.patch("octobot_node.scheduler.api.SCHEDULER", mock_scheduler):
             result = get_all_tasks()
 
-            assert len(result) == 4
+            assert len(result) == 5
             assert periodic_tasks[0] in result
             assert pending_tasks[0] in result
+            assert running_tasks[0] in result
             assert scheduled_tasks[0] in result
             assert result_tasks[0] in result
             mock_scheduler.get_periodic_tasks.assert_called_once()
             mock_scheduler.get_pending_tasks.assert_called_once()
+            mock_scheduler.get_running_tasks.assert_called_once()
             mock_scheduler.get_scheduled_tasks.assert_called_once()
             mock_scheduler.get_results.assert_called_once()
 
@@ -254,6 +320,7 @@ class TestGetAllTasks:
         mock_scheduler = mock.Mock()
         mock_scheduler.get_periodic_tasks.return_value = []
         mock_scheduler.get_pending_tasks.return_value = []
+        mock_scheduler.get_running_tasks.return_value = []
         mock_scheduler.get_scheduled_tasks.return_value = []
         mock_scheduler.get_results.return_value = []
 
@@ -280,6 +347,7 @@ class TestGetAllTasks:
         mock_scheduler = mock.Mock()
         mock_scheduler.get_periodic_tasks.return_value = periodic_tasks
         mock_scheduler.get_pending_tasks.return_value = pending_tasks
+        mock_scheduler.get_running_tasks.return_value = []
         mock_scheduler.get_scheduled_tasks.side_effect = Exception("Error")
         mock_scheduler.get_results.return_value = []
 
@@ -291,81 +359,185 @@ class TestGetAllTasks:
             assert pending_tasks[0] in result
 
 
-class TestGetTaskResult:
-    """Tests for get_task_result function."""
+class TestGetTasksPage:
+    """Tests for get_tasks_page function."""
 
-    @pytest.mark.asyncio
-    async def test_get_task_result_completed(self) -> None:
-        """Test get_task_result for a completed task."""
-        task_id = "task-123"
-        result_data = {"status": "success", "output": "completed"}
+    def test_get_tasks_page_from_page_number(self) -> None:
+        """Test that page numbers are converted into an offset."""
+        mock_scheduler = mock.Mock()
+        mock_scheduler.get_tasks_page.return_value = ([{"id": "task1"}], TaskCursor(TaskSource.PENDING, after=(21.0, "task1")))
 
-        mock_result = mock.Mock()
-        mock_result.ready.return_value = True
-        mock_result.get.return_value = result_data
+        with mock.patch("octobot_node.scheduler.api.SCHEDULER", mock_scheduler):
+            tasks, next_cursor = get_tasks_page(10, page=3, statuses=[TaskStatus.PENDING])
+
+            assert tasks == [{"id": "task1"}]
+            assert TaskCursor.decode(next_cursor) == TaskCursor(TaskSource.PENDING, after=(21.0, "task1"))
+            mock_scheduler.get_tasks_page.assert_called_once_with(
+                10, cursor=None, statuses={TaskStatus.PENDING}, offset=20
+            )
 
+    def test_get_tasks_page_from_cursor(self) -> None:
+        """Test that the cursor takes precedence over the page number."""
         mock_scheduler = mock.Mock()
-        mock_scheduler.INSTANCE = mock.Mock()
-        mock_scheduler.INSTANCE.result.return_value = mock_result
+        mock_scheduler.get_tasks_page.return_value = ([], None)
+        cursor = TaskCursor(TaskSource.RESULTS, after=(5.0, "task5"))
 
         with mock.patch("octobot_node.scheduler.api.SCHEDULER", mock_scheduler):
-            result = await get_task_result(task_id)
+            tasks, next_cursor = get_tasks_page(10, cursor=cursor.encode(), page=3)
 
-            assert result["status"] == "completed"
-            assert result["data"] == result_data
-            mock_scheduler.INSTANCE.result.assert_called_once_with(task_id)
-            mock_result.ready.assert_called_once()
-            mock_result.get.assert_called_once()
+            assert tasks == []
+            assert next_cursor is None
+            mock_scheduler.get_tasks_page.assert_called_once_with(10, cursor=cursor, statuses=None, offset=0)
 
-    @pytest.mark.asyncio
-    async def test_get_task_result_pending(self) -> None:
-        """Test get_task_result for a pending task."""
-        task_id = "task-456"
-
-        mock_result = mock.Mock()
-        mock_result.ready.return_value = False
+    def test_get_tasks_page_invalid_cursor(self) -> None:
+        """Test that invalid cursors are reported to the caller."""
+        with pytest.raises(InvalidCursorError):
+            get_tasks_page(10, cursor="invalid")
 
+    def test_get_tasks_page_exception_handling(self) -> None:
+        """Test get_tasks_page when an exception occurs."""
         mock_scheduler = mock.Mock()
-        mock_scheduler.INSTANCE = mock.Mock()
-        mock_scheduler.INSTANCE.result.return_value = mock_result
+        mock_scheduler.get_tasks_page.side_effect = Exception("Database error")
 
         with mock.patch("octobot_node.scheduler.api.SCHEDULER", mock_scheduler):
-            result = await get_task_result(task_id)
+            assert get_tasks_page(10) == ([], None)
+
 
-            assert result["status"] == "pending or running"
-            assert "data" not in result
-            mock_scheduler.INSTANCE.result.assert_called_once_with(task_id)
-            mock_result.ready.assert_called_once()
-            mock_result.get.assert_not_called()
+class TestGetTaskAsync:
+    """Tests for get_task_async function."""
 
     @pytest.mark.asyncio
-    async def test_get_task_result_not_found(self) -> None:
-        """Test get_task_result for a task that doesn't exist."""
-        task_id = "task-789"
+    async def test_get_task_async(self) -> None:
+        mock_storage = mock.Mock()
+        mock_storage.get_indexed_task = mock.AsyncMock(return_value={"id": "task-1"})
+        with mock.patch("octobot_node.scheduler.api.ASYNC_STORAGE", mock_storage):
+            assert await get_task_async("task-1") == {"id": "task-1"}
+            mock_storage.get_indexed_task.assert_awaited_once_with("task-1")
+
+    @pytest.mark.asyncio
+    async def test_get_task_async_exception_handling(self) -> None:
+        mock_storage = mock.Mock()
+        mock_storage.get_indexed_task = mock.AsyncMock(side_effect=Exception("Redis connection error"))
+        with mock.patch("octobot_node.scheduler.api.ASYNC_STORAGE", mock_storage):
+            assert await get_task_async("task-1") is None
+
 
+class TestGetTaskResult:
+    """Tests for get_task_result and get_task_results functions."""
+
+    @staticmethod
+    def _patch(entries: dict, values: dict):
+        mock_storage = mock.Mock()
+        mock_storage.get_index_entry = mock.AsyncMock(side_effect=lambda task_id: entries.get(task_id))
+        mock_storage.run = mock.AsyncMock(side_effect=lambda func, *args: func(*args))
+        mock_waiter = mock.Mock()
+        mock_waiter.wait = mock.AsyncMock(side_effect=lambda task_ids, wait=0: {
+            task_id: values.get(task_id, EmptyData) for task_id in task_ids
+        })
         mock_scheduler = mock.Mock()
-        mock_scheduler.INSTANCE = mock.Mock()
-        mock_scheduler.INSTANCE.result.return_value = None
+        mock_scheduler.decode_result.side_effect = lambda task_id, value: (task_id, pickle.loads(value))
+        return mock_storage, mock_waiter, mock.patch.multiple(
+            "octobot_node.scheduler.api",
+            ASYNC_STORAGE=mock_storage, RESULT_WAITER=mock_waiter, SCHEDULER=mock_scheduler,
+        )
 
-        with mock.patch("octobot_node.scheduler.api.SCHEDULER", mock_scheduler):
-            result = await get_task_result(task_id)
+    @pytest.mark.asyncio
+    async def test_get_task_result_completed(self) -> None:
+        """Test get_task_result for a completed task."""
+        result_data = {"status": "success", "output": "completed"}
+        entry = TaskIndexEntry(id="task-123", status=TaskStatus.COMPLETED)
+        _, mock_waiter, patch = self._patch({"task-123": entry}, {"task-123": pickle.dumps(result_data)})
+        with patch:
+            result = await get_task_result("task-123", 10)
 
-            assert result == {"error": "task not found"}
-            mock_scheduler.INSTANCE.result.assert_called_once_with(task_id)
+            assert result == {"status": "completed", "data": result_data}
+            mock_waiter.wait.assert_any_await(["task-123"], 10)
+
+    @pytest.mark.asyncio
+    async def test_get_task_result_failed(self) -> None:
+        """Test get_task_result for a failed task."""
+        entry = TaskIndexEntry(id="task-123", status=TaskStatus.FAILED)
+        value = pickle.dumps(HueyError({"error": "boom"}))
+        _, _, patch = self._patch({"task-123": entry}, {"task-123": value})
+        with patch:
+            assert await get_task_result("task-123") == {"status": "failed", "error": "boom"}
 
     @pytest.mark.asyncio
     async def test_get_task_result_running(self) -> None:
-        """Test get_task_result for a running task."""
-        task_id = "task-running"
+        """Test get_task_result for a task that did not finish within the wait delay."""
+        entry = TaskIndexEntry(id="task-running", status=TaskStatus.RUNNING)
+        _, _, patch = self._patch({"task-running": entry}, {})
+        with patch:
+            assert await get_task_result("task-running", 1) == {"status": "running"}
+
+    @pytest.mark.asyncio
+    async def test_get_task_result_not_found(self) -> None:
+        """Test get_task_result for a task that doesn't exist: it is not waited for."""
+        _, mock_waiter, patch = self._patch({}, {})
+        with patch:
+            assert await get_task_result("task-789", 10) == {"error": "task not found"}
+            mock_waiter.wait.assert_any_await([], 10)
+            mock_waiter.wait.assert_any_await(["task-789"])
+
+    @pytest.mark.asyncio
+    async def test_get_task_results_batch(self) -> None:
+        """Test get_task_results caps the wait delay and returns every task result."""
+        entries = {
+            "task-1": TaskIndexEntry(id="task-1", status=TaskStatus.COMPLETED),
+            "task-2": TaskIndexEntry(id="task-2", status=TaskStatus.PENDING),
+        }
+        _, mock_waiter, patch = self._patch(entries, {"task-1": pickle.dumps("ok")})
+        mock_settings = mock.Mock(SCHEDULER_TASK_RESULT_MAX_WAIT=5)
+        with patch, mock.patch("octobot_node.scheduler.api.settings", mock_settings):
+            result = await get_task_results(["task-1", "task-2", "task-3"], 30)
+
+            assert result == {
+                "task-1": {"status": "completed", "data": "ok"},
+                "task-2": {"status": "pending"},
+                "task-3": {"error": "task not found"},
+            }
+            mock_waiter.wait.assert_any_await(["task-1", "task-2"], 5)
+
+    @pytest.mark.asyncio
+    async def test_get_task_results_exception(self) -> None:
+        """Test get_task_results handles storage errors."""
+        mock_storage, _, patch = self._patch({}, {})
+        mock_storage.get_index_entry.side_effect = Exception("Redis connection error")
+        with patch:
+            assert await get_task_results(["task-1"]) == {"task-1": {"error": "failed to retrieve task result"}}
+
 
-        mock_result = mock.Mock()
-        mock_result.ready.return_value = False
+class TestIterTaskResultsExport:
+    """Tests for iter_task_results_export function."""
 
+    def test_iter_task_results_export(self) -> None:
+        """Test the export converts the time range and formats the results."""
         mock_scheduler = mock.Mock()
-        mock_scheduler.INSTANCE = mock.Mock()
-        mock_scheduler.INSTANCE.result.return_value = mock_result
+        mock_scheduler.iter_results.return_value = iter([[{"id": "task-1", "status": TaskStatus.COMPLETED}]])
+        since = datetime.datetime(2025, 1, 1)
+
+        with mock.patch("octobot_node.scheduler.api.SCHEDULER", mock_scheduler):
+            lines = "".join(iter_task_results_export(
+                ExportFormat.NDJSON, {TaskStatus.COMPLETED}, since=since, name="task"
+            )).splitlines()
+
+            assert len(lines) == 1
+            mock_scheduler.iter_results.assert_called_once_with(
+                {TaskStatus.COMPLETED}, since.replace(tzinfo=datetime.timezone.utc).timestamp(), None, "task", 500
+            )
+
+    def test_iter_task_results_export_exception(self) -> None:
+        """Test a storage error aborts the export after the already exported results."""
+        def _iter_results(*_):
+            yield [{"id": "task-1"}]
+            raise Exception("Redis connection error")
+
+        mock_scheduler = mock.Mock()
+        mock_scheduler.iter_results.side_effect = _iter_results
 
         with mock.patch("octobot_node.scheduler.api.SCHEDULER", mock_scheduler):
-            result = await get_task_result(task_id)
+            chunks = iter_task_results_export(ExportFormat.CSV, {TaskStatus.COMPLETED})
 
-            assert result["status"] == "pending or running"
\ No newline at end of file
+            assert len([next(chunks), next(chunks)]) == 2
+            with pytest.raises(Exception, match="Redis connection error"):
+                next(chunks)
@@ -0,0 +1,117 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import threading
+
+import huey
+import mock
+import pytest
+from huey.constants import EmptyData
+
+from octobot_node.app.enums import TaskResultKeys
+from octobot_node.app.models import TaskStatus
+from octobot_node.scheduler.async_storage import AsyncSchedulerStorage
+from octobot_node.scheduler.scheduler import Scheduler
+from octobot_node.scheduler.task_index import RedisTaskIndex, TaskIndexEntry, create_task_index
+
+
+@pytest.fixture
+def scheduler(tmp_path):
+    scheduler = Scheduler()
+    scheduler.INSTANCE = huey.SqliteHuey("test_async_storage", filename=str(tmp_path / "tasks.db"))
+    scheduler.index = create_task_index(scheduler.INSTANCE)
+    return scheduler
+
+
+class TestAsyncSchedulerStorage:
+    @pytest.mark.asyncio
+    async def test_run_in_dedicated_executor(self, scheduler) -> None:
+        storage = AsyncSchedulerStorage(scheduler, 2)
+        try:
+            thread_name = await storage.run(lambda: threading.current_thread().name)
+            assert thread_name.startswith("scheduler-api")
+            assert await storage.run(lambda a, b=0: a + b, 1, b=2) == 3
+        finally:
+            await storage.close()
+        assert storage._executor is None
+
+    @pytest.mark.asyncio
+    async def test_iterate(self, scheduler) -> None:
+        closed = []
+
+        def _generate():
+            try:
+                yield threading.current_thread().name
+                yield None
+                yield "last"
+            finally:
+                closed.append(True)
+
+        storage = AsyncSchedulerStorage(scheduler, 2)
+        try:
+            items = [item async for item in storage.iterate(_generate())]
+            assert items[0].startswith("scheduler-api")
+            assert items[1:] == [None, "last"]
+            assert closed == [True]
+            # stopping the iteration early closes the generator
+            iterator = storage.iterate(_generate())
+            assert (await anext(iterator)).startswith("scheduler-api")
+            await iterator.aclose()
+            assert closed == [True, True]
+        finally:
+            await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_get_indexed_task(self, scheduler) -> None:
+        scheduler.INSTANCE.put_result("task-1", {
+            TaskResultKeys.RESULT.value: "ok",
+            TaskResultKeys.METADATA.value: None,
+            TaskResultKeys.TASK.value: {"name": "task 1"},
+        })
+        scheduler.index.record(TaskIndexEntry(id="task-1", status=TaskStatus.COMPLETED, created_at=1, completed_at=2))
+        scheduler.index.record(TaskIndexEntry(id="task-2", name="task 2", status=TaskStatus.RUNNING, created_at=1))
+        storage = AsyncSchedulerStorage(scheduler, 2)
+        try:
+            assert await storage.peek_result("task-2") is EmptyData
+            task = await storage.get_indexed_task("task-1")
+            assert task == scheduler.get_indexed_task("task-1")
+            assert task["name"] == "task 1"
+            assert task["completed_at"] is not None
+            assert (await storage.get_indexed_task("task-2"))["status"] is TaskStatus.RUNNING
+            assert await storage.get_indexed_task("unknown") is None
+            # results are not consumed
+            assert scheduler.INSTANCE.result_count() == 1
+        finally:
+            await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_redis_reads_use_async_client(self, scheduler) -> None:
+        redis_storage = mock.Mock(spec=huey.RedisHuey("test_async_storage", blocking=False).storage)
+        redis_storage.result_key = "huey.results.test"
+        redis_storage.conn = mock.Mock()
+        scheduler.INSTANCE = mock.Mock(storage=redis_storage)
+        scheduler.index = RedisTaskIndex(redis_storage)
+        client = mock.Mock(
+            hget=mock.AsyncMock(return_value=None),
+            hmget=mock.AsyncMock(return_value=[b"task-1", b"name", None, b"running"] + [None] * 6),
+        )
+        storage = AsyncSchedulerStorage(scheduler, 2)
+        with mock.patch.object(storage, "get_redis_client", mock.Mock(return_value=client)):
+            task = await storage.get_indexed_task("task-1")
+        client.hget.assert_awaited_once_with("huey.results.test", "task-1")
+        client.hmget.assert_awaited_once()
+        redis_storage.conn.hmget.assert_not_called()
+        assert task["id"] == "task-1"
+        assert task["status"] is TaskStatus.RUNNING
@@ -0,0 +1,160 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import os
+import time
+
+import huey
+import mock
+import pytest
+
+from octobot_node.app.models import TaskStatus
+from octobot_node.scheduler.autoscaler import AutoscalePolicy, AutoscaleSample, ConsumerAutoscaler, get_process_memory
+from octobot_node.scheduler.consumer import NodeConsumer
+from octobot_node.scheduler.task_index import MemoryTaskIndex, TaskIndexEntry
+
+
+def _autoscaler(**kwargs) -> ConsumerAutoscaler:
+    policy_values = {"min_workers": 1, "max_workers": 8, "pending_per_worker": 10, "max_wait": 30, "scale_down_delay": 60}
+    policy_values.update(kwargs)
+    return ConsumerAutoscaler(AutoscalePolicy(**policy_values))
+
+
+class TestAutoscalePolicy:
+    def test_is_enabled(self) -> None:
+        assert AutoscalePolicy(min_workers=2, max_workers=4).is_enabled()
+        assert not AutoscalePolicy(min_workers=2).is_enabled()
+        assert not AutoscalePolicy(min_workers=2, max_workers=2).is_enabled()
+        assert not AutoscalePolicy(min_workers=0, max_workers=4).is_enabled()
+
+
+class TestConsumerAutoscaler:
+    def test_scales_up_with_queue_depth(self) -> None:
+        autoscaler = _autoscaler()
+        assert autoscaler.get_target(1, AutoscaleSample(pending=5), now=0) == 1
+        assert autoscaler.get_target(1, AutoscaleSample(pending=35), now=0) == 4
+        assert autoscaler.get_target(4, AutoscaleSample(pending=500), now=0) == 8
+
+    def test_scales_up_with_execution_time_and_wait(self) -> None:
+        autoscaler = _autoscaler()
+        # 10 tasks of 12 seconds: 4 workers are required to run them within 30 seconds
+        assert autoscaler.get_target(1, AutoscaleSample(pending=10, mean_execution_time=12), now=0) == 4
+        # tasks are waiting for too long: add a worker
+        assert autoscaler.get_target(2, AutoscaleSample(pending=1, oldest_pending_age=40), now=0) == 3
+
+    def test_scales_down_one_worker_after_delay(self) -> None:
+        autoscaler = _autoscaler()
+        assert autoscaler.get_target(4, AutoscaleSample(pending=0), now=0) == 4
+        assert autoscaler.get_target(4, AutoscaleSample(pending=0), now=59) == 4
+        assert autoscaler.get_target(4, AutoscaleSample(pending=0), now=60) == 3
+        assert autoscaler.get_target(3, AutoscaleSample(pending=0), now=61) == 3
+        assert autoscaler.get_target(3, AutoscaleSample(pending=0), now=120) == 2
+
+    def test_hysteresis(self) -> None:
+        autoscaler = _autoscaler()
+        # 15 pending tasks fit in 2 workers but not with the scale down margin: keep 3 workers
+        assert autoscaler.get_target(3, AutoscaleSample(pending=15), now=0) == 3
+        assert autoscaler.get_target(3, AutoscaleSample(pending=15), now=1000) == 3
+        # a load increase resets the low load delay
+        assert autoscaler.get_target(3, AutoscaleSample(pending=5), now=1000) == 3
+        assert autoscaler.get_target(3, AutoscaleSample(pending=40), now=1030) == 4
+        assert autoscaler.get_target(4, AutoscaleSample(pending=5), now=1060) == 4
+        assert autoscaler.get_target(4, AutoscaleSample(pending=5), now=1120) == 3
+        assert autoscaler.get_target(1, AutoscaleSample(pending=0), now=2000) == 1
+
+    def test_memory_cap(self) -> None:
+        autoscaler = _autoscaler(worker_max_memory=100)
+        assert autoscaler.get_target(4, AutoscaleSample(pending=500, worker_memory=150), now=0) == 3
+        assert autoscaler.get_target(1, AutoscaleSample(pending=500, worker_memory=150), now=0) == 1
+        assert autoscaler.get_target(4, AutoscaleSample(pending=500, worker_memory=50), now=0) == 8
+
+    def test_sample(self) -> None:
+        task_index = MemoryTaskIndex()
+        now = time.time()
+        task_index.record_many([
+            TaskIndexEntry(id="1", status=TaskStatus.COMPLETED, created_at=now - 100, started_at=now - 20, completed_at=now - 18),
+            TaskIndexEntry(id="2", status=TaskStatus.FAILED, created_at=now - 100, started_at=now - 10, completed_at=now - 6),
+            TaskIndexEntry(id="3", status=TaskStatus.PENDING, created_at=now - 50),
+            TaskIndexEntry(id="4", status=TaskStatus.PENDING, created_at=now - 80, eta=now - 60),
+        ])
+        huey_instance = mock.Mock(pending_count=mock.Mock(return_value=2))
+        autoscaler = ConsumerAutoscaler(AutoscalePolicy(min_workers=1, max_workers=4), task_index)
+        sample = autoscaler.sample(huey_instance)
+        assert sample.pending == 2
+        assert 59 <= sample.oldest_pending_age <= 61
+        assert sample.mean_execution_time == pytest.approx(3)
+        assert sample.worker_memory is None
+
+    def test_sample_worker_memory(self) -> None:
+        autoscaler = _autoscaler(worker_max_memory=100)
+        huey_instance = mock.Mock(pending_count=mock.Mock(return_value=0))
+        memories = {10: 100, 11: 300, 12: None}
+        with mock.patch("octobot_node.scheduler.autoscaler.get_process_memory", mock.Mock(side_effect=memories.get)):
+            # workers whose memory can't be read are ignored
+            assert autoscaler.sample(huey_instance, [10, 11, 12]).worker_memory == 200
+            # thread workers share the node process memory
+            assert autoscaler.sample(huey_instance).worker_memory is None
+
+    def test_get_process_memory(self) -> None:
+        assert get_process_memory() > 0
+        assert get_process_memory(os.getpid()) > 0
+
+
+class TestNodeConsumerScaling:
+    @pytest.mark.timeout(10)
+    def test_scale_up_and_down(self, tmp_path, caplog) -> None:
+        huey_instance = huey.SqliteHuey("test_autoscaler", filename=str(tmp_path / "tasks.db"))
+
+        @huey_instance.task()
+        def add(a, b):
+            return a + b
+
+        consumer = NodeConsumer(huey_instance, workers=1, check_worker_health=True, health_check_interval=60)
+        consumer.start()
+        try:
+            consumer.scale_to(3)
+            assert consumer.workers == 3
+            assert all(worker_t.is_alive() for _, worker_t in consumer.worker_threads)
+            assert [add(i, i).get(blocking=True, timeout=5) for i in range(6)] == [0, 2, 4, 6, 8, 10]
+
+            consumer.scale_to(1)
+            assert consumer.workers == 1
+            retired = [worker_t for _, worker_t in consumer.retired_worker_threads]
+            assert len(retired) == 2
+            for worker_t in retired:
+                worker_t.join(timeout=5)
+                assert not worker_t.is_alive()
+            # retired workers are not respawned
+            assert consumer.check_worker_health() is True
+            assert "died" not in caplog.text
+            assert len(consumer.worker_threads) == 1
+            assert add(1, 2).get(blocking=True, timeout=5) == 3
+        finally:
+            consumer.stop(graceful=True)
+
+    def test_autoscale(self, tmp_path) -> None:
+        huey_instance = huey.MemoryHuey("test_autoscaler")
+        autoscaler = mock.Mock(policy=AutoscalePolicy(min_workers=1, max_workers=4, interval=0))
+        autoscaler.sample.return_value = AutoscaleSample(pending=40)
+        autoscaler.get_target.return_value = 4
+        consumer = NodeConsumer(huey_instance, workers=1, autoscaler=autoscaler)
+        with mock.patch.object(consumer, "scale_to", mock.Mock()) as scale_to_mock:
+            consumer.loop()
+            autoscaler.sample.assert_called_once_with(huey_instance, None)
+            scale_to_mock.assert_called_once_with(4)
+            autoscaler.sample.side_effect = ValueError("storage error")
+            scale_to_mock.reset_mock()
+            consumer.loop()
+            scale_to_mock.assert_not_called()
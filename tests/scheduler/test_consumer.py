@@ -0,0 +1,200 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+
+import huey
+import mock
+import pytest
+
+import octobot_node.scheduler.consumer as consumer_module
+from octobot_node.scheduler.consumer import ConsumerEventLoop, NodeConsumer, SchedulerConsumer
+from octobot_node.scheduler.lanes import LaneScheduler
+from octobot_node.scheduler.scheduler import Scheduler
+
+
+@pytest.fixture
+def scheduler(tmp_path):
+    scheduler = Scheduler()
+    scheduler.INSTANCE = huey.SqliteHuey("test_consumer", filename=str(tmp_path / "tasks.db"))
+
+    @scheduler.INSTANCE.task()
+    def add(a, b):
+        return a + b
+
+    scheduler.add = add
+    return scheduler
+
+
+def _settings(worker_type="thread", workers=2):
+    mock_settings = mock.Mock()
+    mock_settings.SCHEDULER_WORKERS = workers
+    mock_settings.SCHEDULER_WORKER_TYPE = worker_type
+    mock_settings.SCHEDULER_HEALTH_CHECK_INTERVAL = 60
+    mock_settings.SCHEDULER_SHUTDOWN_TIMEOUT = 1
+    mock_settings.SCHEDULER_AUTOSCALE_MAX_WORKERS = None
+    return mock_settings
+
+
+class TestNodeConsumer:
+    def test_skips_signal_handlers_outside_main_thread(self, scheduler) -> None:
+        consumer = NodeConsumer(scheduler.INSTANCE, workers=1)
+        with mock.patch("signal.signal") as signal_mock:
+            thread = threading.Thread(target=consumer._set_signal_handlers)
+            thread.start()
+            thread.join()
+            signal_mock.assert_not_called()
+            consumer._set_signal_handlers()
+            signal_mock.assert_called()
+
+    def test_fork_safe_sqlite_storage(self, scheduler) -> None:
+        storage = scheduler.INSTANCE.storage
+        with mock.patch("os.register_at_fork") as register_at_fork_mock:
+            NodeConsumer(scheduler.INSTANCE, workers=1, worker_type="process")
+            NodeConsumer(scheduler.INSTANCE, workers=1, worker_type="process")
+        # the fork hooks are registered once, on import
+        register_at_fork_mock.assert_not_called()
+        assert list(consumer_module._FORK_SAFE_STORAGES).count(storage) == 1
+        storage.conn
+        consumer_module._before_fork()
+        assert not storage.lock.acquire(blocking=False)
+        consumer_module._after_fork_in_child()
+        assert storage._conn is None
+        assert storage.lock.acquire(blocking=False)
+        storage.lock.release()
+
+
+class TestConsumerEventLoop:
+    def test_reuses_loop(self) -> None:
+        event_loop = ConsumerEventLoop()
+
+        async def get_loop():
+            return asyncio.get_running_loop()
+
+        try:
+            first_loop = event_loop.run(get_loop())
+            assert event_loop.run(get_loop()) is first_loop
+            assert event_loop.thread.is_alive()
+        finally:
+            event_loop.stop()
+        assert event_loop.loop is None
+        assert first_loop.is_closed()
+
+    def test_propagates_context_variables(self) -> None:
+        event_loop = ConsumerEventLoop()
+        task_id = contextvars.ContextVar("task_id", default=None)
+
+        async def job():
+            return task_id.get()
+
+        def run(value):
+            task_id.set(value)
+            return event_loop.run(job())
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(2) as executor:
+                assert list(executor.map(run, ["a", "b", "c"])) == ["a", "b", "c"]
+        finally:
+            event_loop.stop()
+
+    def test_propagates_errors(self) -> None:
+        event_loop = ConsumerEventLoop()
+
+        async def job():
+            raise ValueError("boom")
+
+        try:
+            with pytest.raises(ValueError):
+                event_loop.run(job())
+        finally:
+            event_loop.stop()
+
+
+class TestSchedulerConsumer:
+    @pytest.mark.timeout(10)
+    def test_start_execute_and_stop(self, scheduler) -> None:
+        consumer = SchedulerConsumer(scheduler)
+        with mock.patch("octobot_node.scheduler.consumer.settings", _settings()):
+            consumer.start()
+        assert consumer.workers == 2
+        assert consumer.worker_type == "thread"
+        assert consumer.event_loop is not None
+        assert consumer.is_running()
+        assert scheduler.add(1, 2).get(blocking=True, timeout=5) == 3
+        consumer.stop()
+        assert not consumer.is_started()
+        assert consumer.event_loop is None
+
+    @pytest.mark.timeout(20)
+    def test_process_workers(self, scheduler) -> None:
+        consumer = SchedulerConsumer(scheduler)
+        with mock.patch("octobot_node.scheduler.consumer.settings", _settings("process")):
+            consumer.start()
+        try:
+            assert [scheduler.add(i, i).get(blocking=True, timeout=10) for i in range(4)] == [0, 2, 4, 6]
+        finally:
+            consumer.stop()
+        assert not consumer.is_started()
+
+    @pytest.mark.timeout(10)
+    def test_respawns_dead_workers(self, scheduler) -> None:
+        consumer = SchedulerConsumer(scheduler)
+        with mock.patch("octobot_node.scheduler.consumer.settings", _settings()):
+            consumer.start()
+        try:
+            # wait for workers to be started
+            assert scheduler.add(1, 1).get(blocking=True, timeout=5) == 2
+            environment = consumer.consumer.environment
+            with mock.patch.object(environment, "is_alive", mock.Mock(side_effect=[False, True, True])):
+                assert consumer.consumer.check_worker_health() is False
+            assert scheduler.add(2, 2).get(blocking=True, timeout=5) == 4
+        finally:
+            consumer.stop()
+
+    def test_greenlet_workers_require_gevent_patching(self, scheduler) -> None:
+        consumer = SchedulerConsumer(scheduler)
+        with mock.patch("octobot_node.scheduler.consumer.settings", _settings("greenlet")), \
+             mock.patch("octobot_node.scheduler.consumer.NodeConsumer") as node_consumer_mock:
+            consumer.start()
+        node_consumer_mock.assert_not_called()
+        assert consumer.workers is None
+        assert not consumer.is_started()
+
+    def test_lanes_max_concurrency_requires_thread_workers(self, scheduler) -> None:
+        scheduler.INSTANCE.storage.lanes = LaneScheduler({"execute_actions": 1}, {"execute_actions": 1})
+        consumer = SchedulerConsumer(scheduler)
+        with mock.patch("octobot_node.scheduler.consumer.settings", _settings("process")), \
+             mock.patch("octobot_node.scheduler.consumer.NodeConsumer") as node_consumer_mock:
+            consumer.start()
+        node_consumer_mock.assert_not_called()
+        assert not consumer.is_started()
+        scheduler.INSTANCE.storage.lanes = LaneScheduler({"execute_actions": 1})
+        with mock.patch("octobot_node.scheduler.consumer.settings", _settings("process")), \
+             mock.patch("octobot_node.scheduler.consumer.NodeConsumer") as node_consumer_mock, \
+             mock.patch.object(consumer_module.threading, "Thread"):
+            consumer.start()
+        node_consumer_mock.assert_called_once()
+
+    def test_missing_greenlet_dependency(self, scheduler) -> None:
+        consumer = SchedulerConsumer(scheduler)
+        with mock.patch("octobot_node.scheduler.consumer.settings", _settings("greenlet")), \
+             mock.patch("octobot_node.scheduler.consumer._is_gevent_patched", mock.Mock(return_value=True)), \
+             mock.patch("octobot_node.scheduler.consumer.NodeConsumer", mock.Mock(side_effect=ImportError("gevent"))):
+            consumer.start()
+        assert consumer.workers is None
+        assert not consumer.is_started()
@@ -0,0 +1,101 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import json
+
+import mock
+import pytest
+
+import octobot_commons.cryptography as cryptography
+
+from octobot_node.scheduler.encryption import (
+    ENVELOPE_ID_METADATA_KEY,
+    SIGNATURE_B64_METADATA_KEY,
+    ENVELOPE_MANAGER,
+    KEY_MANAGER,
+    SignatureVerificationError,
+    decrypt_task_result,
+    encrypt_task_result,
+)
+from octobot_node.scheduler.encryption.key_manager import KEY_TYPES
+
+
+@pytest.fixture(scope="module")
+def rsa_keys():
+    return cryptography.generate_rsa_key_pair(key_size=2048)
+
+
+@pytest.fixture(scope="module")
+def ecdsa_keys():
+    return cryptography.generate_ecdsa_key_pair()
+
+
+@pytest.fixture
+def envelope_settings(rsa_keys, ecdsa_keys):
+    mock_settings = mock.Mock(**{key_name: None for key_name in KEY_TYPES})
+    mock_settings.TASKS_OUTPUTS_RSA_PRIVATE_KEY, mock_settings.TASKS_OUTPUTS_RSA_PUBLIC_KEY = rsa_keys
+    mock_settings.TASKS_OUTPUTS_ECDSA_PRIVATE_KEY, mock_settings.TASKS_OUTPUTS_ECDSA_PUBLIC_KEY = ecdsa_keys
+    mock_settings.TASKS_OUTPUTS_ENVELOPE_TTL = 60
+    mock_settings.TASKS_OUTPUTS_ENVELOPE_MAX_RESULTS = 10000
+    ENVELOPE_MANAGER.clear()
+    KEY_MANAGER.clear()
+    with mock.patch("octobot_node.scheduler.encryption.key_manager.settings", mock_settings), \
+         mock.patch("octobot_node.scheduler.encryption.envelopes.settings", mock_settings):
+        yield mock_settings
+    ENVELOPE_MANAGER.clear()
+    KEY_MANAGER.clear()
+
+
+class TestResultEnvelopes:
+    def test_encrypt_and_decrypt_batch(self, envelope_settings) -> None:
+        with mock.patch.object(KEY_MANAGER, "rsa_encrypt_aes_key", wraps=KEY_MANAGER.rsa_encrypt_aes_key) as rsa_encrypt, \
+             mock.patch.object(KEY_MANAGER, "sign_data", wraps=KEY_MANAGER.sign_data) as sign_data:
+            encrypted = [encrypt_task_result(f"result {i}") for i in range(5)]
+        assert rsa_encrypt.call_count == 1
+        assert sign_data.call_count == 1
+        envelope_ids = {json.loads(metadata)[ENVELOPE_ID_METADATA_KEY] for _, metadata in encrypted}
+        assert len(envelope_ids) == 1
+        assert len({json.loads(metadata)["IV_B64"] for _, metadata in encrypted}) == 5
+
+        ENVELOPE_MANAGER.clear()
+        with mock.patch.object(KEY_MANAGER, "rsa_decrypt_aes_key", wraps=KEY_MANAGER.rsa_decrypt_aes_key) as rsa_decrypt:
+            decrypted = [decrypt_task_result(result, metadata) for result, metadata in encrypted]
+        assert decrypted == [f"result {i}" for i in range(5)]
+        assert rsa_decrypt.call_count == 1
+
+    def test_rotates_envelope(self, envelope_settings) -> None:
+        envelope_settings.TASKS_OUTPUTS_ENVELOPE_MAX_RESULTS = 2
+        envelope_ids = [
+            json.loads(encrypt_task_result("result")[1])[ENVELOPE_ID_METADATA_KEY] for _ in range(5)
+        ]
+        assert len(set(envelope_ids)) == 3
+        with mock.patch("octobot_node.scheduler.encryption.envelopes.time.time", return_value=10 ** 12):
+            _, metadata = encrypt_task_result("result")
+        assert json.loads(metadata)[ENVELOPE_ID_METADATA_KEY] not in envelope_ids
+
+    def test_rejects_other_envelope_id(self, envelope_settings) -> None:
+        encrypted_result, metadata = encrypt_task_result("result")
+        parsed_metadata = json.loads(metadata)
+        parsed_metadata[ENVELOPE_ID_METADATA_KEY] = "other"
+        with pytest.raises(SignatureVerificationError):
+            decrypt_task_result(encrypted_result, json.dumps(parsed_metadata))
+
+    def test_per_result_keys_when_disabled(self, envelope_settings) -> None:
+        envelope_settings.TASKS_OUTPUTS_ENVELOPE_TTL = None
+        encrypted_result, metadata = encrypt_task_result("result")
+        parsed_metadata = json.loads(metadata)
+        assert ENVELOPE_ID_METADATA_KEY not in parsed_metadata
+        assert SIGNATURE_B64_METADATA_KEY in parsed_metadata
+        assert decrypt_task_result(encrypted_result, metadata) == "result"
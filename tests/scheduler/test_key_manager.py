@@ -0,0 +1,89 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import mock
+import pytest
+
+import octobot_commons.cryptography as cryptography
+
+from octobot_node.scheduler.encryption import InvalidKeyError, KeyManager, KeyPairMismatchError
+from octobot_node.scheduler.encryption.key_manager import KEY_TYPES
+
+
+@pytest.fixture(scope="module")
+def rsa_keys():
+    return cryptography.generate_rsa_key_pair(key_size=2048)
+
+
+@pytest.fixture(scope="module")
+def ecdsa_keys():
+    return cryptography.generate_ecdsa_key_pair()
+
+
+@pytest.fixture
+def key_settings(rsa_keys, ecdsa_keys):
+    mock_settings = mock.Mock(**{key_name: None for key_name in KEY_TYPES})
+    mock_settings.TASKS_INPUTS_RSA_PRIVATE_KEY, mock_settings.TASKS_INPUTS_RSA_PUBLIC_KEY = rsa_keys
+    mock_settings.TASKS_INPUTS_ECDSA_PRIVATE_KEY, mock_settings.TASKS_INPUTS_ECDSA_PUBLIC_KEY = ecdsa_keys
+    with mock.patch("octobot_node.scheduler.encryption.key_manager.settings", mock_settings):
+        yield mock_settings
+
+
+class TestKeyManager:
+    def test_loads_keys_once(self, key_settings) -> None:
+        key_manager = KeyManager()
+        aes_key = cryptography.generate_aes_key()
+        for _ in range(3):
+            encrypted_aes_key = key_manager.rsa_encrypt_aes_key(aes_key, "TASKS_INPUTS_RSA_PUBLIC_KEY")
+            assert key_manager.rsa_decrypt_aes_key(encrypted_aes_key, "TASKS_INPUTS_RSA_PRIVATE_KEY") == aes_key
+        assert key_manager.timings["load_key"].count == 2
+        assert key_manager.timings["rsa_encrypt"].count == 3
+        assert key_manager.get_timings()["rsa_decrypt"]["count"] == 3
+
+    def test_compatible_with_octobot_commons(self, key_settings) -> None:
+        key_manager = KeyManager()
+        aes_key = cryptography.generate_aes_key()
+        encrypted_aes_key = cryptography.rsa_encrypt_aes_key(aes_key, key_settings.TASKS_INPUTS_RSA_PUBLIC_KEY)
+        assert key_manager.rsa_decrypt_aes_key(encrypted_aes_key, "TASKS_INPUTS_RSA_PRIVATE_KEY") == aes_key
+        signature = key_manager.sign_data(b"data", "TASKS_INPUTS_ECDSA_PRIVATE_KEY")
+        assert cryptography.verify_signature(b"data", key_settings.TASKS_INPUTS_ECDSA_PUBLIC_KEY, signature)
+        assert key_manager.verify_signature(b"data", "TASKS_INPUTS_ECDSA_PUBLIC_KEY", signature)
+        assert not key_manager.verify_signature(b"other data", "TASKS_INPUTS_ECDSA_PUBLIC_KEY", signature)
+
+    def test_reloads_changed_keys(self, key_settings) -> None:
+        key_manager = KeyManager()
+        key = key_manager.get_key("TASKS_INPUTS_ECDSA_PUBLIC_KEY")
+        assert key_manager.get_key("TASKS_INPUTS_ECDSA_PUBLIC_KEY") is key
+        key_settings.TASKS_INPUTS_ECDSA_PRIVATE_KEY, key_settings.TASKS_INPUTS_ECDSA_PUBLIC_KEY = \
+            cryptography.generate_ecdsa_key_pair()
+        assert key_manager.get_key("TASKS_INPUTS_ECDSA_PUBLIC_KEY") is not key
+
+    def test_invalid_keys(self, key_settings) -> None:
+        key_manager = KeyManager()
+        with pytest.raises(InvalidKeyError):
+            key_manager.get_key("TASKS_OUTPUTS_RSA_PUBLIC_KEY")
+        key_settings.TASKS_OUTPUTS_RSA_PUBLIC_KEY = key_settings.TASKS_INPUTS_ECDSA_PUBLIC_KEY
+        with pytest.raises(InvalidKeyError):
+            key_manager.get_key("TASKS_OUTPUTS_RSA_PUBLIC_KEY")
+        key_settings.TASKS_OUTPUTS_RSA_PUBLIC_KEY = b"invalid"
+        with pytest.raises(InvalidKeyError):
+            key_manager.get_key("TASKS_OUTPUTS_RSA_PUBLIC_KEY")
+
+    def test_load_keys_validates_pairs(self, key_settings) -> None:
+        key_manager = KeyManager()
+        key_manager.load_keys()
+        key_settings.TASKS_INPUTS_ECDSA_PUBLIC_KEY = cryptography.generate_ecdsa_key_pair()[1]
+        with pytest.raises(KeyPairMismatchError):
+            key_manager.load_keys()
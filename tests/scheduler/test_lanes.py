@@ -0,0 +1,134 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import collections
+import threading
+
+import huey
+import mock
+import pytest
+from huey.storage import MemoryStorage
+
+from octobot_node.app.models import Task, TaskStatus, TaskType
+from octobot_node.scheduler.lanes import (
+    DEFAULT_LANE,
+    LaneMessage,
+    LaneScheduler,
+    create_huey,
+    create_laned_storage_class,
+)
+from octobot_node.scheduler.scheduler import ListRedisHuey, Scheduler
+
+
+def _message(lane: str, value: str = None) -> LaneMessage:
+    message = LaneMessage((value or lane).encode())
+    message.lane = lane
+    return message
+
+
+def _laned_storage(weights: dict[str, int], max_concurrency: dict[str, int] = None):
+    return create_laned_storage_class(MemoryStorage)("test", lanes=LaneScheduler(weights, max_concurrency))
+
+
+@pytest.fixture
+def laned_huey(tmp_path):
+    huey_instance = create_huey(
+        huey.SqliteHuey, "test_lanes", LaneScheduler({"stop_octobot": 8, "execute_actions": 1}),
+        filename=str(tmp_path / "lanes.db")
+    )
+
+    @huey_instance.task()
+    def run(task: Task):
+        return task.name
+
+    return huey_instance, run
+
+
+class TestLaneScheduler:
+    def test_weighted_fair_dequeue(self) -> None:
+        storage = _laned_storage({"stop": 8, "start": 4, "execute": 2})
+        for _ in range(1000):
+            for lane in ("stop", "start", "execute", "unknown"):
+                storage.enqueue(_message(lane))
+        assert storage.queue_size() == 4000
+        counts = collections.Counter(storage.dequeue().decode() for _ in range(1500))
+        assert counts == {"stop": 800, "start": 400, "execute": 200, "unknown": 100}
+
+    def test_empty_lanes_are_skipped(self) -> None:
+        storage = _laned_storage({"stop": 8, "execute": 1})
+        for index in range(3):
+            storage.enqueue(_message("execute", f"execute{index}"))
+        assert [storage.dequeue() for _ in range(4)] == [b"execute0", b"execute1", b"execute2", None]
+        storage.enqueue(_message("stop"))
+        storage.enqueue(_message("execute"))
+        assert storage.dequeue() == b"stop"
+
+    def test_priority_within_lane(self) -> None:
+        storage = _laned_storage({"execute": 1})
+        storage.enqueue(_message("execute", "low"), 0)
+        storage.enqueue(_message("execute", "high"), 10)
+        assert storage.dequeue() == b"high"
+
+    def test_max_concurrency(self) -> None:
+        storage = _laned_storage({"stop": 1, "execute": 8}, {"execute": 1})
+        for _ in range(3):
+            storage.enqueue(_message("execute"))
+        storage.enqueue(_message("stop"))
+        assert storage.dequeue() == b"execute"
+        # another worker can't run a second execute task
+        other_worker_messages = []
+        thread = threading.Thread(target=lambda: other_worker_messages.extend([storage.dequeue(), storage.dequeue()]))
+        thread.start()
+        thread.join()
+        assert other_worker_messages == [b"stop", None]
+        # the other worker released the stop lane when dequeuing again
+        assert storage.lanes.get_in_flight() == {"stop": 0, "execute": 1, DEFAULT_LANE: 0}
+        # dequeuing again releases the lane of the previous task
+        assert storage.dequeue() == b"execute"
+
+
+class TestLanedHuey:
+    def test_tasks_use_their_type_lane(self, laned_huey) -> None:
+        huey_instance, run = laned_huey
+        for index in range(3):
+            run(Task(name=f"import{index}", type=TaskType.EXECUTE_ACTIONS.value))
+        run.schedule(args=[Task(name="stop", type=TaskType.STOP_OCTOBOT.value)], delay=0, priority=5)
+        run(Task(name="periodic"))
+        storage = huey_instance.storage
+        assert huey_instance.pending_count() == 5
+        assert storage.get_lane_storage("execute_actions").queue_size() == 3
+        assert storage.get_lane_storage(DEFAULT_LANE).name == storage.name
+        assert [huey_instance.dequeue().args[0].name for _ in range(5)] == \
+            ["stop", "import0", "periodic", "import1", "import2"]
+
+    def test_scheduler_enqueue_many_and_pending_page(self, laned_huey) -> None:
+        huey_instance, run = laned_huey
+        scheduler = Scheduler()
+        scheduler.INSTANCE = huey_instance
+        scheduler.create_index()
+        scheduler.enqueue_many([
+            run.s(Task(name="import", type=TaskType.EXECUTE_ACTIONS.value)),
+            run.s(Task(name="stop", type=TaskType.STOP_OCTOBOT.value), priority=1),
+        ])
+        assert huey_instance.storage.get_lane_storage("stop_octobot").queue_size() == 1
+        tasks, _ = scheduler.get_tasks_page(10, statuses={TaskStatus.PENDING})
+        assert sorted(task["name"] for task in tasks) == ["import", "stop"]
+
+
+def test_list_redis_storage_ignores_priorities() -> None:
+    storage = ListRedisHuey("test_lanes").storage
+    storage.conn = mock.Mock()
+    storage.enqueue(b"task", 5)
+    storage.conn.lpush.assert_called_once_with(storage.queue_key, b"task")
@@ -0,0 +1,105 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import pytest
+
+from octobot_node.scheduler.node_registry import (
+    FORGOTTEN_NODE_AGE,
+    NodeHeartbeatPublisher,
+    create_node_registry_store,
+)
+
+
+@pytest.fixture
+def huey_instance(store_huey):
+    return store_huey
+
+
+def _publisher(huey_instance, node_id: str, store=None, interval: float = 10) -> NodeHeartbeatPublisher:
+    return NodeHeartbeatPublisher(
+        huey_instance, store or create_node_registry_store(huey_instance), node_id, interval,
+        lambda: {"node_type": "consumer", "backend_type": "sqlite", "workers": 4}
+    )
+
+
+class TestNodeHeartbeatPublisher:
+    def test_publish_and_list_nodes(self, huey_instance) -> None:
+        store = create_node_registry_store(huey_instance)
+        consumer = _publisher(huey_instance, "consumer-1", store)
+        master = _publisher(huey_instance, "master", store, interval=5)
+        consumer.publish(now=1000)
+        master.publish(now=1000)
+        nodes = master.list_nodes(now=1010)
+        assert [node["node_id"] for node in nodes] == ["consumer-1", "master"]
+        assert nodes[0]["node_type"] == "consumer"
+        assert nodes[0]["workers"] == 4
+        assert nodes[0]["heartbeat_age"] == 10
+        assert nodes[0]["status"] == "alive"
+        assert not nodes[0]["is_current"]
+        assert nodes[1]["is_current"]
+        # master missed 3 heartbeats of 5 seconds
+        assert nodes[1]["status"] == "alive"
+        assert master.list_nodes(now=1016)[1]["status"] == "stale"
+        consumer.publish(now=2000)
+        assert [node["node_id"] for node in master.list_nodes(now=1000 + FORGOTTEN_NODE_AGE + 1)] == ["consumer-1"]
+        assert [heartbeat.node_id for heartbeat in store.get_all()] == ["consumer-1"]
+
+    def test_counts_executed_tasks(self, huey_instance) -> None:
+        publisher = _publisher(huey_instance, "consumer-1")
+        publisher.connect()
+
+        @huey_instance.task()
+        def add(a, b):
+            return a + b
+
+        for i in range(3):
+            add(i, i)
+        while huey_task := huey_instance.dequeue():
+            huey_instance.execute(huey_task)
+        publisher.started_at = 0
+        heartbeat = publisher.publish(now=60)
+        assert heartbeat.executed == 3
+        assert heartbeat.in_flight == 0
+        assert heartbeat.throughput == 3
+        # throughput is computed since the previous heartbeat
+        assert publisher.publish(now=120).throughput == 0
+
+    def test_process_workers_tasks_are_not_counted(self, huey_instance) -> None:
+        publisher = NodeHeartbeatPublisher(
+            huey_instance, create_node_registry_store(huey_instance), "consumer-1", 10,
+            lambda: {"node_type": "consumer", "backend_type": "sqlite", "workers": 4, "worker_type": "process"}
+        )
+        heartbeat = publisher.publish(now=60)
+        assert heartbeat.in_flight is None
+        assert heartbeat.executed is None
+        assert heartbeat.throughput is None
+        assert publisher.list_nodes(now=60)[0]["executed"] is None
+
+    def test_start_and_stop(self, huey_instance) -> None:
+        publisher = _publisher(huey_instance, "consumer-1", interval=60)
+        publisher.start()
+        try:
+            publisher._thread.join(timeout=0.2)
+            assert [node["node_id"] for node in publisher.list_nodes()] == ["consumer-1"]
+        finally:
+            publisher.stop()
+        # stopped nodes leave the registry
+        assert publisher.list_nodes() == []
+
+    def test_disabled(self, huey_instance) -> None:
+        publisher = _publisher(huey_instance, "consumer-1", interval=0)
+        publisher.start()
+        assert publisher._thread is None
+        publisher.stop()
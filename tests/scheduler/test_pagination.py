@@ -0,0 +1,157 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import datetime
+
+import huey
+import mock
+import pytest
+from huey.utils import Error as HueyError
+
+from octobot_node.app.enums import TaskResultKeys
+from octobot_node.app.models import Task, TaskStatus
+from octobot_node.scheduler.pagination import TaskCursor, TaskSource, InvalidCursorError
+from octobot_node.scheduler.scheduler import Scheduler
+from octobot_node.scheduler.task_index import TaskIndexEntry
+
+
+@pytest.fixture
+def scheduler(tmp_path):
+    scheduler = Scheduler()
+    scheduler.INSTANCE = huey.SqliteHuey("test_pagination", filename=str(tmp_path / "tasks.db"))
+    scheduler.create_index()
+
+    @scheduler.INSTANCE.task()
+    def paginated_task(task: Task):
+        return task.name
+
+    scheduler.paginated_task = paginated_task
+    return scheduler
+
+
+def _populate(scheduler, pending=0, scheduled=0, completed=0, failed=0):
+    for i in range(pending):
+        scheduler.paginated_task(Task(name=f"pending-{i}"))
+    scheduled_tasks = [scheduler.paginated_task.s(Task(name=f"scheduled-{i}")) for i in range(scheduled)]
+    for i, scheduled_task in enumerate(scheduled_tasks):
+        scheduled_task.eta = datetime.datetime.now() + datetime.timedelta(hours=1, minutes=i)
+    scheduler.enqueue_many(scheduled_tasks)
+    results = [
+        (f"completed-{i:03}", TaskStatus.COMPLETED, {
+            TaskResultKeys.RESULT.value: "ok",
+            TaskResultKeys.METADATA.value: None,
+            TaskResultKeys.TASK.value: {"name": f"completed-{i}"},
+        })
+        for i in range(completed)
+    ] + [(f"failed-{i:03}", TaskStatus.FAILED, HueyError({"error": "boom"})) for i in range(failed)]
+    for position, (task_id, status, result) in enumerate(results):
+        scheduler.INSTANCE.put_result(task_id, result)
+        scheduler.index.record(TaskIndexEntry(task_id, name=task_id, status=status, completed_at=1000 + position))
+
+
+def _get_status(task):
+    return task["status"] if isinstance(task, dict) else task.status
+
+
+class TestTaskCursor:
+    def test_encode_decode(self) -> None:
+        cursor = TaskCursor(TaskSource.RESULTS, after=(12.5, "task"))
+        assert TaskCursor.decode(cursor.encode()) == cursor
+        cursor = TaskCursor(TaskSource.PERIODIC, 3)
+        assert TaskCursor.decode(cursor.encode()) == cursor
+
+    @pytest.mark.parametrize("cursor", [
+        "", "not a cursor", TaskCursor(TaskSource.PENDING, -1).encode(),
+        TaskCursor(TaskSource.PENDING, after=(1, 2)).encode(),
+    ])
+    def test_decode_invalid_cursor(self, cursor: str) -> None:
+        with pytest.raises(InvalidCursorError):
+            TaskCursor.decode(cursor)
+
+
+class TestGetTasksPage:
+    def test_iterates_all_sources_in_order(self, scheduler) -> None:
+        _populate(scheduler, pending=3, scheduled=2, completed=4, failed=1)
+        pages = []
+        cursor = None
+        while True:
+            tasks, cursor = scheduler.get_tasks_page(3, cursor=cursor)
+            pages.append(tasks)
+            if cursor is None:
+                break
+        statuses = [_get_status(task) for page in pages for task in page]
+        assert [len(page) for page in pages] == [3, 3, 3, 1]
+        assert statuses == (
+            [TaskStatus.PENDING] * 3 + [TaskStatus.SCHEDULED] * 2
+            + [TaskStatus.COMPLETED] * 4 + [TaskStatus.FAILED]
+        )
+        assert [task["name"] for task in pages[0]] == ["pending-0", "pending-1", "pending-2"]
+        assert pages[0][0]["description"] == "Pending task: pending-0"
+        assert pages[1][1]["description"].startswith("Scheduled at")
+
+    def test_offset_skips_whole_sources(self, scheduler) -> None:
+        _populate(scheduler, pending=3, scheduled=2, completed=4)
+        tasks, cursor = scheduler.get_tasks_page(2, offset=6)
+        assert [task["id"] for task in tasks] == ["completed-001", "completed-002"]
+        assert cursor == TaskCursor(TaskSource.RESULTS, after=(1002, "completed-002"))
+
+    def test_status_filter(self, scheduler) -> None:
+        _populate(scheduler, pending=3, scheduled=2, completed=4, failed=2)
+        tasks, cursor = scheduler.get_tasks_page(10, statuses={TaskStatus.FAILED})
+        assert [task["id"] for task in tasks] == ["failed-000", "failed-001"]
+        assert cursor is None
+        tasks, cursor = scheduler.get_tasks_page(2, statuses={TaskStatus.SCHEDULED, TaskStatus.COMPLETED})
+        assert [task["name"] for task in tasks] == ["scheduled-0", "scheduled-1"]
+        tasks, cursor = scheduler.get_tasks_page(2, cursor=cursor, statuses={TaskStatus.SCHEDULED, TaskStatus.COMPLETED})
+        assert [task["id"] for task in tasks] == ["completed-000", "completed-001"]
+
+    def test_running_tasks_from_index(self, scheduler) -> None:
+        scheduler.index.record_many([
+            TaskIndexEntry(id=f"running-{i}", name=f"running-{i}", status=TaskStatus.RUNNING, created_at=i, started_at=i)
+            for i in range(3)
+        ])
+        _populate(scheduler, pending=2, scheduled=1)
+        tasks, cursor = scheduler.get_tasks_page(3, offset=1)
+        assert [_get_status(task) for task in tasks] == [TaskStatus.PENDING, TaskStatus.RUNNING, TaskStatus.RUNNING]
+        assert [task["id"] for task in tasks[1:]] == ["running-0", "running-1"]
+        assert cursor == TaskCursor(TaskSource.RUNNING, after=(1, "running-1"))
+        tasks, cursor = scheduler.get_tasks_page(10, statuses={TaskStatus.RUNNING})
+        assert [task["id"] for task in tasks] == ["running-0", "running-1", "running-2"]
+        assert tasks[0]["description"].startswith("Running since")
+        assert [task["id"] for task in scheduler.get_running_tasks()] == ["running-0", "running-1", "running-2"]
+
+    def test_cursor_is_a_keyset(self, scheduler) -> None:
+        _populate(scheduler, completed=6)
+        tasks, cursor = scheduler.get_tasks_page(2)
+        assert [task["id"] for task in tasks] == ["completed-000", "completed-001"]
+        # entries listed before the cursor are removed: the next page doesn't shift
+        scheduler.index.delete(["completed-000", "completed-001"])
+        list_status_page = scheduler.index.list_status_page
+        with mock.patch.object(scheduler.index, "list_status_page", mock.Mock(side_effect=list_status_page)) \
+                as list_status_page_mock:
+            tasks, cursor = scheduler.get_tasks_page(2, cursor=cursor)
+        assert [task["id"] for task in tasks] == ["completed-002", "completed-003"]
+        assert cursor == TaskCursor(TaskSource.RESULTS, after=(1003, "completed-003"))
+        for call in list_status_page_mock.call_args_list:
+            assert call.args[1] == (1001, "completed-001")
+            assert call.args[2] == 2
+
+    def test_results_without_stored_value_are_skipped(self, scheduler) -> None:
+        _populate(scheduler, completed=3)
+        scheduler.INSTANCE.storage.pop_data("completed-001")
+        tasks, cursor = scheduler.get_tasks_page(10)
+        assert [task["id"] for task in tasks] == ["completed-000", "completed-002"]
+        assert all(task["completed_at"] is not None for task in tasks)
+        assert cursor is None
@@ -0,0 +1,89 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+import pickle
+import time
+
+import huey
+import pytest
+from huey.constants import EmptyData
+
+from octobot_node.app.models import TaskStatus
+from octobot_node.scheduler.async_storage import AsyncSchedulerStorage
+from octobot_node.scheduler.result_waiter import TaskResultWaiter
+from octobot_node.scheduler.scheduler import Scheduler
+from octobot_node.scheduler.task_events import TaskEvent, TaskEventBroadcaster
+
+
+@pytest.fixture
+def waiter(tmp_path):
+    scheduler = Scheduler()
+    scheduler.INSTANCE = huey.SqliteHuey("test_result_waiter", filename=str(tmp_path / "tasks.db"))
+    storage = AsyncSchedulerStorage(scheduler, 2)
+    try:
+        yield TaskResultWaiter(storage, TaskEventBroadcaster(), recheck_interval=10)
+    finally:
+        asyncio.run(storage.close())
+
+
+def _put_result(waiter: TaskResultWaiter, task_id: str, value) -> None:
+    waiter.storage.scheduler.INSTANCE.storage.put_data(task_id, pickle.dumps(value))
+
+
+class TestTaskResultWaiter:
+    @pytest.mark.asyncio
+    async def test_returns_available_results(self, waiter) -> None:
+        _put_result(waiter, "task-1", "ok")
+        started_at = time.monotonic()
+        results = await waiter.wait(["task-1", "task-2"])
+        assert time.monotonic() - started_at < 1
+        assert pickle.loads(results["task-1"]) == "ok"
+        assert results["task-2"] is EmptyData
+
+    @pytest.mark.asyncio
+    async def test_woken_up_by_finished_task_event(self, waiter) -> None:
+        async def finish():
+            await asyncio.sleep(0.1)
+            # other tasks events don't end the wait
+            waiter.broadcaster.publish([TaskEvent(type="completed", task_id="other", status=TaskStatus.COMPLETED)])
+            for task_id in ("task-1", "task-2"):
+                _put_result(waiter, task_id, task_id)
+                waiter.broadcaster.publish([TaskEvent(type="completed", task_id=task_id, status=TaskStatus.COMPLETED)])
+
+        started_at = time.monotonic()
+        results, _ = await asyncio.gather(waiter.wait(["task-1", "task-2"], 5), finish())
+        assert time.monotonic() - started_at < 1
+        assert {task_id: pickle.loads(value) for task_id, value in results.items()} == {
+            "task-1": "task-1", "task-2": "task-2"
+        }
+
+    @pytest.mark.asyncio
+    async def test_rechecks_results_without_event(self, waiter) -> None:
+        waiter.recheck_interval = 0.1
+
+        async def finish():
+            await asyncio.sleep(0.1)
+            _put_result(waiter, "task-1", "ok")
+
+        results, _ = await asyncio.gather(waiter.wait(["task-1"], 5), finish())
+        assert pickle.loads(results["task-1"]) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, waiter) -> None:
+        started_at = time.monotonic()
+        assert await waiter.wait(["task-1"], 0.2) == {"task-1": EmptyData}
+        assert 0.2 <= time.monotonic() - started_at < 1
+        assert waiter.broadcaster.subscriptions == []
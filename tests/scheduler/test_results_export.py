@@ -0,0 +1,118 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import csv
+import datetime
+import io
+import json
+
+import huey
+import pytest
+from huey.utils import Error as HueyError
+
+from octobot_node.app.enums import TaskResultKeys
+from octobot_node.app.models import TaskStatus
+from octobot_node.scheduler.results_export import EXPORT_COLUMNS, ExportFormat, iter_export_chunks
+from octobot_node.scheduler.scheduler import Scheduler
+from octobot_node.scheduler.task_index import MemoryTaskIndex, TaskIndexEntry
+
+FINISHED_STATUSES = {TaskStatus.COMPLETED, TaskStatus.FAILED}
+
+
+@pytest.fixture
+def scheduler(tmp_path):
+    scheduler = Scheduler()
+    scheduler.INSTANCE = huey.SqliteHuey("test_results_export", filename=str(tmp_path / "tasks.db"))
+    scheduler.index = MemoryTaskIndex()
+    for i in range(5):
+        task_id = f"task-{i}"
+        status = TaskStatus.FAILED if i == 3 else TaskStatus.COMPLETED
+        scheduler.index.record(TaskIndexEntry(
+            id=task_id, name="even" if i % 2 == 0 else "odd", type="execute_actions", status=status,
+            created_at=i, started_at=100 + i, completed_at=1000 + i,
+        ))
+        scheduler.INSTANCE.put_result(task_id, HueyError({"error": "boom"}) if status is TaskStatus.FAILED else {
+            TaskResultKeys.RESULT.value: {"encrypted": f"result-{i}"},
+            TaskResultKeys.METADATA.value: f"metadata-{i}",
+            TaskResultKeys.TASK.value: {"name": "even" if i % 2 == 0 else "odd"},
+        })
+    # result not stored anymore
+    scheduler.index.record(TaskIndexEntry(id="task-5", status=TaskStatus.COMPLETED, created_at=5, completed_at=1005))
+    return scheduler
+
+
+def _ids(batches) -> list[list[str]]:
+    return [[task["id"] for task in tasks] for tasks in batches]
+
+
+class TestIterResults:
+    def test_batches_by_completion_time(self, scheduler) -> None:
+        assert _ids(scheduler.iter_results(FINISHED_STATUSES, batch_size=2)) == [
+            ["task-0", "task-1"], ["task-2", "task-3"], ["task-4"]
+        ]
+
+    def test_filters(self, scheduler) -> None:
+        assert _ids(scheduler.iter_results({TaskStatus.COMPLETED}, since=1001, until=1003)) == [["task-1", "task-2"]]
+        assert _ids(scheduler.iter_results(FINISHED_STATUSES, name="even")) == [["task-0", "task-2", "task-4"]]
+
+    def test_stops_after_until(self, scheduler) -> None:
+        read_cursors = []
+        list_completed = scheduler.index.list_completed
+
+        def _list_completed(statuses, since, until, after, limit):
+            read_cursors.append(after)
+            return list_completed(statuses, since, until, after, limit)
+
+        scheduler.index.list_completed = _list_completed
+        assert _ids(scheduler.iter_results(FINISHED_STATUSES, until=1000, batch_size=2)) == [["task-0"]]
+        assert read_cursors == [None]
+
+    def test_tasks_completed_during_export(self, scheduler) -> None:
+        batches = scheduler.iter_results(FINISHED_STATUSES, batch_size=2)
+        assert _ids([next(batches)]) == [["task-0", "task-1"]]
+        # exported results expire and a new task completes while exporting
+        scheduler.index.delete(["task-0", "task-1"])
+        scheduler.index.record(TaskIndexEntry(id="task-6", status=TaskStatus.COMPLETED, created_at=6, completed_at=1006))
+        scheduler.INSTANCE.put_result("task-6", {TaskResultKeys.RESULT.value: "result-6"})
+        assert _ids(batches) == [["task-2", "task-3"], ["task-4"], ["task-6"]]
+
+    def test_results_are_kept_as_stored(self, scheduler) -> None:
+        tasks = {task["id"]: task for tasks in scheduler.iter_results(FINISHED_STATUSES) for task in tasks}
+        assert json.loads(tasks["task-1"]["result"]) == {"encrypted": "result-1"}
+        assert tasks["task-1"]["result_metadata"] == "metadata-1"
+        assert tasks["task-1"]["type"] == "execute_actions"
+        assert tasks["task-1"]["completed_at"] == datetime.datetime.fromtimestamp(1001, tz=datetime.timezone.utc)
+        assert tasks["task-3"]["status"] is TaskStatus.FAILED
+
+
+class TestIterExportChunks:
+    def test_csv(self, scheduler) -> None:
+        chunks = list(iter_export_chunks(scheduler.iter_results(FINISHED_STATUSES, batch_size=2), ExportFormat.CSV))
+        assert len(chunks) == 4
+        rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+        assert list(rows[0]) == EXPORT_COLUMNS
+        assert [row["id"] for row in rows] == [f"task-{i}" for i in range(5)]
+        assert rows[3]["status"] == "failed"
+        assert rows[1]["completed_at"] == "1970-01-01T00:16:41+00:00"
+
+    def test_ndjson(self, scheduler) -> None:
+        chunks = iter_export_chunks(scheduler.iter_results(FINISHED_STATUSES), ExportFormat.NDJSON)
+        rows = [json.loads(line) for line in "".join(chunks).splitlines()]
+        assert [row["id"] for row in rows] == [f"task-{i}" for i in range(5)]
+        assert rows[0]["scheduled_at"] is None
+        assert rows[0]["status"] == "completed"
+
+    def test_empty_csv_has_header(self) -> None:
+        assert list(iter_export_chunks([], ExportFormat.CSV)) == [",".join(EXPORT_COLUMNS) + "\r\n"]
@@ -0,0 +1,171 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import base64
+import contextlib
+import datetime
+import gzip
+import json
+import pickle
+import sqlite3
+
+import huey
+import mock
+import pytest
+
+import octobot_node.scheduler.retention as retention_module
+from octobot_node.app.models import Task, TaskStatus
+from octobot_node.scheduler.retention import ResultCompactor, ResultRetentionPolicy, every_minutes
+from octobot_node.scheduler.scheduler import Scheduler
+from octobot_node.scheduler.task_graph import TaskGraphDefinition, TaskGraphNodeDefinition, create_task_graph_store
+from octobot_node.scheduler.task_index import TaskIndexEntry
+
+
+@pytest.fixture(params=["sqlite", "memory"])
+def scheduler(request, tmp_path):
+    scheduler = Scheduler()
+    if request.param == "sqlite":
+        scheduler.INSTANCE = huey.SqliteHuey("test_retention", filename=str(tmp_path / "tasks.db"))
+    else:
+        scheduler.INSTANCE = huey.MemoryHuey("test_retention")
+    scheduler.create_index()
+    return scheduler
+
+
+def _add_results(scheduler, count, result_size=10):
+    for i in range(count):
+        scheduler.INSTANCE.storage.put_data(str(i), pickle.dumps({"result": i}))
+        scheduler.index.record(TaskIndexEntry(
+            str(i), name=f"task-{i}", status=TaskStatus.COMPLETED, completed_at=1000 + i, result_size=result_size
+        ))
+
+
+def _add_finished_graph(scheduler, graph_id, task_ids, finished_at):
+    scheduler.graphs.save(TaskGraphDefinition(id=graph_id, name=None, nodes={
+        task_id: TaskGraphNodeDefinition(key=task_id, task_id=task_id, task=Task(name=task_id))
+        for task_id in task_ids
+    }))
+    scheduler.graphs.mark_finished(graph_id, finished_at)
+
+
+def _stored_ids(scheduler):
+    return sorted(
+        key.decode() if isinstance(key, bytes) else key for key in scheduler.INSTANCE.storage.result_items()
+    )
+
+
+class TestResultCompactor:
+    def test_disabled_policy(self, scheduler) -> None:
+        _add_results(scheduler, 3)
+        report = ResultCompactor(scheduler, ResultRetentionPolicy()).compact()
+        assert report.expired_count == 0
+        assert _stored_ids(scheduler) == ["0", "1", "2"]
+
+    def test_max_age(self, scheduler) -> None:
+        _add_results(scheduler, 5)
+        report = ResultCompactor(scheduler, ResultRetentionPolicy(max_age=100)).compact(now=1102.5)
+        assert report.expired_count == 3
+        assert _stored_ids(scheduler) == ["3", "4"]
+        assert scheduler.index.count() == 2
+
+    def test_max_count_and_bytes(self, scheduler) -> None:
+        _add_results(scheduler, 5)
+        ResultCompactor(scheduler, ResultRetentionPolicy(max_count=4)).compact()
+        assert _stored_ids(scheduler) == ["1", "2", "3", "4"]
+        report = ResultCompactor(scheduler, ResultRetentionPolicy(max_bytes=25)).compact()
+        assert report.expired_count == 2
+        assert report.expired_bytes == 20
+        assert _stored_ids(scheduler) == ["3", "4"]
+
+    def test_unindexed_and_unrelated_data_are_kept(self, scheduler) -> None:
+        _add_results(scheduler, 2)
+        scheduler.INSTANCE.storage.put_data("custom-key", b"value")
+        ResultCompactor(scheduler, ResultRetentionPolicy(max_count=0)).compact()
+        assert _stored_ids(scheduler) == ["custom-key"]
+
+    def test_archive_before_deletion(self, scheduler, tmp_path) -> None:
+        _add_results(scheduler, 3)
+        archive_dir = tmp_path / "archives"
+        report = ResultCompactor(scheduler, ResultRetentionPolicy(max_count=1), str(archive_dir)).compact()
+        assert report.archived_count == 2
+        with gzip.open(report.archive_path, "rt", encoding="utf-8") as archive:
+            archived = [json.loads(line) for line in archive]
+        assert [result["id"] for result in archived] == ["0", "1"]
+        assert archived[0]["name"] == "task-0"
+        assert pickle.loads(base64.b64decode(archived[1]["value"])) == {"result": 1}
+
+    def test_many_batches(self, scheduler, monkeypatch) -> None:
+        monkeypatch.setattr("octobot_node.scheduler.retention.COMPACTION_BATCH_SIZE", 3)
+        _add_results(scheduler, 10)
+        report = ResultCompactor(scheduler, ResultRetentionPolicy(max_count=2)).compact()
+        assert report.expired_count == 8
+        assert _stored_ids(scheduler) == ["8", "9"]
+
+    def test_finished_graphs_expire_with_their_nodes(self, scheduler) -> None:
+        scheduler.graphs = create_task_graph_store(scheduler.INSTANCE)
+        _add_results(scheduler, 5)
+        _add_finished_graph(scheduler, "expired", ["0", "1"], 1001)
+        _add_finished_graph(scheduler, "partially-expired", ["1", "2"], 1002)
+        scheduler.graphs.save(TaskGraphDefinition(id="running", name=None, nodes={}))
+        report = ResultCompactor(scheduler, ResultRetentionPolicy(max_count=3)).compact()
+        assert report.expired_graphs == 1
+        assert scheduler.graphs.get("expired") is None
+        assert scheduler.graphs.get("partially-expired") is not None
+        assert scheduler.graphs.get("running") is not None
+
+        report = ResultCompactor(scheduler, ResultRetentionPolicy(max_age=100)).compact(now=1102.5)
+        assert report.expired_graphs == 1
+        assert scheduler.graphs.get_finished() == {}
+        assert scheduler.graphs.get("running") is not None
+
+
+class TestVacuum:
+    def test_switches_to_incremental_vacuum(self, tmp_path) -> None:
+        scheduler = Scheduler()
+        scheduler.INSTANCE = huey.SqliteHuey("test_retention", filename=str(tmp_path / "tasks.db"))
+        scheduler.create_index()
+        _add_results(scheduler, 3)
+        ResultCompactor(scheduler, ResultRetentionPolicy(max_count=1)).compact()
+        with contextlib.closing(sqlite3.connect(str(tmp_path / "tasks.db"))) as conn:
+            assert conn.execute("pragma auto_vacuum").fetchone()[0] == 2
+        # following compactions use the incremental vacuum
+        _add_results(scheduler, 300, result_size=1000)
+        scheduler.INSTANCE.storage.sql(
+            "update kv set value = ? where queue = ?", (b"x" * 1000, scheduler.INSTANCE.storage.name), commit=True
+        )
+        with mock.patch.object(
+            retention_module, "SQLITE_INCREMENTAL_VACUUM_PAGES", 10
+        ), mock.patch.object(retention_module.sqlite3, "connect") as connect_mock:
+            ResultCompactor(scheduler, ResultRetentionPolicy(max_count=0)).compact()
+        connect_mock.assert_not_called()
+        assert _stored_ids(scheduler) == []
+        assert scheduler.INSTANCE.storage.sql("pragma freelist_count", results=True)[0][0] == 0
+
+    def test_compaction_without_count_limits_does_not_scan_totals(self, scheduler) -> None:
+        _add_results(scheduler, 3)
+        compactor = ResultCompactor(scheduler, ResultRetentionPolicy(max_age=100))
+        with mock.patch.object(scheduler.index, "count", mock.Mock()) as count_mock, \
+             mock.patch.object(compactor, "_get_total_bytes", mock.Mock()) as get_total_bytes_mock:
+            assert compactor.compact(now=1101.5).expired_count == 2
+        count_mock.assert_not_called()
+        get_total_bytes_mock.assert_not_called()
+
+
+def test_every_minutes() -> None:
+    validate = every_minutes(15)
+    start = datetime.datetime(2024, 1, 1, 0, 0)
+    matching = [minute for minute in range(60) if validate(start + datetime.timedelta(minutes=minute))]
+    assert matching == [0, 15, 30, 45]
+    assert every_minutes(0)(start + datetime.timedelta(minutes=7))
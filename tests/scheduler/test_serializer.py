@@ -0,0 +1,121 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import datetime
+import pickle
+import weakref
+
+import huey
+import mock
+import pytest
+
+import octobot_node.scheduler.serializer as serializer_module
+from octobot_node.app.models import Task, TaskStatus
+from octobot_node.scheduler.serializer import (
+    FORMAT_TAG, TASK_SCHEMA, TaskSerializer, UnsupportedMessageVersionError, encode_task, get_stored_size
+)
+
+
+class _Value:
+    def __init__(self, value: str):
+        self.value = value
+
+
+def _task(**kwargs) -> Task:
+    return Task(name="task", type="execute_actions", content='{"actions": []}', **kwargs)
+
+
+class TestTaskSerializer:
+    def test_schema_covers_task_fields(self) -> None:
+        assert set(TASK_SCHEMA) == set(Task.model_fields)
+
+    def test_round_trip(self) -> None:
+        serializer = TaskSerializer()
+        task = _task(
+            status=TaskStatus.PENDING, retries=2, scheduled_at=datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+        )
+        data = {"args": (task,), "nested": [_task()], "value": 1}
+        serialized = serializer.serialize(data)
+        assert serialized.startswith(FORMAT_TAG)
+        deserialized = serializer.deserialize(serialized)
+        assert deserialized == data
+        assert deserialized["args"][0].status is TaskStatus.PENDING
+        assert len(serialized) < len(pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+
+    def test_only_non_default_fields_are_encoded(self) -> None:
+        task = Task(name="task")
+        assert encode_task(task) == {TASK_SCHEMA.index("id"): task.id.bytes, TASK_SCHEMA.index("name"): "task"}
+
+    def test_content_compression(self) -> None:
+        task = _task()
+        task.content = "a" * 5000
+        assert len(TaskSerializer(compression_threshold=1000).serialize(task)) < 500
+        assert len(TaskSerializer(compression_threshold=None).serialize(task)) > 5000
+        for codec_module in (None, serializer_module.zstandard):
+            if codec_module is None and serializer_module.zstandard is None:
+                continue
+            with mock.patch.object(serializer_module, "zstandard", codec_module):
+                serializer = TaskSerializer(compression_threshold=1000)
+                assert serializer.deserialize(serializer.serialize(task)) == task
+
+    def test_reads_legacy_messages(self) -> None:
+        task = _task()
+        assert TaskSerializer().deserialize(pickle.dumps({"task": task})) == {"task": task}
+
+    def test_legacy_writes(self) -> None:
+        task = _task()
+        serialized = TaskSerializer(compact=False).serialize(task)
+        assert serialized == pickle.dumps(task, pickle.HIGHEST_PROTOCOL)
+        assert TaskSerializer().deserialize(serialized) == task
+
+    def test_unsupported_version(self) -> None:
+        with pytest.raises(UnsupportedMessageVersionError):
+            TaskSerializer().deserialize(FORMAT_TAG + bytes((serializer_module.FORMAT_VERSION + 1,)) + b"data")
+
+    def test_huey_messages(self, tmp_path) -> None:
+        huey_instance = huey.SqliteHuey(
+            "test_serializer", filename=str(tmp_path / "tasks.db"), serializer=TaskSerializer()
+        )
+
+        @huey_instance.task()
+        def get_name(task: Task):
+            return {"name": task.name, "task": task}
+
+        task = _task()
+        result = get_name(task)
+        queued_task = huey_instance.dequeue()
+        assert queued_task.args == (task,)
+        huey_instance.execute(queued_task)
+        assert result.get() == {"name": "task", "task": task}
+
+    def test_stored_size_reuses_last_serialization(self) -> None:
+        huey_instance = huey.MemoryHuey("test_serializer", serializer=TaskSerializer())
+        value = {"result": "value"}
+        size = len(huey_instance.serializer.serialize(value))
+        with mock.patch.object(huey_instance.serializer, "_serialize", mock.Mock()) as serialize_mock:
+            assert get_stored_size(huey_instance, value) == size
+        serialize_mock.assert_not_called()
+        # other values are serialized
+        assert get_stored_size(huey_instance, {"result": "value"}) == size
+        assert get_stored_size(huey.MemoryHuey("test_serializer"), value) > 0
+
+    def test_last_serialized_value_is_not_kept(self) -> None:
+        serializer = TaskSerializer()
+        value = _Value("result")
+        size = len(serializer.serialize(value))
+        assert serializer.get_serialized_size(value) == size
+        value_ref = weakref.ref(value)
+        del value
+        assert value_ref() is None
@@ -0,0 +1,63 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import huey
+import pytest
+
+from octobot_node.scheduler.stores import (
+    KeyedStore,
+    MemoryKeyedStore,
+    SqliteKeyedStore,
+    create_keyed_store,
+)
+
+
+@pytest.fixture
+def store(store_huey) -> KeyedStore:
+    return create_keyed_store(store_huey, "test")
+
+
+class TestKeyedStore:
+    def test_create_keyed_store(self, tmp_path) -> None:
+        assert isinstance(
+            create_keyed_store(huey.SqliteHuey("test", filename=str(tmp_path / "tasks.db")), "test"),
+            SqliteKeyedStore
+        )
+        assert isinstance(create_keyed_store(huey.MemoryHuey("test"), "test"), MemoryKeyedStore)
+
+    def test_base_is_abstract(self) -> None:
+        with pytest.raises(TypeError):
+            KeyedStore()
+
+    def test_put_get_delete(self, store) -> None:
+        store.put("b", "2")
+        store.put("a", "1")
+        store.put("b", "3")
+        assert store.get("a") == "1"
+        assert store.get("missing") is None
+        assert store.get_many(["a", "b", "missing"]) == {"a": "1", "b": "3"}
+        assert list(store.get_all().items()) == [("a", "1"), ("b", "3")]
+        store.delete(["a", "missing"])
+        assert store.get_all() == {"b": "3"}
+
+    def test_put_many(self, store) -> None:
+        store.put("a", "1")
+        store.put_many({"a": "2", "b": "3"})
+        store.put_many({})
+        assert store.get_all() == {"a": "2", "b": "3"}
+
+    def test_namespaces_are_isolated(self, store_huey) -> None:
+        create_keyed_store(store_huey, "first").put("key", "1")
+        assert create_keyed_store(store_huey, "second").get("key") is None
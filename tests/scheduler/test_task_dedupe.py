@@ -0,0 +1,110 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import huey
+import mock
+import pytest
+
+from octobot_node.app.models import Task
+from octobot_node.scheduler.task_dedupe import RedisTaskDedupeStore, create_task_dedupe_store, get_idempotency_key
+
+
+@pytest.fixture
+def store(store_huey):
+    return create_task_dedupe_store(store_huey)
+
+
+class TestGetIdempotencyKey:
+    def test_default_key(self) -> None:
+        task = Task(name="task", type="execute_actions", content="content")
+        assert get_idempotency_key(task) == get_idempotency_key(task.model_copy(update={"id": Task().id}))
+        assert get_idempotency_key(task) != get_idempotency_key(task.model_copy(update={"content": "other"}))
+        assert get_idempotency_key(task.model_copy(update={"idempotency_key": "key"})) == "key"
+
+    def test_task_ids_are_unique(self) -> None:
+        assert Task().id != Task().id
+
+
+class TestTaskDedupeStore:
+    def test_claim_many(self, store) -> None:
+        assert store.claim_many(["a", "b", "a"], ["task-1", "task-2", "task-3"], 60) == [None, None, "task-1"]
+        assert store.claim_many(["b", "c"], ["task-4", "task-5"], 60) == ["task-2", None]
+
+    def test_expired_keys_are_claimed_again(self, store) -> None:
+        with mock.patch("octobot_node.scheduler.task_dedupe.time.time", mock.Mock(return_value=1000)):
+            assert store.claim_many(["a"], ["task-1"], 60) == [None]
+        with mock.patch("octobot_node.scheduler.task_dedupe.time.time", mock.Mock(return_value=1059)):
+            assert store.claim_many(["a"], ["task-2"], 60) == ["task-1"]
+        with mock.patch("octobot_node.scheduler.task_dedupe.time.time", mock.Mock(return_value=1060)):
+            assert store.claim_many(["a"], ["task-3"], 60) == [None]
+
+    def test_release(self, store) -> None:
+        store.claim_many(["a", "b"], ["task-1", "task-2"], 60)
+        # b is claimed by another task
+        store.release(["a", "b"], ["task-1", "task-3"])
+        assert store.claim_many(["a", "b"], ["task-3", "task-4"], 60) == [None, "task-2"]
+
+    def test_finished_tasks_release_their_key(self, store_huey) -> None:
+        store = create_task_dedupe_store(store_huey)
+        store.connect(store_huey)
+
+        @store_huey.task(retries=1)
+        def run(task: Task):
+            if task.content == "fail":
+                raise ValueError("boom")
+            return task.name
+
+        def _submit(task: Task):
+            huey_task = run.s(task)
+            if store.claim_many([get_idempotency_key(task)], [huey_task.id], 60) == [None]:
+                store_huey.enqueue(huey_task)
+            return huey_task
+
+        def _run_pending():
+            while huey_task := store_huey.dequeue():
+                store_huey.execute(huey_task)
+
+        completed_task = Task(name="completed")
+        _submit(completed_task)
+        assert store_huey.pending_count() == 1
+        _submit(completed_task)
+        assert store_huey.pending_count() == 1
+        _run_pending()
+        _submit(completed_task)
+        assert store_huey.pending_count() == 1
+        store_huey.flush()
+
+        failing_task = Task(name="failing", content="fail")
+        failed_huey_task = _submit(failing_task)
+        store_huey.execute(store_huey.dequeue())
+        # the key is kept while the task is retried
+        assert store.claim_many([get_idempotency_key(failing_task)], ["other"], 60) == [failed_huey_task.id]
+        _run_pending()
+        assert store.claim_many([get_idempotency_key(failing_task)], ["other"], 60) == [None]
+
+    def test_redis_claim_many(self) -> None:
+        storage = mock.Mock(spec=huey.RedisHuey("test_task_dedupe", blocking=False).storage)
+        storage.name = "test"
+        pipeline = storage.conn.pipeline.return_value
+        pipeline.execute.return_value = [True, b"task-1", None, b"task-0"]
+        store = create_task_dedupe_store(mock.Mock(storage=storage))
+        assert isinstance(store, RedisTaskDedupeStore)
+        assert store.claim_many(["a", "b"], ["task-1", "task-2"], 1.5) == [None, "task-0"]
+        pipeline.set.assert_any_call("huey.dedupe.test.a", "task-1", nx=True, px=1500)
+        pipeline.get.assert_any_call("huey.dedupe.test.b")
+        store.release(["a"], ["task-1"])
+        storage.conn.register_script.return_value.assert_called_once_with(
+            keys=["huey.dedupe.test.a"], args=["task-1"], client=pipeline
+        )
@@ -0,0 +1,142 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+import json
+import threading
+
+import huey
+import mock
+import pytest
+
+from octobot_node.app.models import TaskStatus
+from octobot_node.scheduler.task_events import (
+    RedisTaskEventBus, TaskEvent, TaskEventBroadcaster, TaskEventBus, create_task_event_bus, create_task_events
+)
+from octobot_node.scheduler.task_index import MemoryTaskIndex, TaskIndexEntry, TaskIndexUpdater
+
+
+def _entry(task_id: str, status) -> TaskIndexEntry:
+    return TaskIndexEntry(id=task_id, name=f"name {task_id}", type="type", status=status)
+
+
+class TestCreateTaskEvents:
+    def test_event_types_and_metrics_delta(self) -> None:
+        events = create_task_events([
+            (_entry("1", TaskStatus.PENDING), None),
+            (_entry("1", TaskStatus.RUNNING), TaskStatus.PENDING),
+            (_entry("1", TaskStatus.COMPLETED), TaskStatus.RUNNING),
+            (_entry("2", TaskStatus.FAILED), TaskStatus.RUNNING),
+            (_entry("3", TaskStatus.SCHEDULED), None),
+        ])
+        assert [event.type for event in events] == ["enqueued", "started", "completed", "failed", "scheduled"]
+        assert events[0].metrics_delta == {"pending": 1}
+        assert events[1].metrics_delta == {"running": 1, "pending": -1}
+        assert events[0].name == "name 1"
+        assert events[0].task_type == "type"
+
+    def test_rescheduled(self) -> None:
+        events = create_task_events([
+            (_entry("1", TaskStatus.SCHEDULED), TaskStatus.RUNNING),
+            (_entry("2", TaskStatus.PENDING), TaskStatus.RUNNING),
+            (_entry("3", TaskStatus.PENDING), TaskStatus.SCHEDULED),
+        ])
+        assert [event.type for event in events] == ["rescheduled", "rescheduled", "enqueued"]
+
+    def test_ignores_updates_without_status_change(self) -> None:
+        assert create_task_events([
+            (TaskIndexEntry(id="1", result_size=10), TaskStatus.COMPLETED),
+            (_entry("2", TaskStatus.RUNNING), TaskStatus.RUNNING),
+        ]) == []
+
+    def test_to_sse(self) -> None:
+        event = TaskEvent(type="started", task_id="1", status="running", previous_status="pending", timestamp=1)
+        event_type, data = event.to_sse().rstrip("\n").split("\n")
+        assert event_type == "event: started"
+        assert json.loads(data.removeprefix("data: "))["previous_status"] == "pending"
+        assert TaskEvent(**event.to_dict()) == event
+
+
+class TestTaskEventBroadcaster:
+    @pytest.mark.asyncio
+    async def test_publish_from_other_thread(self) -> None:
+        broadcaster = TaskEventBroadcaster()
+        async with broadcaster.subscribe() as subscription:
+            thread = threading.Thread(target=broadcaster.publish, args=([TaskEvent(type="started", task_id="1")],))
+            thread.start()
+            thread.join()
+            event = await subscription.get(1)
+            assert event.task_id == "1"
+            assert await subscription.get(0.01) is None
+        assert broadcaster.subscriptions == []
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_resyncs(self) -> None:
+        broadcaster = TaskEventBroadcaster(max_queue_size=2)
+        async with broadcaster.subscribe() as subscription:
+            broadcaster.publish([TaskEvent(type="enqueued", task_id=str(i)) for i in range(5)])
+            await asyncio.sleep(0)
+            assert (await subscription.get(1)).type == "resync"
+            assert await subscription.get(0.01) is None
+            broadcaster.publish([TaskEvent(type="enqueued", task_id="6")])
+            assert (await subscription.get(1)).task_id == "6"
+
+
+class TestTaskEventBus:
+    @pytest.mark.asyncio
+    async def test_publishes_index_updater_changes(self) -> None:
+        huey_instance = huey.MemoryHuey("test_task_events", immediate=True)
+
+        @huey_instance.task()
+        def add(a, b):
+            return a + b
+
+        updater = TaskIndexUpdater(huey_instance, MemoryTaskIndex())
+        updater.connect()
+        bus = create_task_event_bus(huey_instance, mock.Mock())
+        assert type(bus) is TaskEventBus
+        updater.add_listener(bus.on_status_changes)
+        async with bus.broadcaster.subscribe() as subscription:
+            add(1, 2)
+            events = [await subscription.get(1) for _ in range(3)]
+        assert [event.type for event in events] == ["enqueued", "started", "completed"]
+
+    @pytest.mark.asyncio
+    async def test_redis_bus_relays_channel(self) -> None:
+        storage = mock.Mock(spec=huey.RedisHuey("test_task_events", blocking=False).storage)
+        storage.name = "test"
+        event = TaskEvent(type="completed", task_id="1", status=TaskStatus.COMPLETED)
+        messages = [{"type": "subscribe", "data": 1}, {"type": "message", "data": json.dumps([event.to_dict()])}]
+
+        async def listen():
+            for message in messages:
+                yield message
+            await asyncio.Event().wait()
+
+        pubsub = mock.Mock(subscribe=mock.AsyncMock(), aclose=mock.AsyncMock(), listen=listen)
+        bus = create_task_event_bus(mock.Mock(storage=storage), mock.Mock(return_value=mock.Mock(
+            pubsub=mock.Mock(return_value=pubsub)
+        )))
+        assert isinstance(bus, RedisTaskEventBus)
+        bus.publish([event])
+        storage.conn.publish.assert_called_once_with("huey.events.test", json.dumps([event.to_dict()]))
+        async with bus.broadcaster.subscribe() as subscription:
+            await bus.start()
+            try:
+                assert await subscription.get(1) == event
+            finally:
+                await bus.stop()
+        pubsub.subscribe.assert_awaited_once_with("huey.events.test")
+        pubsub.aclose.assert_awaited_once()
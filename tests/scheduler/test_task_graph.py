@@ -0,0 +1,189 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import huey
+import pytest
+
+from octobot_node.app.enums import TaskResultKeys
+from octobot_node.app.models import Task, TaskGraph, TaskGraphNode, TaskStatus
+from octobot_node.scheduler.task_graph import (
+    TaskGraphStore,
+    TaskGraphDefinition,
+    TaskGraphError,
+    TaskGraphRunner,
+    create_task_graph_definition,
+    get_graph_status,
+)
+from octobot_node.scheduler.stores import MemoryKeyedStore
+from octobot_node.scheduler.task_index import MemoryTaskIndex, TaskIndexUpdater
+
+
+def _node(key: str, *depends_on: str, task_type: str = "test") -> TaskGraphNode:
+    return TaskGraphNode(key=key, task=Task(name=key, type=task_type), depends_on=list(depends_on))
+
+
+@pytest.fixture
+def graph_runner():
+    huey_instance = huey.MemoryHuey("test_task_graph")
+    task_index = MemoryTaskIndex()
+    TaskIndexUpdater(huey_instance, task_index).connect()
+
+    def run_node(task: Task):
+        if task.content == "fail":
+            raise ValueError("boom")
+        if task.content and task.content.isdigit() and int(task.content):
+            # executes the node again with one less remaining execution
+            runner.continue_current_node(task.model_copy(update={"content": str(int(task.content) - 1)}), 0)
+        return {TaskResultKeys.RESULT.value: task.name, TaskResultKeys.METADATA.value: task.content}
+
+    @huey_instance.task()
+    def execute_node(task: Task, graph_id: str, node_key: str):
+        if task.type is None:
+            return runner.merge_dependencies_results(graph_id, node_key)
+        return runner.execute_node(graph_id, node_key, lambda: run_node(task))
+
+    runner = TaskGraphRunner(
+        huey_instance, TaskGraphStore(MemoryKeyedStore(), MemoryKeyedStore()), execute_node
+    )
+    runner.connect()
+    return runner, task_index
+
+
+def _run_pending(huey_instance: huey.Huey) -> list[str]:
+    executed = []
+    while huey_task := huey_instance.dequeue():
+        executed.append(huey_task.args[2])
+        huey_instance.execute(huey_task)
+    return executed
+
+
+class TestTaskGraphDefinition:
+    def test_invalid_graphs(self) -> None:
+        with pytest.raises(TaskGraphError):
+            create_task_graph_definition(TaskGraph(nodes=[]))
+        with pytest.raises(TaskGraphError):
+            create_task_graph_definition(TaskGraph(nodes=[_node("a"), _node("a")]))
+        with pytest.raises(TaskGraphError):
+            create_task_graph_definition(TaskGraph(nodes=[_node("a", "unknown")]))
+        with pytest.raises(TaskGraphError):
+            create_task_graph_definition(TaskGraph(nodes=[_node("a"), _node("b", "a", "c"), _node("c", "b")]))
+
+    def test_json_round_trip(self) -> None:
+        definition = create_task_graph_definition(
+            TaskGraph(name="graph", nodes=[_node("a"), _node("b"), TaskGraphNode(key="join", depends_on=["a", "b"])])
+        )
+        parsed = TaskGraphDefinition.from_json(definition.to_json())
+        assert parsed.name == "graph"
+        assert [node.key for node in parsed.get_roots()] == ["a", "b"]
+        assert [node.key for node in parsed.get_dependents("a")] == ["join"]
+        assert parsed.nodes["join"].is_join()
+        assert parsed.nodes["a"].task_id == definition.nodes["a"].task_id
+
+    def test_get_graph_status(self) -> None:
+        assert get_graph_status([None, None]) is TaskStatus.PENDING
+        assert get_graph_status([TaskStatus.SCHEDULED, None]) is TaskStatus.SCHEDULED
+        assert get_graph_status([TaskStatus.COMPLETED, None]) is TaskStatus.RUNNING
+        assert get_graph_status([TaskStatus.COMPLETED, TaskStatus.FAILED, None]) is TaskStatus.FAILED
+        assert get_graph_status([TaskStatus.COMPLETED, TaskStatus.COMPLETED]) is TaskStatus.COMPLETED
+
+
+class TestTaskGraphRunner:
+    def test_runs_branches_then_join(self, graph_runner) -> None:
+        runner, task_index = graph_runner
+        definition, root_tasks = runner.submit(TaskGraph(nodes=[
+            _node("start"),
+            _node("left", "start"),
+            _node("right", "start"),
+            TaskGraphNode(key="join", depends_on=["left", "right"]),
+        ]))
+        for root_task in root_tasks:
+            runner.huey.enqueue(root_task)
+        assert runner.get_status(definition.id, task_index)["status"] is TaskStatus.PENDING
+
+        assert _run_pending(runner.huey)[0] == "start"
+        status = runner.get_status(definition.id, task_index)
+        assert status["status"] is TaskStatus.COMPLETED
+        assert [node["status"] for node in status["nodes"]] == [TaskStatus.COMPLETED] * 4
+
+        join_result = runner.huey.result(definition.nodes["join"].task_id)
+        assert join_result[TaskResultKeys.RESULT.value] == {"left": "left", "right": "right"}
+
+    def test_branches_are_dispatched_together(self, graph_runner) -> None:
+        runner, task_index = graph_runner
+        definition, root_tasks = runner.submit(TaskGraph(nodes=[
+            _node("start"), _node("left", "start"), _node("right", "start"), _node("end", "left", "right")
+        ]))
+        runner.huey.execute(root_tasks[0])
+        assert runner.huey.pending_count() == 2
+        assert runner.get_status(definition.id, task_index)["status"] is TaskStatus.RUNNING
+
+    def test_failed_node_stops_its_dependents(self, graph_runner) -> None:
+        runner, task_index = graph_runner
+        failing = _node("fail")
+        failing.task.content = "fail"
+        definition, root_tasks = runner.submit(TaskGraph(nodes=[
+            _node("ok"), failing, _node("end", "ok", "fail")
+        ]))
+        for root_task in root_tasks:
+            runner.huey.enqueue(root_task)
+        assert sorted(_run_pending(runner.huey)) == ["fail", "ok"]
+        status = runner.get_status(definition.id, task_index)
+        assert status["status"] is TaskStatus.FAILED
+        assert status["nodes"][2]["status"] is None
+
+    def test_unknown_graph(self, graph_runner) -> None:
+        runner, task_index = graph_runner
+        assert runner.get_status("unknown", task_index) is None
+
+    def test_continued_node_dispatches_dependents_after_its_last_execution(self, graph_runner) -> None:
+        runner, task_index = graph_runner
+        continued = _node("continued")
+        continued.task.content = "2"
+        definition, root_tasks = runner.submit(TaskGraph(nodes=[continued, _node("end", "continued")]))
+        runner.huey.execute(root_tasks[0])
+        assert runner.get_status(definition.id, task_index)["nodes"][1]["status"] is None
+
+        assert _run_pending(runner.huey) == ["continued", "continued", "end"]
+        node_task_id = definition.nodes["continued"].task_id
+        assert runner.huey.result(node_task_id)[TaskResultKeys.METADATA.value] == "0"
+        assert runner.get_status(definition.id, task_index)["status"] is TaskStatus.COMPLETED
+
+    def test_continue_current_node_outside_graph_nodes(self, graph_runner) -> None:
+        runner, _ = graph_runner
+        assert runner.continue_current_node(Task(name="task"), 0) is False
+
+    def test_finished_graph_counters_are_deleted(self, graph_runner) -> None:
+        runner, _ = graph_runner
+        definition, root_tasks = runner.submit(TaskGraph(nodes=[
+            _node("start"), _node("left", "start"), _node("right", "start"), _node("end", "left", "right")
+        ]))
+        runner.huey.enqueue(root_tasks[0])
+        _run_pending(runner.huey)
+        assert list(runner.store.get_finished()) == [definition.id]
+        assert not [key for key in runner.huey.storage._counters if key.startswith(f"graph:{definition.id}")]
+
+    def test_failed_graph_is_finished(self, graph_runner) -> None:
+        runner, _ = graph_runner
+        failing = _node("fail")
+        failing.task.content = "fail"
+        definition, root_tasks = runner.submit(TaskGraph(nodes=[
+            _node("ok"), failing, _node("end", "ok", "fail")
+        ]))
+        # the failed node runs first: the other one does not create counters anymore
+        for root_task in sorted(root_tasks, key=lambda root_task: root_task.args[2] != "fail"):
+            runner.huey.enqueue(root_task)
+        assert _run_pending(runner.huey) == ["fail", "ok"]
+        assert list(runner.store.get_finished()) == [definition.id]
+        assert not [key for key in runner.huey.storage._counters if key.startswith(f"graph:{definition.id}")]
@@ -0,0 +1,227 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import huey
+import huey.utils
+import mock
+import pytest
+
+from octobot_node.app.models import Task, TaskStatus
+from octobot_node.scheduler.scheduler import Scheduler
+from octobot_node.scheduler.task_index import (
+    MemoryTaskIndex,
+    RedisTaskIndex,
+    SqliteTaskIndex,
+    TaskIndexEntry,
+    create_task_index,
+)
+
+
+@pytest.fixture
+def scheduler(tmp_path):
+    scheduler = Scheduler()
+    scheduler.INSTANCE = huey.SqliteHuey("test_task_index", filename=str(tmp_path / "tasks.db"))
+
+    @scheduler.INSTANCE.task()
+    def indexed_task(task: Task):
+        if task.content == "fail":
+            raise ValueError("boom")
+        return {"result": task.name, "metadata": None, "task": {"name": task.name}}
+
+    scheduler.indexed_task = indexed_task
+    scheduler.create_index()
+    return scheduler
+
+
+def _run_pending(scheduler):
+    while task := scheduler.INSTANCE.dequeue():
+        scheduler.INSTANCE.execute(task)
+
+
+@pytest.fixture
+def task_index(store_huey):
+    return create_task_index(store_huey)
+
+
+class TestTaskIndex:
+    def test_create_task_index(self, tmp_path) -> None:
+        assert isinstance(
+            create_task_index(huey.SqliteHuey("test", filename=str(tmp_path / "tasks.db"))), SqliteTaskIndex
+        )
+        assert isinstance(create_task_index(huey.MemoryHuey("test")), MemoryTaskIndex)
+
+    def test_record_returns_previous_status(self, task_index) -> None:
+        assert task_index.record(TaskIndexEntry("1", name="a", status=TaskStatus.PENDING, created_at=10)) is None
+        assert task_index.record(
+            TaskIndexEntry("1", status=TaskStatus.RUNNING, started_at=11, created_at=20)
+        ) is TaskStatus.PENDING
+        entry = task_index.get("1")
+        assert entry.name == "a"
+        assert entry.status is TaskStatus.RUNNING
+        assert entry.created_at == 10
+        assert entry.started_at == 11
+
+    def test_record_completes_indexed_entries(self, task_index) -> None:
+        task_index.record(TaskIndexEntry("1", status=TaskStatus.SCHEDULED, eta=15, created_at=10))
+        running = TaskIndexEntry("1", status=TaskStatus.RUNNING, started_at=16, created_at=20)
+        task_index.record_many([running])
+        assert running.created_at == 10
+        assert running.eta == 15
+
+    def test_record_without_status_only_updates(self, task_index) -> None:
+        task_index.record(TaskIndexEntry("1", result_size=12))
+        assert task_index.get("1") is None
+
+    def test_list_count_find_and_delete(self, task_index) -> None:
+        for i in range(5):
+            status = TaskStatus.COMPLETED if i % 2 else TaskStatus.FAILED
+            task_index.record(TaskIndexEntry(str(i), name=f"name-{i % 2}", status=status, completed_at=100 - i))
+        assert [entry.id for entry in task_index.list_entries({TaskStatus.FAILED})] == ["4", "2", "0"]
+        assert [entry.id for entry in task_index.list_entries({TaskStatus.FAILED, TaskStatus.COMPLETED}, 1, 2)] == ["3", "2"]
+        assert task_index.count_by_status() == {TaskStatus.FAILED: 3, TaskStatus.COMPLETED: 2}
+        assert task_index.count({TaskStatus.COMPLETED}) == 2
+        assert sorted(entry.id for entry in task_index.find_by_name("name-1")) == ["1", "3"]
+        task_index.delete(["0", "1"])
+        assert task_index.count() == 3
+        assert [entry.id for entry in task_index.get_many(["0", "2", "3"])] == ["2", "3"]
+
+    def test_list_completed(self, task_index) -> None:
+        for i in range(6):
+            status = TaskStatus.COMPLETED if i % 2 else TaskStatus.FAILED
+            # tasks 2 and 3 completed at the same time
+            task_index.record(TaskIndexEntry(str(i), status=status, completed_at=100 + i - (i == 3)))
+        task_index.record(TaskIndexEntry("running", status=TaskStatus.RUNNING, created_at=101))
+        statuses = {TaskStatus.FAILED, TaskStatus.COMPLETED}
+        assert [entry.id for entry in task_index.list_completed(statuses, limit=3)] == ["0", "1", "2"]
+        assert [entry.id for entry in task_index.list_completed(statuses, after=(102, "2"), limit=2)] == ["3", "4"]
+        assert [entry.id for entry in task_index.list_completed(statuses, since=101, until=102)] == ["1", "2", "3"]
+        assert [entry.id for entry in task_index.list_completed({TaskStatus.COMPLETED}, after=(101, "1"))] == ["3", "5"]
+        assert task_index.list_completed({TaskStatus.RUNNING}) == []
+
+
+    def test_list_page(self, task_index) -> None:
+        task_index.record(TaskIndexEntry("pending", status=TaskStatus.PENDING, created_at=101))
+        for i in range(4):
+            # tasks 1 and 2 are sorted at the same time
+            task_index.record(TaskIndexEntry(str(i), status=TaskStatus.RUNNING, created_at=100 + i - (i == 2)))
+        # finished entries are sorted by completion time
+        task_index.record(TaskIndexEntry("done", status=TaskStatus.COMPLETED, created_at=1, completed_at=102))
+        statuses = {TaskStatus.PENDING, TaskStatus.RUNNING, TaskStatus.COMPLETED}
+        assert [entry.id for entry in task_index.list_page(statuses, limit=3)] == ["0", "1", "2"]
+        assert [entry.id for entry in task_index.list_page(statuses, after=(101, "2"))] == ["pending", "done", "3"]
+        assert [entry.id for entry in task_index.list_page(statuses, limit=2, offset=2)] == ["2", "pending"]
+        assert [entry.id for entry in task_index.list_page({TaskStatus.RUNNING}, after=(101, "1"))] == ["2", "3"]
+
+
+    def test_redis_record_many_is_a_watched_transaction(self) -> None:
+        storage = mock.Mock(spec=huey.RedisHuey("test_task_index", blocking=False).storage)
+        storage.name = "test"
+        storage.counter_key = "huey.counters.test"
+        storage.conn = mock.Mock()
+        task_index = RedisTaskIndex(storage)
+        pipe = mock.Mock()
+        # the first attempt is aborted by a concurrent write of the entry
+        storage.conn.pipeline.return_value.execute.side_effect = [
+            [[None, None, None, None]], [[b"running", b"10", None, None]]
+        ]
+
+        def transaction(func, *watches, value_from_callable):
+            assert watches == (task_index._entry_key("1"),)
+            assert value_from_callable
+            func(mock.Mock())
+            return func(pipe)
+
+        storage.conn.transaction.side_effect = transaction
+        entry = TaskIndexEntry("1", status=TaskStatus.COMPLETED, completed_at=12)
+        assert task_index.record_many([entry], lambda statuses: {"done": statuses.count(TaskStatus.RUNNING)}) == \
+            [TaskStatus.RUNNING]
+        storage.conn.pipeline.assert_called_with(transaction=False)
+        assert [call[0] for call in pipe.method_calls] == ["multi", "hset", "zrem", "zadd", "hincrby"]
+        pipe.zrem.assert_called_once_with(task_index._status_key(TaskStatus.RUNNING), "1")
+        pipe.hincrby.assert_called_once_with("huey.counters.test", "done", 1)
+        assert entry.created_at == 10
+
+
+class TestTaskIndexUpdater:
+    def test_tracks_task_lifecycle(self, scheduler) -> None:
+        result = scheduler.indexed_task(Task(name="ok"))
+        entry = scheduler.index.get(result.id)
+        assert entry.status is TaskStatus.PENDING
+        assert entry.name == "ok"
+        _run_pending(scheduler)
+        entry = scheduler.index.get(result.id)
+        assert entry.status is TaskStatus.COMPLETED
+        assert entry.started_at <= entry.completed_at
+        assert entry.result_size > 0
+
+    def test_tracks_failures(self, scheduler) -> None:
+        result = scheduler.indexed_task(Task(name="ko", content="fail"))
+        _run_pending(scheduler)
+        assert scheduler.index.get(result.id).status is TaskStatus.FAILED
+
+    def test_get_tasks_page_filters_results_using_index(self, scheduler) -> None:
+        results = [scheduler.indexed_task(Task(name=f"task-{i}", content="fail" if i % 2 else None)) for i in range(6)]
+        _run_pending(scheduler)
+        tasks, cursor = scheduler.get_tasks_page(2, statuses={TaskStatus.FAILED})
+        assert [task["id"] for task in tasks] == [results[1].id, results[3].id]
+        assert all(task["completed_at"] is not None for task in tasks)
+        tasks, cursor = scheduler.get_tasks_page(2, cursor=cursor, statuses={TaskStatus.FAILED})
+        assert [task["id"] for task in tasks] == [results[5].id]
+        assert cursor is None
+        tasks, _ = scheduler.get_tasks_page(10, statuses={TaskStatus.COMPLETED}, offset=1)
+        assert [task["id"] for task in tasks] == [results[2].id, results[4].id]
+
+    def test_get_indexed_task(self, scheduler) -> None:
+        pending = scheduler.indexed_task(Task(name="pending"))
+        assert scheduler.get_indexed_task(pending.id)["status"] is TaskStatus.PENDING
+        _run_pending(scheduler)
+        task = scheduler.get_indexed_task(pending.id)
+        assert task["status"] is TaskStatus.COMPLETED
+        assert task["name"] == "pending"
+        assert scheduler.get_indexed_task("unknown") is None
+        assert [task["id"] for task in scheduler.find_indexed_tasks("pending")] == [pending.id]
+
+
+class TestEnqueueMany:
+    def test_enqueue_many(self, scheduler) -> None:
+        tasks = [scheduler.indexed_task.s(Task(name=f"task-{i}")) for i in range(3)]
+        with mock.patch.object(
+            scheduler.index, "record_many", mock.Mock(wraps=scheduler.index.record_many)
+        ) as record_many_mock:
+            scheduler.enqueue_many(tasks)
+        record_many_mock.assert_called_once()
+        assert scheduler.INSTANCE.pending_count() == 3
+        assert [entry.name for entry in scheduler.index.get_many([task.id for task in tasks])] == [
+            "task-0", "task-1", "task-2"
+        ]
+        _run_pending(scheduler)
+        assert [scheduler.INSTANCE.result(task.id)["result"] for task in tasks] == ["task-0", "task-1", "task-2"]
+
+    def test_enqueue_many_schedules_delayed_tasks(self, scheduler) -> None:
+        delayed = scheduler.indexed_task.s(Task(name="delayed"))
+        delayed.eta = huey.utils.normalize_time(delay=60, utc=scheduler.INSTANCE.utc)
+        queued = scheduler.indexed_task.s(Task(name="queued"))
+        scheduler.enqueue_many([delayed, queued])
+        assert scheduler.INSTANCE.pending_count() == 1
+        assert [task.id for task in scheduler.INSTANCE.scheduled()] == [delayed.id]
+        assert scheduler.index.get(delayed.id).status is TaskStatus.SCHEDULED
+        assert scheduler.index.get(queued.id).status is TaskStatus.PENDING
+
+    def test_enqueue_many_failed_write_is_not_indexed(self, scheduler) -> None:
+        task = scheduler.indexed_task.s(Task(name="task"))
+        with mock.patch.object(scheduler.INSTANCE.storage, "db", mock.Mock(side_effect=OSError("disk full"))):
+            with pytest.raises(OSError):
+                scheduler.enqueue_many([task])
+        assert scheduler.index.get(task.id) is None
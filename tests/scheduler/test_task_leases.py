@@ -0,0 +1,173 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import huey
+import pytest
+
+from octobot_node.app.models import TaskStatus
+from octobot_node.scheduler.task_index import MemoryTaskIndex, TaskIndexUpdater
+from octobot_node.scheduler.task_leases import (
+    CURRENT_TASK_ID,
+    REAPER_LOCK_NAME,
+    TaskLeaseManager,
+    create_task_lease_store,
+)
+
+
+@pytest.fixture
+def leases(store_huey):
+    huey_instance = store_huey
+    task_index = MemoryTaskIndex()
+    index_updater = TaskIndexUpdater(huey_instance, task_index)
+    index_updater.connect()
+    manager = TaskLeaseManager(
+        huey_instance, create_task_lease_store(huey_instance), "node-1", 30, max_attempts=2,
+        index_updater=index_updater
+    )
+    manager.connect()
+    seen_leases = []
+
+    @huey_instance.task()
+    def leased_task(value):
+        seen_leases.append(manager.store.get(CURRENT_TASK_ID.get()))
+        if value == "orders":
+            manager.mark_side_effects()
+        return value
+
+    manager.leased_task = leased_task
+    manager.seen_leases = seen_leases
+    return manager, task_index
+
+
+def _run_pending(huey_instance: huey.Huey) -> int:
+    executed = 0
+    while huey_task := huey_instance.dequeue():
+        huey_instance.execute(huey_task)
+        executed += 1
+    return executed
+
+
+def _crash(manager: TaskLeaseManager) -> huey.api.Task:
+    # the worker dies after acquiring the lease: the task is never completed
+    huey_task = manager.huey.dequeue()
+    manager.huey._emit(huey.signals.SIGNAL_EXECUTING, huey_task)
+    manager.on_pre_execute(huey_task)
+    huey_task.execute()
+    with manager._lock:
+        manager._held_leases.clear()
+    return huey_task
+
+
+class TestTaskLeaseManager:
+    def test_lease_is_held_during_execution(self, leases) -> None:
+        manager, _ = leases
+        result = manager.leased_task("a")
+        assert _run_pending(manager.huey) == 1
+        assert result.get() == "a"
+        lease = manager.seen_leases[0]
+        assert lease.task_id == result.id
+        assert lease.node_id == "node-1"
+        assert lease.attempts == 1
+        assert lease.expires_at - lease.acquired_at == 30
+        assert manager.store.get_all() == []
+
+    def test_reap_requeues_orphaned_task(self, leases) -> None:
+        manager, task_index = leases
+        result = manager.leased_task("a")
+        huey_task = _crash(manager)
+        assert task_index.get(huey_task.id).status is TaskStatus.RUNNING
+        # lease is not expired yet
+        assert manager.reap().requeued_task_ids == []
+        lease = manager.store.get(huey_task.id)
+        report = manager.reap(now=lease.expires_at + 1)
+        assert report.requeued_task_ids == [huey_task.id]
+        assert task_index.get(huey_task.id).status is TaskStatus.PENDING
+        requeued_lease = manager.store.get(huey_task.id)
+        assert requeued_lease.requeued
+        # requeued leases are not reaped while their task is pending
+        assert manager.reap(now=requeued_lease.expires_at + 1000).requeued_task_ids == []
+        assert manager.store.get(huey_task.id).expires_at == requeued_lease.expires_at + 1030
+        assert _run_pending(manager.huey) == 1
+        assert result.get() == "a"
+        assert manager.seen_leases[-1].attempts == 2
+        assert manager.store.get_all() == []
+        assert task_index.get(huey_task.id).status is TaskStatus.COMPLETED
+
+    def test_reap_fails_tasks_with_side_effects(self, leases) -> None:
+        manager, task_index = leases
+        result = manager.leased_task("orders")
+        huey_task = _crash(manager)
+        assert manager.store.get(huey_task.id).side_effects
+        report = manager.reap(now=manager.store.get(huey_task.id).expires_at + 1)
+        assert report.requeued_task_ids == []
+        assert report.failed_task_ids == [huey_task.id]
+        assert manager.huey.pending_count() == 0
+        with pytest.raises(huey.exceptions.TaskException):
+            result.get()
+        assert task_index.get(huey_task.id).status is TaskStatus.FAILED
+        assert manager.store.get_all() == []
+
+    def test_reap_fails_after_max_attempts(self, leases) -> None:
+        manager, task_index = leases
+        manager.leased_task("a")
+        huey_task = _crash(manager)
+        assert manager.reap(now=manager.store.get(huey_task.id).expires_at + 1).requeued_task_ids == [huey_task.id]
+        _crash(manager)
+        report = manager.reap(now=manager.store.get(huey_task.id).expires_at + 1)
+        assert report.failed_task_ids == [huey_task.id]
+        assert task_index.get(huey_task.id).status is TaskStatus.FAILED
+
+    def test_reap_requeues_tasks_lost_before_their_execution(self, leases) -> None:
+        manager, task_index = leases
+        manager.leased_task("a")
+        huey_task = _crash(manager)
+        lease = manager.store.get(huey_task.id)
+        assert manager.reap(now=lease.expires_at + 1).requeued_task_ids == [huey_task.id]
+        # the worker dies after dequeuing the requeued task, before executing it
+        manager.huey._emit(huey.signals.SIGNAL_EXECUTING, manager.huey.dequeue())
+        requeued_lease = manager.store.get(huey_task.id)
+        report = manager.reap(now=requeued_lease.expires_at + 1)
+        # the lost execution counts as an attempt
+        assert report.failed_task_ids == [huey_task.id]
+        assert task_index.get(huey_task.id).status is TaskStatus.FAILED
+
+    def test_concurrent_reapers_are_skipped(self, leases) -> None:
+        manager, _ = leases
+        manager.leased_task("a")
+        huey_task = _crash(manager)
+        with manager.huey.lock_task(REAPER_LOCK_NAME):
+            assert manager.reap(now=manager.store.get(huey_task.id).expires_at + 1).requeued_task_ids == []
+        assert manager.reap(now=manager.store.get(huey_task.id).expires_at + 1).requeued_task_ids == [huey_task.id]
+
+    def test_renew(self, leases) -> None:
+        manager, _ = leases
+        manager.leased_task("a")
+        huey_task = manager.huey.dequeue()
+        manager.on_pre_execute(huey_task)
+        manager.mark_side_effects(huey_task.id)
+        manager.renew(now=1000)
+        lease = manager.store.get(huey_task.id)
+        assert lease.expires_at == 1030
+        assert lease.side_effects
+        manager.on_post_execute(huey_task, "a", None)
+        # completed tasks leases are not recreated
+        manager.renew(now=2000)
+        assert manager.store.get_all() == []
+
+    def test_disabled(self, leases) -> None:
+        manager, _ = leases
+        manager.visibility_timeout = None
+        assert not manager.is_enabled()
+        assert manager.reap().requeued_task_ids == []
@@ -0,0 +1,118 @@
+#  This file is part of OctoBot Node (https://github.com/Drakkar-Software/OctoBot-Node)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import huey
+import mock
+import pytest
+
+from octobot_node.app.models import Task, TaskStatus, TaskType
+from octobot_node.scheduler.scheduler import Scheduler
+from octobot_node.scheduler.task_index import TaskIndexEntry
+from octobot_node.scheduler.task_metrics import TaskMetrics
+
+
+@pytest.fixture(params=["sqlite", "memory"])
+def scheduler(request, tmp_path):
+    scheduler = Scheduler()
+    if request.param == "sqlite":
+        scheduler.INSTANCE = huey.SqliteHuey("test_task_metrics", filename=str(tmp_path / "tasks.db"))
+    else:
+        scheduler.INSTANCE = huey.MemoryHuey("test_task_metrics")
+
+    @scheduler.INSTANCE.task(retries=1)
+    def metrics_task(task: Task):
+        if task.content == "fail":
+            raise ValueError("boom")
+        return {"result": task.name, "metadata": None, "task": {"name": task.name}}
+
+    scheduler.metrics_task = metrics_task
+    scheduler.create_index()
+    return scheduler
+
+
+def _run_pending(scheduler):
+    while task := scheduler.INSTANCE.dequeue():
+        scheduler.INSTANCE.execute(task)
+
+
+class TestTaskMetrics:
+    def test_counters_follow_tasks_lifecycle(self, scheduler) -> None:
+        scheduler.metrics_task(Task(name="ok", type=TaskType.START_OCTOBOT.value))
+        scheduler.metrics_task(Task(name="ko", type=TaskType.STOP_OCTOBOT.value, content="fail"))
+        metrics = scheduler.metrics.get_metrics()
+        assert metrics["by_status"][TaskStatus.PENDING] == 2
+        assert metrics["by_type"] == {"start_octobot": {"pending": 1}, "stop_octobot": {"pending": 1}}
+
+        _run_pending(scheduler)
+        metrics = scheduler.metrics.get_metrics()
+        assert metrics["by_status"][TaskStatus.PENDING] == 0
+        assert metrics["by_status"][TaskStatus.RUNNING] == 0
+        assert metrics["by_status"][TaskStatus.COMPLETED] == 1
+        assert metrics["by_status"][TaskStatus.FAILED] == 1
+        assert metrics["by_type"]["start_octobot"]["completed"] == 1
+        assert metrics["by_type"]["stop_octobot"]["failed"] == 1
+        assert metrics["events"]["executing"] == 3
+        assert metrics["events"]["error"] == 2
+        assert metrics["events"]["retrying"] == 1
+
+    def test_counters_are_written_with_index_entries(self, scheduler) -> None:
+        with mock.patch.object(scheduler.metrics, "increment", mock.Mock()) as increment_mock:
+            scheduler.metrics_task(Task(name="ok", type=TaskType.START_OCTOBOT.value))
+            _run_pending(scheduler)
+        increment_mock.assert_not_called()
+        metrics = scheduler.metrics.get_metrics()
+        assert metrics["by_status"][TaskStatus.COMPLETED] == 1
+        assert metrics["events"]["enqueued"] == 1
+        assert metrics["events"]["complete"] == 1
+
+    def test_enqueue_many_counts_once(self, scheduler) -> None:
+        scheduler.enqueue_many([scheduler.metrics_task.s(Task(name=str(i))) for i in range(3)])
+        assert scheduler.metrics.get_metrics()["by_status"][TaskStatus.PENDING] == 3
+        assert scheduler.metrics.get_metrics()["events"]["enqueued"] == 3
+
+    def test_entries_deleted(self, scheduler) -> None:
+        scheduler.metrics_task(Task(name="ok", type=TaskType.START_OCTOBOT.value))
+        _run_pending(scheduler)
+        entries = scheduler.index.list_entries({TaskStatus.COMPLETED})
+        scheduler.metrics.on_entries_deleted(entries)
+        metrics = scheduler.metrics.get_metrics()
+        assert metrics["by_status"][TaskStatus.COMPLETED] == 0
+        assert metrics["by_type"]["start_octobot"]["completed"] == 0
+
+    def test_rebuild_from_index(self, scheduler) -> None:
+        metrics = TaskMetrics(scheduler.INSTANCE)
+        metrics.increment({"metrics.status.failed": 5})
+        scheduler.index.record(TaskIndexEntry("1", type="start_octobot", status=TaskStatus.COMPLETED))
+        scheduler.index.record(TaskIndexEntry("2", status=TaskStatus.PENDING))
+        metrics.rebuild(scheduler.index)
+        by_status = metrics.get_metrics()["by_status"]
+        assert by_status[TaskStatus.FAILED] == 0
+        assert by_status[TaskStatus.COMPLETED] == 1
+        assert by_status[TaskStatus.PENDING] == 1
+        assert metrics.get_metrics()["by_type"] == {"start_octobot": {"completed": 1}}
+
+
+def test_metrics_rebuilt_on_index_creation(tmp_path) -> None:
+    huey_instance = huey.SqliteHuey("test_task_metrics", filename=str(tmp_path / "tasks.db"))
+    scheduler = Scheduler()
+    scheduler.INSTANCE = huey_instance
+    scheduler.create_index()
+    scheduler.index.record(TaskIndexEntry("1", status=TaskStatus.COMPLETED))
+    scheduler.INSTANCE.storage.flush_counters()
+
+    restarted_scheduler = Scheduler()
+    restarted_scheduler.INSTANCE = huey.SqliteHuey("test_task_metrics", filename=str(tmp_path / "tasks.db"))
+    restarted_scheduler.create_index()
+    assert restarted_scheduler.metrics.get_metrics()["by_status"][TaskStatus.COMPLETED] == 1
@@ -20,8 +20,11 @@ import pytest
 import json
 
 import octobot_node.scheduler
+import octobot_node.scheduler.consumer
+import octobot_node.scheduler.api
 import octobot_node.scheduler.tasks
 import octobot_node.scheduler.octobot_lib
+import octobot_node.scheduler.task_dedupe
 import octobot_node.app.models
 import octobot_node.app.enums
 
@@ -111,6 +114,17 @@ class TestHueyTasks:
         result = async_add_numbers(1, 2)
         assert result.get() == 3
 
+    def test_async_task_with_consumer_event_loop(self):
+        event_loop = octobot_node.scheduler.consumer.ConsumerEventLoop()
+        try:
+            with mock.patch.object(octobot_node.scheduler.CONSUMER, "event_loop", event_loop), \
+                 mock.patch.object(event_loop, "run", mock.Mock(wraps=event_loop.run)) as run_mock:
+                result = async_add_numbers(1, 2)
+                assert result.get() == 3
+            run_mock.assert_called_once()
+        finally:
+            event_loop.stop()
+
     def test_execute_octobot_execution(self, schedule_task, mocked_octobot_action_job, requires_octobot_lib_elements):
         assert schedule_task.result is None
         result = octobot_node.scheduler.tasks.execute_octobot(schedule_task).get()
@@ -121,11 +135,36 @@ class TestHueyTasks:
             "transfers": [],
         })
 
+    @pytest.mark.parametrize("run_error", [None, ValueError("boom")])
+    def test_execute_octobot_deletes_plan_after_its_last_step(self, mocked_octobot_action_job, run_error):
+        plans = octobot_node.scheduler.tasks.ACTIONS_PLANS
+        plan = octobot_node.scheduler.octobot_lib.ActionsPlan.create([[], []])
+        plans.save(plan)
+        mocked_octobot_action_job.side_effect = run_error
+        task = octobot_node.app.models.Task(
+            name="test_task",
+            type=octobot_node.app.models.TaskType.EXECUTE_ACTIONS.value,
+            content=json.dumps({
+                octobot_node.scheduler.octobot_lib.DESCRIPTION_VERSION_KEY:
+                    octobot_node.scheduler.octobot_lib.COMPACT_DESCRIPTION_VERSION,
+                "plan_id": plan.id, "step": 1, "state": {}, "auth_details": {},
+            }),
+        )
+        result = octobot_node.scheduler.tasks.execute_octobot(task)
+        if run_error is None:
+            self._assert_task_result(result.get(), {"orders": [], "transfers": []})
+        else:
+            with pytest.raises(huey.exceptions.TaskException):
+                result.get()
+        mocked_octobot_action_job.assert_awaited_once()
+        assert plans.store.get(plan.id) is None
+        assert plans.cache.get(plan.id) is None
+
     @pytest.mark.timeout(5)
     def test_reshedule_octobot_execution_without_delay(self, schedule_task, mocked_octobot_action_job, requires_octobot_lib_elements):
         next_actions_description = mock.Mock(
             get_next_execution_time=mock.Mock(return_value=0),
-            to_dict=mock.Mock(return_value=json.loads(schedule_task.content))
+            to_compact_dict=mock.Mock(return_value=json.loads(schedule_task.content))
         )
         task = octobot_node.scheduler.tasks._reshedule_octobot_execution(schedule_task, next_actions_description)
         result = task.get()
@@ -140,7 +179,7 @@ class TestHueyTasks:
     def test_reshedule_octobot_execution_with_delay(self, schedule_task, mocked_octobot_action_job, requires_octobot_lib_elements):
         next_actions_description = mock.Mock(
             get_next_execution_time=mock.Mock(return_value=time.time() + 1),
-            to_dict=mock.Mock(return_value=json.loads(schedule_task.content))
+            to_compact_dict=mock.Mock(return_value=json.loads(schedule_task.content))
         )
         task = octobot_node.scheduler.tasks._reshedule_octobot_execution(schedule_task, next_actions_description)
         result = task.get()
@@ -151,7 +190,7 @@ class TestHueyTasks:
     def test_reshedule_octobot_execution_with_delay_in_the_past(self, schedule_task, mocked_octobot_action_job, requires_octobot_lib_elements):
         next_actions_description = mock.Mock(
             get_next_execution_time=mock.Mock(return_value=time.time() - 15),
-            to_dict=mock.Mock(return_value=json.loads(schedule_task.content))
+            to_compact_dict=mock.Mock(return_value=json.loads(schedule_task.content))
         )
         task = octobot_node.scheduler.tasks._reshedule_octobot_execution(schedule_task, next_actions_description)
         result = task.get()
@@ -179,3 +218,99 @@ class TestHueyTasks:
             assert result[octobot_node.app.enums.TaskResultKeys.METADATA.value] is None
         assert result[octobot_node.app.enums.TaskResultKeys.TASK.value] == {"name": "test_task"}
         assert result[octobot_node.app.enums.TaskResultKeys.ERROR.value] is None
+
+
+@pytest.fixture
+def dedupe_store():
+    with mock.patch.object(
+        octobot_node.scheduler.SCHEDULER, "dedupe", octobot_node.scheduler.task_dedupe.MemoryTaskDedupeStore()
+    ) as store, mock.patch.object(octobot_node.scheduler.tasks.settings, "SCHEDULER_TASK_DEDUPE_TTL", 3600):
+        yield store
+
+
+@pytest.mark.usefixtures("dedupe_store")
+class TestTriggerTasks:
+    def test_trigger_tasks(self):
+        tasks = [
+            octobot_node.app.models.Task(name="start", type=octobot_node.app.models.TaskType.START_OCTOBOT.value),
+            octobot_node.app.models.Task(name="invalid", type="invalid"),
+            octobot_node.app.models.Task(name="stop", type=octobot_node.app.models.TaskType.STOP_OCTOBOT.value, priority=10),
+        ]
+        with mock.patch.object(octobot_node.scheduler.SCHEDULER, "enqueue_many", mock.Mock()) as enqueue_many_mock:
+            submissions = octobot_node.scheduler.tasks.trigger_tasks(tasks)
+        enqueue_many_mock.assert_called_once()
+        scheduler_tasks = enqueue_many_mock.mock_calls[0].args[0]
+        assert [task.name for task in scheduler_tasks] == ["start_octobot", "stop_octobot"]
+        assert [task.priority for task in scheduler_tasks] == [0, 10]
+        assert all(task.eta is not None for task in scheduler_tasks)
+        assert [submission.id for submission in submissions] == [scheduler_tasks[0].id, None, scheduler_tasks[1].id]
+        assert submissions[1].error == "Invalid task type: invalid"
+
+    def test_trigger_tasks_without_valid_task(self):
+        with mock.patch.object(octobot_node.scheduler.SCHEDULER, "enqueue_many", mock.Mock()) as enqueue_many_mock:
+            submissions = octobot_node.scheduler.tasks.trigger_tasks([octobot_node.app.models.Task(type="invalid")])
+        enqueue_many_mock.assert_not_called()
+        assert submissions[0].error
+
+    def test_trigger_tasks_ignores_duplicates(self):
+        def _task(content):
+            return octobot_node.app.models.Task(
+                name="actions", type=octobot_node.app.models.TaskType.EXECUTE_ACTIONS.value, content=content
+            )
+
+        with mock.patch.object(octobot_node.scheduler.SCHEDULER, "enqueue_many", mock.Mock()) as enqueue_many_mock:
+            first_submissions = octobot_node.scheduler.tasks.trigger_tasks([_task("a"), _task("a")])
+            retried_submissions = octobot_node.scheduler.tasks.trigger_tasks([_task("a"), _task("b")])
+            explicit_key_task = _task("a")
+            explicit_key_task.idempotency_key = "run-again"
+            explicit_key_submissions = octobot_node.scheduler.tasks.trigger_tasks([explicit_key_task])
+        assert [len(call.args[0]) for call in enqueue_many_mock.mock_calls] == [1, 1, 1]
+        assert [submission.duplicate for submission in first_submissions] == [False, True]
+        assert first_submissions[1].id == first_submissions[0].id
+        assert retried_submissions[0].id == first_submissions[0].id
+        assert retried_submissions[0].duplicate
+        assert not retried_submissions[1].duplicate
+        assert not explicit_key_submissions[0].duplicate
+
+    def test_trigger_tasks_without_deduplication(self):
+        task = octobot_node.app.models.Task(name="stop", type=octobot_node.app.models.TaskType.STOP_OCTOBOT.value)
+        with mock.patch.object(octobot_node.scheduler.SCHEDULER, "enqueue_many", mock.Mock()) as enqueue_many_mock, \
+             mock.patch.object(octobot_node.scheduler.tasks.settings, "SCHEDULER_TASK_DEDUPE_TTL", None):
+            submissions = octobot_node.scheduler.tasks.trigger_tasks([task, task])
+        assert len(enqueue_many_mock.mock_calls[0].args[0]) == 2
+        assert not any(submission.duplicate for submission in submissions)
+
+    def test_trigger_tasks_releases_keys_of_failed_enqueues(self):
+        task = octobot_node.app.models.Task(name="stop", type=octobot_node.app.models.TaskType.STOP_OCTOBOT.value)
+        with mock.patch.object(
+            octobot_node.scheduler.SCHEDULER, "enqueue_many", mock.Mock(side_effect=[Exception("storage error"), None])
+        ):
+            with pytest.raises(Exception):
+                octobot_node.scheduler.tasks.trigger_tasks([task])
+            assert not octobot_node.scheduler.tasks.trigger_tasks([task])[0].duplicate
+
+    def test_trigger_task_is_deduplicated(self):
+        task = octobot_node.app.models.Task(name="stop", type=octobot_node.app.models.TaskType.STOP_OCTOBOT.value)
+        with mock.patch.object(octobot_node.scheduler.SCHEDULER, "enqueue_many", mock.Mock()) as enqueue_many_mock:
+            submission = octobot_node.scheduler.tasks.trigger_task(task)
+            retried_submission = octobot_node.scheduler.tasks.trigger_task(task)
+        enqueue_many_mock.assert_called_once()
+        assert submission.id == enqueue_many_mock.mock_calls[0].args[0][0].id
+        assert retried_submission.id == submission.id
+        assert retried_submission.duplicate
+
+    def test_trigger_task_graph(self):
+        graph = octobot_node.app.models.TaskGraph(nodes=[
+            octobot_node.app.models.TaskGraphNode(
+                key="start", task=octobot_node.app.models.Task(type=octobot_node.app.models.TaskType.START_OCTOBOT.value)
+            ),
+            octobot_node.app.models.TaskGraphNode(key="join", depends_on=["start"]),
+        ])
+        with mock.patch.object(octobot_node.scheduler.SCHEDULER, "enqueue_many", mock.Mock()) as enqueue_many_mock:
+            graph_id = octobot_node.scheduler.tasks.trigger_task_graph(graph)
+        scheduler_tasks = enqueue_many_mock.mock_calls[0].args[0]
+        assert [task.args[1:] for task in scheduler_tasks] == [(graph_id, "start")]
+        assert scheduler_tasks[0].eta is not None
+        graph_status = octobot_node.scheduler.api.get_task_graph(graph_id)
+        assert graph_status["nodes"][0]["task_id"] == scheduler_tasks[0].id
+        assert graph_status["nodes"][1]["status"] is None